@@ -0,0 +1,84 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+import time
+from typing import Callable
+
+import click
+import numpy as np
+import pandas as pd
+
+from superset.utils.pandas_postprocessing import (
+    geodetic_parse,
+    geohash_decode,
+    geohash_encode,
+)
+
+
+def generate_df(points: int) -> pd.DataFrame:
+    rng = np.random.default_rng(42)
+    df = pd.DataFrame(
+        {
+            "latitude": rng.uniform(-90, 90, points),
+            "longitude": rng.uniform(-180, 180, points),
+        }
+    )
+    df["geodetic"] = [
+        f"{latitude:.6f}, {longitude:.6f}, 12m"
+        for latitude, longitude in zip(df["latitude"], df["longitude"], strict=False)
+    ]
+    return geohash_encode(
+        df, geohash="geohash", latitude="latitude", longitude="longitude"
+    )
+
+
+@click.command()
+@click.option("--points", default=1_000_000, help="Number of points to generate")
+def main(points: int) -> None:
+    """
+    Benchmark the geospatial post-processing operations.
+    """
+    df = generate_df(points)
+    operations: dict[str, Callable[[], pd.DataFrame]] = {
+        "geohash_encode": lambda: geohash_encode(
+            df[["latitude", "longitude"]],
+            geohash="geohash",
+            latitude="latitude",
+            longitude="longitude",
+        ),
+        "geohash_decode": lambda: geohash_decode(
+            df[["geohash"]], geohash="geohash", latitude="lat", longitude="lon"
+        ),
+        "geodetic_parse": lambda: geodetic_parse(
+            df[["geodetic"]],
+            geodetic="geodetic",
+            latitude="lat",
+            longitude="lon",
+            altitude="alt",
+        ),
+    }
+
+    print(f"Running on {points} points\n")
+    for name, operation in operations.items():
+        start = time.perf_counter()
+        operation()
+        duration = time.perf_counter() - start
+        throughput = points / duration / 1_000_000
+        print(f"{name}: {duration:.3f} s ({throughput:.2f}M points/s)")
+
+
+if __name__ == "__main__":
+    main()  # pylint: disable=no-value-for-parameter
@@ -0,0 +1,87 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+import time
+from typing import Any
+
+import click
+import numpy as np
+import pandas as pd
+
+from superset.common.utils.post_processing_engines import POST_PROCESSING_ENGINES
+
+OPERATIONS: list[dict[str, Any]] = [
+    {
+        "operation": "aggregate",
+        "options": {
+            "groupby": ["country", "day"],
+            "aggregates": {
+                "sum__value": {"column": "value", "operator": "sum"},
+                "max__count": {"column": "count", "operator": "max"},
+            },
+        },
+    },
+    {"operation": "sort", "options": {"by": ["country", "day"]}},
+    {
+        "operation": "cum",
+        "options": {"operator": "sum", "columns": {"sum__value": "cum__value"}},
+    },
+    {"operation": "diff", "options": {"columns": {"max__count": "diff__count"}}},
+]
+
+
+def generate_df(rows: int, groups: int) -> pd.DataFrame:
+    rng = np.random.default_rng(42)
+    return pd.DataFrame(
+        {
+            "country": pd.Series(rng.integers(0, groups, rows)).map(
+                lambda idx: f"country_{idx}"
+            ),
+            "day": rng.integers(0, 365, rows),
+            "value": rng.random(rows),
+            "count": rng.integers(0, 1000, rows),
+        }
+    )
+
+
+@click.command()
+@click.option("--rows", default=2_000_000, help="Number of rows to generate")
+@click.option("--groups", default=100, help="Number of distinct countries")
+@click.option("--repeat", default=3, help="Number of runs per engine")
+def main(rows: int, groups: int, repeat: int) -> None:
+    """
+    Benchmark the post-processing engines on a generated DataFrame.
+    """
+    df = generate_df(rows, groups)
+    print(f"Running {len(OPERATIONS)} operations on {rows} rows\n")
+
+    results: dict[str, float] = {}
+    for name, engine_class in POST_PROCESSING_ENGINES.items():
+        engine = engine_class()
+        durations = []
+        for _ in range(repeat):
+            start = time.perf_counter()
+            engine.execute(df.copy(), OPERATIONS)
+            durations.append(time.perf_counter() - start)
+        results[name] = min(durations)
+
+    print("Results (best of runs):\n")
+    for name, duration in results.items():
+        print(f"{name}: {duration:.3f} s")
+
+
+if __name__ == "__main__":
+    main()  # pylint: disable=no-value-for-parameter
@@ -128,6 +128,23 @@ describe('asyncEvent middleware', () => {
       expect(fetchMock.calls(CACHED_DATA_ENDPOINT)).toHaveLength(1);
     });
 
+    it('resolves with inline chart data without fetching it', async () => {
+      fetchMock.reset();
+      fetchMock.get(EVENTS_ENDPOINT, {
+        status: 200,
+        body: { result: [{ ...asyncDoneEvent, result: chartData.result }] },
+      });
+      fetchMock.get(CACHED_DATA_ENDPOINT, {
+        status: 200,
+        body: { result: chartData },
+      });
+      const actualResolved =
+        await asyncEvent.waitForAsyncData(asyncPendingEvent);
+      expect(actualResolved).toEqual(chartData.result);
+
+      expect(fetchMock.calls(CACHED_DATA_ENDPOINT)).toHaveLength(0);
+    });
+
     it('rejects on event error status', async () => {
       fetchMock.reset();
       fetchMock.get(EVENTS_ENDPOINT, {
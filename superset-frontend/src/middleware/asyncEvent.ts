@@ -37,6 +37,7 @@ type AsyncEvent = {
   status: string;
   errors?: SupersetError[];
   result_url: string | null;
+  result?: any;
 };
 
 type CachedDataResponse = {
@@ -62,6 +63,7 @@ const RETRY_DELAY = 100;
 let config: AppConfig;
 let transport: string;
 let pollingDelayMs: number;
+let longPollTimeout: number;
 let pollingTimeoutId: number;
 let listenersByJobId: Record<string, ListenerFn>;
 let retriesByJobId: Record<string, number>;
@@ -79,6 +81,10 @@ const removeListener = (id: string) => {
 const fetchCachedData = async (
   asyncEvent: AsyncEvent,
 ): Promise<CachedDataResponse> => {
+  // small results are embedded in the event, saving a request
+  if (asyncEvent.result !== undefined) {
+    return { status: 'success', data: asyncEvent.result };
+  }
   let status = 'success';
   let data;
   try {
@@ -124,7 +130,7 @@ export const waitForAsyncData = async (asyncResponse: AsyncEvent) =>
   });
 
 const fetchEvents = makeApi<
-  { last_id?: string | null },
+  { last_id?: string | null; timeout?: number },
   { result: AsyncEvent[] }
 >({
   method: 'GET',
@@ -167,7 +173,10 @@ export const processEvents = async (events: AsyncEvent[]) => {
 };
 
 const loadEventsFromApi = async () => {
-  const eventArgs = lastReceivedEventId ? { last_id: lastReceivedEventId } : {};
+  const eventArgs = {
+    ...(lastReceivedEventId ? { last_id: lastReceivedEventId } : {}),
+    ...(longPollTimeout ? { timeout: longPollTimeout } : {}),
+  };
   if (Object.keys(listenersByJobId).length) {
     try {
       const { result: events } = await fetchEvents(eventArgs);
@@ -238,6 +247,7 @@ export const init = (appConfig?: AppConfig) => {
   config = appConfig || getBootstrapData().common.conf;
   transport = config.GLOBAL_ASYNC_QUERIES_TRANSPORT || TRANSPORT_POLLING;
   pollingDelayMs = config.GLOBAL_ASYNC_QUERIES_POLLING_DELAY || 500;
+  longPollTimeout = config.GLOBAL_ASYNC_QUERIES_LONG_POLL_TIMEOUT || 0;
 
   try {
     lastReceivedEventId = localStorage.getItem(LOCALSTORAGE_KEY);
@@ -53,6 +53,7 @@ interface EventValue {
   status: string;
   errors?: SupersetError[];
   result_url?: string;
+  result?: unknown;
 }
 interface JwtPayload {
   [key: string]: string;
@@ -54,6 +54,13 @@ class AsyncEventsRestApi(BaseSupersetApi):
             description: Last ID received by the client
             schema:
                 type: string
+          - in: query
+            name: timeout
+            description: >-
+              Maximum number of seconds to wait for new events when there are
+              none (long polling), capped by the server configuration
+            schema:
+                type: number
           responses:
             200:
               description: Async event results
@@ -93,7 +100,14 @@ class AsyncEventsRestApi(BaseSupersetApi):
                 request
             )
             last_event_id = request.args.get("last_id")
-            events = async_query_manager.read_events(async_channel_id, last_event_id)
+            if timeout := request.args.get("timeout", type=float):
+                events = async_query_manager.wait_for_events(
+                    async_channel_id, last_event_id, timeout
+                )
+            else:
+                events = async_query_manager.read_events(
+                    async_channel_id, last_event_id
+                )
 
         except AsyncQueryTokenException:
             return self.response_401()
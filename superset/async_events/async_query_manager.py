@@ -18,7 +18,7 @@ from __future__ import annotations
 
 import logging
 import uuid
-from typing import Any, Literal, Optional
+from typing import Any, cast, Literal, Optional
 
 import jwt
 from flask import Flask, Request, request, Response, session
@@ -28,6 +28,7 @@ from superset.async_events.cache_backend import (
     RedisCacheBackend,
     RedisSentinelCacheBackend,
 )
+from superset.async_events.stream_reader import AsyncEventStreamReader, decode_entries
 from superset.utils import json
 from superset.utils.core import get_user_id
 
@@ -96,6 +97,7 @@ def get_cache_backend(
 
 class AsyncQueryManager:
     MAX_EVENT_COUNT = 100
+    LONG_POLL_BLOCK_MS = 500
     STATUS_PENDING = "pending"
     STATUS_RUNNING = "running"
     STATUS_ERROR = "error"
@@ -112,6 +114,8 @@ class AsyncQueryManager:
         self._jwt_cookie_domain: Optional[str]
         self._jwt_cookie_samesite: Optional[Literal["None", "Lax", "Strict"]] = None
         self._jwt_secret: str
+        self._long_poll_timeout: int = 0
+        self._stream_reader: Optional[AsyncEventStreamReader] = None
         self._load_chart_data_into_cache_job: Any = None
         # pylint: disable=invalid-name
         self._load_explore_json_into_cache_job: Any = None
@@ -146,6 +150,8 @@ class AsyncQueryManager:
         self._jwt_cookie_samesite = config["GLOBAL_ASYNC_QUERIES_JWT_COOKIE_SAMESITE"]
         self._jwt_cookie_domain = config["GLOBAL_ASYNC_QUERIES_JWT_COOKIE_DOMAIN"]
         self._jwt_secret = config["GLOBAL_ASYNC_QUERIES_JWT_SECRET"]
+        self._long_poll_timeout = config["GLOBAL_ASYNC_QUERIES_LONG_POLL_TIMEOUT"]
+        self._stream_reader = None
 
         if config["GLOBAL_ASYNC_QUERIES_REGISTER_REQUEST_HANDLERS"]:
             self.register_request_handlers(app)
@@ -265,22 +271,33 @@ class AsyncQueryManager:
         stream_name = f"{self._stream_prefix}{channel}"
         start_id = increment_id(last_id) if last_id else "-"
         results = self._cache.xrange(stream_name, start_id, "+", self.MAX_EVENT_COUNT)
-        # Decode bytes to strings, decode_responses is not supported at RedisCache and RedisSentinelCache  # noqa: E501
-        if isinstance(self._cache, (RedisSentinelCacheBackend, RedisCacheBackend)):
-            decoded_results = [
-                (
-                    event_id.decode("utf-8"),
-                    {
-                        key.decode("utf-8"): value.decode("utf-8")
-                        for key, value in event_data.items()
-                    },
-                )
-                for event_id, event_data in results
-            ]
-            return (
-                [] if not decoded_results else list(map(parse_event, decoded_results))
+        return [] if not results else list(map(parse_event, decode_entries(results)))
+
+    def wait_for_events(
+        self, channel: str, last_id: Optional[str], timeout: float
+    ) -> list[Optional[dict[str, Any]]]:
+        """
+        Long-poll variant of ``read_events``: when there are no new events, block
+        until one is published to the channel or ``timeout`` seconds elapse.
+
+        The timeout is capped by ``GLOBAL_ASYNC_QUERIES_LONG_POLL_TIMEOUT``, and
+        concurrent pollers in the same process share a single ``XREAD BLOCK``.
+        """
+        events = self.read_events(channel, last_id)
+        timeout = min(timeout, self._long_poll_timeout)
+        if events or timeout <= 0:
+            return events
+
+        if not self._stream_reader:
+            self._stream_reader = AsyncEventStreamReader(
+                cast(RedisCacheBackend | RedisSentinelCacheBackend, self._cache),
+                self.LONG_POLL_BLOCK_MS,
+                self.MAX_EVENT_COUNT,
             )
-        return [] if not results else list(map(parse_event, results))
+
+        stream_name = f"{self._stream_prefix}{channel}"
+        entries = self._stream_reader.read(stream_name, last_id or "0-0", timeout)
+        return list(map(parse_event, entries))
 
     def update_job(
         self, job_metadata: dict[str, Any], status: str, **kwargs: Any
@@ -80,6 +80,15 @@ class RedisCacheBackend(RedisCache):
         count = count or self.MAX_EVENT_COUNT
         return self._cache.xrange(stream_name, start, end, count)
 
+    def xread(
+        self,
+        streams: Dict[str, str],
+        count: Optional[int] = None,
+        block: Optional[int] = None,
+    ) -> List[Any]:
+        count = count or self.MAX_EVENT_COUNT
+        return self._cache.xread(streams, count, block)
+
     @classmethod
     def from_config(cls, config: Dict[str, Any]) -> "RedisCacheBackend":
         kwargs = {
@@ -196,6 +205,15 @@ class RedisSentinelCacheBackend(RedisSentinelCache):
         count = count or self.MAX_EVENT_COUNT
         return self._cache.xrange(stream_name, start, end, count)
 
+    def xread(
+        self,
+        streams: Dict[str, str],
+        count: Optional[int] = None,
+        block: Optional[int] = None,
+    ) -> List[Any]:
+        count = count or self.MAX_EVENT_COUNT
+        return self._cache.xread(streams, count, block)
+
     @classmethod
     def from_config(cls, config: Dict[str, Any]) -> "RedisSentinelCacheBackend":
         kwargs = {
@@ -0,0 +1,177 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+from __future__ import annotations
+
+import logging
+import os
+import threading
+from dataclasses import dataclass, field
+from typing import Any, Optional, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from superset.async_events.cache_backend import (
+        RedisCacheBackend,
+        RedisSentinelCacheBackend,
+    )
+
+logger = logging.getLogger(__name__)
+
+StreamEntry = tuple[str, dict[str, Any]]
+
+
+def _to_str(value: Any) -> Any:
+    return value.decode("utf-8") if isinstance(value, bytes) else value
+
+
+def decode_entries(entries: list[Any]) -> list[StreamEntry]:
+    """
+    Decode Redis stream entries to strings, since ``decode_responses`` is not
+    supported by RedisCache and RedisSentinelCache.
+    """
+    return [
+        (
+            _to_str(entry_id),
+            {_to_str(key): _to_str(value) for key, value in entry_data.items()},
+        )
+        for entry_id, entry_data in entries
+    ]
+
+
+def parse_entry_id(entry_id: str) -> tuple[int, int]:
+    # redis stream IDs are in this format: '1607477697866-0'
+    timestamp, _, sequence = entry_id.partition("-")
+    return int(timestamp), int(sequence or 0)
+
+
+@dataclass
+class _Waiter:
+    stream_name: str
+    last_id: str
+    ready: threading.Event = field(default_factory=threading.Event)
+    entries: list[StreamEntry] = field(default_factory=list)
+
+
+class AsyncEventStreamReader:
+    """
+    Multiplex long-poll requests of a worker process over a single blocking
+    ``XREAD``.
+
+    Every poller waiting on a stream is registered as a waiter. A single reader
+    thread issues ``XREAD BLOCK`` over the streams of all current waiters, starting
+    at the oldest ID any of them has seen, and hands new entries to the matching
+    waiters. The thread exits once there are no waiters left.
+    """
+
+    def __init__(
+        self,
+        cache: RedisCacheBackend | RedisSentinelCacheBackend,
+        block_ms: int,
+        count: int,
+    ) -> None:
+        self._cache = cache
+        self._block_ms = block_ms
+        self._count = count
+        self._lock = threading.Lock()
+        self._waiters: list[_Waiter] = []
+        self._thread: Optional[threading.Thread] = None
+        self._pid = os.getpid()
+
+    def read(self, stream_name: str, last_id: str, timeout: float) -> list[StreamEntry]:
+        """
+        Wait up to ``timeout`` seconds for entries newer than ``last_id``.
+
+        :param stream_name: the Redis stream to read from
+        :param last_id: the last entry ID seen by the caller, exclusive
+        :param timeout: maximum number of seconds to wait
+        :returns: the new entries, or an empty list on timeout
+        """
+        waiter = _Waiter(stream_name, last_id)
+        with self._lock:
+            self._waiters.append(waiter)
+            self._ensure_thread()
+
+        waiter.ready.wait(timeout)
+
+        with self._lock:
+            if waiter in self._waiters:
+                self._waiters.remove(waiter)
+
+        return waiter.entries
+
+    def _ensure_thread(self) -> None:
+        if self._pid != os.getpid():
+            # the reader thread does not survive a fork
+            self._pid = os.getpid()
+            self._thread = None
+
+        if self._thread is None or not self._thread.is_alive():
+            self._thread = threading.Thread(
+                target=self._run,
+                name="async-event-stream-reader",
+                daemon=True,
+            )
+            self._thread.start()
+
+    def _get_streams(self) -> dict[str, str]:
+        streams: dict[str, str] = {}
+        for waiter in self._waiters:
+            current = streams.get(waiter.stream_name)
+            if current is None or parse_entry_id(waiter.last_id) < parse_entry_id(
+                current
+            ):
+                streams[waiter.stream_name] = waiter.last_id
+        return streams
+
+    def _release(self, waiters: list[_Waiter]) -> None:
+        for waiter in waiters:
+            self._waiters.remove(waiter)
+            waiter.ready.set()
+
+    def _dispatch(self, stream_name: str, entries: list[StreamEntry]) -> None:
+        released = []
+        for waiter in self._waiters:
+            if waiter.stream_name != stream_name:
+                continue
+            last_id = parse_entry_id(waiter.last_id)
+            waiter.entries = [
+                entry for entry in entries if parse_entry_id(entry[0]) > last_id
+            ]
+            if waiter.entries:
+                released.append(waiter)
+        self._release(released)
+
+    def _run(self) -> None:
+        while True:
+            with self._lock:
+                if not self._waiters:
+                    self._thread = None
+                    return
+                streams = self._get_streams()
+
+            try:
+                response = self._cache.xread(streams, self._count, self._block_ms)
+            except Exception:  # pylint: disable=broad-except
+                logger.warning("Failed to read async event streams", exc_info=True)
+                with self._lock:
+                    # pollers return empty handed and the client polls again
+                    self._release(list(self._waiters))
+                    self._thread = None
+                return
+
+            with self._lock:
+                for stream_name, entries in response or []:
+                    self._dispatch(_to_str(stream_name), decode_entries(entries))
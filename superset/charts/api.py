@@ -598,6 +598,7 @@ class ChartRestApi(BaseSupersetModelRestApi):
 
         # Don't shrink the image if thumb_size is not specified
         thumb_size = rison_dict.get("thumb_size") or window_size
+        image_format = rison_dict.get("format", "png")
 
         chart = cast(Slice, self.datamodel.get(pk, self._base_filters))
         if not chart:
@@ -605,7 +606,9 @@ class ChartRestApi(BaseSupersetModelRestApi):
 
         chart_url = get_url_path("Superset.slice", slice_id=chart.id)
         screenshot_obj = ChartScreenshot(chart_url, chart.digest)
-        cache_key = screenshot_obj.get_cache_key(window_size, thumb_size)
+        cache_key = screenshot_obj.get_cache_key(
+            window_size, thumb_size, image_format=image_format
+        )
         cache_payload = (
             screenshot_obj.get_from_cache_key(cache_key) or ScreenshotCachePayload()
         )
@@ -632,6 +635,7 @@ class ChartRestApi(BaseSupersetModelRestApi):
                 window_size=window_size,
                 thumb_size=thumb_size,
                 force=force,
+                image_format=image_format,
             )
             return build_response(202)
         return build_response(200)
@@ -684,7 +688,7 @@ class ChartRestApi(BaseSupersetModelRestApi):
             if cache_payload.status == StatusValues.UPDATED:
                 return Response(
                     FileWrapper(cache_payload.get_image()),
-                    mimetype="image/png",
+                    mimetype=cache_payload.get_mimetype(),
                     direct_passthrough=True,
                 )
         return self.response_404()
@@ -26,7 +26,7 @@ In order to do that, we reproduce the post-processing in Python for these chart
 
 import logging
 from io import StringIO
-from typing import Any, Optional, TYPE_CHECKING, Union
+from typing import Any, Callable, Optional, TYPE_CHECKING, Union
 
 import numpy as np
 import pandas as pd
@@ -61,6 +61,88 @@ def get_column_key(label: tuple[str, ...], metrics: list[str]) -> tuple[Any, ...
     return tuple(parts)
 
 
+def get_groupby_aggfunc(aggfunc: str) -> Union[str, Callable[..., Any]]:
+    """
+    Return the name of the aggregation when `groupby` implements it natively, since
+    passing the function would call it once per group.
+    """
+    func = pivot_v2_aggfunc_map[aggfunc]
+    return func.__name__ if func in GROUPBY_AGGREGATIONS else func
+
+
+def add_subtotals(  # pylint: disable=too-many-locals
+    df: pd.DataFrame,
+    aggfunc: str,
+    metric_name: str,
+    axis: int = 0,
+    values: Optional[pd.DataFrame] = None,
+) -> pd.DataFrame:
+    """
+    Add a subtotal after each group of rows (or columns), and a total at the end.
+
+    Groups are the prefixes of the MultiIndex labels. The subtotals of all groups
+    of a level are computed in a single `groupby` over ``values``, which defaults
+    to the DataFrame itself, and are put in place with a single `take`.
+    """
+    values = df if values is None else values
+    how = get_groupby_aggfunc(aggfunc)
+    if axis == 1:
+        labels, grouped = df.columns, values.T
+    else:
+        labels, grouped = df.index, values
+    nlevels = labels.nlevels
+    size = len(labels)
+
+    # groups of each level, numbered in order of appearance
+    codes = [
+        pd.MultiIndex.from_arrays(
+            [labels.get_level_values(i) for i in range(level)]
+        ).factorize()[0]
+        for level in range(1, nlevels)
+    ]
+
+    # sort keys, putting each subtotal after the members of its group, and the
+    # total last
+    keys = [*codes, np.zeros(size, dtype=int), np.arange(size)]
+    subtotals = []
+    subtotal_labels: list[tuple[Any, ...]] = []
+    for level in range(nlevels):
+        if level == 0:
+            subtotal = grouped.agg(how).to_frame().T
+            first_positions = np.array([0])
+        else:
+            subtotal = grouped.groupby(codes[level - 1]).agg(how)
+            _, first_positions = np.unique(codes[level - 1], return_index=True)
+        count = len(subtotal)
+
+        for i, key in enumerate(keys):
+            if i < level:
+                group_key = key[first_positions]
+            elif i == level:
+                group_key = np.full(count, size)
+            else:
+                group_key = np.zeros(count, dtype=int)
+            keys[i] = np.concatenate([key, group_key])
+
+        total = metric_name if level == 0 else __("Subtotal")
+        depth = nlevels - level - 1
+        subtotal_labels.extend(
+            (*labels[position][:level], total, *([""] * depth))
+            for position in first_positions
+        )
+        subtotals.append(subtotal.T if axis == 1 else subtotal)
+
+    subtotal_index = pd.MultiIndex.from_tuples(subtotal_labels, names=labels.names)
+    if axis == 1:
+        result = pd.concat(
+            [df, pd.concat(subtotals, axis=1).set_axis(subtotal_index, axis=1)],
+            axis=1,
+        )
+    else:
+        result = pd.concat([df, pd.concat(subtotals).set_axis(subtotal_index, axis=0)])
+    return result.take(np.lexsort(keys[::-1]), axis=axis)
+
+
 def pivot_df(  # pylint: disable=too-many-locals, too-many-arguments, too-many-statements, too-many-branches  # noqa: C901
     df: pd.DataFrame,
     rows: list[str],
@@ -96,7 +178,7 @@ def pivot_df(  # pylint: disable=too-many-locals, too-many-arguments, too-many-s
             index=rows,
             columns=columns,
             values=metrics,
-            aggfunc=pivot_v2_aggfunc_map[aggfunc],
+            aggfunc=get_groupby_aggfunc(aggfunc),
             margins=False,
         )
     else:
@@ -153,9 +235,7 @@ def pivot_df(  # pylint: disable=too-many-locals, too-many-arguments, too-many-s
         df.columns = pd.MultiIndex.from_tuples([(str(i),) for i in df.columns])
 
     if show_rows_total:
-        # add subtotal for each group and overall total; we start from the
-        # overall group, and iterate deeper into subgroups
-        groups = df.columns
+        # add subtotal for each group and overall total
         if not apply_metrics_on_rows:
             for col in df.columns:
                 # we need to replace the temporary placeholder with either a string
@@ -168,44 +248,16 @@ def pivot_df(  # pylint: disable=too-many-locals, too-many-arguments, too-many-s
             # when we applied metrics on rows, we switched the columns and rows
             # so checking column type doesn't apply. Replace everything with np.nan
             df.replace("SUPERSET_PANDAS_NAN", np.nan, inplace=True)
-        for level in range(df.columns.nlevels):
-            subgroups = {group[:level] for group in groups}
-            for subgroup in subgroups:
-                slice_ = df.columns.get_loc(subgroup)
-                subtotal = pivot_v2_aggfunc_map[aggfunc](df.iloc[:, slice_], axis=1)
-                depth = df.columns.nlevels - len(subgroup) - 1
-                total = metric_name if level == 0 else __("Subtotal")
-                subtotal_name = tuple([*subgroup, total, *([""] * depth)])  # noqa: C409
-                # insert column after subgroup
-                df.insert(int(slice_.stop), subtotal_name, subtotal)
+        df = add_subtotals(df, aggfunc, metric_name, axis=1)
 
     if rows and show_columns_total:
-        # add subtotal for each group and overall total; we start from the
-        # overall group, and iterate deeper into subgroups
-        groups = df.index
-        for level in range(df.index.nlevels):
-            subgroups = {group[:level] for group in groups}
-            for subgroup in subgroups:
-                try:
-                    slice_ = df.index.get_loc(subgroup)
-                except Exception:  # pylint: disable=broad-except
-                    logger.exception(
-                        "Error getting location for subgroup %s from %s",
-                        subgroup,
-                        groups,
-                    )
-                    raise
-
-                subtotal = pivot_v2_aggfunc_map[aggfunc](
-                    df.iloc[slice_, :].apply(pd.to_numeric, errors="coerce"), axis=0
-                )
-                depth = groups.nlevels - len(subgroup) - 1
-                total = metric_name if level == 0 else __("Subtotal")
-                subtotal.name = tuple([*subgroup, total, *([""] * depth)])  # noqa: C409
-                # insert row after subgroup
-                df = pd.concat(
-                    [df[: slice_.stop], subtotal.to_frame().T, df[slice_.stop :]]
-                )
+        # add subtotal for each group and overall total
+        df = add_subtotals(
+            df,
+            aggfunc,
+            metric_name,
+            values=df.apply(pd.to_numeric, errors="coerce"),
+        )
 
     # if we want to apply the metrics on the rows we need to pivot the
     # dataframe back
@@ -254,6 +306,18 @@ pivot_v2_aggfunc_map = {
 }
 
 
+# aggregations computed by `groupby` without calling a Python function per group
+GROUPBY_AGGREGATIONS = {
+    pd.Series.count,
+    pd.Series.max,
+    pd.Series.mean,
+    pd.Series.median,
+    pd.Series.min,
+    pd.Series.nunique,
+    pd.Series.sum,
+}
+
+
 def pivot_table_v2(
     df: pd.DataFrame,
     form_data: dict[str, Any],
@@ -61,6 +61,7 @@ screenshot_query_schema = {
         "force": {"type": "boolean"},
         "window_size": width_height_schema,
         "thumb_size": width_height_schema,
+        "format": {"type": "string", "enum": ["png", "webp"]},
     },
 }
 get_export_ids_schema = {"type": "array", "items": {"type": "integer"}}
@@ -1509,6 +1510,14 @@ class ChartDataResponseResult(Schema):
         required=False,
         allow_none=True,
     )
+    post_processing_stats = fields.List(
+        fields.Dict(),
+        metadata={
+            "description": "Duration, input and output shape and peak memory of "
+            "each post-processing operation. Only returned in debug mode."
+        },
+        required=False,
+    )
 
 
 class ChartDataResponseSchema(Schema):
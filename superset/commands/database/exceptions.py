@@ -182,6 +182,11 @@ class DatabaseTablesUnexpectedError(CommandException):
     message = _("Unexpected error occurred, please check your logs for details")
 
 
+class DatabaseMetadataSearchUnexpectedError(CommandException):
+    status = 422
+    message = _("Unexpected error occurred, please check your logs for details")
+
+
 class NoValidatorConfigFoundError(SupersetErrorException):
     status = 422
     message = _("no SQL validator is configured")
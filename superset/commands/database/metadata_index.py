@@ -0,0 +1,140 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+from __future__ import annotations
+
+import logging
+from typing import cast
+
+from superset.commands.base import BaseCommand
+from superset.commands.database.exceptions import DatabaseNotFoundError
+from superset.daos.database import DatabaseDAO
+from superset.daos.metadata_index import MetadataIndexDAO
+from superset.databases import metadata_cache
+from superset.db_engine_specs.base import GenericDBException, SchemaTable
+from superset.distributed_lock import KeyValueDistributedLock
+from superset.exceptions import (
+    CreateKeyValueDistributedLockFailedException,
+    OAuth2RedirectError,
+)
+from superset.models.core import Database
+from superset.utils.decorators import transaction
+
+logger = logging.getLogger(__name__)
+
+
+class CrawlDatabaseMetadataCommand(BaseCommand):
+    """
+    Crawl the tables, views and columns of every schema of a database into the
+    metadata index.
+
+    Each schema is read in bulk by the DB engine spec and committed on its own, so
+    that a failing schema doesn't prevent the others from being indexed. Schemas
+    being indexed by a concurrent crawl are skipped, and schemas that no longer
+    exist are removed from the index.
+    """
+
+    _model: Database
+
+    def __init__(self, db_id: int):
+        self._db_id = db_id
+
+    def run(self) -> None:
+        self.validate()
+        for catalog in self._get_catalog_names():
+            schemas = self._model.get_all_schema_names(catalog=catalog, force=True)
+            for schema in sorted(schemas):
+                try:
+                    tables = self._get_schema_tables(catalog, schema)
+                except OAuth2RedirectError:
+                    # the crawler can't act on behalf of a user
+                    raise
+                except GenericDBException:
+                    logger.warning(
+                        "Error crawling schema %s of catalog %s",
+                        schema,
+                        catalog or "(default)",
+                        exc_info=True,
+                    )
+                    continue
+                try:
+                    # concurrent crawls of a database would index a new schema twice
+                    with KeyValueDistributedLock(
+                        "metadata_index_sync",
+                        database_id=self._db_id,
+                        catalog=catalog,
+                        schema=schema,
+                    ):
+                        self._sync_schema(catalog, schema, tables)
+                except CreateKeyValueDistributedLockFailedException:
+                    logger.info(
+                        "Schema %s of catalog %s is being indexed by another crawl",
+                        schema,
+                        catalog or "(default)",
+                    )
+            self._delete_schemas(catalog, schemas)
+
+    def validate(self) -> None:
+        # the crawler runs in the background, on behalf of no user
+        self._model = cast(
+            Database,
+            DatabaseDAO.find_by_id(self._db_id, skip_base_filter=True),
+        )
+        if not self._model:
+            raise DatabaseNotFoundError()
+
+    def _get_catalog_names(self) -> set[str | None]:
+        if not self._model.db_engine_spec.supports_catalog:
+            return {None}
+        if (
+            self._model.db_engine_spec.supports_cross_catalog_queries
+            or self._model.allow_multi_catalog
+        ):
+            return self._model.get_all_catalog_names(force=True)
+        return {self._model.get_default_catalog()}
+
+    def _get_schema_tables(
+        self,
+        catalog: str | None,
+        schema: str,
+    ) -> list[SchemaTable]:
+        with self._model.get_inspector(catalog=catalog, schema=schema) as inspector:
+            return self._model.db_engine_spec.get_schema_tables(
+                self._model,
+                inspector,
+                schema,
+            )
+
+    @transaction()
+    def _sync_schema(
+        self,
+        catalog: str | None,
+        schema: str,
+        tables: list[SchemaTable],
+    ) -> None:
+        counts = MetadataIndexDAO.sync_schema(self._db_id, catalog, schema, tables)
+        logger.info(
+            "Indexed schema %s of database %s: %s",
+            schema,
+            self._db_id,
+            ", ".join(f"{count} {change}" for change, count in counts.items()),
+        )
+        if any(counts.values()):
+            metadata_cache.invalidate_schema(self._model, catalog, schema)
+
+    @transaction()
+    def _delete_schemas(self, catalog: str | None, schemas: set[str]) -> None:
+        MetadataIndexDAO.delete_schemas(self._db_id, catalog, keep=schemas)
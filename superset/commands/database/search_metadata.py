@@ -0,0 +1,241 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+from __future__ import annotations
+
+import logging
+from typing import Any, cast
+
+from flask import current_app
+
+from superset.commands.base import BaseCommand
+from superset.commands.database.exceptions import (
+    DatabaseMetadataSearchUnexpectedError,
+    DatabaseNotFoundError,
+)
+from superset.daos.database import DatabaseDAO
+from superset.daos.metadata_index import MetadataIndexDAO
+from superset.databases.search_index import (
+    get_search_index,
+    MetadataSearchIndex,
+    SearchEntry,
+    SearchMatch,
+)
+from superset.exceptions import SupersetException
+from superset.extensions import security_manager
+from superset.models.core import Database
+from superset.utils.core import DatasourceName
+
+logger = logging.getLogger(__name__)
+
+
+class SearchDatabaseMetadataCommand(BaseCommand):
+    """
+    Search the tables, views and columns of a database by name.
+
+    When a schema is given it is searched even if it wasn't crawled, using its table
+    and view names; otherwise the first ``METADATA_SEARCH_MAX_SCHEMAS`` schemas of
+    the metadata index are searched. Only the schemas and tables accessible by the
+    user are returned.
+    """
+
+    _model: Database
+
+    def __init__(  # pylint: disable=too-many-arguments
+        self,
+        db_id: int,
+        query: str,
+        catalog_name: str | None = None,
+        schema_name: str | None = None,
+        include_columns: bool = True,
+        page: int = 0,
+        page_size: int = 100,
+    ):
+        self._db_id = db_id
+        self._query = query
+        self._catalog_name = catalog_name
+        self._schema_name = schema_name
+        self._include_columns = include_columns
+        self._page = page
+        self._page_size = page_size
+
+    def run(self) -> dict[str, Any]:
+        self.validate()
+        catalog = self._catalog_name or self._model.get_default_catalog()
+        schemas = sorted(self._get_schema_names(catalog))
+        max_schemas = current_app.config["METADATA_SEARCH_MAX_SCHEMAS"]
+        truncated = len(schemas) > max_schemas
+        if truncated:
+            logger.info(
+                "Searching %i of the %i schemas of database %i",
+                max_schemas,
+                len(schemas),
+                self._model.id,
+            )
+            schemas = schemas[:max_schemas]
+        try:
+            matches: list[tuple[str, SearchMatch]] = []
+            for schema in schemas:
+                index = self._get_search_index(catalog, schema)
+                matches.extend(
+                    (schema, match)
+                    for match in self._filter_accessible(
+                        catalog,
+                        schema,
+                        index.search(self._query, self._include_columns),
+                    )
+                )
+        except SupersetException:
+            raise
+        except Exception as ex:
+            raise DatabaseMetadataSearchUnexpectedError(str(ex)) from ex
+
+        matches.sort(
+            key=lambda item: (
+                -item[1].score,
+                item[1].entry.name,
+                item[0],
+                item[1].entry.table,
+            )
+        )
+        start = self._page * self._page_size
+        return {
+            "count": len(matches),
+            "truncated": truncated,
+            "result": [
+                {
+                    "type": match.entry.type,
+                    "value": match.entry.name,
+                    "catalog": catalog,
+                    "schema": schema,
+                    "table": match.entry.table,
+                    "score": match.score,
+                }
+                for schema, match in matches[start : start + self._page_size]
+            ],
+        }
+
+    def validate(self) -> None:
+        self._model = cast(Database, DatabaseDAO.find_by_id(self._db_id))
+        if not self._model:
+            raise DatabaseNotFoundError()
+
+    def _get_schema_names(self, catalog: str | None) -> set[str]:
+        if self._schema_name:
+            schemas = {self._schema_name}
+        else:
+            schemas = MetadataIndexDAO.get_schema_names(
+                self._model.id,
+                catalog,
+                max_age=current_app.config["METADATA_INDEX_MAX_AGE"],
+            )
+        return security_manager.get_schemas_accessible_by_user(
+            self._model,
+            catalog,
+            schemas,
+        )
+
+    def _get_search_index(
+        self,
+        catalog: str | None,
+        schema: str,
+    ) -> MetadataSearchIndex:
+        max_age = current_app.config["METADATA_INDEX_MAX_AGE"]
+        indexed_schema = (
+            MetadataIndexDAO.find_schema(self._model.id, catalog, schema, max_age)
+            if max_age is not None
+            else None
+        )
+        if indexed_schema is None:
+            return get_search_index(
+                self._model.id,
+                catalog,
+                schema,
+                None,
+                lambda: self._build_live_index(catalog, schema),
+            )
+
+        def build() -> MetadataSearchIndex:
+            entries = []
+            for table in indexed_schema.tables:
+                entries.append(SearchEntry(table.table_name, None, table.table_type))
+                entries.extend(
+                    SearchEntry(table.table_name, column["column_name"], "column")
+                    for column in table.columns
+                )
+            return MetadataSearchIndex(entries)
+
+        return get_search_index(
+            self._model.id,
+            catalog,
+            schema,
+            indexed_schema.crawled_on.isoformat(),
+            build,
+        )
+
+    def _build_live_index(
+        self,
+        catalog: str | None,
+        schema: str,
+    ) -> MetadataSearchIndex:
+        table_names = self._model.get_all_table_names_in_schema(
+            catalog=catalog,
+            schema=schema,
+            cache=self._model.table_cache_enabled,
+            cache_timeout=self._model.table_cache_timeout,
+        )
+        view_names = self._model.get_all_view_names_in_schema(
+            catalog=catalog,
+            schema=schema,
+            cache=self._model.table_cache_enabled,
+            cache_timeout=self._model.table_cache_timeout,
+        )
+        # the names may be raw (unserialized) cached results, see
+        # TablesDatabaseCommand
+        return MetadataSearchIndex(
+            [
+                SearchEntry(DatasourceName(*name).table, None, "table")
+                for name in table_names
+            ]
+            + [
+                SearchEntry(DatasourceName(*name).table, None, "view")
+                for name in view_names
+            ]
+        )
+
+    def _filter_accessible(
+        self,
+        catalog: str | None,
+        schema: str,
+        matches: list[SearchMatch],
+    ) -> list[SearchMatch]:
+        if not matches:
+            return matches
+        accessible = {
+            datasource_name.table
+            for datasource_name in security_manager.get_datasources_accessible_by_user(
+                database=self._model,
+                catalog=catalog,
+                schema=schema,
+                datasource_names=sorted(
+                    {
+                        DatasourceName(match.entry.table, schema, catalog)
+                        for match in matches
+                    }
+                ),
+            )
+        }
+        return [match for match in matches if match.entry.table in accessible]
@@ -20,6 +20,7 @@ from __future__ import annotations
 import logging
 from typing import Any, cast
 
+from flask import current_app
 from sqlalchemy.orm import lazyload, load_only
 
 from superset.commands.base import BaseCommand
@@ -29,6 +30,7 @@ from superset.commands.database.exceptions import (
 )
 from superset.connectors.sqla.models import SqlaTable
 from superset.daos.database import DatabaseDAO
+from superset.daos.metadata_index import MetadataIndexDAO
 from superset.exceptions import SupersetException
 from superset.extensions import db, security_manager
 from superset.models.core import Database
@@ -56,42 +58,18 @@ class TablesDatabaseCommand(BaseCommand):
         self.validate()
         self._catalog_name = self._catalog_name or self._model.get_default_catalog()
         try:
+            table_names, view_names = self._get_indexed_names() or self._get_names()
             tables = security_manager.get_datasources_accessible_by_user(
                 database=self._model,
                 catalog=self._catalog_name,
                 schema=self._schema_name,
-                datasource_names=sorted(
-                    # get_all_table_names_in_schema may return raw (unserialized) cached
-                    # results, so we wrap them as DatasourceName objects here instead of
-                    # directly in the method to ensure consistency.
-                    DatasourceName(*datasource_name)
-                    for datasource_name in self._model.get_all_table_names_in_schema(
-                        catalog=self._catalog_name,
-                        schema=self._schema_name,
-                        force=self._force,
-                        cache=self._model.table_cache_enabled,
-                        cache_timeout=self._model.table_cache_timeout,
-                    )
-                ),
+                datasource_names=sorted(table_names),
             )
-
             views = security_manager.get_datasources_accessible_by_user(
                 database=self._model,
                 catalog=self._catalog_name,
                 schema=self._schema_name,
-                datasource_names=sorted(
-                    # get_all_view_names_in_schema may return raw (unserialized) cached
-                    # results, so we wrap them as DatasourceName objects here instead of
-                    # directly in the method to ensure consistency.
-                    DatasourceName(*datasource_name)
-                    for datasource_name in self._model.get_all_view_names_in_schema(
-                        catalog=self._catalog_name,
-                        schema=self._schema_name,
-                        force=self._force,
-                        cache=self._model.table_cache_enabled,
-                        cache_timeout=self._model.table_cache_timeout,
-                    )
-                ),
+                datasource_names=sorted(view_names),
             )
 
             extra_dict_by_name = {
@@ -142,6 +120,63 @@ class TablesDatabaseCommand(BaseCommand):
         except Exception as ex:
             raise DatabaseTablesUnexpectedError(str(ex)) from ex
 
+    def _get_names(self) -> tuple[list[DatasourceName], list[DatasourceName]]:
+        """
+        Return the names of the tables and views of the schema, read from the
+        database.
+        """
+        # get_all_table_names_in_schema and get_all_view_names_in_schema may return
+        # raw (unserialized) cached results, so we wrap them as DatasourceName objects
+        # here instead of directly in the methods to ensure consistency.
+        table_names = [
+            DatasourceName(*datasource_name)
+            for datasource_name in self._model.get_all_table_names_in_schema(
+                catalog=self._catalog_name,
+                schema=self._schema_name,
+                force=self._force,
+                cache=self._model.table_cache_enabled,
+                cache_timeout=self._model.table_cache_timeout,
+            )
+        ]
+        view_names = [
+            DatasourceName(*datasource_name)
+            for datasource_name in self._model.get_all_view_names_in_schema(
+                catalog=self._catalog_name,
+                schema=self._schema_name,
+                force=self._force,
+                cache=self._model.table_cache_enabled,
+                cache_timeout=self._model.table_cache_timeout,
+            )
+        ]
+        return table_names, view_names
+
+    def _get_indexed_names(
+        self,
+    ) -> tuple[list[DatasourceName], list[DatasourceName]] | None:
+        """
+        Return the names of the tables and views of the schema, read from the
+        metadata index, or None if the schema wasn't crawled recently.
+        """
+        max_age = current_app.config["METADATA_INDEX_MAX_AGE"]
+        if self._force or max_age is None:
+            return None
+
+        indexed_schema = MetadataIndexDAO.find_schema(
+            self._model.id,
+            self._catalog_name,
+            self._schema_name,
+            max_age=max_age,
+        )
+        if indexed_schema is None:
+            return None
+
+        names: dict[str, list[DatasourceName]] = {"table": [], "view": []}
+        for table in indexed_schema.tables:
+            names[table.table_type].append(
+                DatasourceName(table.table_name, self._schema_name, self._catalog_name)
+            )
+        return names["table"], names["view"]
+
     def validate(self) -> None:
         self._model = cast(Database, DatabaseDAO.find_by_id(self._db_id))
         if not self._model:
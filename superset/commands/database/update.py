@@ -40,6 +40,7 @@ from superset.commands.database.ssh_tunnel.exceptions import (
 from superset.commands.database.ssh_tunnel.update import UpdateSSHTunnelCommand
 from superset.commands.database.sync_permissions import SyncPermissionsCommand
 from superset.daos.database import DatabaseDAO
+from superset.databases import metadata_cache
 from superset.databases.ssh_tunnel.models import SSHTunnel
 from superset.exceptions import OAuth2RedirectError
 from superset.models.core import Database
@@ -96,6 +97,7 @@ class UpdateDatabaseCommand(BaseCommand):
         database = DatabaseDAO.update(self._model, self._properties)
         database.set_sqlalchemy_uri(database.sqlalchemy_uri)
         ssh_tunnel = self._handle_ssh_tunnel(database)
+        metadata_cache.invalidate_database(database)
         new_catalog = database.get_default_catalog()
 
         # update assets when the database catalog changes, if the database was not
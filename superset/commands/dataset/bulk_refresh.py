@@ -0,0 +1,421 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+import logging
+from collections import defaultdict
+from concurrent.futures import as_completed, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from functools import partial
+from typing import Any, Callable, NamedTuple, Optional, Union
+
+from flask import current_app, g
+from flask_appbuilder.security.sqla.models import User
+from sqlalchemy.exc import NoSuchTableError
+
+from superset import db, security_manager
+from superset.commands.base import BaseCommand
+from superset.commands.dataset.exceptions import (
+    DatasetForbiddenError,
+    DatasetNotFoundError,
+    DatasetRefreshFailedError,
+)
+from superset.connectors.sqla.models import (
+    MetadataResult,
+    SqlaTable,
+    SqlMetric,
+    TableColumn,
+)
+from superset.connectors.sqla.utils import (
+    get_virtual_table_metadata,
+    resolve_column_types,
+)
+from superset.daos.database import DatabaseDAO
+from superset.daos.dataset import DatasetDAO
+from superset.databases import metadata_cache
+from superset.db_engine_specs.base import MetricType
+from superset.exceptions import SupersetSecurityException
+from superset.models.core import Database
+from superset.sql.parse import Table
+from superset.superset_typing import ResultSetColumnType
+from superset.utils.core import override_user
+from superset.utils.decorators import on_error, transaction
+
+logger = logging.getLogger(__name__)
+
+
+class DatasetSource(NamedTuple):
+    """
+    The fields of a dataset needed to read its metadata, outside of its session.
+    """
+
+    id: int
+    database_id: int
+    catalog: Optional[str]
+    schema: Optional[str]
+    table_name: str
+    is_virtual: bool
+    normalize_columns: bool
+
+
+class DatasetMetadata(NamedTuple):
+    columns: list[ResultSetColumnType]
+    metrics: list[MetricType]
+
+
+@dataclass
+class BulkRefreshResult:
+    refreshed: dict[int, MetadataResult] = field(default_factory=dict)
+    failed: dict[int, str] = field(default_factory=dict)
+
+
+def fetch_schema_metadata(
+    database: Database,
+    catalog: Optional[str],
+    schema: Optional[str],
+    sources: list[DatasetSource],
+) -> dict[int, Union[DatasetMetadata, Exception]]:
+    """
+    Read the metadata of the physical datasets of a schema with a single inspector,
+    listing the tables and views of the schema once instead of once per dataset.
+
+    :param database: The database of the datasets
+    :param catalog: The catalog of the datasets
+    :param schema: The schema of the datasets
+    :param sources: The datasets
+    :returns: The metadata of each dataset, or the error reading it
+    """
+    db_engine_spec = database.db_engine_spec
+    results: dict[int, Union[DatasetMetadata, Exception]] = {}
+    with database.get_inspector(catalog=catalog, schema=schema) as inspector:
+        names = db_engine_spec.get_table_names(
+            database, inspector, schema
+        ) | db_engine_spec.get_view_names(database, inspector, schema)
+        columns: dict[str, list[ResultSetColumnType]] = {}
+        for source in sources:
+            table = Table(source.table_name, schema or None, catalog)
+            if source.table_name not in names:
+                results[source.id] = NoSuchTableError(table)
+                continue
+            try:
+                if source.table_name not in columns:
+                    columns[source.table_name] = db_engine_spec.get_columns(
+                        inspector, table, database.schema_options
+                    )
+                results[source.id] = DatasetMetadata(
+                    resolve_column_types(
+                        database,
+                        [dict(col) for col in columns[source.table_name]],  # type: ignore
+                        source.normalize_columns,
+                    ),
+                    db_engine_spec.get_metrics(database, inspector, table),
+                )
+            except Exception as ex:  # pylint: disable=broad-except
+                results[source.id] = ex
+    return results
+
+
+def fetch_database_metadata(
+    database_id: int,
+    sources: list[DatasetSource],
+) -> dict[int, Union[DatasetMetadata, Exception]]:
+    """
+    Read the metadata of the datasets of a database, one schema at a time.
+
+    :param database_id: The id of the database of the datasets
+    :param sources: The datasets
+    :returns: The metadata of each dataset, or the error reading it
+    """
+    database = DatabaseDAO.find_by_id(database_id, skip_base_filter=True)
+    assert database
+    results: dict[int, Union[DatasetMetadata, Exception]] = {}
+    schemas: dict[tuple[Optional[str], Optional[str]], list[DatasetSource]]
+    schemas = defaultdict(list)
+    for source in sources:
+        if not source.is_virtual:
+            schemas[(source.catalog, source.schema)].append(source)
+            continue
+        try:
+            dataset = DatasetDAO.find_by_id(source.id, skip_base_filter=True)
+            assert dataset
+            results[source.id] = DatasetMetadata(
+                get_virtual_table_metadata(dataset),
+                database.get_metrics(
+                    Table(source.table_name, source.schema or None, source.catalog)
+                ),
+            )
+        except Exception as ex:  # pylint: disable=broad-except
+            results[source.id] = ex
+
+    for (catalog, schema), schema_sources in schemas.items():
+        try:
+            results.update(
+                fetch_schema_metadata(database, catalog, schema, schema_sources)
+            )
+        except Exception as ex:  # pylint: disable=broad-except
+            results.update({source.id: ex for source in schema_sources})
+    return results
+
+
+class ColumnChanges(NamedTuple):
+    result: MetadataResult
+    inserts: list[dict[str, Any]]
+    updates: list[dict[str, Any]]
+    deleted: list[TableColumn]
+    date_column: Optional[str]
+
+
+def diff_columns(
+    model: SqlaTable,
+    old_columns: list[TableColumn],
+    new_columns: list[ResultSetColumnType],
+) -> ColumnChanges:
+    """
+    Diff the columns of a dataset against its metadata, like
+    `SqlaTable.fetch_metadata`, without changing the dataset.
+
+    Calculated columns are kept, and become physical columns if the metadata has a
+    column with their name.
+
+    :param model: The dataset
+    :param old_columns: The columns of the dataset
+    :param new_columns: The metadata of the columns of the dataset
+    :returns: The rows to insert and update, and the columns to delete
+    """
+    changes = ColumnChanges(MetadataResult(), [], [], [], None)
+    old_columns_by_name = {column.column_name: column for column in old_columns}
+    for col in new_columns:
+        old_column = old_columns_by_name.pop(col["column_name"], None)
+        if not old_column:
+            changes.result.added.append(col["column_name"])
+            new_column = TableColumn(
+                column_name=col["column_name"],
+                type=col["type"],
+                groupby=True,
+                filterable=True,
+                database=model.database,
+            )
+            new_column.is_dttm = new_column.is_temporal
+            if col.get("comment"):
+                new_column.description = col["comment"]
+            model.db_engine_spec.alter_new_orm_column(new_column)
+            values = {
+                key: getattr(new_column, key)
+                for key in TableColumn.update_from_object_fields
+            }
+            changes.inserts.append(
+                {
+                    "table_id": model.id,
+                    **{
+                        key: value for key, value in values.items() if value is not None
+                    },
+                }
+            )
+        else:
+            if old_column.type != col["type"]:
+                changes.result.modified.append(col["column_name"])
+            values = {
+                "type": col["type"],
+                "expression": "",
+                "groupby": True,
+                "filterable": True,
+            }
+            if col.get("comment"):
+                values["description"] = col["comment"]
+            if any(getattr(old_column, key) != value for key, value in values.items()):
+                changes.updates.append({"id": old_column.id, **values})
+            new_column = TableColumn(
+                type=col["type"],
+                is_dttm=old_column.is_dttm,
+                database=model.database,
+            )
+        if not changes.date_column and new_column.is_temporal:
+            changes = changes._replace(date_column=col["column_name"])
+
+    for name, old_column in old_columns_by_name.items():
+        if not old_column.expression:
+            changes.result.removed.append(name)
+            changes.deleted.append(old_column)
+    return changes
+
+
+class BulkRefreshDatasetsCommand(BaseCommand):
+    """
+    Refresh the columns and metrics of many datasets at once.
+
+    The metadata of the datasets is read concurrently across databases, with one
+    pass per schema, and the columns of all the datasets are then diffed in memory
+    and written with bulk inserts, updates and deletes. Datasets whose metadata
+    can't be read are reported as failed, without failing the others.
+    """
+
+    def __init__(
+        self,
+        model_ids: list[int],
+        progress: Optional[Callable[[int, int], None]] = None,
+    ):
+        """
+        :param model_ids: The ids of the datasets to refresh
+        :param progress: Called with the number of datasets whose metadata has been
+            read, and the total, every time a database is done
+        """
+        self._model_ids = model_ids
+        self._models: Optional[list[SqlaTable]] = None
+        self._progress = progress
+
+    @transaction(on_error=partial(on_error, reraise=DatasetRefreshFailedError))
+    def run(self) -> BulkRefreshResult:
+        self.validate()
+        assert self._models is not None
+        result = BulkRefreshResult()
+        metadata: dict[int, DatasetMetadata] = {}
+        for model_id, value in self._fetch_metadata().items():
+            if isinstance(value, Exception):
+                logger.warning(
+                    "Error reading the metadata of dataset %s: %s", model_id, value
+                )
+                result.failed[model_id] = str(value)
+            else:
+                metadata[model_id] = value
+
+        models = [model for model in self._models if model.id in metadata]
+        changes = self._sync_columns(models, metadata)
+        for model, change in zip(models, changes, strict=True):
+            result.refreshed[model.id] = change.result
+            if not model.main_dttm_col:
+                model.main_dttm_col = change.date_column
+            model.add_missing_metrics(
+                [SqlMetric(**metric) for metric in metadata[model.id].metrics]
+            )
+            # Apply config supplied mutations.
+            current_app.config["SQLA_TABLE_MUTATOR"](model)
+
+        for database, catalog, schema in {
+            (model.database, model.catalog, model.schema)
+            for model in models
+            if not model.sql
+        }:
+            metadata_cache.invalidate_schema(database, catalog, schema)
+        return result
+
+    def _fetch_metadata(self) -> dict[int, Union[DatasetMetadata, Exception]]:
+        """
+        Read the metadata of the datasets, concurrently across databases.
+        """
+        assert self._models is not None
+        sources: dict[int, list[DatasetSource]] = defaultdict(list)
+        for model in self._models:
+            sources[model.database_id].append(
+                DatasetSource(
+                    id=model.id,
+                    database_id=model.database_id,
+                    catalog=model.catalog,
+                    schema=model.schema,
+                    table_name=model.table_name,
+                    is_virtual=bool(model.sql),
+                    normalize_columns=model.normalize_columns,
+                )
+            )
+
+        total = len(self._models)
+        results: dict[int, Union[DatasetMetadata, Exception]] = {}
+
+        def report(database_results: dict[Any, Any]) -> None:
+            results.update(database_results)
+            logger.info("Read the metadata of %d/%d datasets", len(results), total)
+            if self._progress:
+                self._progress(len(results), total)
+
+        max_workers = min(
+            len(sources),
+            current_app.config["DATASET_BULK_REFRESH_MAX_CONCURRENT_DATABASES"],
+        )
+        if max_workers <= 1:
+            for database_id, database_sources in sources.items():
+                report(fetch_database_metadata(database_id, database_sources))
+            return results
+
+        flask_app = current_app._get_current_object()  # pylint: disable=protected-access
+        user: Optional[User] = getattr(g, "user", None)
+
+        def fetch(
+            database_id: int,
+            database_sources: list[DatasetSource],
+        ) -> dict[int, Union[DatasetMetadata, Exception]]:
+            with flask_app.app_context(), override_user(user):
+                return fetch_database_metadata(database_id, database_sources)
+
+        with ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="dataset-refresh"
+        ) as executor:
+            futures = [
+                executor.submit(fetch, database_id, database_sources)
+                for database_id, database_sources in sources.items()
+            ]
+            for future in as_completed(futures):
+                report(future.result())
+        return results
+
+    @staticmethod
+    def _sync_columns(
+        models: list[SqlaTable],
+        metadata: dict[int, DatasetMetadata],
+    ) -> list[ColumnChanges]:
+        """
+        Diff the columns of the datasets against their metadata, and write the
+        changes in bulk.
+        """
+        old_columns: dict[int, list[TableColumn]] = defaultdict(list)
+        for column in db.session.query(TableColumn).filter(
+            TableColumn.table_id.in_([model.id for model in models])
+        ):
+            old_columns[column.table_id].append(column)
+
+        changes = [
+            diff_columns(model, old_columns[model.id], metadata[model.id].columns)
+            for model in models
+        ]
+        deleted = [column for change in changes for column in change.deleted]
+        updates = [values for change in changes for values in change.updates]
+        inserts = [values for change in changes for values in change.inserts]
+        if deleted:
+            db.session.query(TableColumn).filter(
+                TableColumn.id.in_([column.id for column in deleted])
+            ).delete(synchronize_session=False)
+        db.session.bulk_update_mappings(TableColumn, updates)
+        db.session.bulk_insert_mappings(TableColumn, inserts)
+
+        # the bulk operations bypass the session, reload what they changed
+        for column in deleted:
+            db.session.expunge(column)
+        for model in models:
+            db.session.expire(model, ["columns"])
+            for column in old_columns[model.id]:
+                if column not in deleted:
+                    db.session.expire(column)
+
+        return changes
+
+    def validate(self) -> None:
+        # Validate/populate model exists
+        self._models = DatasetDAO.find_by_ids(self._model_ids)
+        if not self._models or len(self._models) != len(set(self._model_ids)):
+            raise DatasetNotFoundError()
+        # Check ownership
+        for model in self._models:
+            try:
+                security_manager.raise_for_ownership(model)
+            except SupersetSecurityException as ex:
+                raise DatasetForbiddenError() from ex
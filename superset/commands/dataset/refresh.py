@@ -29,6 +29,7 @@ from superset.commands.dataset.exceptions import (
 )
 from superset.connectors.sqla.models import SqlaTable
 from superset.daos.dataset import DatasetDAO
+from superset.databases import metadata_cache
 from superset.exceptions import SupersetSecurityException
 from superset.utils.decorators import on_error, transaction
 
@@ -45,6 +46,12 @@ class RefreshDatasetCommand(BaseCommand):
         self.validate()
         assert self._model
         self._model.fetch_metadata()
+        if not self._model.sql:
+            metadata_cache.invalidate_schema(
+                self._model.database,
+                self._model.catalog,
+                self._model.schema,
+            )
         return self._model
 
     def validate(self) -> None:
@@ -15,15 +15,20 @@
 # specific language governing permissions and limitations
 # under the License.
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from typing import Any, Optional, Union
 from uuid import UUID
 
 import pandas as pd
 from celery.exceptions import SoftTimeLimitExceeded
+from flask_appbuilder.security.sqla.models import User
 
 from superset import app, db, security_manager
+from superset.charts.client_processing import apply_client_processing
+from superset.charts.schemas import ChartDataQueryContextSchema
 from superset.commands.base import BaseCommand
+from superset.commands.chart.data.get_data_command import ChartDataCommand
 from superset.commands.dashboard.permalink.create import CreateDashboardPermalinkCommand
 from superset.commands.exceptions import CommandException, UpdateFailedError
 from superset.commands.report.alert import AlertCommand
@@ -52,7 +57,7 @@ from superset.daos.report import (
 from superset.dashboards.permalink.types import DashboardPermalinkState
 from superset.errors import ErrorLevel, SupersetError, SupersetErrorType
 from superset.exceptions import SupersetErrorsException, SupersetException
-from superset.extensions import feature_flag_manager, machine_auth_provider_factory
+from superset.extensions import feature_flag_manager
 from superset.reports.models import (
     ReportDataFormat,
     ReportExecutionLog,
@@ -193,7 +198,6 @@ class BaseReportState:
     def _get_url(
         self,
         user_friendly: bool = False,
-        result_format: Optional[ChartDataResultFormat] = None,
         **kwargs: Any,
     ) -> str:
         """
@@ -201,17 +205,6 @@ class BaseReportState:
         """
         force = "true" if self._report_schedule.force_screenshot else "false"
         if self._report_schedule.chart:
-            if result_format in {
-                ChartDataResultFormat.CSV,
-                ChartDataResultFormat.JSON,
-            }:
-                return get_url_path(
-                    "ChartDataRestApi.get_data",
-                    pk=self._report_schedule.chart_id,
-                    format=result_format.value,
-                    type=ChartDataResultType.POST_PROCESSED.value,
-                    force=force,
-                )
             return get_url_path(
                 "ExploreView.root",
                 user_friendly=user_friendly,
@@ -352,10 +345,7 @@ class BaseReportState:
                 for url in urls
             ]
         try:
-            imges = []
-            for screenshot in screenshots:
-                if imge := screenshot.get_screenshot(user=user):
-                    imges.append(imge)
+            imges = [imge for imge in self._take_screenshots(screenshots, user) if imge]
         except SoftTimeLimitExceeded as ex:
             logger.warning("A timeout occurred while taking a screenshot.")
             raise ReportScheduleScreenshotTimeout() from ex
@@ -367,6 +357,44 @@ class BaseReportState:
             raise ReportScheduleScreenshotFailedError()
         return imges
 
+    @staticmethod
+    def _take_screenshots(
+        screenshots: list[Union[ChartScreenshot, DashboardScreenshot]],
+        user: User,
+    ) -> list[Optional[bytes]]:
+        """
+        Take the screenshots, up to ALERT_REPORTS_MAX_CONCURRENT_SCREENSHOTS at a
+        time, returning them in the same order.
+        """
+        max_workers = min(
+            len(screenshots), app.config["ALERT_REPORTS_MAX_CONCURRENT_SCREENSHOTS"]
+        )
+        if max_workers <= 1:
+            return [screenshot.get_screenshot(user=user) for screenshot in screenshots]
+
+        flask_app = app._get_current_object()  # pylint: disable=protected-access
+
+        def take_screenshot(
+            screenshot: Union[ChartScreenshot, DashboardScreenshot],
+        ) -> Optional[bytes]:
+            with flask_app.app_context():
+                return screenshot.get_screenshot(user=user)
+
+        executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="report-screenshot"
+        )
+        try:
+            futures = [
+                executor.submit(take_screenshot, screenshot)
+                for screenshot in screenshots
+            ]
+            # the soft time limit is raised in this thread while waiting
+            return [future.result() for future in futures]
+        finally:
+            # drop the screenshots that haven't started yet if one failed or timed
+            # out, and wait for those in progress so their browsers are closed
+            executor.shutdown(wait=True, cancel_futures=True)
+
     def _get_pdf(self) -> bytes:
         """
         Get chart or dashboard pdf
@@ -377,22 +405,64 @@ class BaseReportState:
 
         return pdf
 
+    def _get_chart_data(
+        self, user: User, result_format: ChartDataResultFormat
+    ) -> list[dict[str, Any]]:
+        """
+        Run the chart's saved query context in process as the executor, returning
+        the post-processed query results the chart data API would respond with.
+        """
+        chart = self._report_schedule.chart
+        json_body = json.loads(chart.query_context)
+        json_body["result_format"] = result_format.value
+        json_body["result_type"] = ChartDataResultType.POST_PROCESSED.value
+        json_body["force"] = self._report_schedule.force_screenshot
+
+        try:
+            form_data = json.loads(chart.params)
+        except (TypeError, json.JSONDecodeError):
+            form_data = {}
+
+        with override_user(user):
+            if result_format in ChartDataResultFormat.table_like() and (
+                not security_manager.can_access("can_csv", "Superset")
+            ):
+                raise ReportScheduleCsvFailedError(
+                    f"User {user.username} is not allowed to export CSV"
+                )
+
+            query_context = ChartDataQueryContextSchema().load(json_body)
+            command = ChartDataCommand(query_context)
+            command.validate()
+            result = command.run()
+            # Post-process the data so it matches the data presented in the chart,
+            # e.g. for pivot tables
+            result = apply_client_processing(
+                result, form_data, query_context.datasource
+            )
+        return result["queries"]
+
     def _get_csv_data(self) -> bytes:
-        url = self._get_url(result_format=ChartDataResultFormat.CSV)
         _, username = get_executor(
             executors=app.config["ALERT_REPORTS_EXECUTORS"],
             model=self._report_schedule,
         )
         user = security_manager.find_user(username)
-        auth_cookies = machine_auth_provider_factory.instance.get_auth_cookies(user)
 
         if self._report_schedule.chart.query_context is None:
             logger.warning("No query context found, taking a screenshot to generate it")
             self._update_query_context()
 
         try:
-            logger.info("Getting chart from %s as user %s", url, user.username)
-            csv_data = get_chart_csv_data(chart_url=url, auth_cookies=auth_cookies)
+            logger.info(
+                "Getting chart %s data as user %s",
+                self._report_schedule.chart_id,
+                user.username,
+            )
+            queries = self._get_chart_data(user, ChartDataResultFormat.CSV)
+            csv_data = get_chart_csv_data(
+                queries, encoding=app.config["CSV_EXPORT"].get("encoding", "utf-8")
+            )
         except SoftTimeLimitExceeded as ex:
             raise ReportScheduleCsvTimeout() from ex
         except Exception as ex:
@@ -407,21 +477,24 @@ class BaseReportState:
         """
         Return data as a Pandas dataframe, to embed in notifications as a table.
         """
-        url = self._get_url(result_format=ChartDataResultFormat.JSON)
         _, username = get_executor(
             executors=app.config["ALERT_REPORTS_EXECUTORS"],
             model=self._report_schedule,
         )
         user = security_manager.find_user(username)
-        auth_cookies = machine_auth_provider_factory.instance.get_auth_cookies(user)
 
         if self._report_schedule.chart.query_context is None:
             logger.warning("No query context found, taking a screenshot to generate it")
             self._update_query_context()
 
         try:
-            logger.info("Getting chart from %s as user %s", url, user.username)
-            dataframe = get_chart_dataframe(url, auth_cookies)
+            logger.info(
+                "Getting chart %s data as user %s",
+                self._report_schedule.chart_id,
+                user.username,
+            )
+            queries = self._get_chart_data(user, ChartDataResultFormat.JSON)
+            dataframe = get_chart_dataframe(queries)
         except SoftTimeLimitExceeded as ex:
             raise ReportScheduleDataFrameTimeout() from ex
         except Exception as ex:
@@ -452,6 +525,14 @@ class BaseReportState:
                 "saved, and an error occurred when fetching it via a screenshot. "
                 "Please try loading the chart and saving it again."
             ) from ex
+        # the query context is saved by the web server rendering the chart, in
+        # another session
+        db.session.refresh(self._report_schedule.chart)
+        if self._report_schedule.chart.query_context is None:
+            raise ReportScheduleCsvFailedError(
+                "Unable to fetch data because the chart has no query context "
+                "saved. Please try loading the chart and saving it again."
+            )
 
     def _get_log_data(self) -> HeaderDataType:
         chart_id = None
@@ -17,13 +17,23 @@
 from __future__ import annotations
 
 import logging
-from typing import Any, cast, TypedDict
+from collections.abc import Iterator
+from typing import cast, TypedDict, Union
 
+import msgpack
 import pandas as pd
+import pyarrow as pa
 from flask_babel import gettext as __
 
-from superset import app, db, results_backend, results_backend_use_msgpack
+from superset import (
+    app,
+    db,
+    is_feature_enabled,
+    results_backend,
+    results_backend_use_msgpack,
+)
 from superset.commands.base import BaseCommand
+from superset.db_engine_specs.lib import has_custom_method
 from superset.errors import ErrorLevel, SupersetError, SupersetErrorType
 from superset.exceptions import SupersetErrorException, SupersetSecurityException
 from superset.models.sql_lab import Query
@@ -40,7 +50,7 @@ logger = logging.getLogger(__name__)
 class SqlExportResult(TypedDict):
     query: Query
     count: int
-    data: list[Any]
+    data: Union[bytes, Iterator[bytes]]
 
 
 class SqlResultExportCommand(BaseCommand):
@@ -82,6 +92,32 @@ class SqlResultExportCommand(BaseCommand):
                 status=403,
             ) from ex
 
+    def _get_arrow_table(self, blob: bytes) -> pa.Table | None:
+        """
+        Read the Arrow table stored in the results backend, if it can be exported
+        as is.
+
+        Results are only stored as Arrow when msgpack serialization is enabled, and
+        engines that expand nested columns on read need the pandas path so the
+        export matches what is displayed in SQL Lab.
+        """
+        if not results_backend_use_msgpack:
+            return None
+
+        db_engine_spec = self._query.database.db_engine_spec
+        if is_feature_enabled("PRESTO_EXPAND_DATA") and has_custom_method(
+            db_engine_spec, "expand_data"
+        ):
+            return None
+
+        payload = msgpack.loads(utils.zlib_decompress(blob, decode=False), raw=False)
+        reader = pa.BufferReader(payload["data"])
+        table = pa.ipc.open_stream(reader).read_all()
+        if not csv.can_write_arrow_csv(table, **config["CSV_EXPORT"]):
+            return None
+
+        return table
+
     def run(
         self,
     ) -> SqlExportResult:
@@ -92,6 +128,17 @@ class SqlResultExportCommand(BaseCommand):
                 "Fetching CSV from results backend [%s]", self._query.results_key
             )
             blob = results_backend.get(self._query.results_key)
+        if blob and (table := self._get_arrow_table(blob)) is not None:
+            logger.info("Using pyarrow to stream CSV")
+            return {
+                "query": self._query,
+                "count": table.num_rows,
+                "data": csv.arrow_table_to_escaped_csv(
+                    table,
+                    batch_size=config["CSV_EXPORT_ARROW_BATCH_SIZE"],
+                    **config["CSV_EXPORT"],
+                ),
+            }
         if blob:
             logger.info("Decompressing")
             payload = utils.zlib_decompress(
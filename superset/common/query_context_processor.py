@@ -19,6 +19,7 @@ from __future__ import annotations
 import copy
 import logging
 import re
+from dataclasses import asdict
 from datetime import datetime
 from typing import Any, cast, ClassVar, TYPE_CHECKING, TypedDict
 
@@ -221,7 +222,7 @@ class QueryContextProcessor:
         )
         cache.df.columns = [unescape_separator(col) for col in cache.df.columns.values]
 
-        return {
+        payload: dict[str, Any] = {
             "cache_key": cache_key,
             "cached_dttm": cache.cache_dttm,
             "cache_timeout": self.get_cache_timeout(),
@@ -241,6 +242,13 @@ class QueryContextProcessor:
             "to_dttm": query_obj.to_dttm,
             "label_map": label_map,
         }
+        if app.debug:
+            # only available when post-processing ran for this request, not when
+            # the result was read from the cache
+            payload["post_processing_stats"] = [
+                asdict(stats) for stats in query_obj.post_processing_stats
+            ]
+        return payload
 
     def query_cache_key(self, query_obj: QueryObject, **kwargs: Any) -> str | None:
         """
@@ -262,6 +270,17 @@ class QueryContextProcessor:
         )
         return cache_key
 
+    def post_processing_memo_key(self, query_obj: QueryObject) -> str | None:
+        """
+        Returns the cache key of a QueryObject without its post-processing, which
+        identifies the DataFrame its post-processing operations are run on
+        """
+        if not query_obj.post_processing:
+            return None
+        query_obj_without_post_processing = copy.copy(query_obj)
+        query_obj_without_post_processing.post_processing = []
+        return self.query_cache_key(query_obj_without_post_processing)
+
     def get_query_result(self, query_object: QueryObject) -> QueryResult:
         """Returns a pandas dataframe based on the query object"""
         query_context = self._query_context
@@ -270,11 +289,16 @@ class QueryContextProcessor:
         # support multiple queries from different data sources.
 
         query = ""
+        query_obj = query_object.to_dict()
+        if query_object.post_processing and not query_object.time_offsets:
+            # leading post-processing operations may be pushed down to the database,
+            # time offsets are joined to the result before post-processing
+            query_obj["post_processing"] = query_object.post_processing
         if isinstance(query_context.datasource, Query):
             # todo(hugh): add logic to manage all sip68 models here
-            result = query_context.datasource.exc_query(query_object.to_dict())
+            result = query_context.datasource.exc_query(query_obj)
         else:
-            result = query_context.datasource.query(query_object.to_dict())
+            result = query_context.datasource.query(query_obj)
             query = result.query + ";\n\n"
 
         df = result.df
@@ -296,7 +320,12 @@ class QueryContextProcessor:
 
             # Re-raising QueryObjectValidationError
             try:
-                df = query_object.exec_post_processing(df)
+                df = query_object.exec_post_processing(
+                    df,
+                    start=result.post_processing_pushed,
+                    memo_key=self.post_processing_memo_key(query_object),
+                    force=query_context.force,
+                )
             except InvalidPostProcessingError as ex:
                 raise QueryObjectValidationError(ex.message) from ex
 
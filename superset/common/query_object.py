@@ -18,7 +18,9 @@
 from __future__ import annotations
 
 import logging
+from dataclasses import asdict
 from datetime import datetime
+from functools import partial
 from pprint import pformat
 from typing import Any, NamedTuple, TYPE_CHECKING
 
@@ -29,12 +31,23 @@ from pandas import DataFrame
 
 from superset import feature_flag_manager
 from superset.common.chart_data import ChartDataResultType
+from superset.common.utils.post_processing_engines import (
+    Checkpoint,
+    get_post_processing_engine,
+    PostProcessingStats,
+)
+from superset.common.utils.post_processing_memo import (
+    get_data_key,
+    get_post_processing_memo,
+    get_prefix_keys,
+    PostProcessingMemo,
+)
 from superset.exceptions import (
     InvalidPostProcessingError,
     QueryClauseValidationException,
     QueryObjectValidationError,
 )
-from superset.extensions import event_logger
+from superset.extensions import event_logger, stats_logger_manager
 from superset.sql.parse import sanitize_clause
 from superset.superset_typing import Column, Metric, OrderBy
 from superset.utils import json, pandas_postprocessing
@@ -98,6 +111,7 @@ class QueryObject:  # pylint: disable=too-many-instance-attributes
     order_desc: bool
     orderby: list[OrderBy]
     post_processing: list[dict[str, Any]]
+    post_processing_stats: list[PostProcessingStats]
     result_type: ChartDataResultType | None
     row_limit: int | None
     row_offset: int
@@ -202,6 +216,7 @@ class QueryObject:  # pylint: disable=too-many-instance-attributes
     ) -> None:
         post_processing = post_processing or []
         self.post_processing = [post_proc for post_proc in post_processing if post_proc]
+        self.post_processing_stats = []
 
     def _init_series_columns(
         self,
@@ -443,19 +458,35 @@ class QueryObject:  # pylint: disable=too-many-instance-attributes
 
         return md5_sha_from_dict(cache_dict, default=json_int_dttm_ser, ignore_nan=True)
 
-    def exec_post_processing(self, df: DataFrame) -> DataFrame:
+    def exec_post_processing(
+        self,
+        df: DataFrame,
+        start: int = 0,
+        memo_key: str | None = None,
+        force: bool = False,
+    ) -> DataFrame:
         """
         Perform post processing operations on DataFrame.
 
         :param df: DataFrame returned from database model.
+        :param start: index of the first operation to perform, the operations
+                 before it were already performed by the database
+        :param memo_key: cache key of the query without its post processing. When
+                 set, the results of the leading operations on the DataFrame are
+                 memoized, and the longest memoized prefix of the operations
+                 previously run on the same data is reused.
+        :param force: don't reuse memoized results, memoize the new ones only
         :return: new DataFrame to which all post processing operations have been
                  applied
         :raises QueryObjectValidationError: If the post processing operation
                  is incorrect
         """
         logger.debug("post_processing: \n %s", pformat(self.post_processing))
-        with event_logger.log_context(f"{self.__class__.__name__}.post_processing"):
-            for post_process in self.post_processing:
+        with event_logger.log_context(
+            f"{self.__class__.__name__}.post_processing"
+        ) as log:
+            operations = self.post_processing[start:]
+            for post_process in operations:
                 operation = post_process.get("operation")
                 if not operation:
                     raise InvalidPostProcessingError(
@@ -468,6 +499,66 @@ class QueryObject:  # pylint: disable=too-many-instance-attributes
                             type=operation,
                         )
                     )
-                options = post_process.get("options", {})
-                df = getattr(pandas_postprocessing, operation)(df, **options)
+            checkpoint: Checkpoint | None = None
+            memo = get_post_processing_memo() if memo_key and operations else None
+            # results are only reused for the same data, not for every run of the
+            # query
+            data_key = (
+                get_data_key(memo_key, df) if memo is not None and memo_key else None
+            )
+            if memo is not None and data_key is not None:
+                # keys cover the operations pushed down to the database too
+                prefix_keys = get_prefix_keys(data_key, self.post_processing)[start:]
+                reused = 0
+                if not force:
+                    df, reused = self._get_memoized_prefix(memo, prefix_keys, df)
+                operations = operations[reused:]
+                checkpoint = partial(self._memoize, memo, prefix_keys[reused:])
+
+            engine = get_post_processing_engine()
+            df = engine.execute(df, operations, checkpoint)
+            self.post_processing_stats = engine.stats
+            if engine.stats:
+                # one event log record per operation
+                log(
+                    explode="operations",
+                    operations=json.dumps([asdict(stats) for stats in engine.stats]),
+                )
+            self._log_post_processing_stats()
             return df
+
+    @staticmethod
+    def _get_memoized_prefix(
+        memo: PostProcessingMemo, prefix_keys: list[str], df: DataFrame
+    ) -> tuple[DataFrame, int]:
+        """
+        Return the memoized result of the longest prefix of the operations and its
+        number of operations, or the DataFrame and 0 if no prefix is memoized.
+        """
+        for count in range(len(prefix_keys), 0, -1):
+            memoized = memo.get(prefix_keys[count - 1])
+            if memoized is not None:
+                stats_logger_manager.instance.incr("post_processing.memo.hit")
+                return memoized, count
+        stats_logger_manager.instance.incr("post_processing.memo.miss")
+        return df, 0
+
+    @staticmethod
+    def _memoize(
+        memo: PostProcessingMemo,
+        prefix_keys: list[str],
+        count: int,
+        df: DataFrame,
+    ) -> None:
+        if count:
+            memo.set(prefix_keys[count - 1], df)
+
+    def _log_post_processing_stats(self) -> None:
+        stats_logger = stats_logger_manager.instance
+        for stats in self.post_processing_stats:
+            prefix = f"post_processing.{stats.operation}"
+            stats_logger.timing(f"{prefix}.duration", stats.duration_ms)
+            stats_logger.gauge(f"{prefix}.rows_in", stats.rows_in)
+            stats_logger.gauge(f"{prefix}.rows_out", stats.rows_out)
+            if stats.memory_peak_bytes is not None:
+                stats_logger.gauge(f"{prefix}.memory_peak", stats.memory_peak_bytes)
@@ -0,0 +1,573 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+"""
+Engines executing post-processing chains.
+
+Post-processing operations are defined by the functions of
+``superset.utils.pandas_postprocessing``, which take and return a pandas
+DataFrame. The engine used to run them is selected by the
+``POST_PROCESSING_ENGINE`` config:
+
+- ``pandas`` runs every operation on pandas DataFrames.
+- ``arrow`` runs the operations it supports on a single Arrow table, without
+  materializing intermediate DataFrames, and converts the table back to pandas
+  only when the chain is done or an operation isn't supported. Options without
+  an Arrow equivalent fall back to the pandas implementation, so both engines
+  return the same DataFrame, except that rows with equal sort keys keep their
+  original order.
+
+Engines measure the duration, the input and output shape and, when
+``POST_PROCESSING_TRACE_MEMORY`` is enabled, the peak memory of every operation.
+"""
+
+from __future__ import annotations
+
+import time
+import tracemalloc
+from collections.abc import Iterator, Sequence
+from contextlib import contextmanager
+from dataclasses import dataclass
+from functools import partial, reduce
+from typing import Any, Callable, Optional, TypeVar, Union
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+from flask import current_app
+
+from superset.constants import PandasAxis
+from superset.utils import pandas_postprocessing
+
+T = TypeVar("T", pd.DataFrame, "_ArrowFrame")
+
+# called with the number of operations applied and the resulting DataFrame
+Checkpoint = Callable[[int, pd.DataFrame], None]
+
+ARROW_ERRORS = (pa.ArrowInvalid, pa.ArrowNotImplementedError, pa.ArrowTypeError)
+
+# Arrow types of object columns that are converted back to the same values
+ARROW_OBJECT_TYPES = (
+    pa.types.is_boolean,
+    pa.types.is_date32,
+    pa.types.is_decimal,
+    pa.types.is_null,
+    pa.types.is_string,
+)
+
+# numpy aggregates and their Arrow counterpart, when computed by pandas on a Series
+ARROW_AGGREGATES: dict[str, tuple[str, Optional[pc.FunctionOptions]]] = {
+    "max": ("max", None),
+    "mean": ("mean", None),
+    "min": ("min", None),
+    "nanmax": ("max", None),
+    "nanmean": ("mean", None),
+    "nanmin": ("min", None),
+    "nansum": ("sum", pc.ScalarAggregateOptions(min_count=0)),
+    "sum": ("sum", pc.ScalarAggregateOptions(min_count=0)),
+}
+
+ARROW_CUMULATIVE_FUNCTIONS: dict[str, Callable[..., pa.Array]] = {
+    "max": pc.cumulative_max,
+    "min": pc.cumulative_min,
+    "prod": pc.cumulative_prod,
+    "sum": pc.cumulative_sum,
+}
+
+
+def _no_checkpoint(count: int, df: pd.DataFrame) -> None:
+    pass
+
+
+@dataclass
+class PostProcessingStats:
+    """
+    Measurements of a single post-processing operation.
+    """
+
+    operation: str
+    engine: str
+    duration_ms: float
+    rows_in: int
+    columns_in: int
+    rows_out: int
+    columns_out: int
+    # peak of the memory allocated by the operation, when memory is traced
+    memory_peak_bytes: Optional[int] = None
+
+
+class PostProcessingEngine:
+    """
+    Run post-processing operations on a DataFrame.
+
+    The measurements of the operations run by `execute` are kept in `stats`.
+    """
+
+    name = "pandas"
+
+    def __init__(self, trace_memory: bool = False) -> None:
+        self.trace_memory = trace_memory
+        self.stats: list[PostProcessingStats] = []
+
+    def execute(
+        self,
+        df: pd.DataFrame,
+        operations: list[dict[str, Any]],
+        checkpoint: Optional[Checkpoint] = None,
+    ) -> pd.DataFrame:
+        """
+        Apply validated post-processing operations to a DataFrame.
+
+        :param df: the DataFrame to post-process
+        :param operations: the post-processing operations, in order
+        :param checkpoint: called with the number of operations applied and the
+               resulting DataFrame, whenever the engine holds an intermediate
+               result as a pandas DataFrame, and with the final result
+        :returns: the post-processed DataFrame
+        """
+        self.stats = []
+        with self._tracing_memory():
+            return self._execute(df, operations, checkpoint or _no_checkpoint)
+
+    def _execute(
+        self,
+        df: pd.DataFrame,
+        operations: list[dict[str, Any]],
+        checkpoint: Checkpoint,
+    ) -> pd.DataFrame:
+        for count, operation in enumerate(operations, start=1):
+            df = self._measure(
+                operation,
+                PostProcessingEngine.name,
+                df,
+                partial(self.execute_pandas, df, operation),
+            )
+            checkpoint(count, df)
+        return df
+
+    @contextmanager
+    def _tracing_memory(self) -> Iterator[None]:
+        """
+        Trace memory allocations, unless they are already traced or not wanted.
+        """
+        if not self.trace_memory or tracemalloc.is_tracing():
+            yield
+            return
+
+        tracemalloc.start()
+        try:
+            yield
+        finally:
+            tracemalloc.stop()
+
+    def _measure(
+        self,
+        operation: dict[str, Any],
+        engine: str,
+        data: T,
+        run: Callable[[], Optional[T]],
+    ) -> Optional[T]:
+        """
+        Run an operation and record its measurements, unless it returns None.
+        """
+        rows_in, columns_in = data.shape
+        tracing = self.trace_memory and tracemalloc.is_tracing()
+        if tracing:
+            memory_start = tracemalloc.get_traced_memory()[0]
+            tracemalloc.reset_peak()
+        start = time.perf_counter()
+
+        result = run()
+
+        duration_ms = (time.perf_counter() - start) * 1000
+        if result is None:
+            return None
+        rows_out, columns_out = result.shape
+        self.stats.append(
+            PostProcessingStats(
+                operation=operation["operation"],
+                engine=engine,
+                duration_ms=duration_ms,
+                rows_in=rows_in,
+                columns_in=columns_in,
+                rows_out=rows_out,
+                columns_out=columns_out,
+                memory_peak_bytes=(
+                    tracemalloc.get_traced_memory()[1] - memory_start
+                    if tracing
+                    else None
+                ),
+            )
+        )
+        return result
+
+    @staticmethod
+    def execute_pandas(df: pd.DataFrame, operation: dict[str, Any]) -> pd.DataFrame:
+        options = operation.get("options", {})
+        return getattr(pandas_postprocessing, operation["operation"])(df, **options)
+
+
+class _ArrowFrame:
+    """
+    A DataFrame held as an Arrow table, with its pandas index kept aside.
+    """
+
+    def __init__(self, table: pa.Table, index: pd.Index) -> None:
+        self.table = table
+        self.index = index
+
+    @classmethod
+    def from_pandas(cls, df: pd.DataFrame) -> Optional[_ArrowFrame]:
+        """
+        Convert a DataFrame whose columns survive a round trip through Arrow.
+        """
+        columns = df.columns
+        if (
+            isinstance(columns, pd.MultiIndex)
+            or not all(isinstance(col, str) for col in columns)
+            or not columns.is_unique
+            or not all(isinstance(dtype, np.dtype) for dtype in df.dtypes)
+        ):
+            return None
+        try:
+            table = pa.Table.from_pandas(df, preserve_index=False)
+        except (*ARROW_ERRORS, TypeError, ValueError):
+            return None
+
+        for dtype, field in zip(df.dtypes, table.schema, strict=False):
+            if dtype == np.dtype("O") and not any(
+                is_type(field.type) for is_type in ARROW_OBJECT_TYPES
+            ):
+                return None
+        return cls(table.replace_schema_metadata(None), df.index)
+
+    def to_pandas(self) -> pd.DataFrame:
+        df = self.table.to_pandas()
+        df.index = self.index
+        return df
+
+    def is_numeric(self, column: str, temporal: bool = False) -> bool:
+        type_ = self.table.schema.field(column).type
+        return (
+            pa.types.is_integer(type_)
+            or pa.types.is_floating(type_)
+            or (temporal and pa.types.is_temporal(type_))
+        )
+
+    @property
+    def column_names(self) -> list[str]:
+        return self.table.column_names
+
+    @property
+    def shape(self) -> tuple[int, int]:
+        return self.table.num_rows, self.table.num_columns
+
+    def has_columns(self, columns: Any) -> bool:
+        if isinstance(columns, str):
+            columns = [columns]
+        return all(col in self.column_names for col in columns or [])
+
+    def append_columns(
+        self,
+        columns: dict[str, str],
+        arrays: dict[str, pa.Array],
+    ) -> Optional[_ArrowFrame]:
+        """
+        Add or replace columns like `pandas_postprocessing.utils._append_columns`.
+        """
+        table = self.table
+        if all(source == target for source, target in columns.items()):
+            for source, array in arrays.items():
+                table = table.set_column(
+                    table.column_names.index(source), source, array
+                )
+            return _ArrowFrame(table, self.index)
+
+        targets = list(columns.values())
+        if len(set(targets)) != len(targets) or self.has_columns(targets):
+            # pandas would create duplicate columns
+            return None
+        for source, target in columns.items():
+            table = table.append_column(target, arrays[source])
+        return _ArrowFrame(table, self.index)
+
+
+def _arrow_select(
+    frame: _ArrowFrame,
+    columns: Optional[list[str]] = None,
+    exclude: Optional[list[str]] = None,
+    rename: Optional[dict[str, str]] = None,
+) -> Optional[_ArrowFrame]:
+    table = frame.table
+    if columns:
+        if not frame.has_columns(columns):
+            return None
+        table = table.select(columns)
+    if exclude:
+        if not all(col in table.column_names for col in exclude):
+            return None
+        table = table.drop_columns(exclude)
+    if rename is not None:
+        if not frame.has_columns(list(rename)) or not all(
+            isinstance(name, str) for name in rename.values()
+        ):
+            return None
+        table = table.rename_columns(
+            [rename.get(col, col) for col in table.column_names]
+        )
+    return _ArrowFrame(table, frame.index)
+
+
+def _arrow_rename(
+    frame: _ArrowFrame,
+    columns: dict[str, Optional[str]],
+    inplace: bool = False,
+    level: Optional[Any] = None,
+) -> Optional[_ArrowFrame]:
+    if (
+        level is not None
+        or not columns
+        or not frame.has_columns(list(columns))
+        # pandas raises when all labels already exist
+        or all(name in frame.column_names for name in columns.values())
+        or not all(isinstance(name, str) for name in columns.values())
+    ):
+        return None
+    names = [columns.get(col) or col for col in frame.column_names]
+    return _ArrowFrame(frame.table.rename_columns(names), frame.index)
+
+
+def _arrow_sort(
+    frame: _ArrowFrame,
+    is_sort_index: bool = False,
+    by: Optional[Union[list[str], str]] = None,
+    ascending: Union[list[bool], bool] = True,
+) -> Optional[_ArrowFrame]:
+    if is_sort_index:
+        return None
+    if not by:
+        return frame
+    keys = [by] if isinstance(by, str) else list(by)
+    if not frame.has_columns(keys):
+        return None
+    directions = (
+        ascending if isinstance(ascending, Sequence) else [ascending] * len(keys)
+    )
+    if len(directions) != len(keys):
+        return None
+
+    indices = pc.sort_indices(
+        frame.table,
+        sort_keys=[
+            (key, "ascending" if asc else "descending")
+            for key, asc in zip(keys, directions, strict=False)
+        ],
+        null_placement="at_end",
+    )
+    return _ArrowFrame(
+        frame.table.take(indices),
+        frame.index.take(indices.to_numpy()),
+    )
+
+
+def _arrow_aggregate(
+    frame: _ArrowFrame,
+    groupby: list[str],
+    aggregates: dict[str, dict[str, Any]],
+) -> Optional[_ArrowFrame]:
+    if not groupby or not frame.has_columns(groupby):
+        return None
+
+    aggregations: dict[str, tuple[str, str]] = {}
+    for name, agg_obj in (aggregates or {}).items():
+        column = agg_obj.get("column", name)
+        operator = agg_obj.get("operator")
+        if (
+            agg_obj.get("options")
+            or not isinstance(operator, str)
+            or operator not in ARROW_AGGREGATES
+            or not frame.has_columns([column])
+        ):
+            return None
+        func, _ = ARROW_AGGREGATES[operator]
+        if not frame.is_numeric(column, temporal=func in {"min", "max"}):
+            return None
+        aggregations[name] = (column, operator)
+
+    # pandas drops groups with missing keys and sorts groups by their keys
+    table = frame.table.filter(
+        reduce(pc.and_, [pc.is_valid(frame.table[key]) for key in groupby])
+    )
+    grouped = table.group_by(groupby, use_threads=False).aggregate(
+        [
+            (column, *ARROW_AGGREGATES[operator])
+            for column, operator in dict.fromkeys(aggregations.values())
+        ]
+    )
+    grouped = grouped.sort_by([(key, "ascending") for key in groupby])
+    result = pa.table(
+        {
+            **{key: grouped[key] for key in groupby},
+            **{
+                name: grouped[f"{column}_{ARROW_AGGREGATES[operator][0]}"]
+                for name, (column, operator) in aggregations.items()
+            },
+        }
+    )
+    return _ArrowFrame(result, pd.RangeIndex(result.num_rows))
+
+
+def _arrow_cum(
+    frame: _ArrowFrame,
+    operator: str,
+    columns: dict[str, str],
+) -> Optional[_ArrowFrame]:
+    func = ARROW_CUMULATIVE_FUNCTIONS.get(operator)
+    if (
+        func is None
+        or not columns
+        or not frame.has_columns(list(columns))
+        or not all(frame.is_numeric(column) for column in columns)
+    ):
+        return None
+    arrays = {source: func(pc.fill_null(frame.table[source], 0)) for source in columns}
+    return frame.append_columns(columns, arrays)
+
+
+def _arrow_diff(
+    frame: _ArrowFrame,
+    columns: dict[str, str],
+    periods: int = 1,
+    axis: PandasAxis = PandasAxis.ROW,
+) -> Optional[_ArrowFrame]:
+    if (
+        axis != PandasAxis.ROW
+        or not isinstance(periods, int)
+        or not columns
+        or not frame.has_columns(list(columns))
+        or not all(frame.is_numeric(column, temporal=True) for column in columns)
+    ):
+        return None
+    arrays = {
+        source: pc.pairwise_diff(frame.table[source].combine_chunks(), period=periods)
+        for source in columns
+    }
+    return frame.append_columns(columns, arrays)
+
+
+def _arrow_flatten(
+    frame: _ArrowFrame,
+    reset_index: bool = True,
+    drop_levels: Sequence[Union[int, str]] = (),
+) -> Optional[_ArrowFrame]:
+    # columns of an Arrow table are always flat
+    if reset_index and not isinstance(frame.index, pd.RangeIndex):
+        return None
+    return frame
+
+
+ARROW_OPERATIONS: dict[str, Callable[..., Optional[_ArrowFrame]]] = {
+    "aggregate": _arrow_aggregate,
+    "cum": _arrow_cum,
+    "diff": _arrow_diff,
+    "flatten": _arrow_flatten,
+    "rename": _arrow_rename,
+    "select": _arrow_select,
+    "sort": _arrow_sort,
+}
+
+
+class ArrowPostProcessingEngine(PostProcessingEngine):
+    """
+    Run the operations of a chain on Arrow as long as possible.
+
+    Consecutive operations supported by Arrow share a single table, which is only
+    converted back to pandas for operations that need it and at the end of the
+    chain.
+    """
+
+    name = "arrow"
+
+    def _execute(
+        self,
+        df: pd.DataFrame,
+        operations: list[dict[str, Any]],
+        checkpoint: Checkpoint,
+    ) -> pd.DataFrame:
+        frame: Optional[_ArrowFrame] = None
+        # whether operations ran on the table since it was converted from `df`
+        changed = False
+        for count, operation in enumerate(operations, start=1):
+            if operation["operation"] in ARROW_OPERATIONS:
+                if frame is None:
+                    frame = _ArrowFrame.from_pandas(df)
+                if frame is not None:
+                    result = self._measure(
+                        operation,
+                        self.name,
+                        frame,
+                        partial(self.execute_arrow, frame, operation),
+                    )
+                    if result is not None:
+                        frame, changed = result, True
+                        continue
+
+            if frame is not None and changed:
+                df = frame.to_pandas()
+                checkpoint(count - 1, df)
+            frame, changed = None, False
+            df = self._measure(
+                operation,
+                PostProcessingEngine.name,
+                df,
+                partial(self.execute_pandas, df, operation),
+            )
+            checkpoint(count, df)
+
+        if frame is not None and changed:
+            df = frame.to_pandas()
+            checkpoint(len(operations), df)
+        return df
+
+    @staticmethod
+    def execute_arrow(
+        frame: _ArrowFrame,
+        operation: dict[str, Any],
+    ) -> Optional[_ArrowFrame]:
+        """
+        Run an operation on Arrow, or return None if Arrow can't run it.
+        """
+        arrow_operation = ARROW_OPERATIONS[operation["operation"]]
+        try:
+            return arrow_operation(frame, **operation.get("options", {}))
+        except (*ARROW_ERRORS, KeyError, TypeError):
+            return None
+
+
+POST_PROCESSING_ENGINES: dict[str, type[PostProcessingEngine]] = {
+    engine.name: engine for engine in (PostProcessingEngine, ArrowPostProcessingEngine)
+}
+
+
+def get_post_processing_engine() -> PostProcessingEngine:
+    """
+    Return the post-processing engine configured by `POST_PROCESSING_ENGINE`.
+    """
+    name = current_app.config["POST_PROCESSING_ENGINE"]
+    return POST_PROCESSING_ENGINES[name](
+        trace_memory=current_app.config["POST_PROCESSING_TRACE_MEMORY"]
+    )
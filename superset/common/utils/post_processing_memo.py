@@ -0,0 +1,167 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+"""
+Memoization of the intermediate results of post-processing chains.
+
+Charts of a dashboard often run the same query with post-processing chains that
+only differ after a few operations, e.g. the same ``pivot`` and ``flatten``
+followed by different ``rolling`` windows. The DataFrames resulting from every
+prefix of a chain are kept in memory, keyed by the cache key of the query without
+its post-processing, a fingerprint of the data it returned and a hash of the
+operations of the prefix, so that the next chain sharing that prefix only runs the
+operations that differ. Since the data is part of the key, a query returning new
+data never reuses the results computed on the previous data.
+
+The memo is local to each process and bounded by ``POST_PROCESSING_MEMO_SIZE``
+bytes, evicting the least recently used DataFrames first, and DataFrames expire
+after ``POST_PROCESSING_MEMO_TIMEOUT`` seconds.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, NamedTuple, Optional
+
+import pandas as pd
+from flask import current_app
+
+from superset.utils import json
+from superset.utils.hashing import md5_sha_from_str
+
+
+class _MemoEntry(NamedTuple):
+    df: pd.DataFrame
+    size: int
+    expires: float
+
+
+class PostProcessingMemo:
+    """
+    A thread safe LRU map of DataFrames, bounded by their size in memory.
+
+    DataFrames are copied in and out of the memo, since post-processing
+    operations may change the DataFrames they are given.
+    """
+
+    def __init__(self, max_bytes: int, timeout: float) -> None:
+        self.max_bytes = max_bytes
+        self.timeout = timeout
+        self._entries: OrderedDict[str, _MemoEntry] = OrderedDict()
+        self._size = 0
+        self._lock = threading.Lock()
+
+    @property
+    def size(self) -> int:
+        """
+        The memory used by the memoized DataFrames, in bytes.
+        """
+        return self._size
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _pop(self, key: str) -> None:
+        entry = self._entries.pop(key)
+        self._size -= entry.size
+
+    def get(self, key: str) -> Optional[pd.DataFrame]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if entry.expires <= time.monotonic():
+                self._pop(key)
+                return None
+            self._entries.move_to_end(key)
+        return entry.df.copy()
+
+    def set(self, key: str, df: pd.DataFrame) -> None:
+        size = int(df.memory_usage(index=True, deep=True).sum())
+        if size > self.max_bytes:
+            return
+        entry = _MemoEntry(df.copy(), size, time.monotonic() + self.timeout)
+        with self._lock:
+            if key in self._entries:
+                self._pop(key)
+            self._entries[key] = entry
+            self._size += size
+            while self._size > self.max_bytes:
+                self._pop(next(iter(self._entries)))
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
+
+
+def get_data_key(query_key: str, df: pd.DataFrame) -> Optional[str]:
+    """
+    Return the key of the data a query returned, combining the cache key of the
+    query with a fingerprint of the DataFrame, or None if the DataFrame can't be
+    hashed (e.g. it has columns of lists).
+
+    :param query_key: the cache key of the query, without its post-processing
+    :param df: the DataFrame returned by the query
+    :returns: the key of the data
+    """
+    try:
+        rows = pd.util.hash_pandas_object(df, index=True).to_numpy()
+    except TypeError:
+        return None
+    columns = json.dumps([[str(name), str(dtype)] for name, dtype in df.dtypes.items()])
+    data = hashlib.md5(rows.tobytes()).hexdigest()  # noqa: S324
+    return md5_sha_from_str(query_key + columns + data)
+
+
+def get_prefix_keys(query_key: str, operations: list[dict[str, Any]]) -> list[str]:
+    """
+    Return the memo keys of the results of the first 1, 2, ... operations of a
+    chain run on the result of a query.
+
+    :param query_key: the cache key of the query, without its post-processing
+    :param operations: the post-processing operations, in order
+    :returns: the keys of each prefix of the operations, shortest first
+    """
+    return [
+        md5_sha_from_str(
+            query_key + json.dumps(operations[:count], sort_keys=True, default=str)
+        )
+        for count in range(1, len(operations) + 1)
+    ]
+
+
+_memo: Optional[PostProcessingMemo] = None
+_memo_lock = threading.Lock()
+
+
+def get_post_processing_memo() -> Optional[PostProcessingMemo]:
+    """
+    Return the memo of the process, or None if `POST_PROCESSING_MEMO_SIZE` is 0.
+    """
+    global _memo  # pylint: disable=global-statement
+
+    max_bytes = current_app.config["POST_PROCESSING_MEMO_SIZE"]
+    timeout = current_app.config["POST_PROCESSING_MEMO_TIMEOUT"]
+    if not max_bytes:
+        return None
+    with _memo_lock:
+        if _memo is None or (_memo.max_bytes, _memo.timeout) != (max_bytes, timeout):
+            _memo = PostProcessingMemo(max_bytes, timeout)
+        return _memo
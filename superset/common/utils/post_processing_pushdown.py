@@ -0,0 +1,461 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+"""
+Compile window-style post-processing operations into SQL.
+
+The ``rolling``, ``cum``, ``diff``, ``compare``, ``contribution`` and ``rank``
+operations of ``superset.utils.pandas_postprocessing`` only add or replace columns
+of the result, based on values of the same row or on a window of rows. When the
+database supports window functions, the leading operations of a post-processing
+chain are evaluated by wrapping the query in one ``SELECT`` per operation, so the
+web worker doesn't have to pull and process the full result in pandas.
+
+An operation is only pushed down when its outcome is the same as the one of its
+pandas counterpart, e.g. operations that depend on the order of the rows are only
+pushed down when the query is ordered by all of its dimensions. The remainder of
+the chain is executed in pandas. One known difference is that divisions by a zero
+total yield ``NULL`` instead of an infinite value.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Any, Callable, NamedTuple, Optional
+
+import sqlalchemy as sa
+from sqlalchemy.sql.elements import ColumnElement
+from sqlalchemy.sql.expression import Select
+
+from superset.constants import PandasAxis, PandasPostprocessingCompare
+from superset.utils.core import (
+    PostProcessingContributionOrientation,
+    TIME_COMPARISON,
+)
+
+# adds a label to a SQL expression, see `ExploreMixin.make_sqla_column_compatible`
+MakeLabel = Callable[[ColumnElement, str], ColumnElement]
+
+ROLLING_FUNCTIONS: dict[str, Callable[..., ColumnElement]] = {
+    "max": sa.func.max,
+    "mean": sa.func.avg,
+    "min": sa.func.min,
+    "sum": sa.func.sum,
+}
+
+CUMULATIVE_FUNCTIONS: dict[str, Callable[..., ColumnElement]] = {
+    "max": sa.func.max,
+    "min": sa.func.min,
+    "sum": sa.func.sum,
+}
+
+ORDER_LABEL = "pp_order_{}"
+ROW_NUMBER_LABEL = "pp_row_number"
+
+
+class PushdownResult(NamedTuple):
+    sqla_query: Select
+    labels_expected: list[str]
+    operations: int
+
+
+@dataclass
+class _Step:
+    """
+    The columns assigned and dropped by an operation, with the same semantics as
+    ``df[label] = expression``, and the number of leading rows it removes.
+    """
+
+    assign: dict[str, ColumnElement] = field(default_factory=dict)
+    drop: list[str] = field(default_factory=list)
+    skip_rows: int = 0
+
+
+class PostProcessingCompiler:
+    """
+    Wrap a query in window functions equivalent to post-processing operations.
+
+    :param sqla_query: the query whose result is post-processed
+    :param columns: the labels of the result mapped to their name in the query
+    :param metrics: the labels of the numeric columns of the result
+    :param orderby: the labels the query is ordered by, with their direction
+    :param ordered: whether the order of the query is deterministic, which is
+           required for operations that depend on the order of the rows
+    :param make_label: adds an engine compatible label to an expression
+    """
+
+    def __init__(  # pylint: disable=too-many-arguments
+        self,
+        sqla_query: Select,
+        columns: dict[str, str],
+        metrics: list[str],
+        orderby: list[tuple[str, bool]],
+        ordered: bool,
+        make_label: MakeLabel,
+    ) -> None:
+        self._query = sqla_query
+        self._columns = dict(columns)
+        self._numeric = {metric for metric in metrics if metric in columns}
+        self._order = [(sa.column(columns[label]), asc) for label, asc in orderby]
+        self._ordered = ordered
+        self._make_label = make_label
+        self._row_number: Optional[tuple[str, int]] = None
+        self._operations = 0
+
+    @property
+    def operations(self) -> int:
+        return self._operations
+
+    def _col(self, label: str) -> ColumnElement:
+        return sa.column(self._columns[label])
+
+    def _order_by(self) -> list[ColumnElement]:
+        return [sa.asc(col) if asc else sa.desc(col) for col, asc in self._order]
+
+    def _has_columns(self, labels: Any) -> bool:
+        return bool(labels) and all(
+            isinstance(label, str) and label in self._columns for label in labels
+        )
+
+    def _can_append(self, columns: Any) -> bool:
+        """
+        Whether a `{source: target}` mapping is assigned by `_append_columns` without
+        creating duplicate columns.
+        """
+        if not isinstance(columns, dict) or not self._has_columns(columns):
+            return False
+        if all(source == target for source, target in columns.items()):
+            return True
+        targets = list(columns.values())
+        return len(set(targets)) == len(targets) and not any(
+            target in self._columns for target in targets
+        )
+
+    def _rolling(  # pylint: disable=too-many-arguments
+        self,
+        rolling_type: str,
+        columns: dict[str, str],
+        window: Optional[int] = None,
+        rolling_type_options: Optional[dict[str, Any]] = None,
+        center: bool = False,
+        win_type: Optional[str] = None,
+        min_periods: Optional[int] = None,
+    ) -> Optional[_Step]:
+        func = ROLLING_FUNCTIONS.get(rolling_type)
+        if (
+            not self._ordered
+            or func is None
+            or rolling_type_options
+            or center
+            or win_type is not None
+            or not isinstance(window, int)
+            or window <= 0
+            or not self._can_append(columns)
+        ):
+            return None
+        if min_periods is not None and (
+            not isinstance(min_periods, int) or not 0 < min_periods <= window
+        ):
+            return None
+
+        rows = (-(window - 1), 0)
+        order_by = self._order_by()
+        step = _Step(skip_rows=max((min_periods or 0) - 1, 0))
+        for source, target in columns.items():
+            col = self._col(source)
+            count = sa.func.count(col).over(order_by=order_by, rows=rows)
+            value = sa.cast(func(col).over(order_by=order_by, rows=rows), sa.Float)
+            step.assign[target] = sa.case(
+                [(count >= (min_periods or window), value)],
+                else_=sa.null(),
+            )
+        return step
+
+    def _cum(self, operator: str, columns: dict[str, str]) -> Optional[_Step]:
+        func = CUMULATIVE_FUNCTIONS.get(operator)
+        if not self._ordered or func is None or not self._can_append(columns):
+            return None
+
+        order_by = self._order_by()
+        return _Step(
+            assign={
+                target: func(sa.func.coalesce(self._col(source), 0)).over(
+                    order_by=order_by,
+                    rows=(None, 0),
+                )
+                for source, target in columns.items()
+            }
+        )
+
+    def _diff(
+        self,
+        columns: dict[str, str],
+        periods: int = 1,
+        axis: PandasAxis = PandasAxis.ROW,
+    ) -> Optional[_Step]:
+        if (
+            not self._ordered
+            or axis != PandasAxis.ROW
+            or not isinstance(periods, int)
+            or periods == 0
+            or not self._can_append(columns)
+        ):
+            return None
+
+        order_by = self._order_by()
+        step = _Step()
+        for source, target in columns.items():
+            col = self._col(source)
+            if periods > 0:
+                shifted = sa.func.lag(col, periods)
+            else:
+                shifted = sa.func.lead(col, -periods)
+            step.assign[target] = col - shifted.over(order_by=order_by)
+        return step
+
+    def _compare(  # pylint: disable=too-many-arguments
+        self,
+        source_columns: list[str],
+        compare_columns: list[str],
+        compare_type: PandasPostprocessingCompare,
+        drop_original_columns: Optional[bool] = False,
+        precision: Optional[int] = 4,
+    ) -> Optional[_Step]:
+        # percentages and ratios are rounded half to even by pandas, which
+        # databases don't agree on
+        if (
+            compare_type != PandasPostprocessingCompare.DIFF
+            or not self._has_columns(source_columns)
+            or not self._has_columns(compare_columns)
+            or len(source_columns) != len(compare_columns)
+        ):
+            return None
+
+        step = _Step()
+        for s_col, c_col in zip(source_columns, compare_columns, strict=False):
+            label = TIME_COMPARISON.join([compare_type, s_col, c_col])
+            if label in self._columns or label in step.assign:
+                return None
+            step.assign[label] = self._col(s_col) - self._col(c_col)
+        if drop_original_columns:
+            step.drop = source_columns + compare_columns
+        return step
+
+    def _contribution(  # pylint: disable=too-many-arguments
+        self,
+        orientation: Optional[
+            PostProcessingContributionOrientation
+        ] = PostProcessingContributionOrientation.COLUMN,
+        columns: Optional[list[str]] = None,
+        time_shifts: Optional[list[str]] = None,
+        rename_columns: Optional[list[str]] = None,
+        contribution_totals: Optional[dict[str, float]] = None,
+    ) -> Optional[_Step]:
+        # without explicit columns, all numeric columns of the DataFrame are used
+        if (
+            time_shifts
+            or not self._has_columns(columns)
+            or not all(col in self._numeric for col in columns or [])
+        ):
+            return None
+        columns = columns or []
+        rename_columns = rename_columns or columns
+        if len(rename_columns) != len(columns) or len(set(rename_columns)) != len(
+            rename_columns
+        ):
+            return None
+
+        values = [sa.func.coalesce(self._col(col), 0) for col in columns]
+        step = _Step()
+        if orientation == PostProcessingContributionOrientation.COLUMN:
+            for col, value, label in zip(columns, values, rename_columns, strict=False):
+                if not contribution_totals:
+                    total = sa.func.nullif(sa.func.sum(value).over(), 0)
+                elif col_total := contribution_totals.get(col):
+                    total = sa.literal(col_total)
+                else:
+                    step.assign[label] = sa.literal(0)
+                    continue
+                step.assign[label] = sa.cast(value, sa.Float) / total
+            return step
+
+        total = sa.func.nullif(sum(values[1:], values[0]), 0)
+        for col, label in zip(columns, rename_columns, strict=False):
+            step.assign[label] = sa.cast(self._col(col), sa.Float) / total
+        return step
+
+    def _rank(self, metric: str, group_by: Optional[str] = None) -> Optional[_Step]:
+        if not self._has_columns([metric]) or (
+            group_by is not None and not self._has_columns([group_by])
+        ):
+            return None
+
+        col = self._col(metric)
+        partition_by = [self._col(group_by)] if group_by else []
+        # pandas averages the rank of ties and ignores missing values
+        rank = sa.func.rank().over(
+            partition_by=[*partition_by, col.is_(None)],
+            order_by=col,
+        )
+        ties = sa.func.count().over(partition_by=[*partition_by, col])
+        count = sa.func.count(col).over(partition_by=partition_by or None)
+        missing = [col.is_(None), *(part.is_(None) for part in partition_by)]
+        return _Step(
+            assign={
+                "rank": sa.case(
+                    [(sa.or_(*missing), sa.null())],
+                    else_=sa.cast(rank * 2 + ties - 1, sa.Float) / (count * 2),
+                )
+            }
+        )
+
+    def _apply(self, step: _Step) -> None:
+        alias = self._query.alias(f"post_processing_{self._operations}")
+        select_exprs: list[ColumnElement] = []
+        columns: dict[str, str] = {}
+        for label, name in self._columns.items():
+            if label in step.drop:
+                continue
+            if label in step.assign:
+                col = self._make_label(step.assign[label], label)
+                select_exprs.append(col)
+                columns[label] = col.name
+            else:
+                select_exprs.append(sa.column(name))
+                columns[label] = name
+        for label, expr in step.assign.items():
+            if label not in self._columns:
+                col = self._make_label(expr, label)
+                select_exprs.append(col)
+                columns[label] = col.name
+
+        # keep the original order columns, operations may replace them
+        order = []
+        for i, (col, asc) in enumerate(self._order):
+            order_col = self._make_label(col, ORDER_LABEL.format(i))
+            select_exprs.append(order_col)
+            order.append((sa.column(order_col.name), asc))
+
+        row_number = None
+        if step.skip_rows:
+            col = self._make_label(
+                sa.func.row_number().over(order_by=self._order_by()),
+                ROW_NUMBER_LABEL,
+            )
+            select_exprs.append(col)
+            row_number = (col.name, step.skip_rows)
+
+        query = sa.select(select_exprs).select_from(alias)
+        self._query = self._filter_rows(query)
+        self._columns = columns
+        self._numeric = (self._numeric & columns.keys()) | {
+            label for label in step.assign if label in columns
+        }
+        self._order = order
+        self._row_number = row_number
+        self._operations += 1
+
+    def _filter_rows(self, query: Select) -> Select:
+        if self._row_number:
+            name, skip_rows = self._row_number
+            query = query.where(sa.column(name) > skip_rows)
+        return query
+
+    def compile(self, operation: dict[str, Any]) -> bool:
+        """
+        Push down a post-processing operation.
+
+        :param operation: the post-processing operation
+        :returns: whether the operation was pushed down
+        """
+        operations: dict[str, Callable[..., Optional[_Step]]] = {
+            "compare": self._compare,
+            "contribution": self._contribution,
+            "cum": self._cum,
+            "diff": self._diff,
+            "rank": self._rank,
+            "rolling": self._rolling,
+        }
+        if not isinstance(operation, dict):
+            return False
+        compile_operation = operations.get(operation.get("operation", ""))
+        if compile_operation is None:
+            return False
+        try:
+            step = compile_operation(**(operation.get("options") or {}))
+        except TypeError:
+            # unexpected options are reported by pandas
+            return False
+        if step is None:
+            return False
+        self._apply(step)
+        return True
+
+    def get_query(self) -> Select:
+        """
+        The final query, ordered like the original one.
+        """
+        alias = self._query.alias(f"post_processing_{self._operations}")
+        query = sa.select([sa.column(name) for name in self._columns.values()])
+        query = self._filter_rows(query.select_from(alias))
+        return query.order_by(*self._order_by())
+
+    @property
+    def labels_expected(self) -> list[str]:
+        return list(self._columns)
+
+
+def push_down_post_processing(  # pylint: disable=too-many-arguments
+    sqla_query: Select,
+    columns: dict[str, str],
+    metrics: list[str],
+    orderby: list[tuple[str, bool]],
+    ordered: bool,
+    post_processing: list[dict[str, Any]],
+    make_label: MakeLabel,
+) -> Optional[PushdownResult]:
+    """
+    Push down the leading operations of a post-processing chain into the query.
+
+    See `PostProcessingCompiler` for the parameters.
+
+    :param post_processing: the post-processing operations
+    :returns: the wrapped query, its result labels and the number of operations
+              pushed down, or None if the first operation can't be pushed down
+    """
+    if not all(label in columns for label, _ in orderby):
+        # the wrapping query couldn't preserve the order of the rows
+        return None
+
+    compiler = PostProcessingCompiler(
+        sqla_query,
+        columns,
+        metrics,
+        orderby,
+        ordered,
+        make_label,
+    )
+    for operation in post_processing:
+        if not compiler.compile(operation):
+            break
+
+    if not compiler.operations:
+        return None
+    return PushdownResult(
+        compiler.get_query(),
+        compiler.labels_expected,
+        compiler.operations,
+    )
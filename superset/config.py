@@ -74,6 +74,7 @@ if TYPE_CHECKING:
     from superset.models.core import Database
     from superset.models.dashboard import Dashboard
     from superset.models.slice import Slice
+    from superset.sql.parse import Table
 
     DialectExtensions = dict[str, Dialects | type[Dialect]]
 
@@ -827,6 +828,21 @@ THUMBNAIL_CACHE_CONFIG: CacheConfig = {
 }
 THUMBNAIL_ERROR_CACHE_TTL = int(timedelta(days=1).total_seconds())
 
+# Thumbnail sizes and image formats ("png" or "webp") produced in the same pass as
+# any requested chart or dashboard thumbnail. The page is rendered once per digest
+# and window size, every rendition is derived from that render, and images are
+# stored by content hash, so later requests for these are served without another
+# render. For example:
+#
+# THUMBNAIL_RENDITIONS = {
+#     "chart": [{"thumb_size": (400, 300), "format": "webp"}],
+#     "dashboard": [{"thumb_size": (400, 300), "format": "webp"}],
+# }
+THUMBNAIL_RENDITIONS: dict[str, list[dict[str, Any]]] = {
+    "chart": [],
+    "dashboard": [],
+}
+
 # Time before selenium times out after trying to locate an element on the page and wait
 # for that element to load for a screenshot.
 SCREENSHOT_LOCATE_WAIT = int(timedelta(seconds=10).total_seconds())
@@ -874,6 +890,25 @@ CACHE_CONFIG: CacheConfig = {"CACHE_TYPE": "NullCache"}
 # Cache for datasource metadata and query results
 DATA_CACHE_CONFIG: CacheConfig = {"CACHE_TYPE": "NullCache"}
 
+# The latest partitions of Presto and Hive tables, looked up by the
+# `latest_partition` Jinja macros, `select_star` and the table metadata, are cached in
+# the data cache for this many seconds. This can also be a function of the database
+# and the table, returning the timeout of the table, e.g. to cache the partitions of
+# daily tables longer than those of hourly tables.
+LATEST_PARTITION_CACHE_TIMEOUT: int | Callable[[Database, Table], int] = 60
+# Processes wait up to this many seconds for another process looking up the same
+# partitions, before looking them up themselves.
+LATEST_PARTITION_CACHE_LOCK_TIMEOUT = 30
+
+# The metadata of tables returned by the `table_metadata` endpoints is cached in the
+# data cache for this many seconds, and invalidated when datasets are refreshed or
+# the metadata of their schema is crawled. Set to `None` to disable the cache.
+TABLE_METADATA_CACHE_TIMEOUT: int | None = int(timedelta(minutes=10).total_seconds())
+# The columns, keys, indexes and comment of a table are read concurrently, running up
+# to this many inspector calls at a time on each database, per process. Set to 1 to
+# read them one after another.
+TABLE_METADATA_MAX_CONCURRENT_REQUESTS = 4
+
 # Cache for dashboard filter state. `CACHE_TYPE` defaults to `SupersetMetastoreCache`
 # that stores the values in the key-value table in the Superset metastore, as it's
 # required for Superset to operate correctly, but can be replaced by any
@@ -957,11 +992,53 @@ ALLOWED_EXTENSIONS = {*EXCEL_EXTENSIONS, *CSV_EXTENSIONS, *COLUMNAR_EXTENSIONS}
 # note: index option should not be overridden
 CSV_EXPORT = {"encoding": "utf-8-sig"}
 
+# Number of rows written per chunk when SQL Lab results stored as Arrow (see
+# RESULTS_BACKEND_USE_MSGPACK) are streamed as CSV without a pandas round trip.
+# Only used when CSV_EXPORT contains no options besides `encoding` and `sep`, and
+# the results only have integer, boolean, string or null columns, which Arrow can
+# format like pandas does.
+CSV_EXPORT_ARROW_BATCH_SIZE = 64 * 1024
+
 # Excel Options: key/value pairs that will be passed as argument to DataFrame.to_excel
 # method.
 # note: index option should not be overridden
 EXCEL_EXPORT: dict[str, Any] = {}
 
+# Engine running the post-processing operations of chart data queries, either
+# "pandas" or "arrow". The Arrow engine runs chains of supported operations
+# (aggregate, cum, diff, flatten, rename, select and sort) on a single Arrow table
+# instead of copying a DataFrame between every step, and uses pandas for the rest.
+POST_PROCESSING_ENGINE = "pandas"
+
+# Record the peak memory allocated by each post-processing operation with
+# tracemalloc. Tracing slows down all allocations of the process and only covers
+# memory allocated by Python and numpy, not Arrow buffers, so it's meant for
+# investigating slow or memory hungry charts rather than for production use.
+POST_PROCESSING_TRACE_MEMORY = False
+
+# Memoize the DataFrames resulting from the leading operations of post-processing
+# chains in the memory of each process, keyed by the query, a fingerprint of the
+# data it returned and the operations, so that charts running different operations
+# after the same ones on the same data (e.g. a pivot followed by different rolling
+# windows) only run the operations that differ. The memo holds at most
+# POST_PROCESSING_MEMO_SIZE bytes, evicting the least recently used DataFrames,
+# for POST_PROCESSING_MEMO_TIMEOUT seconds. The memo is disabled when the size is
+# 0, e.g. 64 * 1024 * 1024 enables a 64MB memo.
+POST_PROCESSING_MEMO_SIZE = 0
+POST_PROCESSING_MEMO_TIMEOUT = 300
+
+# Maximum number of processes fitting the models of the prophet post-processing
+# operation, one model per series. With 1, the default, models are fitted
+# sequentially in the web worker. Otherwise each web worker keeps a pool of up to
+# this many processes, each importing Superset and prophet, for as long as it runs,
+# e.g. min(4, os.cpu_count() or 1) fits up to 4 models in parallel.
+PROPHET_MAX_WORKERS = 1
+
+# Timeout of the prophet forecasts cached in the data cache, keyed by the series
+# and the parameters of the model, so unchanged series aren't fitted again. None
+# disables the cache.
+PROPHET_CACHE_TIMEOUT: int | None = int(timedelta(days=1).total_seconds())
+
 # ---------------------------------------------------
 # Time grain configurations
 # ---------------------------------------------------
@@ -1116,6 +1193,7 @@ class CeleryConfig:  # pylint: disable=too-few-public-methods
         "superset.tasks.thumbnails",
         "superset.tasks.cache",
         "superset.tasks.slack",
+        "superset.tasks.metadata_index",
     )
     result_backend = "db+sqlite:///celery_results.sqlite"
     worker_prefetch_multiplier = 1
@@ -1152,6 +1230,11 @@ class CeleryConfig:  # pylint: disable=too-few-public-methods
         #     "task": "slack.cache_channels",
         #     "schedule": crontab(minute="0", hour="*"),
         # },
+        # Uncomment to crawl the metadata of all databases into the metadata index
+        # "metadata_index.crawl": {
+        #     "task": "metadata_index.crawl",
+        #     "schedule": crontab(minute="0", hour="*/6"),
+        # },
     }
 
 
@@ -1160,6 +1243,24 @@ CELERY_CONFIG: type[CeleryConfig] | None = CeleryConfig
 # Set celery config to None to disable all the above configuration
 # CELERY_CONFIG = None
 
+# The `metadata_index.crawl` task above crawls the tables, views and columns of the
+# schemas of every database into the metadata index, which the table list and the
+# table search read instead of inspecting the database. Schemas crawled longer than
+# this ago are read from the database again. Set to None to never read from the
+# index.
+METADATA_INDEX_MAX_AGE: timedelta | None = timedelta(days=1)
+
+# The table and column search of SQL Lab keeps an in-memory index of the names in
+# each schema, built from the metadata index or from the table names of the schema.
+# Indexes are rebuilt after this many seconds, or when the schema is crawled again.
+METADATA_SEARCH_INDEX_TIMEOUT = int(timedelta(minutes=10).total_seconds())
+# The indexes of each process hold at most this many table, view and column names,
+# evicting the least recently used indexes.
+METADATA_SEARCH_INDEX_MAX_ENTRIES = 1_000_000
+# Searches without a schema search at most this many schemas of the metadata index,
+# in alphabetical order, and report when schemas were left out.
+METADATA_SEARCH_MAX_SCHEMAS = 50
+
 # Additional static HTTP headers to be served by your Superset server. Note
 # Flask-Talisman applies the relevant security HTTP headers.
 #
@@ -1659,6 +1760,9 @@ ALERT_REPORTS_QUERY_EXECUTION_MAX_TRIES = 1
 # Custom width for screenshots
 ALERT_REPORTS_MIN_CUSTOM_SCREENSHOT_WIDTH = 600
 ALERT_REPORTS_MAX_CUSTOM_SCREENSHOT_WIDTH = 2400
+# Max number of screenshots taken concurrently for a single report, e.g. when
+# a report covers multiple dashboard tabs. Each one runs its own browser.
+ALERT_REPORTS_MAX_CONCURRENT_SCREENSHOTS = 4
 # Set a minimum interval threshold between executions (for each Alert/Report)
 # Value should be an integer i.e. int(timedelta(minutes=5).total_seconds())
 # You can also assign a function to the config that returns the expected integer
@@ -1707,6 +1811,21 @@ WEBDRIVER_CONFIGURATION = {
 # Note: If using Chrome, you'll want to add the "--marionette" arg.
 WEBDRIVER_OPTION_ARGS = ["--headless"]
 
+# Keep warm, authenticated browsers (Selenium) or browser contexts (Playwright)
+# around between screenshots instead of launching and logging in every time.
+# Browsers are reused per executor user, health checked before use and recycled
+# after `max_uses` screenshots or `max_idle_seconds` of inactivity. At most
+# `max_size` browsers are kept per worker process, and Playwright only pools on
+# the worker's main thread; callers wait up to `acquire_timeout` seconds for one
+# to become available.
+WEBDRIVER_POOL: dict[str, Any] = {
+    "enabled": False,
+    "max_size": 5,
+    "max_uses": 50,
+    "max_idle_seconds": 300,
+    "acquire_timeout": 60,
+}
+
 # The base URL to query for accessing the user interface
 WEBDRIVER_BASEURL = "http://0.0.0.0:8080/"
 # The base URL for the email report hyperlinks.
@@ -1933,6 +2052,10 @@ SSL_CERT_PATH: str | None = None
 # pylint: disable-next=unnecessary-lambda-assignment
 SQLA_TABLE_MUTATOR = lambda table: table  # noqa: E731
 
+# Max number of databases whose metadata is read concurrently when refreshing the
+# columns of many datasets at once, through the bulk dataset refresh endpoint.
+DATASET_BULK_REFRESH_MAX_CONCURRENT_DATABASES = 4
+
 
 # Global async query config options.
 # Requires GLOBAL_ASYNC_QUERIES feature flag to be enabled.
@@ -1955,6 +2078,17 @@ GLOBAL_ASYNC_QUERIES_POLLING_DELAY = int(
     timedelta(milliseconds=500).total_seconds() * 1000
 )
 GLOBAL_ASYNC_QUERIES_WEBSOCKET_URL = "ws://127.0.0.1:8080/"
+# Maximum number of seconds a request to the async event polling endpoint blocks
+# waiting for new events (long polling) when using the "polling" transport.
+# Concurrent long polls in a worker process share a single Redis XREAD BLOCK.
+# Each long poll holds a web server thread, so only enable this with threaded or
+# async (e.g. gevent) workers. Set to 0 to disable long polling.
+GLOBAL_ASYNC_QUERIES_LONG_POLL_TIMEOUT = 0
+# Chart data results whose JSON payload is at most this many bytes are embedded in
+# the job-done async event, so clients don't need a second request to fetch them
+# from the cache. Events are kept in the Redis streams (see the stream limits
+# above), so keep this small. Set to 0 to always return a result URL.
+GLOBAL_ASYNC_QUERIES_INLINE_RESULT_MAX_BYTES = 0
 
 # Global async queries cache backend configuration options:
 # - Set 'CACHE_TYPE' to 'RedisCache' for RedisCacheBackend.
@@ -1626,6 +1626,7 @@ class SqlaTable(
             query=sql,
             errors=errors,
             error_message=error_message,
+            post_processing_pushed=query_str_ext.post_processing_pushed,
         )
 
     def get_sqla_table_object(self) -> Table:
@@ -19,7 +19,7 @@ from __future__ import annotations
 import logging
 from collections.abc import Iterable, Iterator
 from functools import lru_cache
-from typing import Callable, TYPE_CHECKING, TypeVar
+from typing import Any, Callable, TYPE_CHECKING, TypeVar
 from uuid import UUID
 
 from flask_babel import lazy_gettext as _
@@ -38,9 +38,10 @@ from superset.exceptions import (
     SupersetSecurityException,
 )
 from superset.models.core import Database
-from superset.result_set import SupersetResultSet
+from superset.result_set import convert_to_string, dedup, SupersetResultSet
 from superset.sql.parse import SQLScript, Table
 from superset.superset_typing import ResultSetColumnType
+from superset.utils.core import GenericDataType
 
 if TYPE_CHECKING:
     from superset.connectors.sqla.models import SqlaTable
@@ -52,14 +53,32 @@ def get_physical_table_metadata(
     normalize_columns: bool,
 ) -> list[ResultSetColumnType]:
     """Use SQLAlchemy inspector to get table metadata"""
-    db_engine_spec = database.db_engine_spec
-    db_dialect = database.get_dialect()
-
     # Table does not exist or is not visible to a connection.
     if not (database.has_table(table) or database.has_view(table)):
         raise NoSuchTableError(table)
 
-    cols = database.get_columns(table)
+    return resolve_column_types(
+        database,
+        database.get_columns(table),
+        normalize_columns,
+    )
+
+
+def resolve_column_types(
+    database: Database,
+    cols: list[ResultSetColumnType],
+    normalize_columns: bool,
+) -> list[ResultSetColumnType]:
+    """
+    Compile the SQLAlchemy types of columns read by an inspector to strings.
+
+    :param database: The database the columns were read from
+    :param cols: The columns, as returned by the engine spec; they are updated
+    :param normalize_columns: Whether to keep the normalized column names
+    :returns: The columns
+    """
+    db_engine_spec = database.db_engine_spec
+    db_dialect = database.get_dialect()
     for col in cols:
         try:
             if isinstance(col["type"], TypeEngine):
@@ -142,15 +161,24 @@ def get_columns_description(
     schema: str | None,
     query: str,
 ) -> list[ResultSetColumnType]:
+    """
+    Get the columns returned by a query.
+
+    The columns are described without running the query when the DB engine spec
+    supports it; otherwise, or when the description lacks column types, the query is
+    run with a limit of 1 and the columns are read from its result.
+    """
     # TODO(villebro): refactor to use same code that's used by
     #  sql_lab.py:execute_sql_statements
     db_engine_spec = database.db_engine_spec
     try:
         with database.get_raw_connection(catalog=catalog, schema=schema) as conn:
             cursor = conn.cursor()
+            if columns := describe_columns(database, cursor, query):
+                return columns
+
             query = database.apply_limit_to_sql(query, limit=1)
             mutated_query = database.mutate_sql_based_on_config(query)
-            cursor.execute(mutated_query)
             db_engine_spec.execute(cursor, mutated_query, database)
             result = db_engine_spec.fetch_data(cursor, limit=1)
             result_set = SupersetResultSet(result, cursor.description, db_engine_spec)
@@ -159,6 +187,47 @@ def get_columns_description(
         raise SupersetGenericDBErrorException(message=str(ex)) from ex
 
 
+def describe_columns(
+    database: Database,
+    cursor: Any,
+    query: str,
+) -> list[ResultSetColumnType] | None:
+    """
+    Describe the columns returned by a query without running it.
+
+    :returns: The columns, or None if the DB engine spec can't describe the query or
+        the type of some column
+    """
+    db_engine_spec = database.db_engine_spec
+    description = db_engine_spec.get_query_description(database, cursor, query)
+    if not description:
+        return None
+
+    columns: list[ResultSetColumnType] = []
+    names = dedup([convert_to_string(row[0]) for row in description])
+    for name, row in zip(names, description, strict=True):
+        if (db_type := db_engine_spec.get_datatype(row[1])) is None:
+            return None
+        column_spec = db_engine_spec.get_column_spec(db_type)
+        type_generic = None
+        if column_spec is not None:
+            type_generic = (
+                GenericDataType.TEMPORAL
+                if column_spec.is_dttm
+                else column_spec.generic_type
+            )
+        columns.append(
+            {
+                "column_name": name,
+                "name": name,
+                "type": db_type,
+                "type_generic": type_generic,
+                "is_dttm": column_spec is not None and column_spec.is_dttm,
+            }
+        )
+    return columns or None
+
+
 @lru_cache(maxsize=LRU_CACHE_MAX_SIZE)
 def get_dialect_name(drivername: str) -> str:
     return SqlaURL.create(drivername).get_dialect().name
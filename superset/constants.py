@@ -121,6 +121,7 @@ MODEL_VIEW_RW_METHOD_PERMISSION_MAP = {
 
 MODEL_API_RW_METHOD_PERMISSION_MAP = {
     "bulk_delete": "write",
+    "bulk_refresh": "write",
     "delete": "write",
     "distinct": "read",
     "get": "read",
@@ -131,6 +132,7 @@ MODEL_API_RW_METHOD_PERMISSION_MAP = {
     "related": "read",
     "related_objects": "read",
     "tables": "read",
+    "search_metadata": "read",
     "schemas": "read",
     "catalogs": "read",
     "select_star": "read",
@@ -138,6 +140,8 @@ MODEL_API_RW_METHOD_PERMISSION_MAP = {
     "table_metadata_deprecated": "read",
     "table_extra_metadata": "read",
     "table_extra_metadata_deprecated": "read",
+    "invalidate_latest_partition": "write",
+    "invalidate_metadata_cache": "write",
     "test_connection": "write",
     "validate_parameters": "write",
     "favorite_status": "read",
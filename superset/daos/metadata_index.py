@@ -0,0 +1,203 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+from __future__ import annotations
+
+from datetime import datetime, timedelta
+from typing import TYPE_CHECKING
+
+from sqlalchemy.orm import Query
+
+from superset.daos.base import BaseDAO
+from superset.databases.utils import get_col_type
+from superset.extensions import db
+from superset.models.metadata_index import IndexedSchema, IndexedTable
+from superset.sql.parse import Table
+from superset.utils import json
+from superset.utils.hashing import md5_sha_from_str
+
+if TYPE_CHECKING:
+    from superset.db_engine_specs.base import SchemaTable
+
+
+class MetadataIndexDAO(BaseDAO[IndexedSchema]):
+    @staticmethod
+    def _filter_schemas(
+        query: Query,
+        database_id: int,
+        catalog: str | None,
+    ) -> Query:
+        return query.filter(
+            IndexedSchema.database_id == database_id,
+            (
+                IndexedSchema.catalog.is_(None)
+                if catalog is None
+                else IndexedSchema.catalog == catalog
+            ),
+        )
+
+    @classmethod
+    def find_schema(
+        cls,
+        database_id: int,
+        catalog: str | None,
+        schema: str,
+        max_age: timedelta | None = None,
+    ) -> IndexedSchema | None:
+        """
+        Find an indexed schema, ignoring it if it was crawled more than `max_age` ago.
+        """
+        query = cls._filter_schemas(
+            db.session.query(IndexedSchema),
+            database_id,
+            catalog,
+        ).filter(IndexedSchema.schema == schema)
+        if max_age is not None:
+            query = query.filter(IndexedSchema.crawled_on >= datetime.now() - max_age)
+        return query.one_or_none()
+
+    @classmethod
+    def get_schema_names(
+        cls,
+        database_id: int,
+        catalog: str | None,
+        max_age: timedelta | None = None,
+    ) -> set[str]:
+        """
+        Return the names of the indexed schemas of a catalog, ignoring the ones
+        crawled more than `max_age` ago.
+        """
+        query = cls._filter_schemas(
+            db.session.query(IndexedSchema.schema),
+            database_id,
+            catalog,
+        )
+        if max_age is not None:
+            query = query.filter(IndexedSchema.crawled_on >= datetime.now() - max_age)
+        return {schema for (schema,) in query.all()}
+
+    @classmethod
+    def find_table(
+        cls,
+        database_id: int,
+        table: Table,
+        max_age: timedelta | None = None,
+    ) -> IndexedTable | None:
+        """
+        Find an indexed table, ignoring it if it was crawled more than `max_age` ago.
+        """
+        if table.schema is None:
+            return None
+        query = (
+            cls._filter_schemas(
+                db.session.query(IndexedTable).join(IndexedSchema),
+                database_id,
+                table.catalog,
+            )
+            .filter(IndexedSchema.schema == table.schema)
+            .filter(IndexedTable.table_name == table.table)
+        )
+        if max_age is not None:
+            query = query.filter(IndexedSchema.crawled_on >= datetime.now() - max_age)
+        return query.one_or_none()
+
+    @staticmethod
+    def _serialize_columns(table: SchemaTable) -> str:
+        return json.dumps(
+            [
+                {
+                    "name": column["column_name"],
+                    "type": get_col_type(column),
+                    "nullable": column.get("nullable"),
+                    "comment": column.get("comment"),
+                }
+                for column in table.columns
+            ],
+            default=str,
+        )
+
+    @classmethod
+    def sync_schema(
+        cls,
+        database_id: int,
+        catalog: str | None,
+        schema: str,
+        tables: list[SchemaTable],
+    ) -> dict[str, int]:
+        """
+        Replace the indexed tables of a schema with the crawled ones.
+
+        Only the tables that were added, changed or removed since the previous crawl
+        are written, so that crawling a schema that didn't change is cheap.
+
+        :returns: The number of tables added, updated and deleted
+        """
+        indexed_schema = cls.find_schema(database_id, catalog, schema)
+        if indexed_schema is None:
+            indexed_schema = IndexedSchema(
+                database_id=database_id,
+                catalog=catalog,
+                schema=schema,
+            )
+            db.session.add(indexed_schema)
+        indexed_schema.crawled_on = datetime.now()
+
+        existing = {table.table_name: table for table in indexed_schema.tables}
+        counts = {"added": 0, "updated": 0, "deleted": 0}
+        for table in tables:
+            columns_json = cls._serialize_columns(table)
+            checksum = md5_sha_from_str(table.type + columns_json)
+            indexed_table = existing.pop(table.name, None)
+            if indexed_table is None:
+                indexed_schema.tables.append(
+                    IndexedTable(
+                        table_name=table.name,
+                        table_type=table.type,
+                        columns_json=columns_json,
+                        checksum=checksum,
+                    )
+                )
+                counts["added"] += 1
+            elif indexed_table.checksum != checksum:
+                indexed_table.table_type = table.type
+                indexed_table.columns_json = columns_json
+                indexed_table.checksum = checksum
+                counts["updated"] += 1
+
+        for indexed_table in existing.values():
+            indexed_schema.tables.remove(indexed_table)
+            counts["deleted"] += 1
+
+        return counts
+
+    @classmethod
+    def delete_schemas(
+        cls,
+        database_id: int,
+        catalog: str | None,
+        keep: set[str],
+    ) -> None:
+        """
+        Delete the indexed schemas of a catalog that are not in `keep`.
+        """
+        query = cls._filter_schemas(
+            db.session.query(IndexedSchema),
+            database_id,
+            catalog,
+        )
+        for indexed_schema in query.all():
+            if indexed_schema.schema not in keep:
+                db.session.delete(indexed_schema)
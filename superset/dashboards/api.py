@@ -1081,6 +1081,7 @@ class DashboardRestApi(BaseSupersetModelRestApi):
         )
         # Don't shrink the image if thumb_size is not specified
         thumb_size = kwargs["rison"].get("thumb_size") or window_size
+        image_format = kwargs["rison"].get("format", "png")
         force = kwargs["rison"].get("force", False)
         dashboard_state: DashboardPermalinkState = {
             "dataMask": payload.get("dataMask", {}),
@@ -1101,7 +1102,9 @@ class DashboardRestApi(BaseSupersetModelRestApi):
 
         dashboard_url = get_url_path("Superset.dashboard_permalink", key=permalink_key)
         screenshot_obj = DashboardScreenshot(dashboard_url, dashboard.digest)
-        cache_key = screenshot_obj.get_cache_key(window_size, thumb_size, permalink_key)
+        cache_key = screenshot_obj.get_cache_key(
+            window_size, thumb_size, permalink_key, image_format=image_format
+        )
         image_url = get_url_path(
             "DashboardRestApi.screenshot", pk=dashboard.id, digest=cache_key
         )
@@ -1135,6 +1138,7 @@ class DashboardRestApi(BaseSupersetModelRestApi):
                 window_size=window_size,
                 cache_key=cache_key,
                 force=force,
+                image_format=image_format,
             )
             return build_response(202)
         return build_response(200)
@@ -1212,7 +1216,7 @@ class DashboardRestApi(BaseSupersetModelRestApi):
             if download_format == "png":
                 return Response(
                     FileWrapper(image),
-                    mimetype="image/png",
+                    mimetype=cache_payload.get_mimetype(),
                     direct_passthrough=True,
                 )
         return self.response_404()
@@ -42,6 +42,7 @@ screenshot_query_schema = {
         "permalink": {"type": "string"},
         "window_size": width_height_schema,
         "thumb_size": width_height_schema,
+        "format": {"type": "string", "enum": ["png", "webp"]},
     },
 }
 dashboard_title_description = "A title for the dashboard."
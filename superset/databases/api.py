@@ -20,6 +20,7 @@ from __future__ import annotations
 
 import logging
 from datetime import datetime
+from functools import partial
 from io import BytesIO
 from typing import Any, cast
 from zipfile import is_zipfile, ZipFile
@@ -47,6 +48,7 @@ from superset.commands.database.exceptions import (
 from superset.commands.database.export import ExportDatabasesCommand
 from superset.commands.database.importers.dispatcher import ImportDatabasesCommand
 from superset.commands.database.oauth2 import OAuth2StoreTokenCommand
+from superset.commands.database.search_metadata import SearchDatabaseMetadataCommand
 from superset.commands.database.ssh_tunnel.delete import DeleteSSHTunnelCommand
 from superset.commands.database.ssh_tunnel.exceptions import (
     SSHTunnelDatabasePortError,
@@ -74,12 +76,14 @@ from superset.commands.importers.exceptions import (
 from superset.commands.importers.v1.utils import get_contents_from_bundle
 from superset.constants import MODEL_API_RW_METHOD_PERMISSION_MAP, RouteMethod
 from superset.daos.database import DatabaseDAO
+from superset.databases import metadata_cache
 from superset.databases.decorators import check_table_access
 from superset.databases.filters import DatabaseFilter, DatabaseUploadEnabledFilter
 from superset.databases.schemas import (
     CatalogsResponseSchema,
     database_catalogs_query_schema,
     database_schemas_query_schema,
+    database_search_metadata_query_schema,
     database_tables_query_schema,
     DatabaseConnectionSchema,
     DatabaseFunctionNamesResponse,
@@ -87,10 +91,13 @@ from superset.databases.schemas import (
     DatabasePutSchema,
     DatabaseRelatedObjectsResponse,
     DatabaseSchemaAccessForFileUploadResponse,
+    DatabaseSearchMetadataResponse,
     DatabaseTablesResponse,
     DatabaseTestConnectionSchema,
     DatabaseValidateParametersSchema,
     get_export_ids_schema,
+    LatestPartitionCacheSchema,
+    MetadataCacheSchema,
     OAuth2ProviderResponseSchema,
     openapi_spec_methods_override,
     QualifiedTableSchema,
@@ -120,7 +127,7 @@ from superset.extensions import security_manager
 from superset.models.core import Database
 from superset.sql.parse import Table
 from superset.superset_typing import FlaskResponse
-from superset.utils import json
+from superset.utils import json, partition_cache
 from superset.utils.core import (
     error_msg_from_exception,
     get_username,
@@ -151,10 +158,13 @@ class DatabaseRestApi(BaseSupersetModelRestApi):
         RouteMethod.IMPORT,
         RouteMethod.RELATED,
         "tables",
+        "search_metadata",
         "table_metadata",
         "table_metadata_deprecated",
         "table_extra_metadata",
         "table_extra_metadata_deprecated",
+        "invalidate_latest_partition",
+        "invalidate_metadata_cache",
         "select_star",
         "catalogs",
         "schemas",
@@ -278,6 +288,9 @@ class DatabaseRestApi(BaseSupersetModelRestApi):
         "database_catalogs_query_schema": database_catalogs_query_schema,
         "database_schemas_query_schema": database_schemas_query_schema,
         "database_tables_query_schema": database_tables_query_schema,
+        "database_search_metadata_query_schema": (
+            database_search_metadata_query_schema
+        ),
         "get_export_ids_schema": get_export_ids_schema,
     }
 
@@ -288,6 +301,7 @@ class DatabaseRestApi(BaseSupersetModelRestApi):
         DatabaseFunctionNamesResponse,
         DatabaseSchemaAccessForFileUploadResponse,
         DatabaseRelatedObjectsResponse,
+        DatabaseSearchMetadataResponse,
         DatabaseTablesResponse,
         DatabaseTestConnectionSchema,
         DatabaseValidateParametersSchema,
@@ -876,6 +890,81 @@ class DatabaseRestApi(BaseSupersetModelRestApi):
         payload = command.run()
         return self.response(200, **payload)
 
+    @expose("/<int:pk>/search_metadata/")
+    @protect()
+    @rison(database_search_metadata_query_schema)
+    @statsd_metrics
+    @handle_api_exception
+    @event_logger.log_this_with_context(
+        action=lambda self, *args, **kwargs: f"{self.__class__.__name__}"
+        f".search_metadata",
+        log_to_statsd=False,
+    )
+    def search_metadata(self, pk: int, **kwargs: Any) -> FlaskResponse:
+        """Search the tables, views and columns of a database by name.
+        ---
+        get:
+          summary: Search the tables, views and columns of a database by name
+          description: >-
+            Names starting with the query are returned first, followed by names
+            similar to it. Without a schema name only the schemas crawled into the
+            metadata index are searched, up to `METADATA_SEARCH_MAX_SCHEMAS` of them.
+          parameters:
+          - in: path
+            schema:
+              type: integer
+            name: pk
+            description: The database id
+          - in: query
+            name: q
+            content:
+              application/json:
+                schema:
+                  $ref: '#/components/schemas/database_search_metadata_query_schema'
+          responses:
+            200:
+              description: Matching tables, views and columns
+              content:
+                application/json:
+                  schema:
+                    type: object
+                    properties:
+                      count:
+                        type: integer
+                      truncated:
+                        description: >-
+                          Whether schemas were left out of a search without a
+                          schema name
+                        type: boolean
+                      result:
+                        description: >-
+                          A page of the matches, best matches first
+                        type: array
+                        items:
+                          $ref: '#/components/schemas/DatabaseSearchMetadataResponse'
+            400:
+              $ref: '#/components/responses/400'
+            401:
+              $ref: '#/components/responses/401'
+            404:
+              $ref: '#/components/responses/404'
+            422:
+              $ref: '#/components/responses/422'
+            500:
+              $ref: '#/components/responses/500'
+        """
+        command = SearchDatabaseMetadataCommand(
+            pk,
+            kwargs["rison"]["query"],
+            catalog_name=kwargs["rison"].get("catalog_name"),
+            schema_name=kwargs["rison"].get("schema_name"),
+            include_columns=kwargs["rison"].get("include_columns", True),
+            page=kwargs["rison"].get("page", 0),
+            page_size=kwargs["rison"].get("page_size", 100),
+        )
+        payload = command.run()
+        return self.response(200, **payload)
+
     @expose("/<int:pk>/table/<path:table_name>/<schema_name>/", methods=("GET",))
     @protect()
     @check_table_access
@@ -929,7 +1018,13 @@ class DatabaseRestApi(BaseSupersetModelRestApi):
         """
         self.incr_stats("init", self.table_metadata_deprecated.__name__)
         try:
-            table_info = get_table_metadata(database, Table(table_name, schema_name))
+            table = Table(table_name, schema_name)
+            table_info = metadata_cache.get_or_fetch(
+                database,
+                table,
+                "table_metadata",
+                partial(get_table_metadata, database, table),
+            )
         except SQLAlchemyError as ex:
             self.incr_stats("error", self.table_metadata_deprecated.__name__)
             return self.response_422(error_msg_from_exception(ex))
@@ -1002,7 +1097,12 @@ class DatabaseRestApi(BaseSupersetModelRestApi):
         parsed_schema = parse_js_uri_path_item(schema_name, eval_undefined=True)
         table_name = cast(str, parse_js_uri_path_item(table_name))
         table = Table(table_name, parsed_schema)
-        payload = database.db_engine_spec.get_extra_table_metadata(database, table)
+        payload = metadata_cache.get_or_fetch(
+            database,
+            table,
+            "table_extra_metadata",
+            partial(database.db_engine_spec.get_extra_table_metadata, database, table),
+        )
         return self.response(200, **payload)
 
     @expose("/<int:pk>/table_metadata/", methods=["GET"])
@@ -1080,7 +1180,12 @@ class DatabaseRestApi(BaseSupersetModelRestApi):
             # instead of raising 403, raise 404 to hide table existence
             raise TableNotFoundException("No such table") from ex
 
-        payload = database.db_engine_spec.get_table_metadata(database, table)
+        payload = metadata_cache.get_or_fetch(
+            database,
+            table,
+            "table_metadata",
+            partial(database.db_engine_spec.get_table_metadata, database, table),
+        )
 
         return self.response(200, **payload)
 
@@ -1160,10 +1265,183 @@ class DatabaseRestApi(BaseSupersetModelRestApi):
             # instead of raising 403, raise 404 to hide table existence
             raise TableNotFoundException("No such table") from ex
 
-        payload = database.db_engine_spec.get_extra_table_metadata(database, table)
+        payload = metadata_cache.get_or_fetch(
+            database,
+            table,
+            "table_extra_metadata",
+            partial(database.db_engine_spec.get_extra_table_metadata, database, table),
+        )
 
         return self.response(200, **payload)
 
+    @expose("/<int:pk>/latest_partition/", methods=["DELETE"])
+    @protect()
+    @statsd_metrics
+    @event_logger.log_this_with_context(
+        action=lambda self, *args, **kwargs: f"{self.__class__.__name__}"
+        f".invalidate_latest_partition",
+        log_to_statsd=False,
+    )
+    def invalidate_latest_partition(self, pk: int) -> FlaskResponse:
+        """
+        Invalidate the cached latest partitions of a table.
+
+        The latest partitions of all the tables of the database are invalidated if no
+        table name is passed.
+        ---
+        delete:
+          summary: Invalidate the cached latest partitions of a table
+          description: >-
+            The latest partitions of tables, used by the `latest_partition` Jinja
+            macros and the table metadata, are cached. Invalidate them after loading
+            new partitions, to look them up again.
+          parameters:
+          - in: path
+            schema:
+              type: integer
+            name: pk
+            description: The database id
+          - in: query
+            schema:
+              type: string
+            name: name
+            description: >-
+              Optional table name, if not passed the latest partitions of all the
+              tables of the database are invalidated
+          - in: query
+            schema:
+              type: string
+            name: schema
+            description: Optional table schema
+          - in: query
+            schema:
+              type: string
+            name: catalog
+            description: Optional table catalog
+          responses:
+            200:
+              description: Latest partitions invalidated
+              content:
+                application/json:
+                  schema:
+                    type: object
+                    properties:
+                      message:
+                        type: string
+            400:
+              $ref: '#/components/responses/400'
+            401:
+              $ref: '#/components/responses/401'
+            404:
+              $ref: '#/components/responses/404'
+            500:
+              $ref: '#/components/responses/500'
+        """
+        self.incr_stats("init", self.invalidate_latest_partition.__name__)
+
+        if not (database := DatabaseDAO.find_by_id(pk)):
+            raise DatabaseNotFoundException("No such database")
+
+        try:
+            parameters = LatestPartitionCacheSchema().load(request.args)
+        except ValidationError as ex:
+            raise InvalidPayloadSchemaError(ex) from ex
+
+        table = None
+        if parameters["name"]:
+            table = Table(
+                parameters["name"],
+                parameters["schema"],
+                parameters["catalog"],
+            )
+            try:
+                security_manager.raise_for_access(database=database, table=table)
+            except SupersetSecurityException as ex:
+                # instead of raising 403, raise 404 to hide table existence
+                raise TableNotFoundException("No such table") from ex
+
+        partition_cache.invalidate(database, table)
+        return self.response(200, message="OK")
+
+    @expose("/<int:pk>/metadata_cache/", methods=["DELETE"])
+    @protect()
+    @statsd_metrics
+    @event_logger.log_this_with_context(
+        action=lambda self, *args, **kwargs: f"{self.__class__.__name__}"
+        f".invalidate_metadata_cache",
+        log_to_statsd=False,
+    )
+    def invalidate_metadata_cache(self, pk: int) -> FlaskResponse:
+        """
+        Invalidate the cached metadata of a database, catalog or schema.
+        ---
+        delete:
+          summary: Invalidate the cached metadata of a database, catalog or schema
+          description: >-
+            The catalogs, schemas, tables and views of databases, and the metadata of
+            their tables, are cached. Invalidate them after changing the database
+            outside of Superset, to read them again.
+          parameters:
+          - in: path
+            schema:
+              type: integer
+            name: pk
+            description: The database id
+          - in: query
+            schema:
+              type: string
+            name: catalog
+            description: >-
+              Optional catalog, if neither the catalog nor the schema are passed the
+              metadata of the whole database is invalidated
+          - in: query
+            schema:
+              type: string
+            name: schema
+            description: >-
+              Optional schema, if not passed the metadata of the whole catalog is
+              invalidated
+          responses:
+            200:
+              description: Metadata invalidated
+              content:
+                application/json:
+                  schema:
+                    type: object
+                    properties:
+                      message:
+                        type: string
+            400:
+              $ref: '#/components/responses/400'
+            401:
+              $ref: '#/components/responses/401'
+            404:
+              $ref: '#/components/responses/404'
+            500:
+              $ref: '#/components/responses/500'
+        """
+        self.incr_stats("init", self.invalidate_metadata_cache.__name__)
+
+        if not (database := DatabaseDAO.find_by_id(pk)):
+            raise DatabaseNotFoundException("No such database")
+
+        try:
+            parameters = MetadataCacheSchema().load(request.args)
+        except ValidationError as ex:
+            raise InvalidPayloadSchemaError(ex) from ex
+
+        if parameters["schema"]:
+            metadata_cache.invalidate_schema(
+                database,
+                parameters["catalog"],
+                parameters["schema"],
+            )
+        elif parameters["catalog"]:
+            metadata_cache.invalidate_catalog(database, parameters["catalog"])
+        else:
+            metadata_cache.invalidate_database(database)
+        return self.response(200, message="OK")
+
     @expose("/<int:pk>/select_star/<path:table_name>/", methods=("GET",))
     @expose("/<int:pk>/select_star/<path:table_name>/<schema_name>/", methods=("GET",))
     @protect()
@@ -0,0 +1,256 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+"""
+Version stamps of the metadata of databases, and cache of the table metadata
+returned by the database API.
+
+The lists of catalogs, schemas, tables and views of a database, and the metadata of
+its tables, are cached under keys that include version stamps of the database, the
+catalog, the schema and the table they belong to. Bumping a stamp invalidates all
+the metadata under it at once, so that the metadata can be cached for long:
+
+- updating a database bumps the stamp of the database;
+- refreshing a dataset, crawling a schema into the metadata index and creating a
+  table or view in SQL Lab bump the stamp of the schema;
+- the ``DELETE /api/v1/database/<pk>/metadata_cache/`` endpoint bumps the stamp of
+  a database, catalog or schema on demand.
+
+The table metadata endpoints gather the columns, keys, indexes, comment and engine
+specific metadata of a table, each in a round trip to the database. Their results
+are cached in the data cache for ``TABLE_METADATA_CACHE_TIMEOUT`` seconds.
+
+Catalogs and schemas are None when the default ones are requested, so the stamps of
+catalogs, schemas and tables are bumped both under their names and, for the default
+catalog and schema, under None. Stamps are kept in both the cache and the data
+cache, next to the metadata they version.
+"""
+
+from __future__ import annotations
+
+import logging
+import uuid
+from itertools import product
+from typing import Any, Callable, TYPE_CHECKING, TypeVar
+
+from flask import current_app
+
+from superset.extensions import cache_manager, stats_logger_manager
+from superset.sql.parse import Table
+from superset.utils.hashing import md5_sha_from_dict, md5_sha_from_str
+
+if TYPE_CHECKING:
+    from flask_caching import Cache
+
+    from superset.models.core import Database
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+def _get_version_key(database: Database, *parts: str | None) -> str:
+    return ":".join(["metadata", str(database.id), *map(str, parts), "version"])
+
+
+def get_version(cache: Cache, database: Database, *parts: str | None) -> str:
+    """
+    Return the version of the metadata of a database, or of a catalog, schema or
+    table of the database.
+
+    The version changes when the stamp of the database or any of the given parts is
+    bumped.
+
+    :param cache: The cache holding the metadata
+    :param database: The database
+    :param parts: The catalog, schema and table, or a prefix of them
+    :returns: The version
+    """
+    stamps = cache.get_many(
+        *(_get_version_key(database, *parts[:count]) for count in range(len(parts) + 1))
+    )
+    return md5_sha_from_str(":".join(stamp or "" for stamp in stamps))
+
+
+def get_list_version(arguments: dict[str, Any]) -> str:
+    """
+    Return the version of a list of catalogs, schemas, tables or views, from the
+    arguments of the `Database` method listing them.
+
+    :param arguments: The arguments of the method, by name
+    :returns: The version
+    """
+    parts = [arguments[name] for name in ("catalog", "schema") if name in arguments]
+    return get_version(cache_manager.cache, arguments["self"], *parts)
+
+
+def get_cache_key(database: Database, table: Table, kind: str) -> str:
+    """
+    Return the cache key of the metadata of a table.
+
+    :param database: The database of the table
+    :param table: The table
+    :param kind: The kind of metadata, e.g. ``table_metadata``
+    :returns: The cache key
+    """
+    version = get_version(
+        cache_manager.data_cache,
+        database,
+        table.catalog,
+        table.schema,
+        table.table,
+    )
+    return f"table_metadata:{database.id}:" + md5_sha_from_dict(
+        {
+            "catalog": table.catalog,
+            "schema": table.schema,
+            "table": table.table,
+            "kind": kind,
+            "version": version,
+        },
+        default=str,
+    )
+
+
+def get_or_fetch(
+    database: Database,
+    table: Table,
+    kind: str,
+    fetch: Callable[[], T],
+) -> T:
+    """
+    Return the cached metadata of a table, or fetch and cache it.
+
+    :param database: The database of the table
+    :param table: The table
+    :param kind: The kind of metadata, e.g. ``table_metadata``
+    :param fetch: Fetches the metadata
+    :returns: The metadata
+    """
+    timeout = current_app.config["TABLE_METADATA_CACHE_TIMEOUT"]
+    if timeout is None:
+        return fetch()
+
+    cache = cache_manager.data_cache
+    key = get_cache_key(database, table, kind)
+    if (cached := cache.get(key)) is not None:
+        stats_logger_manager.instance.incr(f"{kind}.cache_hit")
+        return cached
+
+    stats_logger_manager.instance.incr(f"{kind}.cache_miss")
+    value = fetch()
+    cache.set(key, value, timeout=timeout)
+    return value
+
+
+def _get_catalog_aliases(
+    database: Database,
+    catalog: str | None,
+) -> tuple[set[str | None], str | None]:
+    """
+    Return the names a catalog can be requested with, and its default schema.
+    """
+    default_catalog = database.get_default_catalog()
+    default_schema = database.get_default_schema(catalog or default_catalog)
+    catalogs = {catalog, catalog or default_catalog}
+    if catalog == default_catalog:
+        catalogs.add(None)
+    return catalogs, default_schema
+
+
+def _get_aliases(
+    database: Database,
+    catalog: str | None,
+    schema: str | None,
+) -> set[tuple[str | None, str | None]]:
+    """
+    Return the catalog and schema pairs a schema can be requested with.
+    """
+    try:
+        catalogs, default_schema = _get_catalog_aliases(database, catalog)
+    except Exception:  # pylint: disable=broad-except
+        logger.warning("Unable to get the default schema", exc_info=True)
+        return {(catalog, schema)}
+
+    schemas = {schema, schema or default_schema}
+    if schema == default_schema:
+        schemas.add(None)
+    return set(product(catalogs, schemas))
+
+
+def _bump(*keys: str) -> None:
+    stamps = {key: uuid.uuid4().hex for key in keys}
+    for cache in (cache_manager.cache, cache_manager.data_cache):
+        cache.set_many(stamps, timeout=0)
+
+
+def invalidate_table(database: Database, table: Table) -> None:
+    """
+    Invalidate the cached metadata of a table.
+
+    :param database: The database of the table
+    :param table: The table
+    """
+    _bump(
+        *(
+            _get_version_key(database, catalog, schema, table.table)
+            for catalog, schema in _get_aliases(database, table.catalog, table.schema)
+        )
+    )
+
+
+def invalidate_schema(
+    database: Database,
+    catalog: str | None,
+    schema: str | None,
+) -> None:
+    """
+    Invalidate the cached tables and views of a schema, and their metadata.
+
+    :param database: The database of the schema
+    :param catalog: The catalog of the schema
+    :param schema: The schema
+    """
+    _bump(
+        *(
+            _get_version_key(database, *alias)
+            for alias in _get_aliases(database, catalog, schema)
+        )
+    )
+
+
+def invalidate_catalog(database: Database, catalog: str | None) -> None:
+    """
+    Invalidate the cached schemas of a catalog, and the metadata under them.
+
+    :param database: The database of the catalog
+    :param catalog: The catalog
+    """
+    try:
+        catalogs, _ = _get_catalog_aliases(database, catalog)
+    except Exception:  # pylint: disable=broad-except
+        logger.warning("Unable to get the default catalog", exc_info=True)
+        catalogs = {catalog}
+    _bump(*(_get_version_key(database, alias) for alias in catalogs))
+
+
+def invalidate_database(database: Database) -> None:
+    """
+    Invalidate the cached catalogs of a database, and the metadata under them.
+
+    :param database: The database
+    """
+    _bump(_get_version_key(database))
@@ -84,6 +84,19 @@ database_tables_query_schema = {
     "required": ["schema_name"],
 }
 
+database_search_metadata_query_schema = {
+    "type": "object",
+    "properties": {
+        "query": {"type": "string", "minLength": 1},
+        "catalog_name": {"type": "string"},
+        "schema_name": {"type": "string"},
+        "include_columns": {"type": "boolean"},
+        "page": {"type": "integer", "minimum": 0},
+        "page_size": {"type": "integer", "minimum": 1, "maximum": 1000},
+    },
+    "required": ["query"],
+}
+
 database_name_description = "A database name to identify this connection."
 port_description = "Port number for the database connection."
 cache_timeout_description = (
@@ -740,6 +753,25 @@ class DatabaseTablesResponse(Schema):
     value = fields.String(metadata={"description": "The table or view name"})
 
 
+class DatabaseSearchMetadataResponse(Schema):
+    type = fields.String(metadata={"description": "table, view or column"})
+    value = fields.String(metadata={"description": "The name of the match"})
+    catalog = fields.String(
+        allow_none=True, metadata={"description": "The catalog of the table"}
+    )
+    schema = fields.String(metadata={"description": "The schema of the table"})
+    table = fields.String(
+        metadata={"description": "The table or view, or the table of the column"}
+    )
+    score = fields.Float(
+        metadata={
+            "description": "How well the name matches the query: between 1 and 2 "
+            "for names starting with the query, and the trigram similarity with "
+            "the query otherwise"
+        }
+    )
+
+
 class ValidateSQLRequest(Schema):
     sql = fields.String(
         required=True, metadata={"description": "SQL statement to validate"}
@@ -1341,3 +1373,38 @@ class QualifiedTableSchema(Schema):
         load_default=None,
         metadata={"description": "The table catalog"},
     )
+
+
+class LatestPartitionCacheSchema(QualifiedTableSchema):
+    """
+    Schema for the table whose cached latest partitions are invalidated.
+
+    The table name can be omitted, to invalidate the latest partitions of all the
+    tables of the database.
+    """
+
+    name = fields.String(
+        required=False,
+        load_default=None,
+        metadata={"description": "The table name"},
+    )
+
+
+class MetadataCacheSchema(Schema):
+    """
+    Schema for the catalog or schema whose cached metadata is invalidated.
+
+    Catalog and schema can be omitted, to invalidate the metadata of the whole
+    database or catalog.
+    """
+
+    catalog = fields.String(
+        required=False,
+        load_default=None,
+        metadata={"description": "The catalog"},
+    )
+    schema = fields.String(
+        required=False,
+        load_default=None,
+        metadata={"description": "The schema"},
+    )
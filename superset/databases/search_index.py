@@ -0,0 +1,202 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+"""
+In-memory search index over the names of the tables, views and columns of a schema.
+
+Names are matched by prefix, using a sorted array of the lower case names, and by
+trigram similarity, using an inverted index from trigrams to names in the style of
+Postgres' ``pg_trgm``, so that typos and partial names still find their table.
+
+Indexes are built per schema, from the metadata index when the schema was crawled
+or from the table and view names of the database otherwise, and cached in each
+process for ``METADATA_SEARCH_INDEX_TIMEOUT`` seconds. The cache holds indexes of at
+most ``METADATA_SEARCH_INDEX_MAX_ENTRIES`` names, evicting the least recently used
+indexes.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from bisect import bisect_left
+from collections import defaultdict, OrderedDict
+from typing import Callable, NamedTuple
+
+import numpy as np
+from flask import current_app
+
+# names sharing less than this proportion of their trigrams with the query are not
+# returned, as with the default `pg_trgm.similarity_threshold`
+SIMILARITY_THRESHOLD = 0.3
+
+
+class SearchEntry(NamedTuple):
+    table: str
+    column: str | None
+    type: str  # "table", "view" or "column"
+
+    @property
+    def name(self) -> str:
+        return self.column if self.column is not None else self.table
+
+
+class SearchMatch(NamedTuple):
+    entry: SearchEntry
+    score: float
+
+
+def get_trigrams(name: str) -> set[str]:
+    """
+    Return the trigrams of a lower case name, padded with two spaces in front and
+    one at the end so that leading characters weigh more.
+    """
+    padded = f"  {name} "
+    return {padded[i : i + 3] for i in range(len(padded) - 2)}
+
+
+class MetadataSearchIndex:
+    """
+    A prefix and trigram index over the names of tables, views and columns.
+    """
+
+    def __init__(self, entries: list[SearchEntry]) -> None:
+        self.entries = entries
+        names = [entry.name.lower() for entry in entries]
+
+        order = sorted(range(len(names)), key=names.__getitem__)
+        self._sorted_names = [names[i] for i in order]
+        self._sorted_ids = np.array(order, dtype=np.int64)
+
+        postings: defaultdict[str, list[int]] = defaultdict(list)
+        self._trigram_counts = np.zeros(len(names), dtype=np.int64)
+        for i, name in enumerate(names):
+            trigrams = get_trigrams(name)
+            self._trigram_counts[i] = len(trigrams)
+            for trigram in trigrams:
+                postings[trigram].append(i)
+        self._postings = {
+            trigram: np.array(ids, dtype=np.int64) for trigram, ids in postings.items()
+        }
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def search(self, query: str, include_columns: bool = True) -> list[SearchMatch]:
+        """
+        Return the entries matching a query, in no particular order.
+
+        Names starting with the query score between 1 and 2, 2 being an exact
+        match, and the other names score their trigram similarity with the query.
+        """
+        query = query.strip().lower()
+        if not query or not self.entries:
+            return []
+
+        scores: dict[int, float] = {}
+
+        start = bisect_left(self._sorted_names, query)
+        end = bisect_left(self._sorted_names, query + "\uffff", lo=start)
+        for position in range(start, end):
+            scores[int(self._sorted_ids[position])] = 1 + len(query) / len(
+                self._sorted_names[position]
+            )
+
+        query_trigrams = get_trigrams(query)
+        postings = [
+            self._postings[trigram]
+            for trigram in query_trigrams
+            if trigram in self._postings
+        ]
+        if postings:
+            shared = np.bincount(np.concatenate(postings), minlength=len(self.entries))
+            similarity = shared / (len(query_trigrams) + self._trigram_counts - shared)
+            for i in np.flatnonzero(similarity >= SIMILARITY_THRESHOLD):
+                scores.setdefault(int(i), float(similarity[i]))
+
+        return [
+            SearchMatch(self.entries[i], score)
+            for i, score in scores.items()
+            if include_columns or self.entries[i].column is None
+        ]
+
+
+class _CachedIndex(NamedTuple):
+    version: str | None
+    expires: float
+    index: MetadataSearchIndex
+
+
+_indexes: OrderedDict[tuple[int, str | None, str], _CachedIndex] = OrderedDict()
+_indexes_size = 0
+_indexes_lock = threading.Lock()
+
+
+def _pop_index(key: tuple[int, str | None, str]) -> None:
+    global _indexes_size  # pylint: disable=global-statement
+
+    _indexes_size -= len(_indexes.pop(key).index)
+
+
+def get_search_index(
+    database_id: int,
+    catalog: str | None,
+    schema: str,
+    version: str | None,
+    build: Callable[[], MetadataSearchIndex],
+) -> MetadataSearchIndex:
+    """
+    Return the cached search index of a schema, building it if it's missing, expired
+    or of another version.
+
+    :param version: The version of the metadata of the schema, e.g. when it was
+        crawled; indexes of other versions are rebuilt
+    :param build: Builds the index of the schema
+    """
+    global _indexes_size  # pylint: disable=global-statement
+
+    key = (database_id, catalog, schema)
+    now = time.monotonic()
+    with _indexes_lock:
+        cached = _indexes.get(key)
+        if cached is not None and cached.version == version and cached.expires > now:
+            _indexes.move_to_end(key)
+            return cached.index
+
+    index = build()
+    timeout = current_app.config["METADATA_SEARCH_INDEX_TIMEOUT"]
+    max_entries = current_app.config["METADATA_SEARCH_INDEX_MAX_ENTRIES"]
+    with _indexes_lock:
+        for expired in [
+            other for other, value in _indexes.items() if value.expires <= now
+        ]:
+            _pop_index(expired)
+        if key in _indexes:
+            _pop_index(key)
+        if len(index) <= max_entries:
+            _indexes[key] = _CachedIndex(version, now + timeout, index)
+            _indexes_size += len(index)
+            while _indexes_size > max_entries:
+                _pop_index(next(iter(_indexes)))
+    return index
+
+
+def clear_search_indexes() -> None:
+    global _indexes_size  # pylint: disable=global-statement
+
+    with _indexes_lock:
+        _indexes.clear()
+        _indexes_size = 0
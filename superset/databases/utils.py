@@ -17,12 +17,16 @@
 
 from __future__ import annotations
 
-from typing import Any, TYPE_CHECKING
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, TYPE_CHECKING
 
+from flask import current_app, g
 from sqlalchemy.engine.url import make_url, URL
 
 from superset.commands.database.exceptions import DatabaseInvalidError
 from superset.sql.parse import Table
+from superset.utils.core import override_user
 
 if TYPE_CHECKING:
     from superset.databases.schemas import (
@@ -32,6 +36,52 @@ if TYPE_CHECKING:
     )
 
 
+_semaphores: dict[tuple[int, int], threading.BoundedSemaphore] = {}
+_semaphores_lock = threading.Lock()
+
+
+def _get_semaphore(database_id: int, limit: int) -> threading.BoundedSemaphore:
+    with _semaphores_lock:
+        key = (database_id, limit)
+        if key not in _semaphores:
+            _semaphores[key] = threading.BoundedSemaphore(limit)
+        return _semaphores[key]
+
+
+def gather_metadata(
+    database: Any,
+    calls: dict[str, Callable[[], Any]],
+) -> dict[str, Any]:
+    """
+    Run calls reading the metadata of a database concurrently.
+
+    Each call runs on its own connection, and up to
+    `TABLE_METADATA_MAX_CONCURRENT_REQUESTS` calls run at a time for each database,
+    across all the requests served by this process.
+
+    :param database: The database model
+    :param calls: The calls, by name
+    :return: The results of the calls, by name
+    """
+    limit = current_app.config["TABLE_METADATA_MAX_CONCURRENT_REQUESTS"]
+    if limit <= 1 or len(calls) <= 1:
+        return {name: call() for name, call in calls.items()}
+
+    semaphore = _get_semaphore(database.id, limit)
+    flask_app = current_app._get_current_object()  # pylint: disable=protected-access
+    user = getattr(g, "user", None)
+
+    def run(call: Callable[[], Any]) -> Any:
+        with semaphore, flask_app.app_context(), override_user(user):
+            return call()
+
+    with ThreadPoolExecutor(
+        max_workers=min(limit, len(calls)), thread_name_prefix="table-metadata"
+    ) as executor:
+        futures = {name: executor.submit(run, call) for name, call in calls.items()}
+        return {name: future.result() for name, future in futures.items()}
+
+
 def get_foreign_keys_metadata(
     database: Any,
     table: Table,
@@ -72,17 +122,27 @@ def get_table_metadata(database: Any, table: Table) -> TableMetadataResponse:
     :return: Dict table metadata ready for API response
     """
     keys = []
-    columns = database.get_columns(table)
-    primary_key = database.get_pk_constraint(table)
+    metadata = gather_metadata(
+        database,
+        {
+            "columns": lambda: database.get_columns(table),
+            "primary_key": lambda: database.get_pk_constraint(table),
+            "foreign_keys": lambda: get_foreign_keys_metadata(database, table),
+            "indexes": lambda: get_indexes_metadata(database, table),
+            "comment": lambda: database.get_table_comment(table),
+        },
+    )
+    columns = metadata["columns"]
+    primary_key = metadata["primary_key"]
     if primary_key and primary_key.get("constrained_columns"):
         primary_key["column_names"] = primary_key.pop("constrained_columns")
         primary_key["type"] = "pk"
         keys += [primary_key]
-    foreign_keys = get_foreign_keys_metadata(database, table)
-    indexes = get_indexes_metadata(database, table)
+    foreign_keys = metadata["foreign_keys"]
+    indexes = metadata["indexes"]
     keys += foreign_keys + indexes
     payload_columns: list[TableMetadataColumnsResponse] = []
-    table_comment = database.get_table_comment(table)
+    table_comment = metadata["comment"]
     for col in columns:
         dtype = get_col_type(col)
         payload_columns.append(
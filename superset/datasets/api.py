@@ -18,6 +18,7 @@
 from __future__ import annotations
 
 import logging
+from dataclasses import asdict
 from datetime import datetime
 from io import BytesIO
 from typing import Any, Callable
@@ -36,6 +37,7 @@ from jinja2.exceptions import TemplateSyntaxError
 from marshmallow import ValidationError
 
 from superset import event_logger, is_feature_enabled
+from superset.commands.dataset.bulk_refresh import BulkRefreshDatasetsCommand
 from superset.commands.dataset.create import CreateDatasetCommand
 from superset.commands.dataset.delete import DeleteDatasetCommand
 from superset.commands.dataset.duplicate import DuplicateDatasetCommand
@@ -62,6 +64,8 @@ from superset.daos.dataset import DatasetDAO
 from superset.databases.filters import DatabaseFilter
 from superset.datasets.filters import DatasetCertifiedFilter, DatasetIsNullOrEmptyFilter
 from superset.datasets.schemas import (
+    DatasetBulkRefreshRequestSchema,
+    DatasetBulkRefreshResponseSchema,
     DatasetCacheWarmUpRequestSchema,
     DatasetCacheWarmUpResponseSchema,
     DatasetDuplicateSchema,
@@ -106,6 +110,7 @@ class DatasetRestApi(BaseSupersetModelRestApi):
         RouteMethod.DISTINCT,
         "bulk_delete",
         "refresh",
+        "bulk_refresh",
         "related_objects",
         "duplicate",
         "get_or_create_dataset",
@@ -286,6 +291,8 @@ class DatasetRestApi(BaseSupersetModelRestApi):
         "get_export_ids_schema": get_export_ids_schema,
     }
     openapi_spec_component_schemas = (
+        DatasetBulkRefreshRequestSchema,
+        DatasetBulkRefreshResponseSchema,
         DatasetCacheWarmUpRequestSchema,
         DatasetCacheWarmUpResponseSchema,
         DatasetRelatedObjectsResponse,
@@ -693,6 +700,82 @@ class DatasetRestApi(BaseSupersetModelRestApi):
             )
             return self.response_422(message=str(ex))
 
+    @expose("/refresh/", methods=("PUT",))
+    @protect()
+    @safe
+    @statsd_metrics
+    @event_logger.log_this_with_context(
+        action=lambda self, *args, **kwargs: f"{self.__class__.__name__}"
+        f".bulk_refresh",
+        log_to_statsd=False,
+    )
+    def bulk_refresh(self) -> Response:
+        """Refresh and update columns of many datasets.
+        ---
+        put:
+          summary: Refresh and update columns of many datasets
+          description: >-
+            Reads the metadata of the datasets concurrently across databases, one
+            schema at a time, and updates their columns in bulk. Datasets whose
+            metadata can't be read are left unchanged, and returned as failed.
+          requestBody:
+            required: true
+            content:
+              application/json:
+                schema:
+                  $ref: "#/components/schemas/DatasetBulkRefreshRequestSchema"
+          responses:
+            200:
+              description: The columns changed for each dataset
+              content:
+                application/json:
+                  schema:
+                    $ref: "#/components/schemas/DatasetBulkRefreshResponseSchema"
+            400:
+              $ref: '#/components/responses/400'
+            401:
+              $ref: '#/components/responses/401'
+            403:
+              $ref: '#/components/responses/403'
+            404:
+              $ref: '#/components/responses/404'
+            422:
+              $ref: '#/components/responses/422'
+            500:
+              $ref: '#/components/responses/500'
+        """
+        try:
+            body = DatasetBulkRefreshRequestSchema().load(request.json)
+        except ValidationError as error:
+            return self.response_400(message=error.messages)
+        try:
+            result = BulkRefreshDatasetsCommand(body["ids"]).run()
+        except DatasetNotFoundError:
+            return self.response_404()
+        except DatasetForbiddenError:
+            return self.response_403()
+        except DatasetRefreshFailedError as ex:
+            logger.error(
+                "Error refreshing datasets %s: %s",
+                self.__class__.__name__,
+                str(ex),
+                exc_info=True,
+            )
+            return self.response_422(message=str(ex))
+        return self.response(
+            200,
+            result={
+                "refreshed": [
+                    {"id": model_id, **asdict(changes)}
+                    for model_id, changes in result.refreshed.items()
+                ],
+                "failed": [
+                    {"id": model_id, "message": message}
+                    for model_id, message in result.failed.items()
+                ],
+            },
+        )
+
     @expose("/<pk>/related_objects", methods=("GET",))
     @protect()
     @safe
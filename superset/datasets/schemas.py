@@ -354,6 +354,45 @@ class DatasetCacheWarmUpRequestSchema(Schema):
     )
 
 
+class DatasetBulkRefreshRequestSchema(Schema):
+    ids = fields.List(
+        fields.Integer(),
+        required=True,
+        validate=Length(min=1),
+        metadata={"description": "The IDs of the datasets to refresh"},
+    )
+
+
+class DatasetBulkRefreshedSchema(Schema):
+    id = fields.Integer(metadata={"description": "The ID of the dataset"})
+    added = fields.List(
+        fields.String(), metadata={"description": "The names of the added columns"}
+    )
+    removed = fields.List(
+        fields.String(), metadata={"description": "The names of the removed columns"}
+    )
+    modified = fields.List(
+        fields.String(),
+        metadata={"description": "The names of the columns whose type changed"},
+    )
+
+
+class DatasetBulkRefreshFailedSchema(Schema):
+    id = fields.Integer(metadata={"description": "The ID of the dataset"})
+    message = fields.String(
+        metadata={"description": "The error reading the metadata of the dataset"}
+    )
+
+
+class DatasetBulkRefreshResultSchema(Schema):
+    refreshed = fields.List(fields.Nested(DatasetBulkRefreshedSchema))
+    failed = fields.List(fields.Nested(DatasetBulkRefreshFailedSchema))
+
+
+class DatasetBulkRefreshResponseSchema(Schema):
+    result = fields.Nested(DatasetBulkRefreshResultSchema)
+
+
 class DatasetCacheWarmUpResponseSingleSchema(Schema):
     chart_id = fields.Integer(
         metadata={"description": "The ID of the chart the status belongs to"}
@@ -21,6 +21,8 @@ from superset.db_engine_specs.postgres import PostgresEngineSpec
 class AuroraMySQLDataAPI(MySQLEngineSpec):
     engine = "mysql"
     default_driver = "auroradataapi"
+    # the Data API driver doesn't describe columns with the native type codes
+    supports_limit_zero = False
     engine_name = "Aurora MySQL (Data API)"
     sqlalchemy_uri_placeholder = (
         "mysql+auroradataapi://{aws_access_id}:{aws_secret_access_key}@/"
@@ -34,6 +36,8 @@ class AuroraMySQLDataAPI(MySQLEngineSpec):
 class AuroraPostgresDataAPI(PostgresEngineSpec):
     engine = "postgresql"
     default_driver = "auroradataapi"
+    # the Data API driver doesn't describe columns with the native type codes
+    supports_limit_zero = False
     engine_name = "Aurora PostgreSQL (Data API)"
     sqlalchemy_uri_placeholder = (
         "postgresql+auroradataapi://{aws_access_id}:{aws_secret_access_key}@/"
@@ -71,6 +71,7 @@ from superset.sql.parse import (
     Table,
 )
 from superset.superset_typing import (
+    DbapiDescription,
     OAuth2ClientConfig,
     OAuth2State,
     OAuth2TokenResponse,
@@ -113,6 +114,16 @@ def convert_inspector_columns(cols: list[SQLAColumnType]) -> list[ResultSetColum
     return result_set_columns
 
 
+class SchemaTable(NamedTuple):
+    """
+    A table or view of a schema, with its columns, as read by the metadata crawler.
+    """
+
+    name: str
+    type: str  # "table" or "view"
+    columns: list[ResultSetColumnType]
+
+
 class TimeGrain(NamedTuple):
     name: str  # TODO: redundant field, remove
     label: str
@@ -348,6 +359,11 @@ class BaseEngineSpec:  # pylint: disable=too-many-public-methods
     supports_multivalues_insert = False
     allows_joins = True
     allows_subqueries = True
+    # Whether `IN (SELECT ...)` predicates are supported without joins, used to limit
+    # the series of queries in a single statement when joins aren't. Some engines
+    # plan them as joins, so this should only be enabled for engines verified to
+    # run them
+    allows_in_subquery = False
     allows_alias_in_select = True
     allows_alias_in_orderby = True
     allows_sql_comments = True
@@ -367,6 +383,10 @@ class BaseEngineSpec:  # pylint: disable=too-many-public-methods
     # But for backward compatibility, False by default
     allows_hidden_cc_in_orderby = False
 
+    # Whether window functions with `ROWS` frames are supported, which is required
+    # to push post-processing operations down to the database
+    supports_window_functions = False
+
     # Whether allow CTE as subquery or regular CTE
     # If True, then it will allow  in subquery ,
     # if False it will allow as regular CTE
@@ -421,6 +441,17 @@ class BaseEngineSpec:  # pylint: disable=too-many-public-methods
     # Does the DB engine spec support cross-catalog queries?
     supports_cross_catalog_queries = False
 
+    # Does the engine plan queries with `LIMIT 0` without reading any data, while still
+    # describing the columns they return? If so, virtual datasets are described that
+    # way instead of by fetching a row. See `get_query_description`.
+    supports_limit_zero = False
+
+    # Can the tables and columns of a schema be read from the standard
+    # `information_schema.tables` and `information_schema.columns` views? If so the
+    # metadata index crawler reads a whole schema with two queries, instead of
+    # inspecting each one of its tables.
+    supports_information_schema = False
+
     # Does the engine supports OAuth 2.0? This requires logic to be added to one of the
     # the user impersonation methods to handle personal tokens.
     supports_oauth2 = False
@@ -1491,6 +1522,102 @@ class BaseEngineSpec:  # pylint: disable=too-many-public-methods
             views = {re.sub(f"^{schema}\\.", "", view) for view in views}
         return views
 
+    @classmethod
+    def get_query_description(
+        cls,
+        database: Database,
+        cursor: Any,
+        query: str,
+    ) -> DbapiDescription | None:
+        """
+        Describe the columns returned by a query without running it.
+
+        By default the query is run with ``LIMIT 0`` when the engine plans it without
+        reading any data. Engines with another way to describe queries, e.g.
+        ``DESCRIBE OUTPUT``, can override this method. When None is returned the
+        query is run with a limit of 1 instead.
+
+        :param database: Database instance
+        :param cursor: Cursor instance
+        :param query: The query to describe
+        :returns: The cursor description of the result of the query, or None
+        """
+        if not cls.supports_limit_zero or cls.limit_method != LimitMethod.FORCE_LIMIT:
+            return None
+
+        sql = database.apply_limit_to_sql(query, limit=0, force=True)
+        sql = database.mutate_sql_based_on_config(sql)
+        cls.execute(cursor, sql, database)
+        # some drivers only describe the result once it was fetched
+        cursor.fetchall()
+        return cursor.description
+
+    @classmethod
+    def get_schema_tables(
+        cls,
+        database: Database,
+        inspector: Inspector,
+        schema: str,
+    ) -> list[SchemaTable]:
+        """
+        Get all the tables and views of a schema, with their columns.
+
+        This is used to crawl the metadata of whole schemas into the metadata index.
+        Table and view names are read like the table list reads them. Databases
+        supporting ``information_schema`` have the columns of all their tables read
+        with one query, the columns of the others (and of the relations missing from
+        ``information_schema``, e.g. materialized views) are inspected per table.
+
+        :param database: The database to inspect
+        :param inspector: The SQLAlchemy inspector, bound to the catalog to crawl
+        :param schema: The schema to inspect
+        :returns: The tables and views of the schema, sorted by name
+        """
+        tables = [
+            (name, "table") for name in cls.get_table_names(database, inspector, schema)
+        ] + [(name, "view") for name in cls.get_view_names(database, inspector, schema)]
+
+        columns: dict[str, list[ResultSetColumnType]] = {}
+        if cls.supports_information_schema:
+            try:
+                with inspector.engine.connect() as connection:
+                    column_rows = connection.execute(
+                        text(
+                            "SELECT table_name, column_name, data_type, is_nullable "
+                            "FROM information_schema.columns "
+                            "WHERE table_schema = :schema "
+                            "ORDER BY table_name, ordinal_position"
+                        ),
+                        {"schema": schema},
+                    ).fetchall()
+            except Exception as ex:
+                raise cls.get_dbapi_mapped_exception(ex) from ex
+
+            for table_name, column_name, data_type, is_nullable in column_rows:
+                columns.setdefault(table_name, []).append(
+                    {
+                        "name": column_name,
+                        "column_name": column_name,
+                        "type": str(data_type).upper(),
+                        "is_dttm": None,
+                        "nullable": str(is_nullable).upper() == "YES",
+                    }
+                )
+
+        return sorted(
+            (
+                SchemaTable(
+                    name,
+                    type_,
+                    columns[name]
+                    if name in columns
+                    else cls.get_columns(inspector, Table(name, schema)),
+                )
+                for name, type_ in tables
+            ),
+            key=lambda table: table.name,
+        )
+
     @classmethod
     def get_indexes(
         cls,
@@ -134,6 +134,7 @@ class BigQueryEngineSpec(BaseEngineSpec):  # pylint: disable=too-many-public-met
     run_multiple_statements_as_one = True
 
     allows_hidden_cc_in_orderby = True
+    supports_window_functions = True
 
     supports_catalog = supports_dynamic_catalog = supports_cross_catalog_queries = True
 
@@ -194,6 +194,7 @@ class DuckDBEngineSpec(DuckDBParametersMixin, BaseEngineSpec):
     engine = "duckdb"
     engine_name = "DuckDB"
     default_driver = "duckdb_engine"
+    supports_window_functions = True
 
     sqlalchemy_uri_placeholder = "duckdb:////path/to/duck.db"
 
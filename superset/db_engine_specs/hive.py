@@ -96,6 +96,8 @@ class HiveEngineSpec(PrestoEngineSpec):
 
     supports_dynamic_schema = True
     supports_cross_catalog_queries = False
+    # unlike Presto, Hive may still launch jobs to run `LIMIT 0` queries
+    supports_limit_zero = False
 
     # When running `SHOW FUNCTIONS`, what is the name of the column with the
     # function names?
@@ -74,6 +74,8 @@ class MySQLEngineSpec(BasicParametersMixin, BaseEngineSpec):
     encryption_parameters = {"ssl": "1"}
 
     supports_dynamic_schema = True
+    supports_information_schema = True
+    supports_limit_zero = True
 
     column_type_mappings = (
         (
@@ -100,6 +100,8 @@ class PostgresBaseEngineSpec(BaseEngineSpec):
     engine = ""
     engine_name = "PostgreSQL"
 
+    supports_window_functions = True
+
     _time_grain_expressions = {
         None: "{col}",
         TimeGrain.SECOND: "DATE_TRUNC('second', {col})",
@@ -206,6 +208,9 @@ class PostgresEngineSpec(BasicParametersMixin, PostgresBaseEngineSpec):
     supports_dynamic_schema = True
     supports_catalog = True
     supports_dynamic_catalog = True
+    supports_information_schema = True
+    # psycopg2 describes columns with type OIDs, which `get_datatype` maps
+    supports_limit_zero = True
 
     default_driver = "psycopg2"
     sqlalchemy_uri_placeholder = (
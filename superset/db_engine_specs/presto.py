@@ -22,11 +22,12 @@ import logging
 import re
 import time
 from abc import ABCMeta
-from collections import defaultdict, deque
+from collections import deque
 from datetime import datetime
+from functools import partial
 from re import Pattern
 from textwrap import dedent
-from typing import Any, cast, Optional, TYPE_CHECKING
+from typing import Any, cast, TYPE_CHECKING
 from urllib import parse
 
 import pandas as pd
@@ -58,7 +59,7 @@ from superset.models.sql_types.presto_sql_types import (
 )
 from superset.result_set import destringify
 from superset.superset_typing import ResultSetColumnType
-from superset.utils import core as utils, json
+from superset.utils import core as utils, json, partition_cache
 from superset.utils.core import GenericDataType
 
 if TYPE_CHECKING:
@@ -93,6 +94,47 @@ CONNECTION_UNKNOWN_DATABASE_ERROR = re.compile(
 logger = logging.getLogger(__name__)
 
 
+# marks the cells of expanded data sets absent from the original rows
+_MISSING = object()
+
+
+def _unnest_arrays(
+    values: dict[str, list[Any]],
+    arrays: list[str],
+    row_count: int,
+) -> int:
+    """
+    Unnest the arrays of a level of nesting into new rows.
+
+    Each row is unnested into as many rows as its longest array, which are shared by
+    the arrays of the row. Other columns are missing from the new rows.
+
+    :param values: the values of each column, updated in place
+    :param arrays: the names of the arrays to unnest
+    :param row_count: the number of rows
+    :return: the number of rows after unnesting
+    """
+    if not arrays:
+        return row_count
+
+    counts = [1] * row_count
+    for name in arrays:
+        for i, value in enumerate(values[name]):
+            if value and value is not _MISSING and len(value) > counts[i]:
+                counts[i] = len(value)
+
+    for name, column_values in values.items():
+        is_array = name in arrays
+        unnested: list[Any] = []
+        for value, count in zip(column_values, counts, strict=True):
+            items = value if is_array and value and value is not _MISSING else [value]
+            unnested.extend(items)
+            unnested.extend([_MISSING] * (count - len(items)))
+        values[name] = unnested
+
+    return sum(counts)
+
+
 def get_children(column: ResultSetColumnType) -> list[ResultSetColumnType]:
     """
     Get the children of a complex Presto type (row or array).
@@ -163,6 +205,8 @@ class PrestoBaseEngineSpec(BaseEngineSpec, metaclass=ABCMeta):
 
     supports_dynamic_schema = True
     supports_catalog = supports_dynamic_catalog = supports_cross_catalog_queries = True
+    supports_window_functions = True
+    supports_limit_zero = True
 
     column_type_mappings = (
         (
@@ -566,7 +610,6 @@ class PrestoBaseEngineSpec(BaseEngineSpec, metaclass=ABCMeta):
         return None
 
     @classmethod
-    @cache_manager.data_cache.memoize(timeout=60)
     def latest_partition(
         cls,
         database: Database,
@@ -576,6 +619,8 @@ class PrestoBaseEngineSpec(BaseEngineSpec, metaclass=ABCMeta):
     ) -> tuple[list[str], list[str] | None]:
         """Returns col name and the latest (max) partition value for a table
 
+        Lookups are cached, see `superset.utils.partition_cache`.
+
         :param table: the table instance
         :param database: database query will be run against
         :type database: models.Database
@@ -587,6 +632,29 @@ class PrestoBaseEngineSpec(BaseEngineSpec, metaclass=ABCMeta):
         >>> latest_partition('foo_table')
         (['ds'], ('2018-01-01',))
         """
+        column_names, values = partition_cache.get_or_fetch(
+            database,
+            table,
+            "latest_partition",
+            partial(cls._latest_partition, database, table, indexes),
+        )
+
+        if not show_first and len(column_names) > 1:
+            raise SupersetTemplateException(
+                "The table should have a single partitioned field "
+                "to use this function. You may want to use "
+                "`presto.latest_sub_partition`"
+            )
+
+        return column_names, values
+
+    @classmethod
+    def _latest_partition(
+        cls,
+        database: Database,
+        table: Table,
+        indexes: list[dict[str, Any]] | None = None,
+    ) -> tuple[list[str], list[str] | None]:
         if indexes is None:
             indexes = database.get_indexes(table)
 
@@ -601,13 +669,6 @@ class PrestoBaseEngineSpec(BaseEngineSpec, metaclass=ABCMeta):
                 "The table should have one partitioned field"
             )
 
-        if not show_first and len(indexes[0]["column_names"]) > 1:
-            raise SupersetTemplateException(
-                "The table should have a single partitioned field "
-                "to use this function. You may want to use "
-                "`presto.latest_sub_partition`"
-            )
-
         column_names = indexes[0]["column_names"]
 
         return column_names, cls._latest_partition_from_df(
@@ -653,6 +714,21 @@ class PrestoBaseEngineSpec(BaseEngineSpec, metaclass=ABCMeta):
         >>> latest_sub_partition('sub_partition_table', event_type='click')
         '2018-01-01'
         """
+        return partition_cache.get_or_fetch(
+            database,
+            table,
+            "latest_sub_partition",
+            partial(cls._latest_sub_partition, database, table, **kwargs),
+            **kwargs,
+        )
+
+    @classmethod
+    def _latest_sub_partition(
+        cls,
+        database: Database,
+        table: Table,
+        **kwargs: Any,
+    ) -> Any:
         indexes = database.get_indexes(table)
         part_fields = indexes[0]["column_names"]
         for k in kwargs.keys():  # pylint: disable=consider-iterating-dictionary
@@ -1129,7 +1205,7 @@ class PrestoEngineSpec(PrestoBaseEngineSpec):
         )
 
     @classmethod
-    def expand_data(  # pylint: disable=too-many-locals  # noqa: C901
+    def expand_data(  # noqa: C901
         cls, columns: list[ResultSetColumnType], data: list[dict[Any, Any]]
     ) -> tuple[
         list[ResultSetColumnType], list[dict[Any, Any]], list[ResultSetColumnType]
@@ -1150,6 +1226,11 @@ class PrestoEngineSpec(PrestoBaseEngineSpec):
             {'ColumnA': ['a2'], 'ColumnA.nested_obj': 'a2', 'ColumnB': 3},
             {'ColumnA': '',     'ColumnA.nested_obj': '',   'ColumnB': 4},
         ]
+
+        The data is expanded one column at a time, and the arrays of each level of
+        nesting are unnested together once the level is processed, so that the time
+        taken is linear in the size of the expanded data set.
+
         :param columns: columns selected in the query
         :param data: original data set
         :return: list of all columns(selected columns and their nested fields),
@@ -1158,64 +1239,46 @@ class PrestoEngineSpec(PrestoBaseEngineSpec):
         if not is_feature_enabled("PRESTO_EXPAND_DATA"):
             return columns, data, []
 
+        # the values of each column, with missing values for the cells absent from
+        # the rows, which are rendered empty
+        names = dict.fromkeys(column["column_name"] for column in columns)
+        names.update(dict.fromkeys(key for row in data for key in row))
+        values = {name: [row.get(name, _MISSING) for row in data] for name in names}
+        row_count = len(data)
+
         # process each column, unnesting ARRAY types and
         # expanding ROW types into new columns
         to_process = deque((column, 0) for column in columns)
         all_columns: list[ResultSetColumnType] = []
+        seen: set[str] = set()
         expanded_columns = []
-        current_array_level = None
+        current_array_level = 0
+        arrays: list[str] = []
         while to_process:
             column, level = to_process.popleft()
-            if column["column_name"] not in [
-                column["column_name"] for column in all_columns
-            ]:
-                all_columns.append(column)
-
-            # When unnesting arrays we need to keep track of how many extra rows
-            # were added, for each original row. This is necessary when we expand
-            # multiple arrays, so that the arrays after the first reuse the rows
-            # added by the first. every time we change a level in the nested arrays
-            # we reinitialize this.
             if level != current_array_level:
-                unnested_rows: dict[int, int] = defaultdict(int)
+                # the arrays of a level share the rows they're unnested into, so
+                # they're unnested together before processing the next level
+                row_count = _unnest_arrays(values, arrays, row_count)
+                arrays = []
                 current_array_level = level
 
             name = column["column_name"]
-            values: str | list[Any] | None
+            if name not in values:
+                values[name] = [_MISSING] * row_count
+            if name not in seen:
+                seen.add(name)
+                all_columns.append(column)
+            column_values = values[name]
 
             if column["type"] and column["type"].startswith("ARRAY("):
                 # keep processing array children; we append to the right so that
                 # multiple nested arrays are processed breadth-first
                 to_process.append((get_children(column)[0], level + 1))
-
-                # unnest array objects data into new rows
-                i = 0
-                while i < len(data):
-                    row = data[i]
-                    values = row.get(name)
-                    if isinstance(values, str):
-                        row[name] = values = destringify(values)
-                    if values:
-                        # how many extra rows we need to unnest the data?
-                        extra_rows = len(values) - 1
-
-                        # how many rows were already added for this row?
-                        current_unnested_rows = unnested_rows[i]
-
-                        # add any necessary rows
-                        missing = extra_rows - current_unnested_rows
-                        for _ in range(missing):
-                            data.insert(i + current_unnested_rows + 1, {})
-                            unnested_rows[i] += 1
-
-                        # unnest array into rows
-                        for j, value in enumerate(values):
-                            data[i + j][name] = value
-
-                        # skip newly unnested rows
-                        i += unnested_rows[i]
-
-                    i += 1
+                for i, value in enumerate(column_values):
+                    if value and isinstance(value, str):
+                        column_values[i] = destringify(value)
+                arrays.append(name)
 
             if column["type"] and column["type"].startswith("ROW("):
                 # expand columns; we append them to the left so they are added
@@ -1225,17 +1288,32 @@ class PrestoEngineSpec(PrestoBaseEngineSpec):
                 expanded_columns.extend(expanded)
 
                 # expand row objects into new columns
-                for row in data:
-                    values = row.get(name) or []
-                    if isinstance(values, str):
-                        values = cast(Optional[list[Any]], destringify(values))
-                        row[name] = values
-                    for value, col in zip(values or [], expanded, strict=False):
-                        row[col["column_name"]] = value
-
+                for col in expanded:
+                    if col["column_name"] not in values:
+                        values[col["column_name"]] = [_MISSING] * row_count
+                expanded_values = [values[col["column_name"]] for col in expanded]
+                for i, value in enumerate(column_values):
+                    if value is _MISSING:
+                        continue
+                    if value and isinstance(value, str):
+                        column_values[i] = value = destringify(value)
+                    for child_values, child_value in zip(
+                        expanded_values, value or [], strict=False
+                    ):
+                        child_values[i] = child_value
+
+        _unnest_arrays(values, arrays, row_count)
+
+        names = dict.fromkeys(column["column_name"] for column in all_columns)
         data = [
-            {k["column_name"]: row.get(k["column_name"], "") for k in all_columns}
-            for row in data
+            dict(zip(names, row, strict=True))
+            for row in zip(
+                *(
+                    ["" if value is _MISSING else value for value in values[name]]
+                    for name in names
+                ),
+                strict=True,
+            )
         ]
 
         return all_columns, data, expanded_columns
@@ -42,6 +42,7 @@ class SqliteEngineSpec(BaseEngineSpec):
     engine_name = "SQLite"
 
     disable_ssh_tunneling = True
+    supports_window_functions = True
 
     _time_grain_expressions = {
         None: "{col}",
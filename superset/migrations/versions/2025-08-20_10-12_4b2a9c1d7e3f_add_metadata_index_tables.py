@@ -0,0 +1,96 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+"""add metadata index tables
+
+Revision ID: 4b2a9c1d7e3f
+Revises: 68daa03e4a41
+Create Date: 2025-08-20 10:12:41.305112
+
+"""
+
+import sqlalchemy as sa
+from sqlalchemy.dialects import mysql
+
+from superset.migrations.shared.utils import (
+    create_fks_for_table,
+    create_index,
+    create_table,
+    drop_index,
+    drop_table,
+)
+
+# revision identifiers, used by Alembic.
+revision = "4b2a9c1d7e3f"
+down_revision = "68daa03e4a41"
+
+
+def upgrade():
+    create_table(
+        "metadata_index_schemas",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("database_id", sa.Integer(), nullable=False),
+        sa.Column("catalog", sa.String(length=256), nullable=True),
+        sa.Column("schema", sa.String(length=256), nullable=False),
+        sa.Column("crawled_on", sa.DateTime(), nullable=False),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    create_fks_for_table(
+        "fk_metadata_index_schemas_database_id_dbs",
+        "metadata_index_schemas",
+        "dbs",
+        ["database_id"],
+        ["id"],
+        ondelete="CASCADE",
+    )
+    create_index(
+        "metadata_index_schemas",
+        "ix_metadata_index_schemas_database_id_schema",
+        ["database_id", "schema"],
+    )
+
+    create_table(
+        "metadata_index_tables",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("schema_id", sa.Integer(), nullable=False),
+        sa.Column("table_name", sa.String(length=256), nullable=False),
+        sa.Column("table_type", sa.String(length=16), nullable=False),
+        sa.Column(
+            "columns_json",
+            sa.Text().with_variant(mysql.MEDIUMTEXT(), "mysql"),
+            nullable=False,
+        ),
+        sa.Column("checksum", sa.String(length=32), nullable=False),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint("schema_id", "table_name"),
+    )
+    create_fks_for_table(
+        "fk_metadata_index_tables_schema_id_metadata_index_schemas",
+        "metadata_index_tables",
+        "metadata_index_schemas",
+        ["schema_id"],
+        ["id"],
+        ondelete="CASCADE",
+    )
+
+
+def downgrade():
+    drop_table("metadata_index_tables")
+    drop_index(
+        "metadata_index_schemas",
+        "ix_metadata_index_schemas_database_id_schema",
+    )
+    drop_table("metadata_index_schemas")
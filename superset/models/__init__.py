@@ -14,6 +14,12 @@
 # KIND, either express or implied.  See the License for the
 # specific language governing permissions and limitations
 # under the License.
-from . import core, dynamic_plugins, sql_lab, user_attributes  # noqa: F401
+from . import (  # noqa: F401
+    core,
+    dynamic_plugins,
+    metadata_index,
+    sql_lab,
+    user_attributes,
+)
 
 # Collections models will be imported separately to avoid circular imports
@@ -64,6 +64,7 @@ from sqlalchemy.sql import ColumnElement, expression, Select
 from superset import app, db, db_engine_specs, is_feature_enabled
 from superset.commands.database.exceptions import DatabaseInvalidError
 from superset.constants import LRU_CACHE_MAX_SIZE, PASSWORD_MASK
+from superset.databases import metadata_cache
 from superset.databases.utils import make_url_safe
 from superset.db_engine_specs.base import MetricType, TimeGrain
 from superset.extensions import (
@@ -730,19 +731,21 @@ class Database(Model, AuditMixinNullable, ImportExportMixin):  # pylint: disable
         )
         return result_set.to_pandas_df()
 
-    def compile_sqla_query(
+    def compile_sqla_query(  # pylint: disable=unused-argument
         self,
         qry: Select,
         catalog: str | None = None,
         schema: str | None = None,
         is_virtual: bool = False,
     ) -> str:
-        with self.get_sqla_engine(catalog=catalog, schema=schema) as engine:
-            sql = str(qry.compile(engine, compile_kwargs={"literal_binds": True}))
+        # compiling only needs the dialect, which doesn't depend on the catalog and
+        # schema, so no engine is created
+        dialect = self.get_dialect()
+        sql = str(qry.compile(dialect=dialect, compile_kwargs={"literal_binds": True}))
 
-            # pylint: disable=protected-access
-            if engine.dialect.identifier_preparer._double_percents:  # noqa
-                sql = sql.replace("%%", "%")
+        # pylint: disable=protected-access
+        if dialect.identifier_preparer._double_percents:  # noqa
+            sql = sql.replace("%%", "%")
 
         # for nwo we only optimize queries on virtual datasources, since the only
         # optimization available is predicate pushdown
@@ -795,6 +798,7 @@ class Database(Model, AuditMixinNullable, ImportExportMixin):  # pylint: disable
     @cache_util.memoized_func(
         key="db:{self.id}:catalog:{catalog}:schema:{schema}:table_list",
         cache=cache_manager.cache,
+        version=metadata_cache.get_list_version,
     )
     def get_all_table_names_in_schema(
         self,
@@ -829,6 +833,7 @@ class Database(Model, AuditMixinNullable, ImportExportMixin):  # pylint: disable
     @cache_util.memoized_func(
         key="db:{self.id}:catalog:{catalog}:schema:{schema}:view_list",
         cache=cache_manager.cache,
+        version=metadata_cache.get_list_version,
     )
     def get_all_view_names_in_schema(
         self,
@@ -877,6 +882,7 @@ class Database(Model, AuditMixinNullable, ImportExportMixin):  # pylint: disable
     @cache_util.memoized_func(
         key="db:{self.id}:catalog:{catalog}:schema_list",
         cache=cache_manager.cache,
+        version=metadata_cache.get_list_version,
     )
     def get_all_schema_names(
         self,
@@ -906,6 +912,7 @@ class Database(Model, AuditMixinNullable, ImportExportMixin):  # pylint: disable
     @cache_util.memoized_func(
         key="db:{self.id}:catalog_list",
         cache=cache_manager.cache,
+        version=metadata_cache.get_list_version,
     )
     def get_all_catalog_names(
         self,
@@ -1107,8 +1114,19 @@ class Database(Model, AuditMixinNullable, ImportExportMixin):  # pylint: disable
         return table.table in views
 
     def get_dialect(self) -> Dialect:
+        """
+        Return the dialect of the database, without creating an engine.
+
+        Dialects are only used to compile and quote SQL, so they're shared by the
+        databases using the same driver.
+        """
         sqla_url = make_url_safe(self.sqlalchemy_uri_decrypted)
-        return sqla_url.get_dialect()()
+        return self._get_dialect(sqla_url.drivername)
+
+    @staticmethod
+    @lru_cache(maxsize=LRU_CACHE_MAX_SIZE)
+    def _get_dialect(drivername: str) -> Dialect:
+        return URL.create(drivername).get_dialect()()
 
     def make_sqla_column_compatible(
         self, sqla_col: ColumnElement, label: str | None = None
@@ -55,6 +55,7 @@ from sqlalchemy_utils import UUIDType
 from superset import app, db, is_feature_enabled
 from superset.advanced_data_type.types import AdvancedDataTypeResponse
 from superset.common.db_query_status import QueryStatus
+from superset.common.utils.post_processing_pushdown import push_down_post_processing
 from superset.common.utils.time_range_utils import get_since_until_from_time_range
 from superset.constants import EMPTY_STRING, NULL_STRING
 from superset.db_engine_specs.base import TimestampExpression
@@ -573,6 +574,7 @@ class QueryResult:  # pylint: disable=too-few-public-methods
         errors: Optional[list[dict[str, Any]]] = None,
         from_dttm: Optional[datetime] = None,
         to_dttm: Optional[datetime] = None,
+        post_processing_pushed: int = 0,
     ) -> None:
         self.df = df
         self.query = query
@@ -585,6 +587,7 @@ class QueryResult:  # pylint: disable=too-few-public-methods
         self.errors = errors or []
         self.from_dttm = from_dttm
         self.to_dttm = to_dttm
+        self.post_processing_pushed = post_processing_pushed
         self.sql_rowcount = len(self.df.index) if not self.df.empty else 0
 
 
@@ -683,6 +686,8 @@ class QueryStringExtended(NamedTuple):
     labels_expected: list[str]
     prequeries: list[str]
     sql: str
+    # number of leading post-processing operations applied by the query
+    post_processing_pushed: int = 0
 
 
 class SqlaQuery(NamedTuple):
@@ -694,6 +699,7 @@ class SqlaQuery(NamedTuple):
     labels_expected: list[str]
     prequeries: list[str]
     sqla_query: Select
+    post_processing_pushed: int = 0
 
 
 class ExploreMixin:  # pylint: disable=too-many-public-methods
@@ -893,6 +899,7 @@ class ExploreMixin:  # pylint: disable=too-many-public-methods
             labels_expected=sqlaq.labels_expected,
             prequeries=sqlaq.prequeries,
             sql=sql,
+            post_processing_pushed=sqlaq.post_processing_pushed,
         )
 
     def _normalize_prequery_result_type(
@@ -1036,6 +1043,7 @@ class ExploreMixin:  # pylint: disable=too-many-public-methods
             query=sql,
             errors=errors,
             error_message=error_message,
+            post_processing_pushed=query_str_ext.post_processing_pushed,
         )
 
     def get_rendered_sql(
@@ -1243,6 +1251,19 @@ class ExploreMixin:  # pylint: disable=too-many-public-methods
         groupby_exprs: dict[str, Any],
         columns_by_name: dict[str, "TableColumn"],
     ) -> ColumnElement:
+        if len(dimensions) == 1:
+            (dimension,) = dimensions
+            values = [
+                self._normalize_prequery_result_type(row, dimension, columns_by_name)
+                for _unused, row in df.iterrows()
+            ]
+            not_null = [value for value in values if not pd.isna(value)]
+            top_groups = groupby_exprs[dimension].in_(not_null)
+            # NULL never matches an IN list
+            if len(not_null) < len(values):
+                top_groups = or_(top_groups, groupby_exprs[dimension].is_(None))
+            return top_groups
+
         groups = []
         for _unused, row in df.iterrows():
             group = []
@@ -1424,15 +1445,17 @@ class ExploreMixin:  # pylint: disable=too-many-public-methods
         rls_filters = self.get_sqla_row_level_filters(template_processor=tp)
         qry = qry.where(and_(*rls_filters))
 
-        with self.database.get_sqla_engine() as engine:
-            sql = str(qry.compile(engine, compile_kwargs={"literal_binds": True}))
-            sql = self._apply_cte(sql, cte)
-            sql = self.database.mutate_sql_based_on_config(sql)
+        sql = str(
+            qry.compile(dialect=db_dialect, compile_kwargs={"literal_binds": True})
+        )
+        sql = self._apply_cte(sql, cte)
+        sql = self.database.mutate_sql_based_on_config(sql)
 
-            # pylint: disable=protected-access
-            if engine.dialect.identifier_preparer._double_percents:
-                sql = sql.replace("%%", "%")
+        # pylint: disable=protected-access
+        if db_dialect.identifier_preparer._double_percents:
+            sql = sql.replace("%%", "%")
 
+        with self.database.get_sqla_engine() as engine:
             with engine.connect() as con:
                 df = pd.read_sql_query(sql=self.text(sql), con=con)
                 # replace NaN with None to ensure it can be serialized to JSON
@@ -1514,6 +1537,7 @@ class ExploreMixin:  # pylint: disable=too-many-public-methods
         timeseries_limit: Optional[int] = None,
         timeseries_limit_metric: Optional[Metric] = None,
         time_shift: Optional[str] = None,
+        post_processing: Optional[list[dict[str, Any]]] = None,
     ) -> SqlaQuery:
         """Querying any sqla table from this common interface"""
         if granularity not in self.dttm_cols and granularity is not None:
@@ -1523,8 +1547,7 @@ class ExploreMixin:  # pylint: disable=too-many-public-methods
         time_grain = extras.get("time_grain_sqla")
 
         # DB-specifc quoting for identifiers
-        with self.database.get_sqla_engine() as engine:
-            quote = engine.dialect.identifier_preparer.quote
+        quote = self.database.quote_identifier
 
         template_kwargs = {
             "columns": columns,
@@ -2050,7 +2073,18 @@ class ExploreMixin:  # pylint: disable=too-many-public-methods
             qry = qry.offset(row_offset)
 
         if series_limit and groupby_series_columns:
-            if db_engine_spec.allows_joins and db_engine_spec.allows_subqueries:
+            # the top groups are selected by a subquery joined to the main query, or
+            # filtered with a semi-join on databases without joins; a prequery
+            # fetches them otherwise
+            use_join = db_engine_spec.allows_joins and db_engine_spec.allows_subqueries
+            use_semi_join = (
+                not use_join
+                and db_engine_spec.allows_subqueries
+                and db_engine_spec.allows_in_subquery
+                and len(groupby_series_columns) == 1
+            )
+            top_groups: Optional[ColumnElement] = None
+            if use_join or use_semi_join:
                 # some sql dialects require for order by expressions
                 # to also be in the select clause -- others, e.g. vertica,
                 # require a unique inner alias
@@ -2092,6 +2126,12 @@ class ExploreMixin:  # pylint: disable=too-many-public-methods
                 subq = subq.order_by(direction(ob))
                 subq = subq.limit(series_limit)
 
+            if use_semi_join:
+                ((gby_name, gby_obj),) = groupby_series_columns.items()
+                subq_alias = subq.alias(SERIES_LIMIT_SUBQ_ALIAS)
+                col_name = db_engine_spec.make_label_compatible(gby_name + "__")
+                top_groups = gby_obj.in_(sa.select([subq_alias.c[col_name]]))
+            elif use_join:
                 on_clause = []
                 for gby_name, gby_obj in groupby_series_columns.items():
                     # in this case the column name, not the alias, needs to be
@@ -2178,6 +2218,7 @@ class ExploreMixin:  # pylint: disable=too-many-public-methods
                     result.df, dimensions, groupby_series_columns, columns_by_name
                 )
 
+            if top_groups is not None:
                 if group_others_when_limit_reached:
                     # Apply Others grouping using the refactored method
                     def _create_top_groups_condition(col_name: str, expr: Any) -> Any:
@@ -2202,6 +2243,40 @@ class ExploreMixin:  # pylint: disable=too-many-public-methods
 
         qry = qry.select_from(tbl)
 
+        post_processing_pushed = 0
+        if (
+            post_processing
+            and not is_rowcount
+            and db_engine_spec.supports_window_functions
+            and db_engine_spec.allows_subqueries
+            and db_engine_spec.get_allows_alias_in_select(self.database)
+        ):
+            # operations that depend on the order of the rows need every row to
+            # have a distinct position, i.e. the order to cover all dimensions
+            orderby_labels = [
+                (col.key, ascending)
+                for col, (_orig_col, ascending) in zip(
+                    orderby_exprs, orderby, strict=False
+                )
+            ]
+            ordered = need_groupby and {
+                col.key for col in groupby_all_columns.values()
+            } <= {label for label, _ in orderby_labels}
+            if pushdown := push_down_post_processing(
+                qry,
+                columns={
+                    col.key: col.name
+                    for col in select_exprs
+                    if col.key in labels_expected
+                },
+                metrics=[col.key for col in metrics_exprs],
+                orderby=orderby_labels,
+                ordered=ordered,
+                post_processing=post_processing,
+                make_label=self.make_sqla_column_compatible,
+            ):
+                qry, labels_expected, post_processing_pushed = pushdown
+
         if is_rowcount:
             if not db_engine_spec.allows_subqueries:
                 raise QueryObjectValidationError(
@@ -2239,4 +2314,5 @@ class ExploreMixin:  # pylint: disable=too-many-public-methods
             labels_expected=labels_expected,
             sqla_query=qry,
             prequeries=prequeries,
+            post_processing_pushed=post_processing_pushed,
         )
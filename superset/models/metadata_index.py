@@ -0,0 +1,110 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+"""
+Models of the metadata index.
+
+The metadata index is a compact copy of the tables, views and columns of the
+schemas of a database, crawled in the background by the `metadata_index.crawl`
+Celery task. The table list and the table search read from it instead of
+inspecting the database on every request.
+"""
+
+from __future__ import annotations
+
+from flask_appbuilder import Model
+from sqlalchemy import Column, DateTime, ForeignKey, Index, Integer, String
+from sqlalchemy.orm import backref, relationship
+from sqlalchemy.schema import UniqueConstraint
+
+from superset.models.core import Database
+from superset.superset_typing import ResultSetColumnType
+from superset.utils import core as utils, json
+
+
+class IndexedSchema(Model):
+    """A schema crawled into the metadata index"""
+
+    __tablename__ = "metadata_index_schemas"
+    __table_args__ = (
+        Index("ix_metadata_index_schemas_database_id_schema", "database_id", "schema"),
+    )
+
+    id = Column(Integer, primary_key=True)
+    database_id = Column(
+        Integer, ForeignKey("dbs.id", ondelete="CASCADE"), nullable=False
+    )
+    catalog = Column(String(256), nullable=True)
+    schema = Column(String(256), nullable=False)
+    crawled_on = Column(DateTime, nullable=False)
+
+    database = relationship(
+        Database,
+        backref=backref(
+            "indexed_schemas",
+            cascade="all, delete-orphan",
+            passive_deletes=True,
+        ),
+    )
+    tables = relationship(
+        "IndexedTable",
+        back_populates="indexed_schema",
+        cascade="all, delete-orphan",
+        passive_deletes=True,
+    )
+
+    def __repr__(self) -> str:
+        return f"{self.database_id}:{self.catalog}:{self.schema}"
+
+
+class IndexedTable(Model):
+    """A table or view crawled into the metadata index"""
+
+    __tablename__ = "metadata_index_tables"
+    __table_args__ = (UniqueConstraint("schema_id", "table_name"),)
+
+    id = Column(Integer, primary_key=True)
+    schema_id = Column(
+        Integer,
+        ForeignKey("metadata_index_schemas.id", ondelete="CASCADE"),
+        nullable=False,
+    )
+    table_name = Column(String(256), nullable=False)
+    # "table" or "view"
+    table_type = Column(String(16), nullable=False)
+    # JSON list of the columns, with their name, type, nullability and comment
+    columns_json = Column(utils.MediumText(), nullable=False)
+    # hash of `table_type` and `columns_json`, to only update changed tables
+    checksum = Column(String(32), nullable=False)
+
+    indexed_schema = relationship(IndexedSchema, back_populates="tables")
+
+    @property
+    def columns(self) -> list[ResultSetColumnType]:
+        return [
+            {
+                "name": column["name"],
+                "column_name": column["name"],
+                "type": column["type"],
+                "is_dttm": None,
+                "nullable": column["nullable"],
+                "comment": column["comment"],
+            }
+            for column in json.loads(self.columns_json)
+        ]
+
+    def __repr__(self) -> str:
+        return f"{self.indexed_schema}:{self.table_name}"
@@ -40,6 +40,7 @@ from superset import (
 )
 from superset.common.db_query_status import QueryStatus
 from superset.constants import QUERY_CANCEL_KEY, QUERY_EARLY_CANCEL_KEY
+from superset.databases import metadata_cache
 from superset.dataframe import df_to_records
 from superset.db_engine_specs import BaseEngineSpec
 from superset.errors import ErrorLevel, SupersetError, SupersetErrorType
@@ -506,6 +507,11 @@ def execute_sql_statements(  # noqa: C901
     query.set_extra_json_key("progress", None)
     query.set_extra_json_key("columns", result_set.columns)
     if query.select_as_cta:
+        metadata_cache.invalidate_schema(
+            database,
+            query.catalog,
+            query.tmp_schema_name,
+        )
         query.select_sql = database.select_star(
             Table(query.tmp_table_name, query.tmp_schema_name),
             limit=query.limit,
@@ -26,6 +26,7 @@ from flask_appbuilder.security.sqla.models import User
 from marshmallow import ValidationError
 
 from superset.charts.schemas import ChartDataQueryContextSchema
+from superset.common.chart_data import ChartDataResultFormat, ChartDataResultType
 from superset.exceptions import SupersetVizException
 from superset.extensions import (
     async_query_manager,
@@ -33,6 +34,7 @@ from superset.extensions import (
     celery_app,
     security_manager,
 )
+from superset.utils import json
 from superset.utils.cache import generate_cache_key, set_and_log_cache
 from superset.utils.core import override_user
 from superset.views.utils import get_datasource_info, get_viz
@@ -65,6 +67,51 @@ def _create_query_context_from_form(form_data: dict[str, Any]) -> QueryContext:
         raise ValidationError("Request is incorrect") from ex
 
 
+def _get_inline_result(result: dict[str, Any]) -> list[dict[str, Any]] | None:
+    """
+    Return the chart data to embed in the job-done event, if it is small enough.
+
+    The queries are serialized the same way the ``/api/v1/chart/data/<cache_key>``
+    endpoint does it, and only embedded when the payload stays under
+    ``GLOBAL_ASYNC_QUERIES_INLINE_RESULT_MAX_BYTES``, which saves the client a
+    round trip to fetch the cached result.
+
+    :param result: The chart data command result
+    :returns: The serializable queries, or None if they need to be fetched
+    """
+    max_bytes = current_app.config["GLOBAL_ASYNC_QUERIES_INLINE_RESULT_MAX_BYTES"]
+    query_context = result["query_context"]
+    if (
+        not max_bytes
+        or query_context.result_format != ChartDataResultFormat.JSON
+        or query_context.result_type == ChartDataResultType.POST_PROCESSED
+    ):
+        return None
+
+    queries = result["queries"]
+    # every row repeats the quoted column names, which gives a lower bound of the
+    # payload size that avoids serializing results that are obviously too large
+    min_size = sum(
+        query.get("rowcount", 0)
+        * sum(len(str(name)) + 4 for name in query.get("colnames") or [])
+        for query in queries
+    )
+    if min_size > max_bytes:
+        return None
+
+    if security_manager.is_guest_user():
+        for query in queries:
+            query.pop("query", None)
+
+    payload = json.dumps(queries, default=json.json_int_dttm_ser, ignore_nan=True)
+    if len(payload.encode("utf-8")) > max_bytes:
+        return None
+
+    # round trip through JSON so temporal and NaN values are encoded like in the
+    # chart data API response, rather than by the event serializer
+    return json.loads(payload)
+
+
 def _load_user_from_job_metadata(job_metadata: dict[str, Any]) -> User:
     if user_id := job_metadata.get("user_id"):
         # logged in user
@@ -95,10 +142,13 @@ def load_chart_data_into_cache(
             result = command.run(cache=True)
             cache_key = result["cache_key"]
             result_url = f"/api/v1/chart/data/{cache_key}"
+            updates: dict[str, Any] = {"result_url": result_url}
+            if (inline_result := _get_inline_result(result)) is not None:
+                updates["result"] = inline_result
             async_query_manager.update_job(
                 job_metadata,
                 async_query_manager.STATUS_DONE,
-                result_url=result_url,
+                **updates,
             )
         except SoftTimeLimitExceeded as ex:
             logger.warning("A timeout occurred while loading chart data, error: %s", ex)
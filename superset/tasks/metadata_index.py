@@ -0,0 +1,46 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+import logging
+
+from superset.commands.database.metadata_index import CrawlDatabaseMetadataCommand
+from superset.extensions import celery_app, db
+from superset.models.core import Database
+
+logger = logging.getLogger(__name__)
+
+
+@celery_app.task(name="metadata_index.crawl")
+def crawl() -> None:
+    """
+    Crawl the metadata of every database into the metadata index, one task per
+    database.
+    """
+    for (database_id,) in db.session.query(Database.id).all():
+        crawl_database.delay(database_id)
+
+
+@celery_app.task(name="metadata_index.crawl_database")
+def crawl_database(database_id: int) -> None:
+    try:
+        CrawlDatabaseMetadataCommand(database_id).run()
+    except Exception as ex:
+        logger.exception(
+            "An error occurred while crawling the metadata of database %s: %s",
+            database_id,
+            ex,
+        )
+        raise
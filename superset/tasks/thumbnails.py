@@ -41,6 +41,7 @@ def cache_chart_thumbnail(
     force: bool,
     window_size: Optional[WindowSize] = None,
     thumb_size: Optional[WindowSize] = None,
+    image_format: str = "png",
 ) -> None:
     # pylint: disable=import-outside-toplevel
     from superset.models.slice import Slice
@@ -67,6 +68,7 @@ def cache_chart_thumbnail(
             window_size=window_size,
             thumb_size=thumb_size,
             force=force,
+            image_format=image_format,
         )
     return None
 
@@ -118,6 +120,7 @@ def cache_dashboard_screenshot(  # pylint: disable=too-many-arguments
     guest_token: Optional[GuestToken] = None,
     thumb_size: Optional[WindowSize] = None,
     window_size: Optional[WindowSize] = None,
+    image_format: str = "png",
 ) -> None:
     # pylint: disable=import-outside-toplevel
     from superset.models.dashboard import Dashboard
@@ -149,4 +152,5 @@ def cache_dashboard_screenshot(  # pylint: disable=too-many-arguments
             thumb_size=thumb_size,
             cache_key=cache_key,
             force=force,
+            image_format=image_format,
         )
@@ -89,7 +89,11 @@ ONE_YEAR = 365 * 24 * 60 * 60  # 1 year in seconds
 logger = logging.getLogger(__name__)
 
 
-def memoized_func(key: str, cache: Cache = cache_manager.cache) -> Callable[..., Any]:
+def memoized_func(
+    key: str,
+    cache: Cache = cache_manager.cache,
+    version: Callable[[dict[str, Any]], str] | None = None,
+) -> Callable[..., Any]:
     """
     Decorator with configurable key and cache backend.
 
@@ -115,6 +119,9 @@ def memoized_func(key: str, cache: Cache = cache_manager.cache) -> Callable[...,
     :param key: a callable function that takes function arguments and returns
                 the caching key.
     :param cache: a FlaskCache instance that will store the cache.
+    :param version: an optional callable that takes the function arguments and returns
+                    a version appended to the caching key, so that changing the
+                    version invalidates the cached results.
     """  # noqa: E501
 
     def wrap(f: Callable[..., Any]) -> Callable[..., Any]:
@@ -133,6 +140,8 @@ def memoized_func(key: str, cache: Cache = cache_manager.cache) -> Callable[...,
             bound_args = signature.bind(*args, **kwargs)
             bound_args.apply_defaults()
             cache_key = key.format(**bound_args.arguments)
+            if version:
+                cache_key = f"{cache_key}:{version(bound_args.arguments)}"
 
             obj = cache.get(cache_key)
             if not force and obj is not None:
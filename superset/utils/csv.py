@@ -14,17 +14,20 @@
 # KIND, either express or implied.  See the License for the
 # specific language governing permissions and limitations
 # under the License.
+import codecs
 import logging
+import os
 import re
-import urllib.request
+from collections.abc import Iterator
+from functools import reduce
 from typing import Any, Optional, Union
-from urllib.error import URLError
 
 import numpy as np
 import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
 
-from superset.utils import json
-from superset.utils.core import GenericDataType
+from superset.utils.core import create_zip, GenericDataType
 
 logger = logging.getLogger(__name__)
 
@@ -38,6 +41,15 @@ negative_number_re = re.compile(r"^-[0-9.]+$")
 #
 problematic_chars_re = re.compile(r'^(?:"{2}|\s{1,})(?=[\-@+|=%])|^[\-@+|=%]')
 
+# RE2 (used by pyarrow.compute) has no lookahead support, so the Arrow variant of
+# the pattern above consumes the special character instead of peeking at it.
+problematic_chars_arrow_re = r'^(?:"{2}|\s{1,})[\-@+|=%]|^[\-@+|=%]'
+negative_number_arrow_re = r"^-[0-9.]+$"
+
+# ``DataFrame.to_csv`` keyword arguments that have an equivalent when writing CSV
+# through ``pyarrow.csv``; any other key in ``CSV_EXPORT`` requires pandas.
+ARROW_CSV_SUPPORTED_KWARGS = {"encoding", "sep"}
+
 
 def escape_value(value: str) -> str:
     """
@@ -81,36 +93,154 @@ def df_to_escaped_csv(df: pd.DataFrame, **kwargs: Any) -> Any:
     return df.to_csv(escapechar="\\", **kwargs)
 
 
+def _is_arrow_csv_type(type_: pa.DataType) -> bool:
+    if pa.types.is_dictionary(type_):
+        type_ = type_.value_type
+
+    return (
+        pa.types.is_integer(type_)
+        or pa.types.is_boolean(type_)
+        or pa.types.is_string(type_)
+        or pa.types.is_large_string(type_)
+        or pa.types.is_null(type_)
+    )
+
+
+def can_write_arrow_csv(table: pa.Table, **kwargs: Any) -> bool:
+    """
+    Check whether a table can be exported with ``arrow_table_to_escaped_csv``.
+
+    Only integers, booleans, strings and nulls are formatted like pandas formats the
+    records of the table, floats, decimals and temporal values are not. Options
+    other than the delimiter and encoding only have a pandas implementation.
+    """
+    if set(kwargs) - ARROW_CSV_SUPPORTED_KWARGS:
+        return False
+
+    return all(_is_arrow_csv_type(field.type) for field in table.schema)
+
+
+def _escape_arrow_array(array: pa.Array) -> pa.Array:
+    needs_escaping = pc.and_(
+        pc.match_substring_regex(array, problematic_chars_arrow_re),
+        pc.invert(pc.match_substring_regex(array, negative_number_arrow_re)),
+    )
+    if not pc.any(needs_escaping).as_py():
+        return array
+
+    escaped = pc.binary_join_element_wise(
+        "'", pc.replace_substring(array, "|", "\\|"), ""
+    )
+    return pc.if_else(needs_escaping, escaped, array)
+
+
+def _quote_arrow_array(array: pa.Array, sep: str) -> pa.Array:
+    """
+    Quote string values like the ``csv`` module does for ``DataFrame.to_csv``: the
+    escape character is escaped, and values containing the delimiter, a quote or a
+    line terminator are quoted, doubling their quotes.
+    """
+    array = pc.replace_substring(array, "\\", "\\\\")
+    needs_quoting = reduce(
+        pc.or_,
+        [pc.match_substring(array, char) for char in {sep, '"', *os.linesep}],
+    )
+    if not pc.any(needs_quoting).as_py():
+        return array
+
+    quoted = pc.binary_join_element_wise(
+        '"', pc.replace_substring(array, '"', '""'), '"', ""
+    )
+    return pc.if_else(needs_quoting, quoted, array)
+
+
+def _format_arrow_array(array: pa.Array, sep: str) -> pa.Array:
+    """
+    Format the values of an array as CSV fields, nulls as empty fields.
+    """
+    if pa.types.is_dictionary(array.type):
+        array = array.cast(array.type.value_type)
+
+    if pa.types.is_boolean(array.type):
+        array = pc.if_else(array, "True", "False")
+    elif pa.types.is_string(array.type) or pa.types.is_large_string(array.type):
+        array = _quote_arrow_array(_escape_arrow_array(array), sep)
+    else:
+        array = array.cast(pa.string())
+
+    return pc.fill_null(array, "")
+
+
+def _join_arrow_lines(fields: list[pa.Array], sep: str) -> str:
+    lines = pc.binary_join_element_wise(*fields, sep)
+    offsets = pa.array([0, len(lines)], pa.int32())
+    text = pc.binary_join(pa.ListArray.from_arrays(offsets, lines), os.linesep)
+    return text[0].as_py() + os.linesep
+
+
+def arrow_table_to_escaped_csv(
+    table: pa.Table,
+    batch_size: int = 65536,
+    **kwargs: Any,
+) -> Iterator[bytes]:
+    """
+    Serialize an Arrow table to CSV in batches, escaping and formatting values like
+    ``df_to_escaped_csv`` does, without materializing a DataFrame.
+
+    :param table: the table to serialize, see ``can_write_arrow_csv``
+    :param batch_size: maximum number of rows written per chunk
+    :param kwargs: the ``CSV_EXPORT`` options, see ``can_write_arrow_csv``
+    :returns: an iterator of encoded CSV chunks
+    """
+    encoder = codecs.getincrementalencoder(kwargs.get("encoding", "utf-8"))()
+    sep = kwargs.get("sep", ",")
+
+    names = _format_arrow_array(pa.array(table.column_names, pa.string()), sep)
+    yield encoder.encode(sep.join(names.to_pylist()) + os.linesep)
+
+    for batch in table.to_batches(max_chunksize=batch_size):
+        if batch.num_rows:
+            fields = [_format_arrow_array(column, sep) for column in batch.columns]
+            yield encoder.encode(_join_arrow_lines(fields, sep))
+
+
 def get_chart_csv_data(
-    chart_url: str, auth_cookies: Optional[dict[str, str]] = None
+    queries: list[dict[str, Any]], encoding: str = "utf-8"
 ) -> Optional[bytes]:
-    content = None
-    if auth_cookies:
-        opener = urllib.request.build_opener()
-        cookie_str = ";".join([f"{key}={val}" for key, val in auth_cookies.items()])
-        opener.addheaders.append(("Cookie", cookie_str))
-        response = opener.open(chart_url)
-        content = response.read()
-        if response.getcode() != 200:
-            raise URLError(response.getcode())
-    if content:
-        return content
-    return None
-
-
-def get_chart_dataframe(
-    chart_url: str, auth_cookies: Optional[dict[str, str]] = None
-) -> Optional[pd.DataFrame]:
+    """
+    Return the CSV results of chart data queries, zipped if there are several.
+
+    :param queries: the query results of a chart data command
+    :param encoding: the encoding of the CSV data
+    """
+    if not queries:
+        return None
+    if len(queries) == 1:
+        data = queries[0]["data"]
+        return data.encode(encoding) if data else None
+
+    files = {
+        f"query_{idx + 1}.csv": query["data"].encode(encoding)
+        for idx, query in enumerate(queries)
+    }
+    return create_zip(files).getvalue()
+
+
+def get_chart_dataframe(queries: list[dict[str, Any]]) -> Optional[pd.DataFrame]:
+    """
+    Return the results of the first chart data query as a dataframe.
+
+    :param queries: the JSON query results of a chart data command
+    """
     # Disable all the unnecessary-lambda violations in this function
     # pylint: disable=unnecessary-lambda
-    content = get_chart_csv_data(chart_url, auth_cookies)
-    if content is None:
+    if not queries:
         return None
 
-    result = json.loads(content.decode("utf-8"))
+    result = queries[0]
     # need to convert float value to string to show full long number
     pd.set_option("display.float_format", lambda x: str(x))
-    df = pd.DataFrame.from_dict(result["result"][0]["data"])
+    df = pd.DataFrame.from_dict(result["data"])
 
     if df.empty:
         return None
@@ -118,22 +248,22 @@ def get_chart_dataframe(
     try:
         # if any column type is equal to 2, need to convert data into
         # datetime timestamp for that column.
-        if GenericDataType.TEMPORAL in result["result"][0]["coltypes"]:
-            for i in range(len(result["result"][0]["coltypes"])):
-                if result["result"][0]["coltypes"][i] == GenericDataType.TEMPORAL:
-                    df[result["result"][0]["colnames"][i]] = df[
-                        result["result"][0]["colnames"][i]
-                    ].astype("datetime64[ms]")
+        if GenericDataType.TEMPORAL in result["coltypes"]:
+            for i in range(len(result["coltypes"])):
+                if result["coltypes"][i] == GenericDataType.TEMPORAL:
+                    df[result["colnames"][i]] = df[result["colnames"][i]].astype(
+                        "datetime64[ms]"
+                    )
     except BaseException as err:
         logger.error(err)
 
     # rebuild hierarchical columns and index
     df.columns = pd.MultiIndex.from_tuples(
-        tuple(colname) if isinstance(colname, list) else (colname,)
-        for colname in result["result"][0]["colnames"]
+        tuple(colname) if isinstance(colname, (list, tuple)) else (colname,)
+        for colname in result["colnames"]
     )
     df.index = pd.MultiIndex.from_tuples(
-        tuple(indexname) if isinstance(indexname, list) else (indexname,)
-        for indexname in result["result"][0]["indexnames"]
+        tuple(indexname) if isinstance(indexname, (list, tuple)) else (indexname,)
+        for indexname in result["indexnames"]
     )
     return df
@@ -14,7 +14,7 @@
 # KIND, either express or implied.  See the License for the
 # specific language governing permissions and limitations
 # under the License.
-from typing import Any, Callable, Optional, Union
+from typing import Optional, Union
 
 import numpy as np
 from flask_babel import gettext as _
@@ -22,9 +22,15 @@ from pandas import DataFrame, Series, to_numeric
 
 from superset.exceptions import InvalidPostProcessingError
 from superset.utils.core import PostProcessingBoxplotWhiskerType
-from superset.utils.pandas_postprocessing.aggregate import aggregate
+from superset.utils.pandas_postprocessing.utils import (
+    _get_group_codes,
+    validate_column_args,
+)
 
+STATISTICS = ("mean", "median", "max", "min", "q1", "q3", "count", "outliers")
 
+
+@validate_column_args("groupby", "metrics")
 def boxplot(  # noqa: C901
     df: DataFrame,
     groupby: list[str],
@@ -56,77 +62,102 @@ def boxplot(  # noqa: C901
     :return: DataFrame with boxplot statistics per groupby
     """
 
-    def quartile1(series: Series) -> float:
-        return np.nanpercentile(series, 25, method="midpoint")
-
-    def quartile3(series: Series) -> float:
-        return np.nanpercentile(series, 75, method="midpoint")
-
-    if whisker_type == PostProcessingBoxplotWhiskerType.TUKEY:
-
-        def whisker_high(series: Series) -> float:
-            upper_outer_lim = quartile3(series) + 1.5 * (
-                quartile3(series) - quartile1(series)
+    if whisker_type == PostProcessingBoxplotWhiskerType.PERCENTILE and (
+        not isinstance(percentiles, (list, tuple))
+        or len(percentiles) != 2
+        or not isinstance(percentiles[0], (int, float))
+        or not isinstance(percentiles[1], (int, float))
+        or percentiles[0] >= percentiles[1]
+    ):
+        raise InvalidPostProcessingError(
+            _(
+                "percentiles must be a list or tuple with two numeric values, "
+                "of which the first is lower than the second value"
             )
-            return series[series <= upper_outer_lim].max()
+        )
 
-        def whisker_low(series: Series) -> float:
-            lower_outer_lim = quartile1(series) - 1.5 * (
-                quartile3(series) - quartile1(series)
-            )
-            return series[series >= lower_outer_lim].min()
+    # quantiles need numeric values, coerce the other values to NaN
+    for column in metrics:
+        if df.dtypes[column] == np.object_:
+            df[column] = to_numeric(df[column], errors="coerce")
 
+    codes, groups = _get_group_codes(df, groupby)
+    rows = codes >= 0
+    keys = codes[rows]
+    values_df = df.loc[rows, metrics]
+    if values_df.empty:
+        return DataFrame(
+            columns=groupby
+            + [f"{metric}__{name}" for name in STATISTICS for metric in metrics]
+        )
+    grouped = values_df.groupby(keys)
+
+    quartiles = grouped.quantile([0.25, 0.75], interpolation="midpoint")
+    q1 = quartiles.xs(0.25, level=1)
+    q3 = quartiles.xs(0.75, level=1)
+    if whisker_type == PostProcessingBoxplotWhiskerType.TUKEY:
+        # the whiskers are the most extreme values within 1.5 IQR of the quartiles
+        upper_limit = q3 + 1.5 * (q3 - q1)
+        lower_limit = q1 - 1.5 * (q3 - q1)
+        # masking values casts integers to floats, whiskers are values of the
+        # metrics though
+        whisker_high = (
+            values_df.where(values_df.to_numpy() <= upper_limit.to_numpy()[keys])
+            .groupby(keys)
+            .max()
+            .astype(values_df.dtypes)
+        )
+        whisker_low = (
+            values_df.where(values_df.to_numpy() >= lower_limit.to_numpy()[keys])
+            .groupby(keys)
+            .min()
+            .astype(values_df.dtypes)
+        )
     elif whisker_type == PostProcessingBoxplotWhiskerType.PERCENTILE:
-        if (
-            not isinstance(percentiles, (list, tuple))
-            or len(percentiles) != 2
-            or not isinstance(percentiles[0], (int, float))
-            or not isinstance(percentiles[1], (int, float))
-            or percentiles[0] >= percentiles[1]
-        ):
-            raise InvalidPostProcessingError(
-                _(
-                    "percentiles must be a list or tuple with two numeric values, "
-                    "of which the first is lower than the second value"
-                )
-            )
-        low, high = percentiles[0], percentiles[1]
-
-        def whisker_high(series: Series) -> float:
-            return np.nanpercentile(series, high)
-
-        def whisker_low(series: Series) -> float:
-            return np.nanpercentile(series, low)
-
+        low, high = percentiles[0] / 100, percentiles[1] / 100  # type: ignore
+        whiskers = grouped.quantile([low, high])
+        whisker_high = whiskers.xs(high, level=1)
+        whisker_low = whiskers.xs(low, level=1)
     else:
-        whisker_high = np.max
-        whisker_low = np.min
-
-    def outliers(series: Series) -> set[float]:
-        above = series[series > whisker_high(series)]
-        below = series[series < whisker_low(series)]
-        return above.tolist() + below.tolist()
-
-    operators: dict[str, Callable[[Any], Any]] = {
-        "mean": np.mean,
-        "median": np.median,
+        whisker_high = grouped.max()
+        whisker_low = grouped.min()
+
+    # values above the high whisker come first, then values below the low one
+    outliers_df = DataFrame(index=whisker_high.index)
+    for metric in metrics:
+        values = values_df[metric].to_numpy()
+        positions = np.concatenate(
+            [
+                np.flatnonzero(values > whisker_high[metric].to_numpy()[keys]),
+                np.flatnonzero(values < whisker_low[metric].to_numpy()[keys]),
+            ]
+        )
+        positions = positions[np.argsort(keys[positions], kind="stable")]
+        splits = np.searchsorted(keys[positions], whisker_high.index[1:])
+        outliers_df[metric] = Series(
+            [chunk.tolist() for chunk in np.split(values[positions], splits)],
+            index=whisker_high.index,
+            dtype=object,
+        )
+
+    statistics: dict[str, Union[DataFrame, Series]] = {
+        "mean": grouped.mean(),
+        "median": grouped.median(),
         "max": whisker_high,
         "min": whisker_low,
-        "q1": quartile1,
-        "q3": quartile3,
-        "count": np.ma.count,
-        "outliers": outliers,
-    }
-    aggregates: dict[str, dict[str, Union[str, Callable[..., Any]]]] = {
-        f"{metric}__{operator_name}": {"column": metric, "operator": operator}
-        for operator_name, operator in operators.items()
-        for metric in metrics
+        "q1": q1,
+        "q3": q3,
+        "count": grouped.size(),
+        "outliers": outliers_df,
     }
-
-    # nanpercentile needs numeric values, otherwise the isnan function
-    # that's used in the underlying function will fail
-    for column in metrics:
-        if df.dtypes[column] == np.object_:
-            df[column] = to_numeric(df[column], errors="coerce")
-
-    return aggregate(df, groupby=groupby, aggregates=aggregates)
+    result = DataFrame(
+        {
+            f"{metric}__{name}": (
+                statistic if isinstance(statistic, Series) else statistic[metric]
+            )
+            for name, statistic in statistics.items()
+            for metric in metrics
+        }
+    )
+    result.index = groups[result.index]
+    return result.reset_index(drop=not groupby)
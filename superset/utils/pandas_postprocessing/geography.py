@@ -14,16 +14,152 @@
 # KIND, either express or implied.  See the License for the
 # specific language governing permissions and limitations
 # under the License.
-from typing import Optional
+from typing import Any, Optional
 
 import geohash as geohash_lib
+import numpy as np
+import pandas as pd
 from flask_babel import gettext as _
+from geopy import units
 from geopy.point import Point
 from pandas import DataFrame
 
 from superset.exceptions import InvalidPostProcessingError
 from superset.utils.pandas_postprocessing.utils import _append_columns
 
+GEOHASH_ALPHABET = b"0123456789bcdefghjkmnpqrstuvwxyz"
+
+# Number of characters of the geohashes encoded by `geohash_encode`. Up to 12
+# characters, the 60 bits of a geohash fit in a 64 bits integer.
+GEOHASH_PRECISION = 12
+GEOHASH_HALF_BITS = GEOHASH_PRECISION * 5 // 2
+
+# value of each byte in a geohash, -1 for invalid characters
+GEOHASH_DECODE_MAP = np.full(256, -1, dtype=np.int64)
+for _value, _char in enumerate(GEOHASH_ALPHABET):
+    GEOHASH_DECODE_MAP[_char] = _value
+    GEOHASH_DECODE_MAP[ord(chr(_char).upper())] = _value
+
+# Geodetic points made of a decimal latitude, longitude and optional altitude,
+# which geopy parses as written. Separators are restricted to `,;/`, since geopy
+# would read whitespace separated numbers followed by `m` as arcminutes.
+DECIMAL_POINT_PATTERN = (
+    r"^[^\S\n]*(?P<latitude>[+-]?\d+(?:\.\d+)?)\s*[,;/]\s*"
+    r"(?P<longitude>[+-]?\d+(?:\.\d+)?)"
+    r"(?:\s*[,;/]\s*(?P<altitude>[+-]?\d+(?:\.\d+)?)[ ]*"
+    r"(?P<altitude_units>km|m|mi|ft|nm|nmi))?\s*$"
+)
+
+# kilometers in one unit of altitude, as converted by geopy
+ALTITUDE_CONVERTERS = {
+    "km": lambda distance: distance,
+    "m": lambda distance: distance / 1000.0,
+    "mi": lambda distance: distance * 1.609344,
+    "ft": lambda distance: distance / units.feet(kilometers=1.0),
+    "nm": lambda distance: distance / units.nautical(kilometers=1.0),
+    "nmi": lambda distance: distance / units.nautical(kilometers=1.0),
+}
+
+
+def _spread_bits(values: np.ndarray) -> np.ndarray:
+    """
+    Move the 32 low bits of each value to the even bits of a 64 bits integer.
+    """
+    values = values.astype(np.uint64) & np.uint64(0xFFFFFFFF)
+    for shift, mask in (
+        (16, 0x0000FFFF0000FFFF),
+        (8, 0x00FF00FF00FF00FF),
+        (4, 0x0F0F0F0F0F0F0F0F),
+        (2, 0x3333333333333333),
+        (1, 0x5555555555555555),
+    ):
+        values = (values | (values << np.uint64(shift))) & np.uint64(mask)
+    return values
+
+
+def _compact_bits(values: np.ndarray) -> np.ndarray:
+    """
+    Inverse of `_spread_bits`, gathering the even bits of each value.
+    """
+    values = values & np.uint64(0x5555555555555555)
+    for shift, mask in (
+        (1, 0x3333333333333333),
+        (2, 0x0F0F0F0F0F0F0F0F),
+        (4, 0x00FF00FF00FF00FF),
+        (8, 0x0000FFFF0000FFFF),
+        (16, 0x00000000FFFFFFFF),
+    ):
+        values = (values | (values >> np.uint64(shift))) & np.uint64(mask)
+    return values
+
+
+def _geohash_encode_array(latitudes: np.ndarray, longitudes: np.ndarray) -> np.ndarray:
+    """
+    Encode arrays of latitudes and longitudes into an array of geohashes, like
+    `geohash.encode`.
+    """
+    if not (
+        np.isfinite(latitudes).all()
+        and np.isfinite(longitudes).all()
+        and ((latitudes >= -90) & (latitudes < 90)).all()
+    ):
+        raise ValueError("Invalid latitude or longitude")
+    longitudes = np.where(
+        (longitudes < -180) | (longitudes >= 180),
+        np.mod(longitudes + 180, 360) - 180,
+        longitudes,
+    )
+
+    # position of each coordinate in a grid of 2**GEOHASH_HALF_BITS cells per axis;
+    # scaling by a power of 2 is exact, so cells are the same as geohash's
+    half = 2 ** (GEOHASH_HALF_BITS - 1)
+    latitude_cells = np.floor(latitudes / 90 * half).astype(np.int64) + half
+    longitude_cells = np.floor(longitudes / 180 * half).astype(np.int64) + half
+
+    # longitude bits come first
+    bits = (_spread_bits(longitude_cells) << np.uint64(1)) | _spread_bits(
+        latitude_cells
+    )
+    alphabet = np.frombuffer(GEOHASH_ALPHABET, dtype=np.uint8)
+    shifts = np.arange(GEOHASH_PRECISION - 1, -1, -1, dtype=np.uint64) * np.uint64(5)
+    chars = alphabet[((bits[:, None] >> shifts) & np.uint64(31)).astype(np.intp)]
+    return chars.view(f"S{GEOHASH_PRECISION}").ravel().astype(str)
+
+
+def _geohash_decode_array(geohashes: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Decode an array of geohashes of the same length into arrays of latitudes and
+    longitudes, the centers of the geohash cells, like `geohash.decode`.
+    """
+    length = len(geohashes[0]) if len(geohashes) else 0
+    chars = np.frombuffer(
+        geohashes.astype(f"S{max(length, 1)}").tobytes(), dtype=np.uint8
+    ).reshape(len(geohashes), -1)[:, :length]
+    values = GEOHASH_DECODE_MAP[chars]
+    if (values < 0).any():
+        raise ValueError("Invalid geohash")
+
+    bits = np.zeros(len(geohashes), dtype=np.uint64)
+    for column in range(length):
+        bits = (bits << np.uint64(5)) | values[:, column].astype(np.uint64)
+
+    # longitude bits come first, so the last bit is a longitude bit when the
+    # number of bits is odd
+    bit_count = length * 5
+    longitude_bit_count = (bit_count + 1) // 2
+    latitude_bit_count = bit_count // 2
+    if bit_count % 2:
+        longitudes, latitudes = _compact_bits(bits), _compact_bits(bits >> 1)
+    else:
+        longitudes, latitudes = _compact_bits(bits >> 1), _compact_bits(bits)
+
+    latitude_delta = 90.0 / 2**latitude_bit_count
+    longitude_delta = 180.0 / 2**longitude_bit_count
+    return (
+        latitudes.astype(np.float64) * (2 * latitude_delta) - 90.0 + latitude_delta,
+        longitudes.astype(np.float64) * (2 * longitude_delta) - 180.0 + longitude_delta,
+    )
+
 
 def geohash_decode(
     df: DataFrame, geohash: str, longitude: str, latitude: str
@@ -38,14 +174,28 @@ def geohash_decode(
     :return: DataFrame with decoded longitudes and latitudes
     """
     try:
-        lonlat_df = DataFrame()
-        lonlat_df["latitude"], lonlat_df["longitude"] = zip(
-            *df[geohash].apply(geohash_lib.decode), strict=False
+        geohashes = df[geohash]
+        lonlat_df = DataFrame(
+            index=geohashes.index, columns=["latitude", "longitude"], dtype=float
         )
+        lengths = geohashes.str.len()
+        # geohashes of up to 12 characters fit in 64 bits integers, decode them
+        # by length; decode longer ones and non string values one by one
+        vectorized = lengths.le(GEOHASH_PRECISION)
+        for length in lengths[vectorized].unique():
+            mask = lengths.eq(length).to_numpy()
+            lonlat_df.loc[mask, "latitude"], lonlat_df.loc[mask, "longitude"] = (
+                _geohash_decode_array(geohashes[mask].to_numpy(dtype=str))
+            )
+        others = ~vectorized.to_numpy()
+        if others.any():
+            lonlat_df.loc[others, ["latitude", "longitude"]] = [
+                geohash_lib.decode(value) for value in geohashes[others]
+            ]
         return _append_columns(
             df, lonlat_df, {"latitude": latitude, "longitude": longitude}
         )
-    except ValueError as ex:
+    except (TypeError, ValueError) as ex:
         raise InvalidPostProcessingError(_("Invalid geohash string")) from ex
 
 
@@ -65,14 +215,15 @@ def geohash_encode(
     :return: DataFrame with decoded longitudes and latitudes
     """
     try:
-        encode_df = df[[latitude, longitude]]
-        encode_df.columns = ["latitude", "longitude"]
-        encode_df["geohash"] = encode_df.apply(
-            lambda row: geohash_lib.encode(row["latitude"], row["longitude"]),
-            axis=1,
+        encode_df = df[[latitude, longitude]].set_axis(
+            ["latitude", "longitude"], axis=1
+        )
+        encode_df["geohash"] = _geohash_encode_array(
+            encode_df["latitude"].to_numpy(dtype=float),
+            encode_df["longitude"].to_numpy(dtype=float),
         )
         return _append_columns(df, encode_df, {"geohash": geohash})
-    except ValueError as ex:
+    except (TypeError, ValueError) as ex:
         raise InvalidPostProcessingError(_("Invalid longitude/latitude")) from ex
 
 
@@ -95,7 +246,7 @@ def geodetic_parse(
     :return: DataFrame with decoded longitudes and latitudes
     """
 
-    def _parse_location(location: str) -> tuple[float, float, float]:
+    def _parse_location(location: Any) -> tuple[float, float, float]:
         """
         Parse a string containing a geodetic point and return latitude, longitude
         and altitude
@@ -104,15 +255,48 @@ def geodetic_parse(
         return point[0], point[1], point[2]
 
     try:
-        geodetic_df = DataFrame()
-        (
-            geodetic_df["latitude"],
-            geodetic_df["longitude"],
-            geodetic_df["altitude"],
-        ) = zip(*df[geodetic].apply(_parse_location), strict=False)
+        geodetic_df = _parse_decimal_points(df[geodetic])
+        # points in other formats, or that geopy would normalize or reject
+        others = geodetic_df["latitude"].isna().to_numpy()
+        if others.any():
+            geodetic_df.loc[others, ["latitude", "longitude", "altitude"]] = [
+                _parse_location(location) for location in df[geodetic][others]
+            ]
         columns = {"latitude": latitude, "longitude": longitude}
         if altitude:
             columns["altitude"] = altitude
         return _append_columns(df, geodetic_df, columns)
     except ValueError as ex:
         raise InvalidPostProcessingError(_("Invalid geodetic string")) from ex
+
+
+def _parse_decimal_points(locations: pd.Series) -> DataFrame:
+    """
+    Parse geodetic points in decimal degrees like geopy, leaving the coordinates of
+    other points missing.
+    """
+    parsed = locations.astype(str).str.extract(DECIMAL_POINT_PATTERN)
+    parsed = parsed.where(locations.map(type).eq(str), axis=0)
+
+    latitudes = parsed["latitude"].to_numpy(dtype=float, na_value=np.nan)
+    longitudes = parsed["longitude"].to_numpy(dtype=float, na_value=np.nan)
+    distances = parsed["altitude"].to_numpy(dtype=float, na_value=np.nan)
+    altitudes = np.zeros(len(parsed))
+    for unit, convert in ALTITUDE_CONVERTERS.items():
+        matches = parsed["altitude_units"].eq(unit).to_numpy()
+        altitudes[matches] = convert(distances[matches])
+
+    # geopy normalizes longitudes and rejects latitudes out of range
+    invalid = ~(
+        (np.abs(latitudes) <= 90) & (np.abs(longitudes) <= 180) & np.isfinite(altitudes)
+    )
+    latitudes[invalid] = longitudes[invalid] = altitudes[invalid] = np.nan
+    # adding 0.0 turns -0.0 into 0.0, like geopy
+    return DataFrame(
+        {
+            "latitude": latitudes + 0.0,
+            "longitude": longitudes + 0.0,
+            "altitude": altitudes + 0.0,
+        },
+        index=locations.index,
+    )
@@ -17,7 +17,9 @@
 from __future__ import annotations
 
 import numpy as np
-from pandas import DataFrame, Series, to_numeric
+from pandas import DataFrame, to_numeric
+
+from superset.utils.pandas_postprocessing.utils import _get_group_codes
 
 
 # pylint: disable=too-many-arguments
@@ -63,23 +65,20 @@ def histogram(
         f"{bin_edges[i]} - {bin_edges[i + 1]}" for i in range(len(bin_edges) - 1)
     ]
 
-    def hist_values(series: Series) -> np.ndarray:
-        # we might have NaN values as the result of grouping so we need to drop them
-        result = np.histogram(series.dropna(), bins=bin_edges)[0]
-        return result if not cumulative else np.cumsum(result)
-
-    if len(groupby) == 0:
-        # without grouping
-        hist_dict = dict(zip(bin_edges_str, hist_values(df[column]), strict=False))
-        histogram_df = DataFrame(hist_dict, index=[0])
-    else:
-        # with grouping
-        histogram_df = (
-            df.groupby(groupby)[column]
-            .apply(lambda x: Series(hist_values(x)))
-            .unstack(fill_value=0)
-        )
-        histogram_df.columns = bin_edges_str
+    # bin the values of all groups at once; like `np.histogram`, bins are half
+    # open except the last one, which includes the right edge
+    bin_count = len(bin_edges) - 1
+    codes, groups = _get_group_codes(df, groupby)
+    rows = codes >= 0
+    bin_indices = np.searchsorted(bin_edges, df[column].to_numpy(), side="right") - 1
+    bin_indices = np.minimum(bin_indices, bin_count - 1)
+    counts = np.bincount(
+        codes[rows] * bin_count + bin_indices[rows],
+        minlength=len(groups) * bin_count,
+    ).reshape(len(groups), bin_count)
+    if cumulative:
+        counts = np.cumsum(counts, axis=1)
+    histogram_df = DataFrame(counts, index=groups, columns=bin_edges_str)
 
     if normalize:
         histogram_df = histogram_df / histogram_df.values.sum()
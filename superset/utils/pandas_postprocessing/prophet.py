@@ -14,18 +14,35 @@
 # KIND, either express or implied.  See the License for the
 # specific language governing permissions and limitations
 # under the License.
+import hashlib
 import logging
-from typing import Optional, Union
+import multiprocessing
+import os
+import threading
+from concurrent.futures import Executor, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Optional, Union
 
 import pandas as pd
+from flask import current_app, has_app_context
 from flask_babel import gettext as _
 from pandas import DataFrame
 
 from superset.exceptions import InvalidPostProcessingError
+from superset.extensions import cache_manager
+from superset.utils import json
 from superset.utils.core import DTTM_ALIAS
 from superset.utils.decorators import suppress_logging
 from superset.utils.pandas_postprocessing.utils import PROPHET_TIME_GRAIN_MAP
 
+logger = logging.getLogger(__name__)
+
+# processes fitting models, shared by the requests of a web worker
+_executor: Optional[ProcessPoolExecutor] = None
+_executor_pid: Optional[int] = None
+_executor_workers = 0
+_executor_lock = threading.Lock()
+
 
 def _prophet_parse_seasonality(
     input_value: Optional[Union[bool, int]],
@@ -40,6 +57,21 @@ def _prophet_parse_seasonality(
         return input_value
 
 
+def _import_prophet() -> Any:
+    try:
+        # `prophet` complains about `plotly` not being installed
+        with suppress_logging("prophet.plot"):
+            # pylint: disable=import-outside-toplevel
+            from prophet import Prophet
+
+        prophet_logger = logging.getLogger("prophet.plot")
+        prophet_logger.setLevel(logging.CRITICAL)
+        prophet_logger.setLevel(logging.NOTSET)
+    except ModuleNotFoundError as ex:
+        raise InvalidPostProcessingError(_("`prophet` package not installed")) from ex
+    return Prophet
+
+
 def _prophet_fit_and_predict(  # pylint: disable=too-many-arguments
     df: DataFrame,
     confidence_interval: float,
@@ -52,17 +84,7 @@ def _prophet_fit_and_predict(  # pylint: disable=too-many-arguments
     """
     Fit a prophet model and return a DataFrame with predicted results.
     """
-    try:
-        # `prophet` complains about `plotly` not being installed
-        with suppress_logging("prophet.plot"):
-            # pylint: disable=import-outside-toplevel
-            from prophet import Prophet
-
-        prophet_logger = logging.getLogger("prophet.plot")
-        prophet_logger.setLevel(logging.CRITICAL)
-        prophet_logger.setLevel(logging.NOTSET)
-    except ModuleNotFoundError as ex:
-        raise InvalidPostProcessingError(_("`prophet` package not installed")) from ex
+    Prophet = _import_prophet()  # noqa: N806
     model = Prophet(
         interval_width=confidence_interval,
         yearly_seasonality=yearly_seasonality,
@@ -77,6 +99,121 @@ def _prophet_fit_and_predict(  # pylint: disable=too-many-arguments
     return forecast.join(df.set_index("ds"), on="ds").set_index(["ds"])
 
 
+def _get_executor(max_workers: int) -> Executor:
+    """
+    Return the process pool fitting models, created on first use and again after
+    the web worker is forked or the pool is resized.
+    """
+    global _executor, _executor_pid, _executor_workers  # pylint: disable=global-statement
+
+    with _executor_lock:
+        if (
+            _executor is None
+            or _executor_pid != os.getpid()
+            or _executor_workers != max_workers
+        ):
+            if _executor is not None and _executor_pid == os.getpid():
+                _executor.shutdown(wait=False)
+            # spawned processes don't inherit the locks, threads and connections
+            # of the web worker
+            _executor = ProcessPoolExecutor(
+                max_workers=max_workers,
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+            _executor_pid = os.getpid()
+            _executor_workers = max_workers
+        return _executor
+
+
+def _reset_executor() -> None:
+    global _executor  # pylint: disable=global-statement
+
+    with _executor_lock:
+        if _executor is not None and _executor_pid == os.getpid():
+            _executor.shutdown(wait=False, cancel_futures=True)
+        _executor = None
+
+
+def _get_cache_key(df: DataFrame, **kwargs: Any) -> str:
+    """
+    Key of a forecast, hashing the series and the parameters of the model.
+    """
+    hash_ = hashlib.md5(  # noqa: S324
+        pd.util.hash_pandas_object(df, index=False).to_numpy().tobytes()
+    )
+    hash_.update(json.dumps(kwargs, sort_keys=True).encode("utf-8"))
+    return f"prophet_forecast_{hash_.hexdigest()}"
+
+
+def _prophet_fit_and_predict_parallel(
+    fit_dfs: dict[str, DataFrame],
+    max_workers: int,
+    **kwargs: Any,
+) -> dict[str, DataFrame]:
+    """
+    Fit the models in the process pool, or return no forecast if the pool broke.
+    """
+    executor = _get_executor(max_workers)
+    try:
+        futures = {
+            column: executor.submit(_prophet_fit_and_predict, df=fit_df, **kwargs)
+            for column, fit_df in fit_dfs.items()
+        }
+        return {column: future.result() for column, future in futures.items()}
+    except BrokenProcessPool:
+        logger.warning("Prophet process pool broke, fitting models in process")
+        _reset_executor()
+        return {}
+
+
+def _prophet_fit_and_predict_all(
+    fit_dfs: dict[str, DataFrame],
+    **kwargs: Any,
+) -> dict[str, DataFrame]:
+    """
+    Fit a model for each series, in parallel and reusing cached forecasts when
+    running within the app.
+    """
+    max_workers = 1
+    cache_timeout: Optional[int] = None
+    if has_app_context():
+        max_workers = current_app.config["PROPHET_MAX_WORKERS"]
+        cache_timeout = current_app.config["PROPHET_CACHE_TIMEOUT"]
+
+    forecasts: dict[str, DataFrame] = {}
+    cache_keys: dict[str, str] = {}
+    if cache_timeout is not None:
+        for column, fit_df in fit_dfs.items():
+            cache_keys[column] = _get_cache_key(fit_df, **kwargs)
+            forecast = cache_manager.data_cache.get(cache_keys[column])
+            if forecast is not None:
+                forecasts[column] = forecast
+
+    missing = [column for column in fit_dfs if column not in forecasts]
+    if missing:
+        # fail fast, rather than in each process
+        _import_prophet()
+
+    if min(max_workers, len(missing)) > 1:
+        forecasts.update(
+            _prophet_fit_and_predict_parallel(
+                {column: fit_dfs[column] for column in missing},
+                max_workers,
+                **kwargs,
+            )
+        )
+
+    for column in missing:
+        if column not in forecasts:
+            forecasts[column] = _prophet_fit_and_predict(df=fit_dfs[column], **kwargs)
+        if column in cache_keys:
+            cache_manager.data_cache.set(
+                cache_keys[column], forecasts[column], timeout=cache_timeout
+            )
+
+    return {column: forecasts[column] for column in fit_dfs}
+
+
 def prophet(  # pylint: disable=too-many-arguments
     df: DataFrame,
     time_grain: str,
@@ -137,34 +274,29 @@ def prophet(  # pylint: disable=too-many-arguments
     if len(df.columns) < 2:
         raise InvalidPostProcessingError(_("DataFrame include at least one series"))
 
-    target_df = DataFrame()
-
-    for column in [
-        column
+    fit_dfs = {
+        column: df[[index, column]].rename(columns={index: "ds", column: "y"})
         for column in df.columns
         if column != index
         and pd.to_numeric(df[column], errors="coerce").notnull().all()
-    ]:
-        fit_df = _prophet_fit_and_predict(
-            df=df[[index, column]].rename(columns={index: "ds", column: "y"}),
-            confidence_interval=confidence_interval,
-            yearly_seasonality=_prophet_parse_seasonality(yearly_seasonality),
-            weekly_seasonality=_prophet_parse_seasonality(weekly_seasonality),
-            daily_seasonality=_prophet_parse_seasonality(daily_seasonality),
-            periods=periods,
-            freq=freq,
-        )
-        new_columns = [
+    }
+    forecasts = _prophet_fit_and_predict_all(
+        fit_dfs,
+        confidence_interval=confidence_interval,
+        yearly_seasonality=_prophet_parse_seasonality(yearly_seasonality),
+        weekly_seasonality=_prophet_parse_seasonality(weekly_seasonality),
+        daily_seasonality=_prophet_parse_seasonality(daily_seasonality),
+        periods=periods,
+        freq=freq,
+    )
+    for column, fit_df in forecasts.items():
+        fit_df.columns = [
             f"{column}__yhat",
             f"{column}__yhat_lower",
             f"{column}__yhat_upper",
             f"{column}",
         ]
-        fit_df.columns = new_columns
-        if target_df.empty:
-            target_df = fit_df
-        else:
-            for new_column in new_columns:
-                target_df = target_df.assign(**{new_column: fit_df[new_column]})
+
+    target_df = pd.concat(forecasts.values(), axis=1) if forecasts else DataFrame()
     target_df.reset_index(level=0, inplace=True)
     return target_df.rename(columns={"ds": index})
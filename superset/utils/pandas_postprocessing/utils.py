@@ -181,6 +181,23 @@ def _get_aggregate_funcs(
     return agg_funcs
 
 
+def _get_group_codes(df: DataFrame, groupby: list[str]) -> tuple[np.ndarray, pd.Index]:
+    """
+    Number the groups of a DataFrame in the order of `DataFrame.groupby`, so that
+    operations over groups can be computed with NumPy primitives.
+
+    :param df: DataFrame to group
+    :param groupby: columns to group by. All rows are in a single group if empty.
+    :return: the group number of each row, -1 for rows with missing keys, and the
+             keys of the groups
+    """
+    if not groupby:
+        return np.zeros(len(df), dtype=np.intp), pd.RangeIndex(1)
+    grouped = df.groupby(groupby, observed=True)
+    codes = grouped.ngroup().fillna(-1).to_numpy(dtype=np.intp)
+    return codes, grouped.size().index
+
+
 def _append_columns(
     base_df: DataFrame, append_df: DataFrame, columns: dict[str, str]
 ) -> DataFrame:
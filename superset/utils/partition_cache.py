@@ -0,0 +1,185 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+"""
+Cache of the latest partitions of tables.
+
+Looking up the latest partition of a Presto or Hive table runs a query on the
+partitions of the table, and the ``latest_partition`` Jinja macros run it for every
+query of the charts of a virtual dataset using them. The lookups are cached in the
+data cache, so that they're shared across processes, for
+``LATEST_PARTITION_CACHE_TIMEOUT`` seconds.
+
+Only one process looks up the partitions of a table at a time: the others wait for
+its result, for up to ``LATEST_PARTITION_CACHE_LOCK_TIMEOUT`` seconds. Lookups can
+be invalidated for a table, e.g. after loading a new partition, or for a whole
+database.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+import time
+import uuid
+from typing import Any, Callable, TYPE_CHECKING, TypeVar
+from weakref import WeakValueDictionary
+
+from flask import current_app
+
+from superset.extensions import cache_manager, stats_logger_manager
+from superset.utils.hashing import md5_sha_from_dict
+
+if TYPE_CHECKING:
+    from superset.models.core import Database
+    from superset.sql.parse import Table
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+# how often processes waiting for another one to look up partitions poll the cache
+POLL_INTERVAL = 0.1
+
+_locks: WeakValueDictionary[str, threading.Lock] = WeakValueDictionary()
+_locks_lock = threading.Lock()
+
+
+def _get_lock(key: str) -> threading.Lock:
+    with _locks_lock:
+        lock = _locks.get(key)
+        if lock is None:
+            lock = _locks[key] = threading.Lock()
+        return lock
+
+
+def _get_version_key(database: Database, table: Table | None = None) -> str:
+    if table is None:
+        return f"latest_partition:{database.id}:version"
+    return (
+        f"latest_partition:{database.id}:{table.catalog}:{table.schema}:{table.table}"
+        ":version"
+    )
+
+
+def _get_timeout(database: Database, table: Table) -> int:
+    timeout = current_app.config["LATEST_PARTITION_CACHE_TIMEOUT"]
+    return timeout(database, table) if callable(timeout) else timeout
+
+
+def get_cache_key(
+    database: Database,
+    table: Table,
+    lookup: str,
+    **kwargs: Any,
+) -> str:
+    """
+    Return the cache key of a lookup of the partitions of a table.
+
+    The key includes the versions of the database and the table, so that
+    invalidating them changes the keys of all their lookups.
+
+    :param database: The database of the table
+    :param table: The table
+    :param lookup: The name of the lookup, e.g. ``latest_partition``
+    :param kwargs: The parameters of the lookup
+    :returns: The cache key
+    """
+    versions = cache_manager.data_cache.get_many(
+        _get_version_key(database),
+        _get_version_key(database, table),
+    )
+    return f"latest_partition:{database.id}:" + md5_sha_from_dict(
+        {
+            "catalog": table.catalog,
+            "schema": table.schema,
+            "table": table.table,
+            "lookup": lookup,
+            "kwargs": kwargs,
+            "versions": versions,
+        },
+        default=str,
+    )
+
+
+def get_or_fetch(
+    database: Database,
+    table: Table,
+    lookup: str,
+    fetch: Callable[[], T],
+    **kwargs: Any,
+) -> T:
+    """
+    Return the cached result of a lookup of the partitions of a table, or run it.
+
+    Concurrent lookups with the same parameters, in this process or others, wait
+    for the first one instead of running it again.
+
+    :param database: The database of the table
+    :param table: The table
+    :param lookup: The name of the lookup, e.g. ``latest_partition``
+    :param fetch: Runs the lookup
+    :param kwargs: The parameters of the lookup
+    :returns: The result of the lookup
+    """
+    cache = cache_manager.data_cache
+    stats_logger = stats_logger_manager.instance
+    key = get_cache_key(database, table, lookup, **kwargs)
+
+    # results are wrapped, to tell a cached `None` from a missing key
+    if (cached := cache.get(key)) is not None:
+        stats_logger.incr("latest_partition.cache_hit")
+        return cached[0]
+
+    with _get_lock(key):
+        if (cached := cache.get(key)) is not None:
+            stats_logger.incr("latest_partition.cache_wait")
+            return cached[0]
+
+        lock_key = f"{key}:lock"
+        lock_timeout = current_app.config["LATEST_PARTITION_CACHE_LOCK_TIMEOUT"]
+        if not cache.add(lock_key, True, timeout=lock_timeout):
+            deadline = time.monotonic() + lock_timeout
+            while time.monotonic() < deadline:
+                time.sleep(POLL_INTERVAL)
+                if (cached := cache.get(key)) is not None:
+                    stats_logger.incr("latest_partition.cache_wait")
+                    return cached[0]
+            logger.warning("Timed out waiting for the lookup of %s", key)
+
+        stats_logger.incr("latest_partition.cache_miss")
+        try:
+            value = fetch()
+            cache.set(key, (value,), timeout=_get_timeout(database, table))
+        finally:
+            cache.delete(lock_key)
+        return value
+
+
+def invalidate(database: Database, table: Table | None = None) -> None:
+    """
+    Invalidate the cached lookups of the partitions of a table, or of all the
+    tables of a database.
+
+    :param database: The database
+    :param table: The table, or None for all the tables of the database
+    """
+    cache_manager.data_cache.set(
+        _get_version_key(database, table),
+        uuid.uuid4().hex,
+        timeout=0,
+    )
+    stats_logger_manager.instance.incr("latest_partition.cache_invalidate")
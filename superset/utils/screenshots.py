@@ -17,6 +17,7 @@
 from __future__ import annotations
 
 import base64
+import hashlib
 import logging
 from datetime import datetime
 from enum import Enum
@@ -24,6 +25,7 @@ from io import BytesIO
 from typing import cast, TYPE_CHECKING, TypedDict
 
 from flask import current_app
+from typing_extensions import NotRequired
 
 from superset import app, feature_flag_manager, thumbnail_cache
 from superset.extensions import event_logger
@@ -67,35 +69,57 @@ class ScreenshotCachePayloadType(TypedDict):
     image: str | None
     timestamp: str
     status: str
+    image_key: NotRequired[str | None]
+    image_format: NotRequired[str]
 
 
 class ScreenshotCachePayload:
-    def __init__(
+    def __init__(  # pylint: disable=too-many-arguments
         self,
         image: bytes | None = None,
         status: StatusValues = StatusValues.PENDING,
         timestamp: str = "",
+        image_key: str | None = None,
+        image_format: str = "png",
     ):
         self._image = image
+        self._image_key = image_key
+        self._image_format = image_format
         self._timestamp = timestamp or datetime.now().isoformat()
         self.status = StatusValues.UPDATED if image else status
 
     @classmethod
-    def from_dict(cls, payload: ScreenshotCachePayloadType) -> ScreenshotCachePayload:
+    def from_dict(
+        cls, payload: ScreenshotCachePayloadType, image: bytes | None = None
+    ) -> ScreenshotCachePayload:
+        """
+        :param payload: the cached payload
+        :param image: the image, when stored separately under the payload's
+            ``image_key``
+        """
+        if image is None and payload["image"]:
+            image = base64.b64decode(payload["image"])
         return cls(
-            image=base64.b64decode(payload["image"]) if payload["image"] else None,
+            image=image,
             status=StatusValues(payload["status"]),
             timestamp=payload["timestamp"],
+            image_key=payload.get("image_key"),
+            image_format=payload.get("image_format", "png"),
         )
 
     def to_dict(self) -> ScreenshotCachePayloadType:
-        return {
-            "image": base64.b64encode(self._image).decode("utf-8")
-            if self._image
-            else None,
+        payload: ScreenshotCachePayloadType = {
+            "image": None,
             "timestamp": self._timestamp,
             "status": self.status.value,
+            "image_format": self._image_format,
         }
+        if self._image_key:
+            # the image itself is stored by content hash
+            payload["image_key"] = self._image_key
+        elif self._image:
+            payload["image"] = base64.b64encode(self._image).decode("utf-8")
+        return payload
 
     def update_timestamp(self) -> None:
         self._timestamp = datetime.now().isoformat()
@@ -103,17 +127,26 @@ class ScreenshotCachePayload:
     def pending(self) -> None:
         self.update_timestamp()
         self._image = None
+        self._image_key = None
         self.status = StatusValues.PENDING
 
     def computing(self) -> None:
         self.update_timestamp()
         self._image = None
+        self._image_key = None
         self.status = StatusValues.COMPUTING
 
-    def update(self, image: bytes) -> None:
+    def update(
+        self,
+        image: bytes,
+        image_key: str | None = None,
+        image_format: str = "png",
+    ) -> None:
         self.update_timestamp()
         self.status = StatusValues.UPDATED
         self._image = image
+        self._image_key = image_key
+        self._image_format = image_format
 
     def error(
         self,
@@ -126,6 +159,9 @@ class ScreenshotCachePayload:
             return None
         return BytesIO(self._image)
 
+    def get_mimetype(self) -> str:
+        return f"image/{self._image_format}"
+
     def get_timestamp(self) -> str:
         return self._timestamp
 
@@ -179,6 +215,7 @@ class BaseScreenshot:
         self,
         window_size: bool | WindowSize | None = None,
         thumb_size: bool | WindowSize | None = None,
+        image_format: str = "png",
     ) -> str:
         window_size = window_size or self.window_size
         thumb_size = thumb_size or self.thumb_size
@@ -189,6 +226,36 @@ class BaseScreenshot:
             "window_size": window_size,
             "thumb_size": thumb_size,
         }
+        if image_format != "png":
+            args["image_format"] = image_format
+        return md5_sha_from_dict(args)
+
+    def get_render_cache_key(self, window_size: WindowSize) -> str:
+        """
+        The key of the full size render of the page, which all thumbnail sizes and
+        formats for the same digest are derived from.
+        """
+        args = {
+            "thumbnail_type": self.thumbnail_type,
+            "url": self.url,
+            "digest": self.digest,
+            "type": "render",
+            "window_size": window_size,
+        }
+        return md5_sha_from_dict(args)
+
+    def get_rendition_cache_key(
+        self, window_size: WindowSize, thumb_size: WindowSize, image_format: str
+    ) -> str:
+        args = {
+            "thumbnail_type": self.thumbnail_type,
+            "url": self.url,
+            "digest": self.digest,
+            "type": "rendition",
+            "window_size": window_size,
+            "thumb_size": thumb_size,
+            "image_format": image_format,
+        }
         return md5_sha_from_dict(args)
 
     def get_from_cache(
@@ -212,11 +279,104 @@ class BaseScreenshot:
                 pass
             elif isinstance(payload, dict):
                 payload = cast(ScreenshotCachePayloadType, payload)
-                payload = ScreenshotCachePayload.from_dict(payload)
+                image = None
+                if image_key := payload.get("image_key"):
+                    image = cls.cache.get(image_key)
+                    if image is None:
+                        logger.info("Thumbnail image has expired: %s", image_key)
+                        return None
+                payload = ScreenshotCachePayload.from_dict(payload, image=image)
             return payload
         logger.info("Failed at getting from cache: %s", cache_key)
         return None
 
+    @classmethod
+    def store_image(cls, image: bytes) -> str:
+        """
+        Store an image under its content hash, so that identical images, e.g. of
+        the same chart rendered for different users, are only stored once.
+
+        :returns: the cache key of the image
+        """
+        image_key = f"thumbnail_image_{hashlib.sha256(image).hexdigest()}"
+        # setting it again refreshes the timeout for the payloads referencing it
+        cls.cache.set(image_key, image)
+        return image_key
+
+    def get_stored_image(self, cache_key: str) -> tuple[str, bytes] | None:
+        """
+        Get an image stored by ``store_image`` through the render or rendition key
+        referencing it.
+        """
+        if (image_key := self.cache.get(cache_key)) and (
+            image := self.cache.get(image_key)
+        ) is not None:
+            return image_key, image
+        return None
+
+    def get_renditions(
+        self, thumb_size: WindowSize, image_format: str
+    ) -> list[tuple[WindowSize, str]]:
+        """
+        The thumbnail sizes and formats to produce from a render: the requested
+        one, followed by those configured in THUMBNAIL_RENDITIONS.
+        """
+        renditions = [(tuple(thumb_size), image_format)]
+        for rendition in app.config["THUMBNAIL_RENDITIONS"].get(
+            self.thumbnail_type, []
+        ):
+            size_and_format = (
+                tuple(rendition["thumb_size"]),
+                rendition.get("format", "png"),
+            )
+            if size_and_format not in renditions:
+                renditions.append(size_and_format)
+        return cast(list[tuple[WindowSize, str]], renditions)
+
+    def render(
+        self, user: User | None, window_size: WindowSize, force: bool
+    ) -> bytes | None:
+        """
+        Render the page, or reuse the render of the same URL, digest and window size.
+        """
+        render_key = self.get_render_cache_key(window_size)
+        if not force and (stored := self.get_stored_image(render_key)):
+            logger.info("Reusing render for thumbnail: %s", render_key)
+            return stored[1]
+
+        with event_logger.log_context(f"screenshot.compute.{self.thumbnail_type}"):
+            image = self.get_screenshot(user=user, window_size=window_size)
+        if image:
+            self.cache.set(render_key, self.store_image(image))
+        return image
+
+    def cache_renditions(
+        self,
+        image: bytes,
+        window_size: WindowSize,
+        renditions: list[tuple[WindowSize, str]],
+    ) -> dict[tuple[WindowSize, str], tuple[str, bytes]]:
+        """
+        Produce and cache all renditions of a render in one pass.
+
+        :returns: the image key and image of each rendition
+        """
+        rendered = {}
+        for thumb_size, image_format in renditions:
+            if thumb_size == tuple(window_size) and image_format == "png":
+                thumbnail = image
+            else:
+                thumbnail = self.resize_image(
+                    image, output=image_format, thumb_size=thumb_size
+                )
+            image_key = self.store_image(thumbnail)
+            self.cache.set(
+                self.get_rendition_cache_key(window_size, thumb_size, image_format),
+                image_key,
+            )
+            rendered[(thumb_size, image_format)] = image_key, thumbnail
+        return rendered
+
     def compute_and_cache(  # pylint: disable=too-many-arguments
         self,
         force: bool,
@@ -224,18 +384,26 @@ class BaseScreenshot:
         window_size: WindowSize | None = None,
         thumb_size: WindowSize | None = None,
         cache_key: str | None = None,
+        image_format: str = "png",
     ) -> None:
         """
         Computes the thumbnail and caches the result
 
+        The page is rendered once per digest and window size. The requested
+        thumbnail and the renditions configured in THUMBNAIL_RENDITIONS are all
+        derived from that render, and stored by content hash.
+
         :param user: If no user is given will use the current context
         :param cache: The cache to keep the thumbnail payload
         :param window_size: The window size from which will process the thumb
         :param thumb_size: The final thumbnail size
         :param force: Will force the computation even if it's already cached
+        :param image_format: The thumbnail image format, png or webp
         :return: Image payload
         """
-        cache_key = cache_key or self.get_cache_key(window_size, thumb_size)
+        cache_key = cache_key or self.get_cache_key(
+            window_size, thumb_size, image_format=image_format
+        )
         cache_payload = self.get_from_cache_key(cache_key) or ScreenshotCachePayload()
         if (
             cache_payload.status in [StatusValues.COMPUTING, StatusValues.UPDATED]
@@ -251,27 +419,37 @@ class BaseScreenshot:
         logger.info("Processing url for thumbnail: %s", cache_key)
         cache_payload.computing()
         self.cache.set(cache_key, cache_payload.to_dict())
-        image = None
-        # Assuming all sorts of things can go wrong with Selenium
-        try:
-            logger.info("trying to generate screenshot")
-            with event_logger.log_context(f"screenshot.compute.{self.thumbnail_type}"):
-                image = self.get_screenshot(user=user, window_size=window_size)
-        except Exception as ex:  # pylint: disable=broad-except
-            logger.warning("Failed at generating thumbnail %s", ex, exc_info=True)
-            cache_payload.error()
-        if image and window_size != thumb_size:
+
+        thumbnail = None
+        if not force:
+            thumbnail = self.get_stored_image(
+                self.get_rendition_cache_key(window_size, thumb_size, image_format)
+            )
+
+        if not thumbnail:
+            image = None
+            # Assuming all sorts of things can go wrong with Selenium
             try:
-                image = self.resize_image(image, thumb_size=thumb_size)
+                logger.info("trying to generate screenshot")
+                image = self.render(user, window_size, force)
             except Exception as ex:  # pylint: disable=broad-except
-                logger.warning("Failed at resizing thumbnail %s", ex, exc_info=True)
+                logger.warning("Failed at generating thumbnail %s", ex, exc_info=True)
                 cache_payload.error()
-                image = None
-
-        if image:
+            if image:
+                try:
+                    renditions = self.get_renditions(thumb_size, image_format)
+                    thumbnail = self.cache_renditions(image, window_size, renditions)[
+                        renditions[0]
+                    ]
+                except Exception as ex:  # pylint: disable=broad-except
+                    logger.warning("Failed at resizing thumbnail %s", ex, exc_info=True)
+                    cache_payload.error()
+
+        if thumbnail:
             logger.info("Caching thumbnail: %s", cache_key)
+            image_key, image = thumbnail
             with event_logger.log_context(f"screenshot.cache.{self.thumbnail_type}"):
-                cache_payload.update(image)
+                cache_payload.update(image, image_key, image_format)
         self.cache.set(cache_key, cache_payload.to_dict())
         logger.info("Updated thumbnail cache; Status: %s", cache_payload.get_status())
         return
@@ -349,6 +527,7 @@ class DashboardScreenshot(BaseScreenshot):
         window_size: bool | WindowSize | None = None,
         thumb_size: bool | WindowSize | None = None,
         permalink_key: str | None = None,
+        image_format: str = "png",
     ) -> str:
         window_size = window_size or self.window_size
         thumb_size = thumb_size or self.thumb_size
@@ -360,4 +539,6 @@ class DashboardScreenshot(BaseScreenshot):
             "thumb_size": thumb_size,
             "permalink_key": permalink_key,
         }
+        if image_format != "png":
+            args["image_format"] = image_format
         return md5_sha_from_dict(args)
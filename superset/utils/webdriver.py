@@ -18,10 +18,14 @@
 from __future__ import annotations
 
 import logging
+import os
+import threading
 from abc import ABC, abstractmethod
+from collections.abc import Iterator
+from contextlib import contextmanager
 from enum import Enum
 from time import sleep
-from typing import TYPE_CHECKING
+from typing import Any, Callable, TYPE_CHECKING
 
 from flask import current_app
 from packaging import version
@@ -41,6 +45,7 @@ from selenium.webdriver.support.ui import WebDriverWait
 from superset import feature_flag_manager
 from superset.extensions import machine_auth_provider_factory
 from superset.utils.retries import retry_call
+from superset.utils.webdriver_pool import WebDriverPool
 
 WindowSize = tuple[int, int]
 logger = logging.getLogger(__name__)
@@ -50,6 +55,7 @@ if TYPE_CHECKING:
 
 if feature_flag_manager.is_feature_enabled("PLAYWRIGHT_REPORTS_AND_THUMBNAILS"):
     from playwright.sync_api import (
+        Browser,
         BrowserContext,
         Error as PlaywrightError,
         Locator,
@@ -70,6 +76,118 @@ class ChartStandaloneMode(Enum):
     SHOW_NAV = 0
 
 
+def get_pool_config() -> dict[str, Any] | None:
+    """
+    Return the browser pool options from ``WEBDRIVER_POOL``, or None if pooling is
+    disabled.
+    """
+    pool_config = dict(current_app.config["WEBDRIVER_POOL"])
+    if not pool_config.pop("enabled", False):
+        return None
+    return pool_config
+
+
+_selenium_pool: WebDriverPool[WebDriver] | None = None
+
+
+def _is_selenium_driver_healthy(driver: WebDriver) -> bool:
+    try:
+        return bool(driver.current_url)
+    except Exception:  # pylint: disable=broad-except
+        return False
+
+
+def _get_selenium_pool() -> WebDriverPool[WebDriver] | None:
+    """
+    Return the per process pool of authenticated Selenium drivers, or None if
+    pooling is disabled.
+    """
+    global _selenium_pool  # pylint: disable=global-statement
+
+    if (pool_config := get_pool_config()) is None:
+        return None
+    if _selenium_pool is None:
+        _selenium_pool = WebDriverPool(
+            "selenium",
+            destroy=lambda driver: WebDriverSelenium.destroy(
+                driver, current_app.config["SCREENSHOT_SELENIUM_RETRIES"]
+            ),
+            is_healthy=_is_selenium_driver_healthy,
+            **pool_config,
+        )
+    return _selenium_pool
+
+
+class _PlaywrightRuntime:
+    """
+    A Playwright driver and Chromium browser kept alive between screenshots,
+    along with a pool of authenticated browser contexts.
+
+    The Playwright sync API is bound to the thread that started it, and the
+    browser can only be closed from that thread, so the runtime is only kept on
+    the main thread of the process, which lives as long as the worker does.
+    Screenshots taken on other threads, e.g. by the report screenshot executor,
+    launch and close their own browser. The browser is relaunched once it has
+    been used for ``max_uses`` screenshots or is disconnected.
+    """
+
+    _runtime: _PlaywrightRuntime | None = None
+
+    def __init__(self, pool_config: dict[str, Any]) -> None:
+        self._pid = os.getpid()
+        self._playwright = sync_playwright().start()
+        self._browser: Browser | None = None
+        self._max_uses = pool_config.get("max_uses", 50)
+        self._uses = 0
+        self.pool: WebDriverPool[BrowserContext] = WebDriverPool(
+            "playwright",
+            destroy=lambda context: context.close(),
+            is_healthy=lambda context: bool(
+                context.browser and context.browser.is_connected()
+            ),
+            **pool_config,
+        )
+
+    @classmethod
+    def get(cls) -> _PlaywrightRuntime | None:
+        if threading.current_thread() is not threading.main_thread():
+            return None
+        if (pool_config := get_pool_config()) is None:
+            return None
+        if cls._runtime is None or cls._runtime._pid != os.getpid():
+            # a runtime inherited from the parent process talks to its browser
+            cls._runtime = cls(pool_config)
+        return cls._runtime
+
+    def _get_browser(self) -> Browser:
+        if not self._browser or not self._browser.is_connected():
+            self._browser = self._playwright.chromium.launch(
+                args=current_app.config["WEBDRIVER_OPTION_ARGS"]
+            )
+            self._uses = 0
+        return self._browser
+
+    @contextmanager
+    def acquire_context(
+        self, user: User, create: Callable[[Browser, User], BrowserContext]
+    ) -> Iterator[BrowserContext]:
+        """
+        Check an authenticated browser context for the user out of the pool.
+        """
+        if self._browser and self._uses >= self._max_uses:
+            # pooled contexts are all idle, since the sync API only hands out one
+            # at a time per thread
+            self.pool.clear()
+            self._browser.close()
+            self._browser = None
+
+        self._uses += 1
+        with self.pool.acquire(
+            user.id, lambda: create(self._get_browser(), user)
+        ) as context:
+            yield context
+
+
 # pylint: disable=too-few-public-methods
 class WebDriverProxy(ABC):
     def __init__(self, driver_type: str, window: WindowSize | None = None):
@@ -136,112 +254,123 @@ class WebDriverPlaywright(WebDriverProxy):
 
         return error_messages
 
-    def get_screenshot(  # pylint: disable=too-many-locals, too-many-statements  # noqa: C901
-        self, url: str, element_name: str, user: User
-    ) -> bytes | None:
+    def create_context(self, browser: Browser, user: User) -> BrowserContext:
+        pixel_density = current_app.config["WEBDRIVER_WINDOW"].get("pixel_density", 1)
+        context = browser.new_context(
+            bypass_csp=True,
+            viewport={
+                "height": self._window[1],
+                "width": self._window[0],
+            },
+            device_scale_factor=pixel_density,
+        )
+        context.set_default_timeout(
+            current_app.config["SCREENSHOT_PLAYWRIGHT_DEFAULT_TIMEOUT"]
+        )
+        return self.auth(user, context)
+
+    def get_screenshot(self, url: str, element_name: str, user: User) -> bytes | None:
+        if runtime := _PlaywrightRuntime.get():
+            with runtime.acquire_context(user, self.create_context) as context:
+                page = context.new_page()
+                try:
+                    page.set_viewport_size(
+                        {"width": self._window[0], "height": self._window[1]}
+                    )
+                    return self.take_screenshot(page, url, element_name, user)
+                finally:
+                    page.close()
+
         with sync_playwright() as playwright:
             browser_args = current_app.config["WEBDRIVER_OPTION_ARGS"]
             browser = playwright.chromium.launch(args=browser_args)
-            pixel_density = current_app.config["WEBDRIVER_WINDOW"].get(
-                "pixel_density", 1
-            )
-            context = browser.new_context(
-                bypass_csp=True,
-                viewport={
-                    "height": self._window[1],
-                    "width": self._window[0],
-                },
-                device_scale_factor=pixel_density,
+            context = self.create_context(browser, user)
+            page = context.new_page()
+            return self.take_screenshot(page, url, element_name, user)
+
+    def take_screenshot(  # pylint: disable=too-many-locals, too-many-statements  # noqa: C901
+        self, page: Page, url: str, element_name: str, user: User
+    ) -> bytes | None:
+        try:
+            page.goto(
+                url,
+                wait_until=current_app.config["SCREENSHOT_PLAYWRIGHT_WAIT_EVENT"],
             )
-            context.set_default_timeout(
-                current_app.config["SCREENSHOT_PLAYWRIGHT_DEFAULT_TIMEOUT"]
+        except PlaywrightTimeout:
+            logger.exception(
+                "Web event %s not detected. Page %s might not have been fully loaded",  # noqa: E501
+                current_app.config["SCREENSHOT_PLAYWRIGHT_WAIT_EVENT"],
+                url,
             )
-            self.auth(user, context)
-            page = context.new_page()
+
+        img: bytes | None = None
+        selenium_headstart = current_app.config["SCREENSHOT_SELENIUM_HEADSTART"]
+        logger.debug("Sleeping for %i seconds", selenium_headstart)
+        page.wait_for_timeout(selenium_headstart * 1000)
+        element: Locator
+        try:
             try:
-                page.goto(
-                    url,
-                    wait_until=current_app.config["SCREENSHOT_PLAYWRIGHT_WAIT_EVENT"],
+                # page didn't load
+                logger.debug(
+                    "Wait for the presence of %s at url: %s", element_name, url
                 )
+                element = page.locator(f".{element_name}")
+                element.wait_for()
+            except PlaywrightTimeout:
+                logger.exception("Timed out requesting url %s", url)
+                raise
+
+            try:
+                # chart containers didn't render
+                logger.debug("Wait for chart containers to draw at url: %s", url)
+                slice_container_locator = page.locator(".chart-container")
+                for slice_container_elem in slice_container_locator.all():
+                    slice_container_elem.wait_for()
             except PlaywrightTimeout:
                 logger.exception(
-                    "Web event %s not detected. Page %s might not have been fully loaded",  # noqa: E501
-                    current_app.config["SCREENSHOT_PLAYWRIGHT_WAIT_EVENT"],
+                    "Timed out waiting for chart containers to draw at url %s",
                     url,
                 )
-
-            img: bytes | None = None
-            selenium_headstart = current_app.config["SCREENSHOT_SELENIUM_HEADSTART"]
-            logger.debug("Sleeping for %i seconds", selenium_headstart)
-            page.wait_for_timeout(selenium_headstart * 1000)
-            element: Locator
+                raise
             try:
-                try:
-                    # page didn't load
-                    logger.debug(
-                        "Wait for the presence of %s at url: %s", element_name, url
-                    )
-                    element = page.locator(f".{element_name}")
-                    element.wait_for()
-                except PlaywrightTimeout:
-                    logger.exception("Timed out requesting url %s", url)
-                    raise
-
-                try:
-                    # chart containers didn't render
-                    logger.debug("Wait for chart containers to draw at url: %s", url)
-                    slice_container_locator = page.locator(".chart-container")
-                    for slice_container_elem in slice_container_locator.all():
-                        slice_container_elem.wait_for()
-                except PlaywrightTimeout:
-                    logger.exception(
-                        "Timed out waiting for chart containers to draw at url %s",
-                        url,
-                    )
-                    raise
-                try:
-                    # charts took too long to load
-                    logger.debug(
-                        "Wait for loading element of charts to be gone at url: %s", url
-                    )
-                    for loading_element in page.locator(".loading").all():
-                        loading_element.wait_for(state="detached")
-                except PlaywrightTimeout:
-                    logger.exception(
-                        "Timed out waiting for charts to load at url %s", url
-                    )
-                    raise
-
-                selenium_animation_wait = current_app.config[
-                    "SCREENSHOT_SELENIUM_ANIMATION_WAIT"
-                ]
-                logger.debug(
-                    "Wait %i seconds for chart animation", selenium_animation_wait
-                )
-                page.wait_for_timeout(selenium_animation_wait * 1000)
+                # charts took too long to load
                 logger.debug(
-                    "Taking a PNG screenshot of url %s as user %s",
-                    url,
-                    user.username,
+                    "Wait for loading element of charts to be gone at url: %s", url
                 )
-                if current_app.config["SCREENSHOT_REPLACE_UNEXPECTED_ERRORS"]:
-                    unexpected_errors = WebDriverPlaywright.find_unexpected_errors(page)
-                    if unexpected_errors:
-                        logger.warning(
-                            "%i errors found in the screenshot. URL: %s. Errors are: %s",  # noqa: E501
-                            len(unexpected_errors),
-                            url,
-                            unexpected_errors,
-                        )
-                img = element.screenshot()
+                for loading_element in page.locator(".loading").all():
+                    loading_element.wait_for(state="detached")
             except PlaywrightTimeout:
-                # raise again for the finally block, but handled above
-                pass
-            except PlaywrightError:
-                logger.exception(
-                    "Encountered an unexpected error when requesting url %s", url
-                )
-            return img
+                logger.exception("Timed out waiting for charts to load at url %s", url)
+                raise
+
+            selenium_animation_wait = current_app.config[
+                "SCREENSHOT_SELENIUM_ANIMATION_WAIT"
+            ]
+            logger.debug("Wait %i seconds for chart animation", selenium_animation_wait)
+            page.wait_for_timeout(selenium_animation_wait * 1000)
+            logger.debug(
+                "Taking a PNG screenshot of url %s as user %s",
+                url,
+                user.username,
+            )
+            if current_app.config["SCREENSHOT_REPLACE_UNEXPECTED_ERRORS"]:
+                unexpected_errors = WebDriverPlaywright.find_unexpected_errors(page)
+                if unexpected_errors:
+                    logger.warning(
+                        "%i errors found in the screenshot. URL: %s. Errors are: %s",  # noqa: E501
+                        len(unexpected_errors),
+                        url,
+                        unexpected_errors,
+                    )
+            img = element.screenshot()
+        except PlaywrightTimeout:
+            # raise again for the finally block, but handled above
+            pass
+        except PlaywrightError:
+            logger.exception(
+                "Encountered an unexpected error when requesting url %s", url
+            )
+        return img
 
 
 class WebDriverSelenium(WebDriverProxy):
@@ -383,8 +512,22 @@ class WebDriverSelenium(WebDriverProxy):
 
         return error_messages
 
-    def get_screenshot(self, url: str, element_name: str, user: User) -> bytes | None:  # noqa: C901
+    def get_screenshot(self, url: str, element_name: str, user: User) -> bytes | None:
+        if pool := _get_selenium_pool():
+            with pool.acquire(
+                (self._driver_type, user.id), lambda: self.auth(user)
+            ) as driver:
+                return self.take_screenshot(driver, url, element_name, user)
+
         driver = self.auth(user)
+        try:
+            return self.take_screenshot(driver, url, element_name, user)
+        finally:
+            self.destroy(driver, current_app.config["SCREENSHOT_SELENIUM_RETRIES"])
+
+    def take_screenshot(  # noqa: C901
+        self, driver: WebDriver, url: str, element_name: str, user: User
+    ) -> bytes | None:
         driver.set_window_size(*self._window)
         driver.get(url)
         img: bytes | None = None
@@ -482,6 +625,4 @@ class WebDriverSelenium(WebDriverProxy):
                 "Encountered an unexpected error when requesting url %s", url
             )
             raise
-        finally:
-            self.destroy(driver, current_app.config["SCREENSHOT_SELENIUM_RETRIES"])
         return img
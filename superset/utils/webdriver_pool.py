@@ -0,0 +1,228 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+from __future__ import annotations
+
+import logging
+import os
+import threading
+import time
+from collections.abc import Hashable, Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Callable, Generic, Optional, TypeVar
+
+from superset.extensions import stats_logger_manager
+from superset.utils.dates import now_as_float
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+class WebDriverPoolTimeoutError(Exception):
+    """Raised when no browser could be checked out of the pool in time"""
+
+
+@dataclass
+class _PooledDriver(Generic[T]):
+    key: Hashable
+    driver: T
+    uses: int = 0
+    last_used: float = field(default_factory=time.monotonic)
+
+
+class WebDriverPool(Generic[T]):
+    """
+    A pool of warm, authenticated browsers.
+
+    Browsers are keyed, typically by the user they are authenticated as, and are
+    reused for that key only. At most ``max_size`` browsers exist at any time; a
+    caller asking for a key without an idle browser either creates one, replaces
+    an idle browser of another key or waits for one to be returned. Browsers are
+    health checked before being handed out, and recycled once they have been used
+    ``max_uses`` times or have been idle for ``max_idle_seconds``.
+
+    Pool waits, hits, misses and recycles are reported through the stats logger
+    under ``webdriver_pool.<name>.*``.
+    """
+
+    def __init__(  # pylint: disable=too-many-arguments
+        self,
+        name: str,
+        destroy: Callable[[T], None],
+        is_healthy: Callable[[T], bool],
+        max_size: int = 5,
+        max_uses: int = 50,
+        max_idle_seconds: float = 300,
+        acquire_timeout: float = 60,
+    ) -> None:
+        self._name = name
+        self._destroy = destroy
+        self._is_healthy = is_healthy
+        self._max_size = max_size
+        self._max_uses = max_uses
+        self._max_idle_seconds = max_idle_seconds
+        self._acquire_timeout = acquire_timeout
+        self._condition = threading.Condition()
+        self._idle: list[_PooledDriver[T]] = []
+        self._size = 0
+        self._pid = os.getpid()
+
+    @property
+    def size(self) -> int:
+        return self._size
+
+    @property
+    def idle_count(self) -> int:
+        return len(self._idle)
+
+    def _incr(self, metric: str) -> None:
+        stats_logger_manager.instance.incr(f"webdriver_pool.{self._name}.{metric}")
+
+    def _is_expired(self, pooled: _PooledDriver[T], now: float) -> bool:
+        return (
+            pooled.uses >= self._max_uses
+            or now - pooled.last_used > self._max_idle_seconds
+        )
+
+    def _destroy_all(self, drivers: list[_PooledDriver[T]]) -> None:
+        for pooled in drivers:
+            try:
+                self._destroy(pooled.driver)
+            except Exception:  # pylint: disable=broad-except
+                logger.warning("Failed to destroy pooled browser", exc_info=True)
+
+    def _reset_after_fork(self) -> None:
+        if self._pid != os.getpid():
+            # browsers belong to the parent process, forget about them
+            self._pid = os.getpid()
+            self._idle = []
+            self._size = 0
+
+    def _checkout(self, key: Hashable) -> Optional[_PooledDriver[T]]:
+        """
+        Take an idle browser for the key out of the pool, or reserve a slot for a
+        new one, in which case None is returned.
+        """
+        deadline = time.monotonic() + self._acquire_timeout
+        while True:
+            to_destroy: list[_PooledDriver[T]] = []
+            candidate: Optional[_PooledDriver[T]] = None
+            with self._condition:
+                self._reset_after_fork()
+                now = time.monotonic()
+                for pooled in list(self._idle):
+                    if self._is_expired(pooled, now):
+                        self._idle.remove(pooled)
+                        self._size -= 1
+                        to_destroy.append(pooled)
+                        self._incr("recycle")
+
+                candidate = next((p for p in self._idle if p.key == key), None)
+                if candidate:
+                    self._idle.remove(candidate)
+                elif self._size < self._max_size:
+                    self._size += 1
+                elif self._idle:
+                    # make room by evicting the least recently used idle browser
+                    evicted = min(self._idle, key=lambda p: p.last_used)
+                    self._idle.remove(evicted)
+                    to_destroy.append(evicted)
+                else:
+                    remaining = deadline - now
+                    if remaining <= 0:
+                        raise WebDriverPoolTimeoutError(
+                            f"No browser available in the {self._name} pool after "
+                            f"{self._acquire_timeout} seconds"
+                        )
+                    self._condition.wait(remaining)
+                    continue
+
+            self._destroy_all(to_destroy)
+            if candidate is None:
+                self._incr("miss")
+                return None
+            if self._is_healthy(candidate.driver):
+                self._incr("hit")
+                return candidate
+
+            self._incr("unhealthy")
+            self._discard(candidate)
+
+    def _checkin(self, pooled: _PooledDriver[T]) -> None:
+        pooled.uses += 1
+        pooled.last_used = time.monotonic()
+        if pooled.uses >= self._max_uses:
+            self._incr("recycle")
+            self._discard(pooled)
+            return
+
+        with self._condition:
+            if self._pid != os.getpid():
+                return
+            self._idle.append(pooled)
+            self._condition.notify()
+
+    def _release_slot(self) -> None:
+        with self._condition:
+            self._size -= 1
+            self._condition.notify()
+
+    def _discard(self, pooled: _PooledDriver[T]) -> None:
+        self._release_slot()
+        self._destroy_all([pooled])
+
+    @contextmanager
+    def acquire(self, key: Hashable, create: Callable[[], T]) -> Iterator[T]:
+        """
+        Check a browser out of the pool for the duration of the context.
+
+        The browser is returned to the pool when the context exits normally, and
+        destroyed if an exception is raised, since its state is unknown.
+
+        :param key: the key browsers are reused for, e.g. the user id
+        :param create: creates and authenticates a browser on a pool miss
+        :raises WebDriverPoolTimeoutError: if the pool is exhausted
+        """
+        start = now_as_float()
+        pooled = self._checkout(key)
+        if pooled is None:
+            try:
+                pooled = _PooledDriver(key, create())
+            except BaseException:
+                self._release_slot()
+                raise
+        stats_logger_manager.instance.timing(
+            f"webdriver_pool.{self._name}.wait", now_as_float() - start
+        )
+
+        try:
+            yield pooled.driver
+        except BaseException:
+            self._discard(pooled)
+            raise
+        self._checkin(pooled)
+
+    def clear(self) -> None:
+        """
+        Destroy all idle browsers.
+        """
+        with self._condition:
+            idle, self._idle = self._idle, []
+            self._size -= len(idle)
+            self._condition.notify_all()
+        self._destroy_all(idle)
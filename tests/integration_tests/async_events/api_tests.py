@@ -69,6 +69,29 @@ class TestAsyncEventApi(SupersetTestCase):
         mock_xrange.assert_called_with(channel_id, "1607471525180-1", "+", 100)
         assert response == {"result": []}
 
+    def _test_events_long_poll_logic(self, mock_cache):
+        with (
+            mock.patch.object(mock_cache, "xrange") as mock_xrange,
+            mock.patch.object(mock_cache, "xread") as mock_xread,
+            mock.patch.object(async_query_manager, "_long_poll_timeout", 30),
+        ):
+            mock_xrange.return_value = []
+            mock_xread.return_value = [
+                (
+                    b"async-events-" + self.UUID.encode(),
+                    [(b"1607471525180-1", {b"data": b'{"status": "done"}'})],
+                )
+            ]
+            rv = self.client.get(
+                "api/v1/async_event/?last_id=1607471525180-0&timeout=10"
+            )
+            response = json.loads(rv.data.decode("utf-8"))
+
+        assert rv.status_code == 200
+        channel_id = app.config["GLOBAL_ASYNC_QUERIES_REDIS_STREAM_PREFIX"] + self.UUID
+        mock_xread.assert_called_with({channel_id: "1607471525180-0"}, 100, 500)
+        assert response == {"result": [{"id": "1607471525180-1", "status": "done"}]}
+
     def _test_events_results_logic(self, mock_cache):
         with mock.patch.object(mock_cache, "xrange") as mock_xrange:
             mock_xrange.return_value = [
@@ -125,6 +148,12 @@ class TestAsyncEventApi(SupersetTestCase):
             RedisSentinelCacheBackend, self._test_events_logic
         )
 
+    @mock.patch("uuid.uuid4", return_value=UUID)
+    def test_events_long_poll(self, mock_uuid4):
+        self.run_test_with_cache_backend(
+            RedisCacheBackend, self._test_events_long_poll_logic
+        )
+
     def test_events_no_login(self):
         app._got_first_request = False
         async_query_manager_factory.init_app(app)
@@ -2207,6 +2207,46 @@ class TestDatabaseApi(SupersetTestCase):
                 assert option["type"] == "table"
                 assert option["value"] in schemas
 
+    def test_database_search_metadata(self):
+        """
+        Database API: Test database search metadata
+        """
+        self.login(ADMIN_USERNAME)
+        database = db.session.query(Database).filter_by(database_name="examples").one()
+
+        schema_name = self.default_schema_backend_map[database.backend]
+        table_names = {
+            name[0]
+            for name in database.get_all_table_names_in_schema(None, schema_name)
+        }
+        query = {"query": "birth_names", "schema_name": schema_name, "page_size": 5}
+        rv = self.client.get(
+            f"api/v1/database/{database.id}/search_metadata/?q={prison.dumps(query)}"
+        )
+
+        assert rv.status_code == 200
+        response = json.loads(rv.data.decode("utf-8"))
+        assert len(response["result"]) <= 5
+        for item in response["result"]:
+            assert item["type"] == "table"
+            assert item["schema"] == schema_name
+            assert item["value"] in table_names
+        if "birth_names" in table_names:
+            assert response["result"][0]["value"] == "birth_names"
+            assert response["result"][0]["score"] == 2
+
+    def test_database_search_metadata_invalid_query(self):
+        """
+        Database API: Test database search metadata with invalid query
+        """
+        self.login(ADMIN_USERNAME)
+        database = db.session.query(Database).first()
+        rv = self.client.get(
+            f"api/v1/database/{database.id}/search_metadata/"
+            f"?q={prison.dumps({'schema_name': 'main'})}"
+        )
+        assert rv.status_code == 400
+
     @patch("superset.utils.log.logger")
     def test_database_tables_not_found(self, logger_mock):
         """
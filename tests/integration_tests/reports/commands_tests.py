@@ -14,8 +14,9 @@
 # KIND, either express or implied.  See the License for the
 # specific language governing permissions and limitations
 # under the License.
+import codecs
 from contextlib import contextmanager
-from datetime import datetime, timedelta, timezone
+from datetime import datetime, timedelta
 from typing import Optional
 from unittest.mock import call, Mock, patch
 from uuid import uuid4
@@ -36,9 +37,11 @@ from slack_sdk.errors import (
     SlackRequestError,
     SlackTokenRotationError,
 )
+from sqlalchemy import update
 from sqlalchemy.sql import func
 
 from superset import db
+from superset.commands.chart.exceptions import ChartDataQueryFailedError
 from superset.commands.report.exceptions import (
     AlertQueryError,
     AlertQueryInvalidTypeError,
@@ -84,6 +87,7 @@ from tests.integration_tests.fixtures.birth_names_dashboard import (
     load_birth_names_dashboard_with_slices,  # noqa: F401
     load_birth_names_data,  # noqa: F401
 )
+from tests.integration_tests.fixtures.query_context import get_query_context
 from tests.integration_tests.fixtures.tabbed_dashboard import (
     tabbed_dashboard,  # noqa: F401
 )
@@ -271,6 +275,20 @@ def create_report_email_chart_with_csv_no_query_context():
     cleanup_report_schedule(report_schedule)
 
 
+@pytest.fixture
+def create_report_email_chart_with_csv_query_context():
+    chart = db.session.query(Slice).first()
+    chart.query_context = json.dumps(get_query_context("birth_names"))
+    report_schedule = create_report_notification(
+        email_target="target@email.com",
+        chart=chart,
+        report_format=ReportDataFormat.CSV,
+        name="report_csv_query_context",
+    )
+    yield report_schedule
+    cleanup_report_schedule(report_schedule)
+
+
 @pytest.fixture
 def create_report_email_dashboard():
     dashboard = db.session.query(Dashboard).first()
@@ -932,26 +950,18 @@ def test_email_chart_report_dry_run(
     "load_birth_names_dashboard_with_slices",
     "create_report_email_chart_with_csv",
 )
-@patch("superset.utils.csv.urllib.request.urlopen")
-@patch("superset.utils.csv.urllib.request.OpenerDirector.open")
 @patch("superset.reports.notifications.email.send_email_smtp")
-@patch("superset.utils.csv.get_chart_csv_data")
+@patch("superset.commands.report.execute.BaseReportState._get_chart_data")
 def test_email_chart_report_schedule_with_csv(
-    csv_mock,
+    chart_data_mock,
     email_mock,
-    mock_open,
-    mock_urlopen,
     create_report_email_chart_with_csv,
 ):
     """
     ExecuteReport Command: Test chart email report schedule with CSV
     """
-    # setup csv mock
-    response = Mock()
-    mock_open.return_value = response
-    mock_urlopen.return_value = response
-    mock_urlopen.return_value.getcode.return_value = 200
-    response.read.return_value = CSV_FILE
+    # setup chart data mock
+    chart_data_mock.return_value = [{"data": CSV_FILE.decode("utf-8")}]
 
     with freeze_time("2020-01-01T00:00:00Z"):
         AsyncExecuteReportScheduleCommand(
@@ -969,9 +979,9 @@ def test_email_chart_report_schedule_with_csv(
         )
         # Assert the email smtp address
         assert email_mock.call_args[0][0] == notification_targets[0]
-        # Assert the email csv file
+        # Assert the email csv file, encoded as configured in CSV_EXPORT
         smtp_images = email_mock.call_args[1]["data"]
-        assert smtp_images[list(smtp_images.keys())[0]] == CSV_FILE
+        assert smtp_images[list(smtp_images.keys())[0]] == codecs.BOM_UTF8 + CSV_FILE
         # Assert logs are correct
         assert_log(ReportState.SUCCESS)
 
@@ -980,31 +990,30 @@ def test_email_chart_report_schedule_with_csv(
     "load_birth_names_dashboard_with_slices",
     "create_report_email_chart_with_csv_no_query_context",
 )
-@patch("superset.utils.csv.urllib.request.urlopen")
-@patch("superset.utils.csv.urllib.request.OpenerDirector.open")
 @patch("superset.reports.notifications.email.send_email_smtp")
-@patch("superset.utils.csv.get_chart_csv_data")
 @patch("superset.utils.screenshots.ChartScreenshot.get_screenshot")
 def test_email_chart_report_schedule_with_csv_no_query_context(
     screenshot_mock,
-    csv_mock,
     email_mock,
-    mock_open,
-    mock_urlopen,
     create_report_email_chart_with_csv_no_query_context,
 ):
     """
     ExecuteReport Command: Test chart email report schedule with CSV (no query context)
     """
-    # setup screenshot mock
-    screenshot_mock.return_value = SCREENSHOT_FILE
+    chart_id = create_report_email_chart_with_csv_no_query_context.chart_id
+
+    def save_query_context(*args, **kwargs):
+        # the web server rendering the chart saves its query context, in another
+        # session
+        with db.engine.begin() as connection:
+            connection.execute(
+                update(Slice.__table__)
+                .where(Slice.__table__.c.id == chart_id)
+                .values(query_context=json.dumps(get_query_context("birth_names")))
+            )
+        return SCREENSHOT_FILE
 
-    # setup csv mock
-    response = Mock()
-    mock_open.return_value = response
-    mock_urlopen.return_value = response
-    mock_urlopen.return_value.getcode.return_value = 200
-    response.read.return_value = CSV_FILE
+    screenshot_mock.side_effect = save_query_context
 
     with freeze_time("2020-01-01T00:00:00Z"):
         AsyncExecuteReportScheduleCommand(
@@ -1015,49 +1024,66 @@ def test_email_chart_report_schedule_with_csv_no_query_context(
 
         # verify that when query context is null we request a screenshot
         screenshot_mock.assert_called_once()
+        smtp_images = email_mock.call_args[1]["data"]
+        csv_data = smtp_images[list(smtp_images.keys())[0]]
+        assert csv_data.startswith(codecs.BOM_UTF8 + b"name,sum__num")
+        assert_log(ReportState.SUCCESS)
+
+
+@pytest.mark.usefixtures(
+    "load_birth_names_dashboard_with_slices",
+    "create_report_email_chart_with_csv_query_context",
+)
+@patch("superset.reports.notifications.email.send_email_smtp")
+def test_email_chart_report_schedule_with_csv_in_process(
+    email_mock,
+    create_report_email_chart_with_csv_query_context,
+):
+    """
+    ExecuteReport Command: Test chart email report schedule with CSV generated
+    in process from the saved query context
+    """
+    with freeze_time("2020-01-01T00:00:00Z"):
+        AsyncExecuteReportScheduleCommand(
+            TEST_ID,
+            create_report_email_chart_with_csv_query_context.id,
+            datetime.utcnow(),
+        ).run()
+
+        smtp_images = email_mock.call_args[1]["data"]
+        csv_data = smtp_images[list(smtp_images.keys())[0]]
+        assert csv_data.startswith(codecs.BOM_UTF8 + b"name,sum__num")
+        assert len(csv_data.splitlines()) > 1
+        assert_log(ReportState.SUCCESS)
 
 
 @pytest.mark.usefixtures(
     "load_birth_names_dashboard_with_slices",
     "create_report_email_chart_with_text",
 )
-@patch("superset.utils.csv.urllib.request.urlopen")
-@patch("superset.utils.csv.urllib.request.OpenerDirector.open")
 @patch("superset.reports.notifications.email.send_email_smtp")
-@patch("superset.utils.csv.get_chart_dataframe")
+@patch("superset.commands.report.execute.BaseReportState._get_chart_data")
 def test_email_chart_report_schedule_with_text(
-    dataframe_mock,
+    chart_data_mock,
     email_mock,
-    mock_open,
-    mock_urlopen,
     create_report_email_chart_with_text,
 ):
     """
     ExecuteReport Command: Test chart email report schedule with text
     """
-    # setup dataframe mock
-    response = Mock()
-    mock_open.return_value = response
-    mock_urlopen.return_value = response
-    mock_urlopen.return_value.getcode.return_value = 200
-
     # test without date type.
-    response.read.return_value = json.dumps(
+    chart_data_mock.return_value = [
         {
-            "result": [
-                {
-                    "data": {
-                        "t1": {0: "c11", 1: "c21"},
-                        "t2": {0: "c12", 1: "c22"},
-                        "t3__sum": {0: "c13", 1: "c23"},
-                    },
-                    "colnames": [("t1",), ("t2",), ("t3__sum",)],
-                    "indexnames": [(0,), (1,)],
-                    "coltypes": [1, 1],
-                },
-            ],
-        }
-    ).encode("utf-8")
+            "data": {
+                "t1": {0: "c11", 1: "c21"},
+                "t2": {0: "c12", 1: "c22"},
+                "t3__sum": {0: "c13", 1: "c23"},
+            },
+            "colnames": [("t1",), ("t2",), ("t3__sum",)],
+            "indexnames": [(0,), (1,)],
+            "coltypes": [1, 1],
+        },
+    ]
 
     with freeze_time("2020-01-01T00:00:00Z"):
         AsyncExecuteReportScheduleCommand(
@@ -1095,24 +1121,19 @@ def test_email_chart_report_schedule_with_text(
         assert_log(ReportState.SUCCESS)
 
     # test with date type.
-    dt = datetime(2022, 1, 1).replace(tzinfo=timezone.utc)
-    ts = datetime.timestamp(dt) * 1000
-    response.read.return_value = json.dumps(
+    dt = datetime(2022, 1, 1)
+    chart_data_mock.return_value = [
         {
-            "result": [
-                {
-                    "data": {
-                        "t1": {0: "c11", 1: "c21"},
-                        "t2__date": {0: ts, 1: ts},
-                        "t3__sum": {0: "c13", 1: "c23"},
-                    },
-                    "colnames": [("t1",), ("t2__date",), ("t3__sum",)],
-                    "indexnames": [(0,), (1,)],
-                    "coltypes": [1, 2],
-                },
-            ],
-        }
-    ).encode("utf-8")
+            "data": {
+                "t1": {0: "c11", 1: "c21"},
+                "t2__date": {0: dt, 1: dt},
+                "t3__sum": {0: "c13", 1: "c23"},
+            },
+            "colnames": [("t1",), ("t2__date",), ("t3__sum",)],
+            "indexnames": [(0,), (1,)],
+            "coltypes": [1, 2],
+        },
+    ]
 
     with freeze_time("2020-01-01T00:00:00Z"):
         AsyncExecuteReportScheduleCommand(
@@ -1571,13 +1592,9 @@ def test_slack_chart_report_schedule_with_errors(
 )
 @patch("superset.reports.notifications.slack.should_use_v2_api", return_value=False)
 @patch("superset.reports.notifications.slack.get_slack_client")
-@patch("superset.utils.csv.urllib.request.urlopen")
-@patch("superset.utils.csv.urllib.request.OpenerDirector.open")
-@patch("superset.utils.csv.get_chart_csv_data")
+@patch("superset.commands.report.execute.BaseReportState._get_chart_data")
 def test_slack_chart_report_schedule_with_csv(
-    csv_mock,
-    mock_open,
-    mock_urlopen,
+    chart_data_mock,
     slack_client_mock_class,
     slack_should_use_v2_api_mock,
     create_report_slack_chart_with_csv,
@@ -1585,12 +1602,8 @@ def test_slack_chart_report_schedule_with_csv(
     """
     ExecuteReport Command: Test chart slack report V1 schedule with CSV
     """
-    # setup csv mock
-    response = Mock()
-    mock_open.return_value = response
-    mock_urlopen.return_value = response
-    mock_urlopen.return_value.getcode.return_value = 200
-    response.read.return_value = CSV_FILE
+    # setup chart data mock
+    chart_data_mock.return_value = [{"data": CSV_FILE.decode("utf-8")}]
 
     notification_targets = get_target_from_report_schedule(
         create_report_slack_chart_with_csv
@@ -1609,7 +1622,7 @@ def test_slack_chart_report_schedule_with_csv(
         )
         assert (
             slack_client_mock_class.return_value.files_upload.call_args[1]["file"]
-            == CSV_FILE
+            == codecs.BOM_UTF8 + CSV_FILE
         )
 
         # Assert logs are correct
@@ -1620,42 +1633,29 @@ def test_slack_chart_report_schedule_with_csv(
     "load_birth_names_dashboard_with_slices", "create_report_slack_chart_with_text"
 )
 @patch("superset.reports.notifications.slack.should_use_v2_api", return_value=False)
-@patch("superset.utils.csv.urllib.request.urlopen")
-@patch("superset.utils.csv.urllib.request.OpenerDirector.open")
 @patch("superset.reports.notifications.slack.get_slack_client")
-@patch("superset.utils.csv.get_chart_dataframe")
+@patch("superset.commands.report.execute.BaseReportState._get_chart_data")
 def test_slack_chart_report_schedule_with_text(
-    dataframe_mock,
+    chart_data_mock,
     slack_client_mock_class,
-    mock_open,
-    mock_urlopen,
     slack_should_use_v2_api_mock,
     create_report_slack_chart_with_text,
 ):
     """
     ExecuteReport Command: Test chart slack report schedule with text
     """
-    # setup dataframe mock
-    response = Mock()
-    mock_open.return_value = response
-    mock_urlopen.return_value = response
-    mock_urlopen.return_value.getcode.return_value = 200
-    response.read.return_value = json.dumps(
+    chart_data_mock.return_value = [
         {
-            "result": [
-                {
-                    "data": {
-                        "t1": {0: "c11", 1: "c21"},
-                        "t2": {0: "c12", 1: "c22"},
-                        "t3__sum": {0: "c13", 1: "c23"},
-                    },
-                    "colnames": [("t1",), ("t2",), ("t3__sum",)],
-                    "indexnames": [(0,), (1,)],
-                    "coltypes": [1, 1, 0],
-                },
-            ],
-        }
-    ).encode("utf-8")
+            "data": {
+                "t1": {0: "c11", 1: "c21"},
+                "t2": {0: "c12", 1: "c22"},
+                "t3__sum": {0: "c13", 1: "c23"},
+            },
+            "colnames": [("t1",), ("t2",), ("t3__sum",)],
+            "indexnames": [(0,), (1,)],
+            "coltypes": [1, 1, 0],
+        },
+    ]
 
     with freeze_time("2020-01-01T00:00:00Z"):
         AsyncExecuteReportScheduleCommand(
@@ -2070,15 +2070,11 @@ def test_soft_timeout_screenshot(screenshot_mock, email_mock, create_alert_email
 @pytest.mark.usefixtures(
     "load_birth_names_dashboard_with_slices", "create_report_email_chart_with_csv"
 )
-@patch("superset.utils.csv.urllib.request.urlopen")
-@patch("superset.utils.csv.urllib.request.OpenerDirector.open")
 @patch("superset.reports.notifications.email.send_email_smtp")
-@patch("superset.utils.csv.get_chart_csv_data")
+@patch("superset.commands.report.execute.BaseReportState._get_chart_data")
 def test_soft_timeout_csv(
-    csv_mock,
+    chart_data_mock,
     email_mock,
-    mock_open,
-    mock_urlopen,
     create_report_email_chart_with_csv,
 ):
     """
@@ -2086,10 +2082,7 @@ def test_soft_timeout_csv(
     """
     from celery.exceptions import SoftTimeLimitExceeded
 
-    response = Mock()
-    mock_open.return_value = response
-    mock_urlopen.return_value = response
-    mock_urlopen.return_value.getcode.side_effect = SoftTimeLimitExceeded()
+    chart_data_mock.side_effect = SoftTimeLimitExceeded()
 
     with pytest.raises(ReportScheduleCsvTimeout):
         AsyncExecuteReportScheduleCommand(
@@ -2109,25 +2102,17 @@ def test_soft_timeout_csv(
 @pytest.mark.usefixtures(
     "load_birth_names_dashboard_with_slices", "create_report_email_chart_with_csv"
 )
-@patch("superset.utils.csv.urllib.request.urlopen")
-@patch("superset.utils.csv.urllib.request.OpenerDirector.open")
 @patch("superset.reports.notifications.email.send_email_smtp")
-@patch("superset.utils.csv.get_chart_csv_data")
+@patch("superset.commands.report.execute.BaseReportState._get_chart_data")
 def test_generate_no_csv(
-    csv_mock,
+    chart_data_mock,
     email_mock,
-    mock_open,
-    mock_urlopen,
     create_report_email_chart_with_csv,
 ):
     """
     ExecuteReport Command: Test fail on generating csv
     """
-    response = Mock()
-    mock_open.return_value = response
-    mock_urlopen.return_value = response
-    mock_urlopen.return_value.getcode.return_value = 200
-    response.read.return_value = None
+    chart_data_mock.return_value = [{"data": ""}]
 
     with pytest.raises(ReportScheduleCsvFailedError):
         AsyncExecuteReportScheduleCommand(
@@ -2176,20 +2161,13 @@ def test_fail_screenshot(screenshot_mock, email_mock, create_report_email_chart)
     "load_birth_names_dashboard_with_slices", "create_report_email_chart_with_csv"
 )
 @patch("superset.reports.notifications.email.send_email_smtp")
-@patch("superset.utils.csv.urllib.request.urlopen")
-@patch("superset.utils.csv.urllib.request.OpenerDirector.open")
-@patch("superset.utils.csv.get_chart_csv_data")
-def test_fail_csv(
-    csv_mock, mock_open, mock_urlopen, email_mock, create_report_email_chart_with_csv
-):
+@patch("superset.commands.report.execute.BaseReportState._get_chart_data")
+def test_fail_csv(chart_data_mock, email_mock, create_report_email_chart_with_csv):
     """
     ExecuteReport Command: Test error on csv
     """
 
-    response = Mock()
-    mock_open.return_value = response
-    mock_urlopen.return_value = response
-    mock_urlopen.return_value.getcode.return_value = 500
+    chart_data_mock.side_effect = ChartDataQueryFailedError("Query failed")
 
     with pytest.raises(ReportScheduleCsvFailedError):
         AsyncExecuteReportScheduleCommand(
@@ -2200,9 +2178,7 @@ def test_fail_csv(
     # Assert the email smtp address, asserts a notification was sent with the error
     assert email_mock.call_args[0][0] == DEFAULT_OWNER_EMAIL
 
-    assert_log(
-        ReportState.ERROR, error_message="Failed generating csv <urlopen error 500>"
-    )
+    assert_log(ReportState.ERROR, error_message="Failed generating csv Query failed")
 
 
 @pytest.mark.usefixtures(
@@ -187,6 +187,24 @@ class TestWebDriverSelenium(SupersetTestCase):
         webdriver.get_screenshot(url, "chart-container", user=user)
         assert mock_sleep.call_args_list[1] == call(4)
 
+    @patch("superset.utils.webdriver.WebDriverWait")
+    @patch("superset.utils.webdriver.firefox")
+    @patch("superset.utils.webdriver.sleep")
+    @patch("superset.utils.webdriver._selenium_pool", None)
+    def test_screenshot_selenium_pool(
+        self, mock_sleep, mock_webdriver, mock_webdriver_wait
+    ):
+        webdriver = WebDriverSelenium("firefox")
+        user = security_manager.get_user_by_username(ADMIN_USERNAME)
+        url = get_url_path("Superset.slice", slice_id=1, standalone="true")
+        with patch.dict(app.config["WEBDRIVER_POOL"], {"enabled": True}):
+            webdriver.get_screenshot(url, "chart-container", user=user)
+            webdriver.get_screenshot(url, "chart-container", user=user)
+
+        driver = mock_webdriver.webdriver.WebDriver.return_value
+        assert mock_webdriver.webdriver.WebDriver.call_count == 1
+        driver.quit.assert_not_called()
+
 
 class TestThumbnails(SupersetTestCase):
     mock_image = b"bytes mock image"
@@ -166,3 +166,49 @@ def test_submit_explore_json_job_as_guest_user(
     )
 
     assert "guest_token" not in job_meta
+
+
+def test_wait_for_events_returns_pending_events(async_query_manager):
+    async_query_manager._cache = Mock()
+    async_query_manager._long_poll_timeout = 30
+    async_query_manager._stream_prefix = "async-events-"
+    async_query_manager._cache.xrange.return_value = [
+        ("1-0", {"data": '{"job_id": "abc"}'})
+    ]
+
+    events = async_query_manager.wait_for_events("channel", "0-5", timeout=10)
+
+    assert events == [{"id": "1-0", "job_id": "abc"}]
+    async_query_manager._cache.xrange.assert_called_with(
+        "async-events-channel", "0-6", "+", 100
+    )
+    async_query_manager._cache.xread.assert_not_called()
+
+
+def test_wait_for_events_blocks(async_query_manager):
+    async_query_manager._cache = Mock()
+    async_query_manager._long_poll_timeout = 30
+    async_query_manager._stream_prefix = "async-events-"
+    async_query_manager._cache.xrange.return_value = []
+    async_query_manager._cache.xread.return_value = [
+        (b"async-events-channel", [(b"1-0", {b"data": b'{"job_id": "abc"}'})])
+    ]
+
+    events = async_query_manager.wait_for_events("channel", None, timeout=10)
+
+    assert events == [{"id": "1-0", "job_id": "abc"}]
+    async_query_manager._cache.xread.assert_called_with(
+        {"async-events-channel": "0-0"},
+        AsyncQueryManager.MAX_EVENT_COUNT,
+        AsyncQueryManager.LONG_POLL_BLOCK_MS,
+    )
+
+
+def test_wait_for_events_disabled(async_query_manager):
+    async_query_manager._cache = Mock()
+    async_query_manager._long_poll_timeout = 0
+    async_query_manager._stream_prefix = "async-events-"
+    async_query_manager._cache.xrange.return_value = []
+
+    assert async_query_manager.wait_for_events("channel", None, timeout=10) == []
+    async_query_manager._cache.xread.assert_not_called()
@@ -0,0 +1,81 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+import threading
+from unittest.mock import Mock
+
+from superset.async_events.stream_reader import (
+    AsyncEventStreamReader,
+    decode_entries,
+    parse_entry_id,
+)
+
+
+def test_decode_entries():
+    assert decode_entries([(b"1-0", {b"data": b"{}"}), ("2-0", {"data": "{}"})]) == [
+        ("1-0", {"data": "{}"}),
+        ("2-0", {"data": "{}"}),
+    ]
+
+
+def test_parse_entry_id():
+    assert parse_entry_id("1607477697866-12") == (1607477697866, 12)
+    assert parse_entry_id("0") == (0, 0)
+    assert parse_entry_id("10-0") > parse_entry_id("9-5")
+
+
+def test_read_dispatches_to_waiters():
+    cache = Mock()
+    cache.xread.return_value = [
+        (b"stream-a", [(b"1-0", {b"data": b"a1"}), (b"2-0", {b"data": b"a2"})]),
+    ]
+    reader = AsyncEventStreamReader(cache, block_ms=10, count=100)
+
+    results = {}
+
+    def poll(name: str, last_id: str) -> None:
+        results[name] = reader.read("stream-a", last_id, timeout=5)
+
+    threads = [
+        threading.Thread(target=poll, args=("first", "0-0")),
+        threading.Thread(target=poll, args=("second", "1-0")),
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert results["first"] == [("1-0", {"data": "a1"}), ("2-0", {"data": "a2"})]
+    assert results["second"] == [("2-0", {"data": "a2"})]
+    for call in cache.xread.call_args_list:
+        assert call.args[1:] == (100, 10)
+
+
+def test_read_timeout():
+    cache = Mock()
+    cache.xread.return_value = []
+    reader = AsyncEventStreamReader(cache, block_ms=10, count=100)
+
+    assert reader.read("stream-a", "5-0", timeout=0.05) == []
+    cache.xread.assert_called_with({"stream-a": "5-0"}, 100, 10)
+
+
+def test_read_backend_error():
+    cache = Mock()
+    cache.xread.side_effect = Exception("connection lost")
+    reader = AsyncEventStreamReader(cache, block_ms=10, count=100)
+
+    assert reader.read("stream-a", "0-0", timeout=5) == []
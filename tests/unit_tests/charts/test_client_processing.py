@@ -1467,6 +1467,78 @@ def test_pivot_df_multi_column():
     )
 
 
+def test_pivot_df_subtotals_count():
+    """
+    Pivot table with subtotals of an aggregation other than sum.
+    """
+    df = pd.DataFrame(
+        {
+            "state": ["CA", "CA", "CA", "NY", "NY"],
+            "gender": ["boy", "girl", "girl", "boy", "girl"],
+            "year": ["2020", "2020", "2021", "2021", "2021"],
+            "num": [1, 2, 3, 4, 5],
+        }
+    )
+    pivoted = pivot_df(
+        df,
+        rows=["state", "gender"],
+        columns=["year"],
+        metrics=["num"],
+        aggfunc="Count",
+        show_rows_total=True,
+        show_columns_total=True,
+    )
+    assert (
+        pivoted.to_markdown()
+        == f"""
+|                       |   ('num', '2020') |   ('num', '2021') |   ('num', 'Subtotal') |   ('{_("Total")} (Count)', '') |
+|:----------------------|------------------:|------------------:|----------------------:|------------------------:|
+| ('CA', 'boy')         |                 1 |               nan |                     1 |                       1 |
+| ('CA', 'girl')        |                 1 |                 1 |                     2 |                       2 |
+| ('CA', 'Subtotal')    |                 2 |                 1 |                     2 |                       2 |
+| ('NY', 'boy')         |               nan |                 1 |                     1 |                       1 |
+| ('NY', 'girl')        |               nan |                 1 |                     1 |                       1 |
+| ('NY', 'Subtotal')    |                 0 |                 2 |                     2 |                       2 |
+| ('{_("Total")} (Count)', '') |                 2 |                 3 |                     4 |                       4 |
+    """.strip()  # noqa: E501
+    )
+
+
+@pytest.mark.parametrize(
+    "transpose_pivot,combine_metrics",
+    [(False, False), (True, False), (False, True)],
+)
+def test_pivot_df_subtotals_level_names(
+    transpose_pivot: bool,
+    combine_metrics: bool,
+) -> None:
+    """
+    Pivot table with totals keeps the names of the row and column levels.
+    """
+    df = pd.DataFrame(
+        {
+            "state": ["CA", "CA", "CA", "NY", "NY"],
+            "gender": ["boy", "girl", "girl", "boy", "girl"],
+            "year": ["2020", "2020", "2021", "2021", "2021"],
+            "num": [1, 2, 3, 4, 5],
+        }
+    )
+    kwargs = {
+        "rows": ["state", "gender"],
+        "columns": ["year"],
+        "metrics": ["num"],
+        "transpose_pivot": transpose_pivot,
+        "combine_metrics": combine_metrics,
+    }
+    expected = pivot_df(df, **kwargs)
+    pivoted = pivot_df(df, show_rows_total=True, show_columns_total=True, **kwargs)
+
+    assert pivoted.index.names == expected.index.names
+    assert pivoted.columns.names == expected.columns.names
+    if not transpose_pivot:
+        assert pivoted.index.names == ["state", "gender"]
+
+
 def test_pivot_df_complex_null_values():
     """
     Pivot table when a column, rows and 2 metrics are selected.
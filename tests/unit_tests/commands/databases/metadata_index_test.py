@@ -0,0 +1,220 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+from collections.abc import Iterator
+from datetime import timedelta
+from pathlib import Path
+
+import pytest
+from pytest_mock import MockerFixture
+from sqlalchemy import create_engine
+from sqlalchemy.orm.session import Session
+
+from superset.commands.database.metadata_index import CrawlDatabaseMetadataCommand
+from superset.daos.metadata_index import MetadataIndexDAO
+from superset.db_engine_specs.base import GenericDBException, SchemaTable
+from superset.distributed_lock import KeyValueDistributedLock
+from superset.models.core import Database
+from superset.sql.parse import Table
+
+
+@pytest.fixture
+def crawled_uri(tmp_path: Path) -> str:
+    """
+    A SQLite database to crawl.
+    """
+    uri = f"sqlite:///{tmp_path / 'crawled.db'}"
+    engine = create_engine(uri)
+    with engine.begin() as connection:
+        connection.exec_driver_sql("CREATE TABLE t1 (a INTEGER NOT NULL, b TEXT)")
+        connection.exec_driver_sql("CREATE TABLE t2 (c REAL)")
+        connection.exec_driver_sql("CREATE VIEW v1 AS SELECT a FROM t1")
+    return uri
+
+
+@pytest.fixture
+def database(session: Session, crawled_uri: str) -> Iterator[Database]:
+    Database.metadata.create_all(session.get_bind())  # pylint: disable=no-member
+    database = Database(database_name="my_database", sqlalchemy_uri=crawled_uri)
+    session.add(database)
+    session.flush()
+    yield database
+    session.rollback()
+
+
+def test_crawl(database: Database) -> None:
+    """
+    Test that the tables, views and columns of every schema are indexed.
+    """
+    CrawlDatabaseMetadataCommand(database.id).run()
+
+    indexed_schema = MetadataIndexDAO.find_schema(database.id, None, "main")
+    assert indexed_schema is not None
+    assert {
+        table.table_name: (table.table_type, table.columns)
+        for table in indexed_schema.tables
+    } == {
+        "t1": (
+            "table",
+            [
+                {
+                    "name": "a",
+                    "column_name": "a",
+                    "type": "INTEGER",
+                    "is_dttm": None,
+                    "nullable": False,
+                    "comment": None,
+                },
+                {
+                    "name": "b",
+                    "column_name": "b",
+                    "type": "TEXT",
+                    "is_dttm": None,
+                    "nullable": True,
+                    "comment": None,
+                },
+            ],
+        ),
+        "t2": (
+            "table",
+            [
+                {
+                    "name": "c",
+                    "column_name": "c",
+                    "type": "REAL",
+                    "is_dttm": None,
+                    "nullable": True,
+                    "comment": None,
+                },
+            ],
+        ),
+        "v1": (
+            "view",
+            [
+                {
+                    "name": "a",
+                    "column_name": "a",
+                    "type": "INTEGER",
+                    "is_dttm": None,
+                    "nullable": True,
+                    "comment": None,
+                },
+            ],
+        ),
+    }
+    assert MetadataIndexDAO.find_table(database.id, Table("t2", "main")) is not None
+    assert MetadataIndexDAO.find_table(database.id, Table("t3", "main")) is None
+
+
+def test_crawl_incremental(database: Database, crawled_uri: str) -> None:
+    """
+    Test that crawling again only writes the tables that changed, and removes the
+    schemas that no longer exist.
+    """
+    CrawlDatabaseMetadataCommand(database.id).run()
+    t2 = MetadataIndexDAO.find_table(database.id, Table("t2", "main"))
+    assert t2 is not None
+    checksum = t2.checksum
+
+    with create_engine(crawled_uri).begin() as connection:
+        connection.exec_driver_sql("ALTER TABLE t1 ADD COLUMN d TEXT")
+        connection.exec_driver_sql("DROP VIEW v1")
+        connection.exec_driver_sql("CREATE TABLE t3 (e TEXT)")
+    with database.get_inspector() as inspector:
+        tables = database.db_engine_spec.get_schema_tables(database, inspector, "main")
+    assert MetadataIndexDAO.sync_schema(database.id, None, "main", tables) == {
+        "added": 1,
+        "updated": 1,
+        "deleted": 1,
+    }
+    assert MetadataIndexDAO.sync_schema(database.id, None, "main", tables) == {
+        "added": 0,
+        "updated": 0,
+        "deleted": 0,
+    }
+    t2 = MetadataIndexDAO.find_table(database.id, Table("t2", "main"))
+    assert t2 is not None
+    assert t2.checksum == checksum
+
+    MetadataIndexDAO.delete_schemas(database.id, None, keep=set())
+    assert MetadataIndexDAO.find_schema(database.id, None, "main") is None
+
+
+def test_crawl_max_age(database: Database, mocker: MockerFixture) -> None:
+    """
+    Test that schemas crawled too long ago are ignored.
+    """
+    CrawlDatabaseMetadataCommand(database.id).run()
+    assert MetadataIndexDAO.find_schema(
+        database.id, None, "main", max_age=timedelta(hours=1)
+    )
+
+    datetime = mocker.patch("superset.daos.metadata_index.datetime")
+    datetime.now.return_value = (
+        MetadataIndexDAO.find_schema(database.id, None, "main").crawled_on  # type: ignore
+        + timedelta(hours=2)
+    )
+    assert not MetadataIndexDAO.find_schema(
+        database.id, None, "main", max_age=timedelta(hours=1)
+    )
+    assert not MetadataIndexDAO.find_table(
+        database.id, Table("t1", "main"), max_age=timedelta(hours=1)
+    )
+
+
+def test_crawl_schema_error(mocker: MockerFixture, database: Database) -> None:
+    """
+    Test that schemas that can't be read are skipped.
+    """
+    mocker.patch.object(
+        Database,
+        "get_all_schema_names",
+        return_value={"main", "broken"},
+    )
+    get_schema_tables = mocker.patch.object(
+        database.db_engine_spec,
+        "get_schema_tables",
+        side_effect=[
+            GenericDBException("schema doesn't exist"),
+            [SchemaTable("t1", "table", [])],
+        ],
+    )
+
+    CrawlDatabaseMetadataCommand(database.id).run()
+
+    assert get_schema_tables.call_count == 2
+    assert MetadataIndexDAO.find_schema(database.id, None, "broken") is None
+    indexed_schema = MetadataIndexDAO.find_schema(database.id, None, "main")
+    assert indexed_schema is not None
+    assert [table.table_name for table in indexed_schema.tables] == ["t1"]
+
+
+def test_crawl_concurrent(database: Database) -> None:
+    """
+    Test that schemas being indexed by a concurrent crawl are skipped, so that they
+    aren't indexed twice.
+    """
+    with KeyValueDistributedLock(
+        "metadata_index_sync",
+        database_id=database.id,
+        catalog=None,
+        schema="main",
+    ):
+        CrawlDatabaseMetadataCommand(database.id).run()
+        assert MetadataIndexDAO.find_schema(database.id, None, "main") is None
+
+    CrawlDatabaseMetadataCommand(database.id).run()
+    assert MetadataIndexDAO.find_schema(database.id, None, "main") is not None
@@ -0,0 +1,176 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+from collections.abc import Iterator
+from datetime import datetime
+from unittest.mock import MagicMock
+
+import pytest
+from pytest_mock import MockerFixture
+
+from superset.commands.database.search_metadata import SearchDatabaseMetadataCommand
+from superset.databases.search_index import clear_search_indexes
+from superset.extensions import security_manager
+
+
+@pytest.fixture(autouse=True)
+def clear_indexes() -> Iterator[None]:
+    clear_search_indexes()
+    yield
+    clear_search_indexes()
+
+
+@pytest.fixture
+def database(mocker: MockerFixture) -> MagicMock:
+    """
+    Mock a database with a crawled schema, `crawled`, and a schema that was not
+    crawled, `live`.
+    """
+    database = mocker.MagicMock()
+    database.id = 1
+    database.get_default_catalog.return_value = None
+    database.get_all_table_names_in_schema.return_value = {
+        ("sales", "live", None),
+    }
+    database.get_all_view_names_in_schema.return_value = {
+        ("sales_summary", "live", None),
+    }
+    DatabaseDAO = mocker.patch(  # noqa: N806
+        "superset.commands.database.search_metadata.DatabaseDAO"
+    )
+    DatabaseDAO.find_by_id.return_value = database
+
+    def find_schema(
+        database_id: int,
+        catalog: str | None,
+        schema: str,
+        max_age: object,
+    ) -> MagicMock | None:
+        if schema != "crawled":
+            return None
+        indexed_schema = mocker.MagicMock(crawled_on=datetime(2024, 1, 1))
+        indexed_schema.tables = [
+            mocker.MagicMock(
+                table_name="sales",
+                table_type="table",
+                columns=[{"column_name": "sale_id"}, {"column_name": "amount"}],
+            ),
+            mocker.MagicMock(table_name="secret_sales", table_type="table", columns=[]),
+        ]
+        return indexed_schema
+
+    MetadataIndexDAO = mocker.patch(  # noqa: N806
+        "superset.commands.database.search_metadata.MetadataIndexDAO"
+    )
+    MetadataIndexDAO.find_schema.side_effect = find_schema
+    MetadataIndexDAO.get_schema_names.return_value = {"crawled", "forbidden"}
+
+    mocker.patch.object(
+        security_manager,
+        "get_schemas_accessible_by_user",
+        side_effect=lambda database, catalog, schemas: schemas - {"forbidden"},
+    )
+    mocker.patch.object(
+        security_manager,
+        "get_datasources_accessible_by_user",
+        side_effect=lambda database, catalog, schema, datasource_names: [
+            name for name in datasource_names if name.table != "secret_sales"
+        ],
+    )
+    return database
+
+
+def test_search_crawled_schemas(database: MagicMock) -> None:
+    """
+    Test that all the accessible crawled schemas are searched, including columns,
+    and that inaccessible tables are left out.
+    """
+    payload = SearchDatabaseMetadataCommand(1, "sale").run()
+
+    assert payload["count"] == 2
+    assert [
+        (item["type"], item["schema"], item["table"], item["value"])
+        for item in payload["result"]
+    ] == [
+        ("table", "crawled", "sales", "sales"),
+        ("column", "crawled", "sales", "sale_id"),
+    ]
+    database.get_all_table_names_in_schema.assert_not_called()
+
+
+def test_search_live_schema(database: MagicMock) -> None:
+    """
+    Test that a schema that wasn't crawled is searched by its table and view names.
+    """
+    payload = SearchDatabaseMetadataCommand(1, "sales", schema_name="live").run()
+
+    assert [(item["type"], item["value"]) for item in payload["result"]] == [
+        ("table", "sales"),
+        ("view", "sales_summary"),
+    ]
+    database.get_all_table_names_in_schema.assert_called_once_with(
+        catalog=None,
+        schema="live",
+        cache=database.table_cache_enabled,
+        cache_timeout=database.table_cache_timeout,
+    )
+
+    payload = SearchDatabaseMetadataCommand(1, "sales", schema_name="forbidden").run()
+    assert payload == {"count": 0, "truncated": False, "result": []}
+
+
+def test_search_pagination(database: MagicMock) -> None:
+    """
+    Test that matches are paginated, keeping the total count.
+    """
+    payload = SearchDatabaseMetadataCommand(
+        1,
+        "sale",
+        schema_name="crawled",
+        page=1,
+        page_size=1,
+    ).run()
+    assert payload["count"] == 2
+    assert [item["value"] for item in payload["result"]] == ["sale_id"]
+
+    payload = SearchDatabaseMetadataCommand(
+        1,
+        "sale",
+        schema_name="crawled",
+        include_columns=False,
+    ).run()
+    assert [item["value"] for item in payload["result"]] == ["sales"]
+
+
+def test_search_max_schemas(database: MagicMock, mocker: MockerFixture) -> None:
+    """
+    Test that a search without a schema searches a limited number of schemas.
+    """
+    from superset.commands.database import search_metadata
+
+    mocker.patch.dict(
+        search_metadata.current_app.config, {"METADATA_SEARCH_MAX_SCHEMAS": 1}
+    )
+    search_metadata.MetadataIndexDAO.get_schema_names.return_value = {
+        "crawled",
+        "live",
+    }
+
+    payload = SearchDatabaseMetadataCommand(1, "sale").run()
+
+    assert payload["truncated"] is True
+    assert {item["schema"] for item in payload["result"]} == {"crawled"}
+    database.get_all_table_names_in_schema.assert_not_called()
@@ -45,6 +45,10 @@ def database_with_catalog(mocker: MockerFixture) -> MagicMock:
 
     DatabaseDAO = mocker.patch("superset.commands.database.tables.DatabaseDAO")  # noqa: N806
     DatabaseDAO.find_by_id.return_value = database
+    MetadataIndexDAO = mocker.patch(  # noqa: N806
+        "superset.commands.database.tables.MetadataIndexDAO"
+    )
+    MetadataIndexDAO.find_schema.return_value = None
 
     return database
 
@@ -69,6 +73,10 @@ def database_without_catalog(mocker: MockerFixture) -> MagicMock:
 
     DatabaseDAO = mocker.patch("superset.commands.database.tables.DatabaseDAO")  # noqa: N806
     DatabaseDAO.find_by_id.return_value = database
+    MetadataIndexDAO = mocker.patch(  # noqa: N806
+        "superset.commands.database.tables.MetadataIndexDAO"
+    )
+    MetadataIndexDAO.find_schema.return_value = None
 
     return database
 
@@ -203,3 +211,47 @@ def test_tables_without_catalog(
         cache=database_without_catalog.table_cache_enabled,
         cache_timeout=database_without_catalog.table_cache_timeout,
     )
+
+
+def test_tables_from_metadata_index(
+    mocker: MockerFixture,
+    database_with_catalog: MockerFixture,
+) -> None:
+    """
+    Test that tables and views are read from the metadata index when the schema was
+    crawled recently, unless forced.
+    """
+    get_datasources_accessible_by_user = mocker.patch.object(
+        security_manager,
+        "get_datasources_accessible_by_user",
+        side_effect=lambda datasource_names, **kwargs: datasource_names,
+    )
+    MetadataIndexDAO = mocker.patch(  # noqa: N806
+        "superset.commands.database.tables.MetadataIndexDAO"
+    )
+    indexed_schema = MetadataIndexDAO.find_schema.return_value
+    indexed_schema.tables = [
+        mocker.MagicMock(table_name="table3", table_type="table"),
+        mocker.MagicMock(table_name="view2", table_type="view"),
+    ]
+
+    payload = TablesDatabaseCommand(1, "catalog1", "schema1", False).run()
+    assert payload == {
+        "count": 2,
+        "result": [
+            {"value": "table3", "type": "table", "extra": None},
+            {"value": "view2", "type": "view"},
+        ],
+    }
+    database_with_catalog.get_all_table_names_in_schema.assert_not_called()
+    database_with_catalog.get_all_view_names_in_schema.assert_not_called()
+    get_datasources_accessible_by_user.assert_any_call(
+        database=database_with_catalog,
+        catalog="catalog1",
+        schema="schema1",
+        datasource_names=[DatasourceName("table3", "schema1", "catalog1")],
+    )
+
+    payload = TablesDatabaseCommand(1, "catalog1", "schema1", True).run()
+    assert payload["count"] == 3
+    assert MetadataIndexDAO.find_schema.call_count == 1
@@ -0,0 +1,169 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+from collections.abc import Iterator
+from pathlib import Path
+from threading import get_ident
+
+import pytest
+from pytest_mock import MockerFixture
+from sqlalchemy import create_engine
+from sqlalchemy.orm.session import Session
+
+from superset.commands.dataset.bulk_refresh import (
+    BulkRefreshDatasetsCommand,
+    DatasetMetadata,
+    DatasetSource,
+)
+from superset.commands.dataset.exceptions import DatasetNotFoundError
+from superset.connectors.sqla.models import MetadataResult, SqlaTable, TableColumn
+from superset.models.core import Database
+
+
+@pytest.fixture
+def datasets(
+    mocker: MockerFixture,
+    session: Session,
+    tmp_path: Path,
+) -> Iterator[list[SqlaTable]]:
+    """
+    Datasets on the tables of a SQLite database, whose columns are out of date.
+    """
+    uri = f"sqlite:///{tmp_path / 'refreshed.db'}"
+    with create_engine(uri).begin() as connection:
+        connection.exec_driver_sql("CREATE TABLE t1 (a INTEGER, b TEXT, ts DATETIME)")
+        connection.exec_driver_sql("INSERT INTO t1 VALUES (1, 'b', '2024-01-01')")
+        connection.exec_driver_sql("CREATE TABLE t2 (c REAL)")
+
+    mocker.patch("superset.security_manager.raise_for_ownership")
+    mocker.patch(
+        "superset.security_manager.can_access_all_datasources", return_value=True
+    )
+    SqlaTable.metadata.create_all(session.get_bind())  # pylint: disable=no-member
+    database = Database(database_name="my_database", sqlalchemy_uri=uri)
+    datasets = [
+        SqlaTable(
+            table_name="t1",
+            schema="main",
+            database=database,
+            columns=[
+                TableColumn(column_name="a", type="TEXT", groupby=False),
+                TableColumn(column_name="b", type="TEXT"),
+                TableColumn(column_name="old", type="TEXT"),
+                TableColumn(column_name="calculated", type="INTEGER", expression="a"),
+            ],
+        ),
+        SqlaTable(table_name="t2", schema="main", database=database),
+        SqlaTable(table_name="t3", schema="main", database=database),
+        SqlaTable(
+            table_name="virtual",
+            schema="main",
+            database=database,
+            sql="SELECT a AS x FROM t1",
+        ),
+    ]
+    session.add_all(datasets)
+    session.flush()
+    yield datasets
+    session.rollback()
+
+
+def test_bulk_refresh(
+    mocker: MockerFixture,
+    session: Session,
+    datasets: list[SqlaTable],
+) -> None:
+    """
+    Test that the columns of the datasets are diffed and written in bulk, and that
+    datasets whose metadata can't be read are reported.
+    """
+    mocker.patch.dict(
+        "flask.current_app.config",
+        {"DATASET_BULK_REFRESH_MAX_CONCURRENT_DATABASES": 1},
+    )
+    progress = mocker.MagicMock()
+    t1, t2, t3, virtual = datasets
+
+    result = BulkRefreshDatasetsCommand(
+        [dataset.id for dataset in datasets], progress
+    ).run()
+
+    assert result.refreshed == {
+        t1.id: MetadataResult(added=["ts"], removed=["old"], modified=["a"]),
+        t2.id: MetadataResult(added=["c"]),
+        virtual.id: MetadataResult(added=["x"]),
+    }
+    assert list(result.failed) == [t3.id]
+    progress.assert_called_once_with(4, 4)
+
+    columns = {
+        column.column_name: (column.type, column.groupby, column.expression)
+        for column in t1.columns
+    }
+    assert columns == {
+        "a": ("INTEGER", True, ""),
+        "b": ("TEXT", True, ""),
+        "ts": ("DATETIME", True, None),
+        "calculated": ("INTEGER", True, "a"),
+    }
+    assert t1.main_dttm_col == "ts"
+    assert next(col for col in t1.columns if col.column_name == "ts").is_dttm
+    assert [column.column_name for column in t2.columns] == ["c"]
+    assert [column.column_name for column in virtual.columns] == ["x"]
+    assert [metric.metric_name for metric in t2.metrics] == ["count"]
+    assert t3.columns == []
+
+
+def test_bulk_refresh_concurrent(
+    mocker: MockerFixture,
+    session: Session,
+    datasets: list[SqlaTable],
+) -> None:
+    """
+    Test that the metadata of different databases is read concurrently.
+    """
+    t1, t2, *_ = datasets
+    t2.database = Database(database_name="other_database", sqlalchemy_uri="sqlite://")
+    session.flush()
+    threads: set[int] = set()
+
+    def fetch_database_metadata(
+        database_id: int,
+        sources: list[DatasetSource],
+    ) -> dict[int, DatasetMetadata]:
+        threads.add(get_ident())
+        return {source.id: DatasetMetadata([], []) for source in sources}
+
+    mocker.patch(
+        "superset.commands.dataset.bulk_refresh.fetch_database_metadata",
+        side_effect=fetch_database_metadata,
+    )
+    progress = mocker.MagicMock()
+
+    result = BulkRefreshDatasetsCommand([t1.id, t2.id], progress).run()
+
+    assert result.refreshed[t1.id].removed == ["a", "b", "old"]
+    assert result.refreshed[t2.id] == MetadataResult()
+    assert get_ident() not in threads
+    assert [call.args for call in progress.call_args_list] == [(1, 2), (2, 2)]
+
+
+def test_bulk_refresh_not_found(datasets: list[SqlaTable]) -> None:
+    """
+    Test that refreshing datasets that don't exist fails.
+    """
+    with pytest.raises(DatasetNotFoundError):
+        BulkRefreshDatasetsCommand([datasets[0].id, 1234]).run()
@@ -21,10 +21,15 @@ from unittest.mock import patch
 from uuid import UUID
 
 import pytest
+from celery.exceptions import SoftTimeLimitExceeded
 from pytest_mock import MockerFixture
 
 from superset.app import SupersetApp
 from superset.commands.exceptions import UpdateFailedError
+from superset.commands.report.exceptions import (
+    ReportScheduleScreenshotFailedError,
+    ReportScheduleScreenshotTimeout,
+)
 from superset.commands.report.execute import BaseReportState
 from superset.dashboards.permalink.types import DashboardPermalinkState
 from superset.reports.models import (
@@ -557,3 +562,130 @@ def test_update_recipient_to_slack_v2_missing_channels(mocker: MockerFixture):
     )
     with pytest.raises(UpdateFailedError):
         mock_cmmd.update_report_schedule_slack_v2()
+
+
+def create_dashboard_report_state(mocker: MockerFixture) -> BaseReportState:
+    report_schedule = ReportSchedule()
+    report_schedule.type = ReportScheduleType.REPORT
+    report_schedule.chart = None
+    report_schedule.dashboard = mocker.MagicMock()
+    report_schedule.custom_width = None
+    report_schedule.custom_height = None
+    report_state = BaseReportState(
+        report_schedule=report_schedule,
+        scheduled_dttm=datetime.now(),
+        execution_id=UUID("084e7ee6-5557-4ecd-9632-b7f39c9ec524"),
+    )
+    mocker.patch.object(
+        report_state,
+        "get_dashboard_urls",
+        return_value=[f"http://localhost/tab/{i}" for i in range(4)],
+    )
+    mocker.patch(
+        "superset.commands.report.execute.get_executor",
+        return_value=("executor", "username"),
+    )
+    mocker.patch(
+        "superset.commands.report.execute.security_manager",
+        new_callable=mocker.MagicMock,
+    )
+    return report_state
+
+
+@pytest.mark.parametrize("max_concurrent", [1, 4])
+def test_get_screenshots_multiple_tabs(
+    app: SupersetApp,
+    mocker: MockerFixture,
+    max_concurrent: int,
+) -> None:
+    """
+    Test that tab screenshots are returned in order, whether or not they are taken
+    concurrently.
+    """
+    import time
+
+    from superset.utils.screenshots import DashboardScreenshot
+
+    app.config["ALERT_REPORTS_MAX_CONCURRENT_SCREENSHOTS"] = max_concurrent
+    report_state = create_dashboard_report_state(mocker)
+
+    def get_screenshot(self: DashboardScreenshot, user: object) -> bytes:
+        # later tabs finish first
+        tab = self.url.split("/tab/")[1][0]
+        time.sleep(0.05 * (4 - int(tab)))
+        return f"tab {tab}".encode()
+
+    mocker.patch.object(DashboardScreenshot, "get_screenshot", get_screenshot)
+
+    assert report_state._get_screenshots() == [
+        b"tab 0",
+        b"tab 1",
+        b"tab 2",
+        b"tab 3",
+    ]
+
+
+@pytest.mark.parametrize(
+    "side_effect,expected",
+    [
+        (SoftTimeLimitExceeded(), ReportScheduleScreenshotTimeout),
+        (Exception("page crashed"), ReportScheduleScreenshotFailedError),
+    ],
+)
+def test_get_screenshots_multiple_tabs_error(
+    app: SupersetApp,
+    mocker: MockerFixture,
+    side_effect: Exception,
+    expected: type[Exception],
+) -> None:
+    """
+    Test that a failing tab screenshot fails the report when taken concurrently.
+    """
+    from superset.utils.screenshots import DashboardScreenshot
+
+    app.config["ALERT_REPORTS_MAX_CONCURRENT_SCREENSHOTS"] = 4
+    report_state = create_dashboard_report_state(mocker)
+    mocker.patch.object(
+        DashboardScreenshot,
+        "get_screenshot",
+        side_effect=[b"tab 0", side_effect, b"tab 2", b"tab 3"],
+    )
+
+    with pytest.raises(expected):
+        report_state._get_screenshots()
+
+
+def test_get_screenshots_multiple_tabs_timeout_waits(
+    app: SupersetApp,
+    mocker: MockerFixture,
+) -> None:
+    """
+    Test that screenshots in progress are finished, closing their browsers, before
+    a soft time limit fails the report, and pending ones are dropped.
+    """
+    import time
+
+    from superset.utils.screenshots import DashboardScreenshot
+
+    app.config["ALERT_REPORTS_MAX_CONCURRENT_SCREENSHOTS"] = 2
+    report_state = create_dashboard_report_state(mocker)
+    started: list[str] = []
+    finished: list[str] = []
+
+    def get_screenshot(self: DashboardScreenshot, user: object) -> bytes:
+        tab = self.url.split("/tab/")[1][0]
+        started.append(tab)
+        if tab == "0":
+            raise SoftTimeLimitExceeded()
+        time.sleep(0.2)
+        finished.append(tab)
+        return f"tab {tab}".encode()
+
+    mocker.patch.object(DashboardScreenshot, "get_screenshot", get_screenshot)
+
+    with pytest.raises(ReportScheduleScreenshotTimeout):
+        report_state._get_screenshots()
+
+    assert "1" in finished
+    assert sorted(finished) == sorted(tab for tab in started if tab != "0")
+    assert len(started) < 4
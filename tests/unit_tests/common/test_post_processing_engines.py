@@ -0,0 +1,326 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+import tracemalloc
+from typing import Any
+
+import pandas as pd
+import pytest
+from pytest_mock import MockerFixture
+
+from superset.common.query_object import QueryObject
+from superset.common.utils.post_processing_engines import (
+    ArrowPostProcessingEngine,
+    get_post_processing_engine,
+    PostProcessingEngine,
+)
+from superset.exceptions import InvalidPostProcessingError
+from superset.utils import json
+from tests.unit_tests.fixtures.dataframes import (
+    categories_df,
+    multiple_metrics_df,
+    names_df,
+)
+
+ARROW_CHAINS: list[tuple[pd.DataFrame, list[dict[str, Any]]]] = [
+    (
+        categories_df,
+        [
+            {
+                "operation": "aggregate",
+                "options": {
+                    "groupby": ["category", "dept"],
+                    "aggregates": {
+                        "asc_sum": {"column": "asc_idx", "operator": "sum"},
+                        "asc_mean": {"column": "asc_idx", "operator": "mean"},
+                        "nulls_sum": {"column": "idx_nulls", "operator": "sum"},
+                        "nulls_max": {"column": "idx_nulls", "operator": "nanmax"},
+                        "desc_min": {"column": "desc_idx", "operator": "min"},
+                    },
+                },
+            },
+            {"operation": "flatten"},
+            {
+                "operation": "sort",
+                "options": {"by": ["dept", "category"], "ascending": [False, True]},
+            },
+            {
+                "operation": "cum",
+                "options": {"operator": "sum", "columns": {"asc_sum": "asc_cum"}},
+            },
+            {"operation": "diff", "options": {"columns": {"asc_mean": "asc_mean"}}},
+            {
+                "operation": "select",
+                "options": {
+                    "columns": ["dept", "category", "asc_cum", "asc_mean", "nulls_sum"],
+                    "exclude": ["category"],
+                    "rename": {"asc_cum": "cumulated"},
+                },
+            },
+            {"operation": "rename", "options": {"columns": {"dept": "department"}}},
+        ],
+    ),
+    (
+        categories_df,
+        [
+            {"operation": "sort", "options": {"by": "desc_idx"}},
+            {
+                "operation": "cum",
+                "options": {"operator": "max", "columns": {"idx_nulls": "idx_nulls"}},
+            },
+            {
+                "operation": "diff",
+                "options": {"columns": {"asc_idx": "asc_diff"}, "periods": -3},
+            },
+        ],
+    ),
+    (
+        names_df,
+        [
+            {
+                "operation": "aggregate",
+                "options": {
+                    "groupby": ["region", "dt"],
+                    "aggregates": {
+                        "seconds": {"operator": "nansum"},
+                        "cars": {"operator": "max"},
+                    },
+                },
+            },
+            {"operation": "sort", "options": {"by": ["seconds", "region"]}},
+        ],
+    ),
+]
+
+MIXED_CHAINS: list[tuple[pd.DataFrame, list[dict[str, Any]]]] = [
+    (
+        multiple_metrics_df,
+        [
+            {
+                "operation": "pivot",
+                "options": {
+                    "index": ["dttm"],
+                    "columns": ["country"],
+                    "aggregates": {
+                        "sum_metric": {"operator": "mean"},
+                        "count_metric": {"operator": "mean"},
+                    },
+                },
+            },
+            {"operation": "flatten"},
+            {
+                "operation": "cum",
+                "options": {
+                    "operator": "sum",
+                    "columns": {"sum_metric, UK": "sum_metric, UK"},
+                },
+            },
+            {"operation": "sort", "options": {"by": "dttm", "ascending": False}},
+            {
+                "operation": "rolling",
+                "options": {
+                    "rolling_type": "sum",
+                    "window": 2,
+                    "min_periods": 1,
+                    "columns": {"count_metric, US": "count_metric, US"},
+                },
+            },
+            {"operation": "select", "options": {"exclude": ["sum_metric, US"]}},
+        ],
+    ),
+    (
+        categories_df,
+        [
+            # unsupported aggregate, then an Arrow chain again
+            {
+                "operation": "aggregate",
+                "options": {
+                    "groupby": ["dept"],
+                    "aggregates": {
+                        "q2": {
+                            "column": "asc_idx",
+                            "operator": "percentile",
+                            "options": {"q": 50},
+                        },
+                    },
+                },
+            },
+            {"operation": "sort", "options": {"by": "q2", "ascending": False}},
+            {"operation": "diff", "options": {"columns": {"q2": "q2"}, "periods": 2}},
+        ],
+    ),
+    (
+        categories_df,
+        [
+            {"operation": "sort", "options": {"is_sort_index": True}},
+            {"operation": "cum", "options": {"operator": "sum", "columns": {}}},
+            {"operation": "rename", "options": {"columns": {"dept": None}}},
+        ],
+    ),
+]
+
+
+def run(
+    engine: PostProcessingEngine,
+    df: pd.DataFrame,
+    operations: list[dict[str, Any]],
+) -> pd.DataFrame:
+    return engine.execute(df.copy(), operations)
+
+
+@pytest.mark.parametrize("df, operations", ARROW_CHAINS)
+def test_arrow_engine_parity(
+    mocker: MockerFixture,
+    df: pd.DataFrame,
+    operations: list[dict[str, Any]],
+) -> None:
+    """
+    Test that chains supported by Arrow don't go through pandas, and return the same
+    DataFrame as pandas.
+    """
+    expected = run(PostProcessingEngine(), df, operations)
+    execute_pandas = mocker.spy(PostProcessingEngine, "execute_pandas")
+
+    result = run(ArrowPostProcessingEngine(), df, operations)
+
+    execute_pandas.assert_not_called()
+    pd.testing.assert_frame_equal(result, expected)
+
+
+@pytest.mark.parametrize("df, operations", MIXED_CHAINS)
+def test_arrow_engine_fallback(df: pd.DataFrame, operations: list[dict[str, Any]]):
+    """
+    Test that operations and options not supported by Arrow fall back to pandas.
+    """
+    pd.testing.assert_frame_equal(
+        run(ArrowPostProcessingEngine(), df, operations),
+        run(PostProcessingEngine(), df, operations),
+    )
+
+
+def test_arrow_engine_errors() -> None:
+    """
+    Test that invalid options raise the errors of the pandas operations.
+    """
+    with pytest.raises(InvalidPostProcessingError, match="Referenced columns"):
+        run(
+            ArrowPostProcessingEngine(),
+            categories_df,
+            [{"operation": "sort", "options": {"by": "foo"}}],
+        )
+
+
+def test_arrow_engine_unsupported_frame() -> None:
+    """
+    Test that DataFrames that can't round trip through Arrow are left to pandas.
+    """
+    df = pd.DataFrame({"a": [[1], [2, 3]], "b": [2, 1]})
+    result = run(
+        ArrowPostProcessingEngine(),
+        df,
+        [{"operation": "sort", "options": {"by": "b"}}],
+    )
+    assert result["a"].tolist() == [[2, 3], [1]]
+
+
+def test_get_post_processing_engine(app_context: None, mocker: MockerFixture) -> None:
+    """
+    Test that the engine is selected by the `POST_PROCESSING_ENGINE` config.
+    """
+    assert isinstance(get_post_processing_engine(), PostProcessingEngine)
+
+    mocker.patch.dict(
+        "superset.common.utils.post_processing_engines.current_app.config",
+        {"POST_PROCESSING_ENGINE": "arrow"},
+    )
+    assert isinstance(get_post_processing_engine(), ArrowPostProcessingEngine)
+
+
+@pytest.mark.parametrize(
+    "engine_class", [PostProcessingEngine, ArrowPostProcessingEngine]
+)
+def test_engine_stats(engine_class: type[PostProcessingEngine]) -> None:
+    """
+    Test that engines measure every operation they run.
+    """
+    engine = engine_class()
+    run(engine, *MIXED_CHAINS[1])
+
+    assert [
+        (
+            stats.operation,
+            stats.rows_in,
+            stats.columns_in,
+            stats.rows_out,
+            stats.columns_out,
+        )
+        for stats in engine.stats
+    ] == [
+        ("aggregate", 101, 7, 5, 2),
+        ("sort", 5, 2, 5, 2),
+        ("diff", 5, 2, 5, 2),
+    ]
+    assert all(stats.duration_ms >= 0 for stats in engine.stats)
+    assert all(stats.memory_peak_bytes is None for stats in engine.stats)
+    expected_engines = (
+        ["pandas", "arrow", "arrow"]
+        if engine_class is ArrowPostProcessingEngine
+        else ["pandas"] * 3
+    )
+    assert [stats.engine for stats in engine.stats] == expected_engines
+
+
+def test_engine_stats_trace_memory() -> None:
+    """
+    Test that the peak memory of operations is measured when memory is traced.
+    """
+    engine = PostProcessingEngine(trace_memory=True)
+    run(engine, *MIXED_CHAINS[0])
+
+    assert len(engine.stats) == len(MIXED_CHAINS[0][1])
+    assert all(stats.memory_peak_bytes > 0 for stats in engine.stats)
+    assert not tracemalloc.is_tracing()
+
+
+def test_exec_post_processing_stats(app_context: None, mocker: MockerFixture) -> None:
+    """
+    Test that `exec_post_processing` logs the measurements of each operation.
+    """
+    stats_logger = mocker.patch(
+        "superset.common.query_object.stats_logger_manager"
+    ).instance
+    log = mocker.MagicMock()
+    log_context = mocker.patch("superset.common.query_object.event_logger.log_context")
+    log_context.return_value.__enter__.return_value = log
+
+    df, operations = MIXED_CHAINS[1]
+    query_object = QueryObject(post_processing=operations)
+    query_object.exec_post_processing(df.copy())
+
+    assert [stats.operation for stats in query_object.post_processing_stats] == [
+        "aggregate",
+        "sort",
+        "diff",
+    ]
+    stats_logger.timing.assert_any_call(
+        "post_processing.aggregate.duration",
+        query_object.post_processing_stats[0].duration_ms,
+    )
+    stats_logger.gauge.assert_any_call("post_processing.aggregate.rows_out", 5)
+    log.assert_called_once()
+    assert log.call_args.kwargs["explode"] == "operations"
+    records = json.loads(log.call_args.kwargs["operations"])
+    assert [record["operation"] for record in records] == ["aggregate", "sort", "diff"]
@@ -0,0 +1,246 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+from collections.abc import Iterator
+from typing import Any
+
+import pandas as pd
+import pytest
+from flask import current_app
+from pytest_mock import MockerFixture
+
+from superset.common.query_object import QueryObject
+from superset.common.utils.post_processing_engines import (
+    ArrowPostProcessingEngine,
+    PostProcessingEngine,
+)
+from superset.common.utils.post_processing_memo import (
+    get_data_key,
+    get_post_processing_memo,
+    get_prefix_keys,
+    PostProcessingMemo,
+)
+from tests.unit_tests.fixtures.dataframes import categories_df, multiple_metrics_df
+
+PIVOT: list[dict[str, Any]] = [
+    {
+        "operation": "pivot",
+        "options": {
+            "index": ["dttm"],
+            "columns": ["country"],
+            "aggregates": {"sum_metric": {"operator": "sum"}},
+        },
+    },
+    {"operation": "flatten"},
+]
+ROLLING: dict[str, Any] = {
+    "operation": "rolling",
+    "options": {
+        "rolling_type": "sum",
+        "window": 2,
+        "min_periods": 1,
+        "columns": {"sum_metric, UK": "sum_metric, UK"},
+    },
+}
+SORT: dict[str, Any] = {
+    "operation": "sort",
+    "options": {"by": "sum_metric, US", "ascending": False},
+}
+
+
+@pytest.fixture
+def memo(mocker: MockerFixture, app_context: None) -> Iterator[PostProcessingMemo]:
+    mocker.patch.dict(current_app.config, {"POST_PROCESSING_MEMO_SIZE": 1024 * 1024})
+    memo = get_post_processing_memo()
+    assert memo is not None
+    memo.clear()
+    yield memo
+    memo.clear()
+
+
+def run(
+    operations: list[dict[str, Any]],
+    memo_key: str = "key",
+    force: bool = False,
+    df: pd.DataFrame = multiple_metrics_df,
+) -> tuple[pd.DataFrame, list[str]]:
+    query_object = QueryObject(post_processing=operations)
+    df = query_object.exec_post_processing(df.copy(), memo_key=memo_key, force=force)
+    return df, [stats.operation for stats in query_object.post_processing_stats]
+
+
+def test_memo_eviction(mocker: MockerFixture) -> None:
+    """
+    Test that the memo evicts the least recently used DataFrames to stay within its
+    size, and expires DataFrames.
+    """
+    df = pd.DataFrame({"a": range(100)})
+    size = df.memory_usage(index=True, deep=True).sum()
+    memo = PostProcessingMemo(max_bytes=2 * size, timeout=60)
+
+    memo.set("a", df)
+    memo.set("b", df)
+    assert memo.get("a") is not None
+    memo.set("c", df)
+    assert len(memo) == 2
+    assert memo.size == 2 * size
+    assert memo.get("b") is None
+    assert memo.get("a") is not None
+
+    # DataFrames larger than the memo aren't memoized
+    memo.set("d", pd.concat([df] * 3))
+    assert memo.get("d") is None
+
+    monotonic = mocker.patch(
+        "superset.common.utils.post_processing_memo.time.monotonic"
+    )
+    monotonic.return_value = 1e12
+    assert memo.get("a") is None
+    assert len(memo) == 1
+
+
+def test_memo_copies() -> None:
+    """
+    Test that changes to the DataFrames given to or returned by the memo don't
+    change the memoized DataFrames.
+    """
+    memo = PostProcessingMemo(max_bytes=1024 * 1024, timeout=60)
+    df = pd.DataFrame({"a": [1, 2, 3]})
+    memo.set("a", df)
+    df["a"] = 0
+    memoized = memo.get("a")
+    assert memoized is not None
+    memoized["a"] = 0
+    assert memo.get("a")["a"].tolist() == [1, 2, 3]  # type: ignore
+
+
+def test_exec_post_processing_shared_prefix(memo: PostProcessingMemo) -> None:
+    """
+    Test that chains sharing leading operations only run the operations that
+    differ.
+    """
+    expected, _ = run([*PIVOT, SORT], memo_key="")
+
+    _, operations = run([*PIVOT, ROLLING])
+    assert operations == ["pivot", "flatten", "rolling"]
+    assert len(memo) == 3
+
+    df, operations = run([*PIVOT, SORT])
+    assert operations == ["sort"]
+    pd.testing.assert_frame_equal(df, expected)
+
+    df, operations = run([*PIVOT, SORT])
+    assert operations == []
+    pd.testing.assert_frame_equal(df, expected)
+
+    # other queries and forced queries don't reuse memoized results
+    _, operations = run([*PIVOT, SORT], memo_key="other")
+    assert operations == ["pivot", "flatten", "sort"]
+    _, operations = run([*PIVOT, SORT], force=True)
+    assert operations == ["pivot", "flatten", "sort"]
+
+
+def test_exec_post_processing_new_data(memo: PostProcessingMemo) -> None:
+    """
+    Test that results computed on the data previously returned by a query aren't
+    reused once the query returns different data.
+    """
+    run([*PIVOT, SORT])
+
+    new_df = multiple_metrics_df.copy()
+    new_df["sum_metric"] = new_df["sum_metric"] * 2
+    expected, _ = run([*PIVOT, SORT], memo_key="", df=new_df)
+    df, operations = run([*PIVOT, SORT], df=new_df)
+    assert operations == ["pivot", "flatten", "sort"]
+    pd.testing.assert_frame_equal(df, expected)
+
+    df, operations = run([*PIVOT, SORT], df=new_df)
+    assert operations == []
+    pd.testing.assert_frame_equal(df, expected)
+
+
+def test_get_data_key() -> None:
+    """
+    Test that the key of the data changes with the values and columns of the
+    DataFrame, and that DataFrames that can't be hashed have no key.
+    """
+    df = pd.DataFrame({"a": [1, 2], "b": ["x", "y"]})
+    key = get_data_key("key", df)
+    assert key == get_data_key("key", df.copy())
+    assert key != get_data_key("other", df)
+    assert key != get_data_key("key", df.assign(a=[1, 3]))
+    assert key != get_data_key("key", df.rename(columns={"b": "c"}))
+    assert key != get_data_key("key", df.astype({"a": "float64"}))
+    assert get_data_key("key", pd.DataFrame({"a": [[1], [2]]})) is None
+
+
+def test_memo_disabled(app_context: None) -> None:
+    """
+    Test that the memo is disabled by default.
+    """
+    assert get_post_processing_memo() is None
+
+
+def test_exec_post_processing_pushed_down(memo: PostProcessingMemo) -> None:
+    """
+    Test that the memo keys of operations cover the operations performed by the
+    database.
+    """
+    operations = [{"operation": "flatten"}, *PIVOT]
+    QueryObject(post_processing=operations).exec_post_processing(
+        multiple_metrics_df.copy(), start=1, memo_key="key"
+    )
+    data_key = get_data_key("key", multiple_metrics_df)
+    assert data_key is not None
+    prefix_keys = get_prefix_keys(data_key, operations)
+    assert memo.get(prefix_keys[0]) is None
+    assert memo.get(prefix_keys[2]) is not None
+
+
+@pytest.mark.parametrize(
+    "engine_class, checkpoints",
+    [
+        (PostProcessingEngine, [1, 2, 3, 4]),
+        # only pandas results are checkpointed
+        (ArrowPostProcessingEngine, [1, 2, 4]),
+    ],
+)
+def test_engine_checkpoints(
+    mocker: MockerFixture,
+    engine_class: type[PostProcessingEngine],
+    checkpoints: list[int],
+) -> None:
+    """
+    Test that engines checkpoint the intermediate pandas DataFrames.
+    """
+    checkpoint = mocker.MagicMock()
+    engine_class().execute(
+        categories_df.copy(),
+        [
+            {
+                "operation": "pivot",
+                "options": {
+                    "index": ["dept"],
+                    "aggregates": {"asc_idx": {"operator": "sum"}},
+                },
+            },
+            {"operation": "flatten"},
+            {"operation": "sort", "options": {"by": "dept"}},
+            {"operation": "sort", "options": {"by": "dept", "ascending": False}},
+        ],
+        checkpoint,
+    )
+    assert [call.args[0] for call in checkpoint.call_args_list] == checkpoints
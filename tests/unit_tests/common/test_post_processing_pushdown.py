@@ -0,0 +1,305 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+from typing import Any, Optional
+
+import pandas as pd
+import pytest
+import sqlalchemy as sa
+from sqlalchemy.engine import Engine
+from sqlalchemy.sql.elements import ColumnElement
+
+from superset.common.utils.post_processing_pushdown import push_down_post_processing
+from superset.utils import pandas_postprocessing
+
+ROWS = [
+    ("2024-01-01", "fr", 1, 10.0),
+    ("2024-01-01", "uk", 2, None),
+    ("2024-01-02", "fr", 3, 30.0),
+    ("2024-01-02", "uk", 4, 40.0),
+    ("2024-01-03", "fr", None, 50.0),
+    ("2024-01-03", "uk", 6, 60.0),
+    ("2024-01-04", "fr", 7, 70.0),
+    ("2024-01-04", "uk", 7, 80.0),
+    ("2024-01-05", "fr", 9, None),
+    ("2024-01-05", "uk", 3, 100.0),
+]
+
+
+@pytest.fixture
+def engine() -> Engine:
+    engine = sa.create_engine("sqlite://")
+    with engine.begin() as conn:
+        conn.execute("CREATE TABLE t (ds TEXT, country TEXT, a INTEGER, b REAL)")
+        conn.execute("INSERT INTO t VALUES (?, ?, ?, ?)", ROWS)
+    return engine
+
+
+def make_label(col: ColumnElement, label: str) -> ColumnElement:
+    col = col.label(label)
+    col.key = label
+    return col
+
+
+def get_query(order_desc: bool = False) -> sa.sql.Select:
+    direction = sa.desc if order_desc else sa.asc
+    return (
+        sa.select(
+            [
+                sa.column("ds").label("ds"),
+                sa.column("country").label("country"),
+                sa.func.max(sa.column("a")).label("a"),
+                sa.func.max(sa.column("b")).label("b"),
+            ]
+        )
+        .select_from(sa.table("t"))
+        .group_by(sa.column("ds"), sa.column("country"))
+        .order_by(direction(sa.column("ds")), direction(sa.column("country")))
+    )
+
+
+def push_down(
+    post_processing: list[dict[str, Any]],
+    ordered: bool = True,
+    order_desc: bool = False,
+) -> Optional[Any]:
+    return push_down_post_processing(
+        get_query(order_desc),
+        columns={"ds": "ds", "country": "country", "a": "a", "b": "b"},
+        metrics=["a", "b"],
+        orderby=[("ds", not order_desc), ("country", not order_desc)],
+        ordered=ordered,
+        post_processing=post_processing,
+        make_label=make_label,
+    )
+
+
+def post_process(df: pd.DataFrame, post_processing: list[dict[str, Any]]):
+    for operation in post_processing:
+        df = getattr(pandas_postprocessing, operation["operation"])(
+            df, **operation.get("options", {})
+        )
+    return df.reset_index(drop=True)
+
+
+@pytest.mark.parametrize(
+    "post_processing",
+    [
+        [
+            {
+                "operation": "rolling",
+                "options": {
+                    "rolling_type": "sum",
+                    "window": 3,
+                    "min_periods": 2,
+                    "columns": {"a": "a", "b": "b"},
+                },
+            }
+        ],
+        [
+            {
+                "operation": "rolling",
+                "options": {
+                    "rolling_type": "mean",
+                    "window": 2,
+                    "columns": {"a": "a_mean"},
+                },
+            }
+        ],
+        [
+            {
+                "operation": "cum",
+                "options": {"operator": "sum", "columns": {"a": "a", "b": "b"}},
+            },
+            {
+                "operation": "diff",
+                "options": {"columns": {"b": "b_diff"}, "periods": 2},
+            },
+        ],
+        [
+            {
+                "operation": "cum",
+                "options": {"operator": "max", "columns": {"b": "b_max"}},
+            }
+        ],
+        [
+            {
+                "operation": "diff",
+                "options": {"columns": {"a": "a"}, "periods": -1},
+            }
+        ],
+        [
+            {
+                "operation": "compare",
+                "options": {
+                    "source_columns": ["a"],
+                    "compare_columns": ["b"],
+                    "compare_type": "difference",
+                    "drop_original_columns": True,
+                },
+            }
+        ],
+        [
+            {
+                "operation": "contribution",
+                "options": {"columns": ["a", "b"], "rename_columns": ["%a", "%b"]},
+            }
+        ],
+        [
+            {
+                "operation": "contribution",
+                "options": {"columns": ["a", "b"], "orientation": "row"},
+            }
+        ],
+        [
+            {
+                "operation": "contribution",
+                "options": {"columns": ["b"], "contribution_totals": {"b": 500}},
+            }
+        ],
+        [
+            {
+                "operation": "contribution",
+                "options": {"columns": ["a", "b"], "contribution_totals": {}},
+            }
+        ],
+        [{"operation": "rank", "options": {"metric": "a"}}],
+        [{"operation": "rank", "options": {"metric": "a", "group_by": "country"}}],
+    ],
+)
+def test_push_down_post_processing(
+    engine: Engine, post_processing: list[dict[str, Any]]
+) -> None:
+    """
+    Test that post-processing operations pushed down to the database give the same
+    result as pandas.
+    """
+    pushdown = push_down(post_processing)
+    assert pushdown is not None
+    assert pushdown.operations == len(post_processing)
+
+    expected = post_process(pd.read_sql(get_query(), engine), post_processing)
+    df = pd.read_sql(pushdown.sqla_query, engine)
+    assert list(df.columns) == pushdown.labels_expected
+    pd.testing.assert_frame_equal(df, expected, check_dtype=False)
+
+
+def test_push_down_post_processing_descending(engine: Engine) -> None:
+    """
+    Test that the pushed down operations follow the order of the query.
+    """
+    post_processing = [
+        {
+            "operation": "cum",
+            "options": {"operator": "sum", "columns": {"a": "a"}},
+        }
+    ]
+    pushdown = push_down(post_processing, order_desc=True)
+    assert pushdown is not None
+
+    expected = post_process(
+        pd.read_sql(get_query(order_desc=True), engine), post_processing
+    )
+    df = pd.read_sql(pushdown.sqla_query, engine)
+    pd.testing.assert_frame_equal(df, expected, check_dtype=False)
+
+
+def test_push_down_post_processing_prefix() -> None:
+    """
+    Test that only the leading operations that can be pushed down are.
+    """
+    pushdown = push_down(
+        [
+            {
+                "operation": "cum",
+                "options": {"operator": "sum", "columns": {"a": "a"}},
+            },
+            {
+                "operation": "pivot",
+                "options": {"index": ["ds"], "columns": ["country"]},
+            },
+            {
+                "operation": "cum",
+                "options": {"operator": "sum", "columns": {"b": "b"}},
+            },
+        ]
+    )
+    assert pushdown is not None
+    assert pushdown.operations == 1
+
+
+@pytest.mark.parametrize(
+    "operation",
+    [
+        # order dependent
+        {"operation": "cum", "options": {"operator": "sum", "columns": {"a": "a"}}},
+        {"operation": "diff", "options": {"columns": {"a": "a"}}},
+        {
+            "operation": "rolling",
+            "options": {"rolling_type": "sum", "window": 2, "columns": {"a": "a"}},
+        },
+    ],
+)
+def test_push_down_post_processing_unordered(operation: dict[str, Any]) -> None:
+    """
+    Test that operations depending on the order of rows need a deterministic order.
+    """
+    assert push_down([operation], ordered=False) is None
+    assert push_down([operation], ordered=True) is not None
+
+
+@pytest.mark.parametrize(
+    "operation",
+    [
+        {"operation": "cum", "options": {"operator": "prod", "columns": {"a": "a"}}},
+        {"operation": "cum", "options": {"operator": "sum", "columns": {"c": "c"}}},
+        # would create a duplicate column
+        {"operation": "diff", "options": {"columns": {"a": "a", "b": "a"}}},
+        {"operation": "diff", "options": {"columns": {"a": "a"}, "axis": 1}},
+        {
+            "operation": "rolling",
+            "options": {"rolling_type": "median", "window": 2, "columns": {"a": "a"}},
+        },
+        {
+            "operation": "rolling",
+            "options": {
+                "rolling_type": "sum",
+                "window": 2,
+                "min_periods": 0,
+                "columns": {"a": "a"},
+            },
+        },
+        {
+            "operation": "compare",
+            "options": {
+                "source_columns": ["a"],
+                "compare_columns": ["b"],
+                "compare_type": "ratio",
+            },
+        },
+        # columns default to all numeric columns
+        {"operation": "contribution", "options": {}},
+        {"operation": "contribution", "options": {"columns": ["country"]}},
+        {"operation": "rank", "options": {"metric": "a", "group_by": "c"}},
+        {"operation": "rolling", "options": {"foo": "bar"}},
+        {"operation": "pivot", "options": {}},
+    ],
+)
+def test_push_down_post_processing_fallback(operation: dict[str, Any]) -> None:
+    """
+    Test that operations without an equivalent SQL are left to pandas.
+    """
+    assert push_down([operation]) is None
@@ -96,6 +96,79 @@ def test_returns_column_descriptions(mocker: MockerFixture) -> None:
     ]
 
 
+def test_columns_description_without_execution(mocker: MockerFixture) -> None:
+    """
+    Test that queries are described without running them when the DB engine spec
+    supports it.
+    """
+    from superset.db_engine_specs.postgres import PostgresEngineSpec
+    from superset.utils.core import GenericDataType
+
+    database = mocker.MagicMock()
+    database.db_engine_spec = PostgresEngineSpec
+    database.apply_limit_to_sql.return_value = "SELECT * FROM t LIMIT 0"
+    database.mutate_sql_based_on_config.side_effect = lambda sql: sql
+    cursor = database.get_raw_connection().__enter__().cursor()
+    # varchar, timestamp and a duplicate column name
+    cursor.description = [("a", 1043), ("b", 1114), ("a", 20)]
+
+    assert get_columns_description(database, None, "public", "SELECT * FROM t") == [
+        {
+            "column_name": "a",
+            "name": "a",
+            "type": "STRING",
+            "type_generic": GenericDataType.STRING,
+            "is_dttm": False,
+        },
+        {
+            "column_name": "b",
+            "name": "b",
+            "type": "DATETIME",
+            "type_generic": GenericDataType.TEMPORAL,
+            "is_dttm": True,
+        },
+        {
+            "column_name": "a__1",
+            "name": "a__1",
+            "type": "LONGINTEGER",
+            "type_generic": GenericDataType.NUMERIC,
+            "is_dttm": False,
+        },
+    ]
+    database.apply_limit_to_sql.assert_called_once_with(
+        "SELECT * FROM t",
+        limit=0,
+        force=True,
+    )
+    cursor.execute.assert_called_once_with("SELECT * FROM t LIMIT 0")
+
+
+def test_columns_description_fallback(mocker: MockerFixture) -> None:
+    """
+    Test that queries are run once, with a limit of 1, when the description of the
+    query lacks the type of some column.
+    """
+    from superset.db_engine_specs.postgres import PostgresEngineSpec
+
+    database = mocker.MagicMock()
+    database.db_engine_spec = PostgresEngineSpec
+    database.apply_limit_to_sql.side_effect = lambda sql, limit, force=False: (
+        f"{sql} LIMIT {limit}"
+    )
+    database.mutate_sql_based_on_config.side_effect = lambda sql: sql
+    cursor = database.get_raw_connection().__enter__().cursor()
+    cursor.description = [("a", 1043), ("b", -1)]
+    cursor.fetchall.side_effect = [[], [("x", 1)]]
+
+    columns = get_columns_description(database, None, "public", "SELECT * FROM t")
+
+    assert [column["name"] for column in columns] == ["a", "b"]
+    assert cursor.execute.call_args_list == [
+        mocker.call("SELECT * FROM t LIMIT 0"),
+        mocker.call("SELECT * FROM t LIMIT 1"),
+    ]
+
+
 def test_get_virtual_table_metadata(mocker: MockerFixture) -> None:
     """
     Test the `get_virtual_table_metadata` function.
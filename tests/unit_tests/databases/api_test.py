@@ -2426,3 +2426,68 @@ def test_schemas_with_oauth2(
             }
         ]
     }
+
+
+def test_invalidate_latest_partition(
+    mocker: MockerFixture,
+    client: Any,
+    full_api_access: None,
+) -> None:
+    """
+    Test the `invalidate_latest_partition` endpoint.
+    """
+    database = mocker.MagicMock()
+    mocker.patch("superset.databases.api.DatabaseDAO.find_by_id", return_value=database)
+    raise_for_access = mocker.patch(
+        "superset.databases.api.security_manager.raise_for_access"
+    )
+    invalidate = mocker.patch("superset.databases.api.partition_cache.invalidate")
+
+    response = client.delete("/api/v1/database/1/latest_partition/?name=t&schema=s")
+    assert response.status_code == 200
+    invalidate.assert_called_with(database, Table("t", "s"))
+    raise_for_access.assert_called_with(database=database, table=Table("t", "s"))
+
+    response = client.delete("/api/v1/database/1/latest_partition/")
+    assert response.status_code == 200
+    invalidate.assert_called_with(database, None)
+
+    raise_for_access.side_effect = SupersetSecurityException(
+        SupersetError(
+            error_type=SupersetErrorType.TABLE_SECURITY_ACCESS_ERROR,
+            message="No access",
+            level=ErrorLevel.ERROR,
+        )
+    )
+    response = client.delete("/api/v1/database/1/latest_partition/?name=t")
+    assert response.status_code == 404
+    assert invalidate.call_count == 2
+
+
+def test_invalidate_metadata_cache(
+    mocker: MockerFixture,
+    client: Any,
+    full_api_access: None,
+) -> None:
+    """
+    Test the `invalidate_metadata_cache` endpoint.
+    """
+    database = mocker.MagicMock()
+    mocker.patch("superset.databases.api.DatabaseDAO.find_by_id", return_value=database)
+    metadata_cache = mocker.patch("superset.databases.api.metadata_cache")
+
+    response = client.delete("/api/v1/database/1/metadata_cache/?schema=s")
+    assert response.status_code == 200
+    metadata_cache.invalidate_schema.assert_called_with(database, None, "s")
+
+    response = client.delete("/api/v1/database/1/metadata_cache/?catalog=c")
+    assert response.status_code == 200
+    metadata_cache.invalidate_catalog.assert_called_with(database, "c")
+
+    response = client.delete("/api/v1/database/1/metadata_cache/")
+    assert response.status_code == 200
+    metadata_cache.invalidate_database.assert_called_with(database)
+
+    mocker.patch("superset.databases.api.DatabaseDAO.find_by_id", return_value=None)
+    response = client.delete("/api/v1/database/1/metadata_cache/")
+    assert response.status_code == 404
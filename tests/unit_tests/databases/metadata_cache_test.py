@@ -0,0 +1,159 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+from typing import Any
+
+import pytest
+from cachelib import SimpleCache
+from pytest_mock import MockerFixture
+
+from superset.databases import metadata_cache
+from superset.sql.parse import Table
+
+
+@pytest.fixture
+def cache(mocker: MockerFixture, app_context: None) -> SimpleCache:
+    cache = SimpleCache()
+    mocker.patch.object(metadata_cache.cache_manager, "_data_cache", cache)
+    return cache
+
+
+@pytest.fixture
+def database(mocker: MockerFixture) -> Any:
+    database = mocker.MagicMock(id=1)
+    database.get_default_catalog.return_value = None
+    database.get_default_schema.return_value = "public"
+    return database
+
+
+def test_get_or_fetch(mocker: MockerFixture, cache: SimpleCache, database: Any) -> None:
+    """
+    Test that the metadata is cached per table and kind.
+    """
+    stats_logger = mocker.patch.object(
+        metadata_cache.stats_logger_manager, "_stats_logger", mocker.MagicMock()
+    )
+    fetch = mocker.MagicMock(return_value={"name": "t1"})
+    table = Table("t1", "public")
+
+    for _ in range(2):
+        assert metadata_cache.get_or_fetch(
+            database, table, "table_metadata", fetch
+        ) == {"name": "t1"}
+    fetch.assert_called_once()
+    stats_logger.incr.assert_any_call("table_metadata.cache_hit")
+
+    metadata_cache.get_or_fetch(database, table, "table_extra_metadata", fetch)
+    metadata_cache.get_or_fetch(
+        database, Table("t2", "public"), "table_metadata", fetch
+    )
+    assert fetch.call_count == 3
+
+    mocker.patch.dict(
+        "flask.current_app.config", {"TABLE_METADATA_CACHE_TIMEOUT": None}
+    )
+    metadata_cache.get_or_fetch(database, table, "table_metadata", fetch)
+    assert fetch.call_count == 4
+
+
+def test_invalidate(mocker: MockerFixture, cache: SimpleCache, database: Any) -> None:
+    """
+    Test that invalidating a table, schema or database invalidates the metadata of
+    the tables they cover, including when requested with the default schema.
+    """
+    fetch = mocker.MagicMock(return_value={})
+
+    def get(table: Table) -> None:
+        metadata_cache.get_or_fetch(database, table, "table_metadata", fetch)
+
+    tables = [Table("t1", "public"), Table("t1"), Table("t2", "public")]
+    for table in tables:
+        get(table)
+    assert fetch.call_count == 3
+
+    metadata_cache.invalidate_table(database, Table("t1", "public"))
+    for table in tables:
+        get(table)
+    assert fetch.call_count == 5
+
+    metadata_cache.invalidate_schema(database, None, "other")
+    for table in tables:
+        get(table)
+    assert fetch.call_count == 5
+
+    metadata_cache.invalidate_schema(database, None, "public")
+    for table in tables:
+        get(table)
+    assert fetch.call_count == 8
+
+    metadata_cache.invalidate_database(database)
+    get(tables[0])
+    assert fetch.call_count == 9
+
+
+def test_memoized_lists(mocker: MockerFixture, cache: SimpleCache) -> None:
+    """
+    Test that the cached lists of catalogs, schemas and tables of a database are
+    invalidated by bumping the stamps of the database, catalog or schema.
+    """
+    from superset.models.core import Database
+
+    # the lists are memoized in the cache object the methods were decorated with
+    for method in ("get", "set", "get_many", "set_many"):
+        mocker.patch.object(
+            metadata_cache.cache_manager.cache, method, getattr(cache, method)
+        )
+    mocker.patch("superset.models.core.Database.get_default_catalog", return_value="c")
+    mocker.patch("superset.models.core.Database.get_default_schema", return_value="s")
+    inspector = mocker.patch("superset.models.core.Database.get_inspector")
+    db_engine_spec = mocker.patch(
+        "superset.models.core.Database.db_engine_spec",
+        new_callable=mocker.PropertyMock,
+    ).return_value
+    db_engine_spec.get_catalog_names.return_value = {"c"}
+    db_engine_spec.get_schema_names.return_value = {"s"}
+    db_engine_spec.get_table_names.return_value = {"t"}
+    database = Database(id=1, database_name="db", sqlalchemy_uri="sqlite://")
+
+    def get_lists() -> None:
+        database.get_all_catalog_names()
+        database.get_all_schema_names(catalog="c")
+        database.get_all_table_names_in_schema(catalog=None, schema="s")
+        database.get_all_table_names_in_schema(catalog="c", schema="other")
+
+    def get_counts() -> tuple[int, int, int]:
+        return (
+            db_engine_spec.get_catalog_names.call_count,
+            db_engine_spec.get_schema_names.call_count,
+            db_engine_spec.get_table_names.call_count,
+        )
+
+    get_lists()
+    get_lists()
+    assert inspector.call_count == 4
+    assert get_counts() == (1, 1, 2)
+
+    metadata_cache.invalidate_schema(database, "c", "s")
+    get_lists()
+    assert get_counts() == (1, 1, 3)
+
+    metadata_cache.invalidate_catalog(database, "c")
+    get_lists()
+    assert get_counts() == (1, 2, 5)
+
+    metadata_cache.invalidate_database(database)
+    get_lists()
+    assert get_counts() == (2, 3, 7)
@@ -0,0 +1,146 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+from pytest_mock import MockerFixture
+
+from superset.databases.search_index import (
+    clear_search_indexes,
+    get_search_index,
+    get_trigrams,
+    MetadataSearchIndex,
+    SearchEntry,
+)
+
+INDEX = MetadataSearchIndex(
+    [
+        SearchEntry("orders", None, "table"),
+        SearchEntry("orders", "order_id", "column"),
+        SearchEntry("orders", "customer_id", "column"),
+        SearchEntry("order_items", None, "table"),
+        SearchEntry("customers", None, "table"),
+        SearchEntry("customers", "customer_id", "column"),
+        SearchEntry("daily_orders", None, "view"),
+    ]
+)
+
+
+def search(query: str, include_columns: bool = True) -> list[tuple[str, str]]:
+    return [
+        (match.entry.table, match.entry.name)
+        for match in sorted(
+            INDEX.search(query, include_columns),
+            key=lambda match: (-match.score, match.entry.name, match.entry.table),
+        )
+    ]
+
+
+def test_get_trigrams() -> None:
+    assert get_trigrams("cat") == {"  c", " ca", "cat", "at "}
+
+
+def test_search_prefix() -> None:
+    """
+    Test that names starting with the query come first, shortest first, and that
+    exact matches score 2.
+    """
+    assert search("order")[:3] == [
+        ("orders", "orders"),
+        ("orders", "order_id"),
+        ("order_items", "order_items"),
+    ]
+    assert max(match.score for match in INDEX.search("ORDERS")) == 2
+
+
+def test_search_fuzzy() -> None:
+    """
+    Test that names similar to the query are found, even with typos.
+    """
+    assert search("custmers") == [
+        ("customers", "customers"),
+        ("customers", "customer_id"),
+        ("orders", "customer_id"),
+    ]
+    assert ("daily_orders", "daily_orders") in search("orders")
+    assert search("zzz") == []
+    assert search("  ") == []
+
+
+def test_search_without_columns() -> None:
+    """
+    Test that columns can be left out of the results.
+    """
+    assert search("customer", include_columns=False) == [
+        ("customers", "customers"),
+    ]
+
+
+def test_get_search_index(app_context: None, mocker: MockerFixture) -> None:
+    """
+    Test that indexes are cached until they expire or their version changes.
+    """
+    clear_search_indexes()
+    build = mocker.MagicMock(return_value=INDEX)
+
+    assert get_search_index(1, None, "public", "v1", build) is INDEX
+    assert get_search_index(1, None, "public", "v1", build) is INDEX
+    assert build.call_count == 1
+
+    get_search_index(1, None, "public", "v2", build)
+    get_search_index(1, None, "other", "v2", build)
+    assert build.call_count == 3
+
+    monotonic = mocker.patch("superset.databases.search_index.time.monotonic")
+    monotonic.return_value = 1e12
+    get_search_index(1, None, "public", "v2", build)
+    assert build.call_count == 4
+    clear_search_indexes()
+
+
+def test_get_search_index_max_entries(
+    app_context: None,
+    mocker: MockerFixture,
+) -> None:
+    """
+    Test that the least recently used indexes are evicted once the cached indexes
+    hold too many names, and that indexes too large to cache are not cached.
+    """
+    from flask import current_app
+
+    mocker.patch.dict(
+        current_app.config,
+        {"METADATA_SEARCH_INDEX_MAX_ENTRIES": 2 * len(INDEX)},
+    )
+    clear_search_indexes()
+    build = mocker.MagicMock(return_value=INDEX)
+
+    get_search_index(1, None, "a", None, build)
+    get_search_index(1, None, "b", None, build)
+    get_search_index(1, None, "a", None, build)
+    assert build.call_count == 2
+
+    # evicts "b", the least recently used index
+    get_search_index(1, None, "c", None, build)
+    get_search_index(1, None, "a", None, build)
+    assert build.call_count == 3
+    get_search_index(1, None, "b", None, build)
+    assert build.call_count == 4
+
+    large = MetadataSearchIndex(INDEX.entries * 3)
+    build_large = mocker.MagicMock(return_value=large)
+    assert get_search_index(1, None, "d", None, build_large) is large
+    assert get_search_index(1, None, "d", None, build_large) is large
+    assert build_large.call_count == 2
+    clear_search_indexes()
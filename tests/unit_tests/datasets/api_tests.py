@@ -17,6 +17,7 @@
 
 from typing import Any
 
+from pytest_mock import MockerFixture
 from sqlalchemy.orm.session import Session
 
 from superset import db
@@ -72,3 +73,34 @@ def test_put_invalid_dataset(
             }
         ]
     }
+
+
+def test_bulk_refresh(
+    mocker: MockerFixture,
+    client: Any,
+    full_api_access: None,
+) -> None:
+    """
+    Test the bulk refresh endpoint.
+    """
+    from superset.commands.dataset.bulk_refresh import BulkRefreshResult
+    from superset.connectors.sqla.models import MetadataResult
+
+    command = mocker.patch("superset.datasets.api.BulkRefreshDatasetsCommand")
+    command.return_value.run.return_value = BulkRefreshResult(
+        refreshed={1: MetadataResult(added=["a"])},
+        failed={2: "main.t2"},
+    )
+
+    response = client.put("/api/v1/dataset/refresh/", json={"ids": [1, 2]})
+    assert response.status_code == 200
+    assert response.json == {
+        "result": {
+            "refreshed": [{"id": 1, "added": ["a"], "removed": [], "modified": []}],
+            "failed": [{"id": 2, "message": "main.t2"}],
+        },
+    }
+    command.assert_called_once_with([1, 2])
+
+    response = client.put("/api/v1/dataset/refresh/", json={"ids": []})
+    assert response.status_code == 400
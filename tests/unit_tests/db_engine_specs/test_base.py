@@ -539,3 +539,122 @@ def test_use_equality_for_boolean_filters_property() -> None:
 
     # Default should be False (use IS operators)
     assert BaseEngineSpec.use_equality_for_boolean_filters is False
+
+
+def test_get_schema_tables_information_schema(mocker: MockerFixture) -> None:
+    """
+    Test that names are read like the table list reads them, and the columns of all
+    the tables with one query when the database supports `information_schema`.
+    Relations missing from `information_schema`, like materialized views, are
+    inspected.
+    """
+    from superset.db_engine_specs.base import BaseEngineSpec, SchemaTable
+
+    mocker.patch.object(BaseEngineSpec, "supports_information_schema", True)
+    get_columns = mocker.patch.object(
+        BaseEngineSpec,
+        "get_columns",
+        return_value=[{"name": "a", "column_name": "a", "type": "INTEGER"}],
+    )
+    inspector = mocker.MagicMock()
+    inspector.get_table_names.return_value = ["t1", "empty"]
+    inspector.get_view_names.return_value = ["v1", "mv1"]
+    connection = inspector.engine.connect.return_value.__enter__.return_value
+    connection.execute.return_value.fetchall.return_value = [
+        ("t1", "a", "integer", "NO"),
+        ("t1", "b", "character varying", "YES"),
+        ("v1", "a", "integer", "YES"),
+    ]
+
+    tables = BaseEngineSpec.get_schema_tables(mocker.MagicMock(), inspector, "public")
+
+    assert connection.execute.call_count == 1
+    assert connection.execute.call_args.args[1] == {"schema": "public"}
+    assert sorted(call.args[1].table for call in get_columns.call_args_list) == [
+        "empty",
+        "mv1",
+    ]
+    assert tables == [
+        SchemaTable(
+            "empty", "table", [{"name": "a", "column_name": "a", "type": "INTEGER"}]
+        ),
+        SchemaTable(
+            "mv1", "view", [{"name": "a", "column_name": "a", "type": "INTEGER"}]
+        ),
+        SchemaTable(
+            "t1",
+            "table",
+            [
+                {
+                    "name": "a",
+                    "column_name": "a",
+                    "type": "INTEGER",
+                    "is_dttm": None,
+                    "nullable": False,
+                },
+                {
+                    "name": "b",
+                    "column_name": "b",
+                    "type": "CHARACTER VARYING",
+                    "is_dttm": None,
+                    "nullable": True,
+                },
+            ],
+        ),
+        SchemaTable(
+            "v1",
+            "view",
+            [
+                {
+                    "name": "a",
+                    "column_name": "a",
+                    "type": "INTEGER",
+                    "is_dttm": None,
+                    "nullable": True,
+                },
+            ],
+        ),
+    ]
+
+
+def test_supports_limit_zero() -> None:
+    """
+    Test that queries are only described with `LIMIT 0` by engines whose drivers
+    describe columns with type codes that `get_datatype` maps, since the query is
+    run again with `LIMIT 1` otherwise.
+    """
+    from superset.db_engine_specs.aurora import (
+        AuroraMySQLDataAPI,
+        AuroraPostgresDataAPI,
+    )
+    from superset.db_engine_specs.hive import HiveEngineSpec
+    from superset.db_engine_specs.mysql import MySQLEngineSpec
+    from superset.db_engine_specs.postgres import PostgresEngineSpec
+    from superset.db_engine_specs.presto import PrestoEngineSpec
+    from superset.db_engine_specs.redshift import RedshiftEngineSpec
+    from superset.db_engine_specs.snowflake import SnowflakeEngineSpec
+    from superset.db_engine_specs.trino import TrinoEngineSpec
+    from superset.db_engine_specs.vertica import VerticaEngineSpec
+
+    for spec in (
+        PostgresEngineSpec,
+        MySQLEngineSpec,
+        PrestoEngineSpec,
+        TrinoEngineSpec,
+    ):
+        assert spec.supports_limit_zero
+    for spec in (
+        RedshiftEngineSpec,
+        SnowflakeEngineSpec,
+        VerticaEngineSpec,
+        HiveEngineSpec,
+        AuroraMySQLDataAPI,
+        AuroraPostgresDataAPI,
+    ):
+        assert not spec.supports_limit_zero
+
+    # psycopg2 type OIDs
+    assert PostgresEngineSpec.get_datatype(23) is not None
+    assert PostgresEngineSpec.get_datatype(25) is not None
+    # Presto and Trino describe columns with type names
+    assert TrinoEngineSpec.get_datatype("varchar") == "VARCHAR"
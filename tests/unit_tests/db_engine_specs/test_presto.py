@@ -28,6 +28,7 @@ from sqlalchemy.engine.url import make_url
 
 from superset.sql.parse import Table
 from superset.utils.core import GenericDataType
+from tests.unit_tests.conftest import with_feature_flags
 from tests.unit_tests.db_engine_specs.utils import (
     assert_column_spec,
     assert_convert_dttm,
@@ -342,3 +343,81 @@ SELECT * \nFROM my_catalog.my_schema.my_table
  LIMIT :param_1
     """.strip()
     )
+
+
+def test_latest_partition_cached(mocker: MockerFixture, app_context: None) -> None:
+    """
+    Test that latest partition lookups go through the partition cache.
+    """
+    import pandas as pd
+    from cachelib import SimpleCache
+
+    from superset.db_engine_specs.presto import PrestoEngineSpec
+    from superset.exceptions import SupersetTemplateException
+    from superset.utils import partition_cache
+
+    mocker.patch.object(partition_cache.cache_manager, "_data_cache", SimpleCache())
+    database = mocker.MagicMock(id=1)
+    database.get_extra.return_value = {}
+    database.get_indexes.return_value = [{"column_names": ["ds", "hour"]}]
+    database.get_df.return_value = pd.DataFrame({"ds": ["2024-01-01"], "hour": [1]})
+
+    for _ in range(2):
+        assert PrestoEngineSpec.latest_partition(
+            database, Table("t"), show_first=True
+        ) == (["ds", "hour"], ("2024-01-01", 1))
+    database.get_df.assert_called_once()
+
+    with pytest.raises(SupersetTemplateException):
+        PrestoEngineSpec.latest_partition(database, Table("t"))
+    database.get_df.assert_called_once()
+
+    database.get_df.return_value = pd.DataFrame({"ds": ["2024-01-02"]})
+    assert PrestoEngineSpec.latest_sub_partition(database, Table("t"), hour=1) == (
+        "2024-01-02"
+    )
+    assert PrestoEngineSpec.latest_sub_partition(database, Table("t"), hour=1) == (
+        "2024-01-02"
+    )
+    assert database.get_df.call_count == 2
+
+
+@with_feature_flags(PRESTO_EXPAND_DATA=True)
+def test_expand_data_shared_rows() -> None:
+    """
+    Test that the arrays of a level of nesting share the rows they're unnested into,
+    whichever array is the longest.
+    """
+    from superset.db_engine_specs.presto import PrestoEngineSpec
+
+    columns = [
+        {"column_name": "id", "name": "id", "type": "BIGINT", "is_dttm": False},
+        {"column_name": "a", "name": "a", "type": "ARRAY(BIGINT)", "is_dttm": False},
+        {
+            "column_name": "r",
+            "name": "r",
+            "type": "ROW(B ARRAY(BIGINT))",
+            "is_dttm": False,
+        },
+    ]
+    data = [
+        {"id": 1, "a": "[1]", "r": "[[10, 20, 30]]"},
+        {"id": 2, "a": [2, 3], "r": [None]},
+        {"id": 3, "a": None, "r": None},
+    ]
+
+    all_columns, expanded_data, expanded_columns = PrestoEngineSpec.expand_data(
+        columns,
+        data,
+    )
+
+    assert [column["column_name"] for column in all_columns] == ["id", "a", "r", "r.b"]
+    assert [column["column_name"] for column in expanded_columns] == ["r.b"]
+    assert [(row["id"], row["a"], row["r.b"]) for row in expanded_data] == [
+        (1, 1, 10),
+        ("", "", 20),
+        ("", "", 30),
+        (2, 2, None),
+        ("", 3, ""),
+        (3, None, ""),
+    ]
@@ -170,8 +170,11 @@ def test_values_for_column_double_percents(
     """
     from superset.connectors.sqla.models import SqlaTable, TableColumn
 
-    with database.get_sqla_engine() as engine:
-        engine.dialect.identifier_preparer._double_percents = "pyformat"
+    mocker.patch.object(
+        database.get_dialect().identifier_preparer,
+        "_double_percents",
+        "pyformat",
+    )
 
     table = SqlaTable(
         database=database,
@@ -360,3 +363,93 @@ def test_apply_series_others_grouping_with_false_condition(database: Database) -
         assert len(result_groupby_columns) == 1
         assert "category" in result_groupby_columns
         assert result_groupby_columns["category"].name == "category"
+
+
+@pytest.mark.parametrize(
+    "allows_joins, allows_in_subquery, expected, selects",
+    [
+        (True, True, "JOIN", 2),
+        (False, True, "IN (SELECT", 3),
+        (False, False, "WHERE b = ", 1),
+    ],
+)
+def test_series_limit(
+    mocker: MockerFixture,
+    database: Database,
+    allows_joins: bool,
+    allows_in_subquery: bool,
+    expected: str,
+    selects: int,
+) -> None:
+    """
+    Test that the top groups of series are selected in the query itself with a join
+    or a semi-join, falling back to a prequery.
+    """
+    from superset.connectors.sqla.models import SqlaTable, TableColumn
+
+    get_sqla_engine = database.get_sqla_engine
+    mocker.patch.object(
+        database,
+        "get_sqla_engine",
+        side_effect=lambda *args, **kwargs: get_sqla_engine(),
+    )
+    mocker.patch.object(database.db_engine_spec, "allows_joins", allows_joins)
+    mocker.patch.object(
+        database.db_engine_spec, "allows_in_subquery", allows_in_subquery
+    )
+    table = SqlaTable(
+        database=database,
+        schema=None,
+        table_name="t",
+        columns=[
+            TableColumn(column_name="a", type="INTEGER"),
+            TableColumn(column_name="b", type="TEXT"),
+        ],
+    )
+
+    result = table.query(
+        {
+            "metrics": [
+                {
+                    "expressionType": "SQL",
+                    "sqlExpression": "COUNT(*)",
+                    "label": "count",
+                }
+            ],
+            "columns": ["b"],
+            "series_columns": ["b"],
+            "series_limit": 1,
+            "order_desc": True,
+            "is_timeseries": False,
+            "filter": [],
+            "extras": {},
+        }
+    )
+
+    assert result.df["b"].tolist() in (["Alice"], ["Bob"])
+    assert expected in result.query
+    assert result.query.count("SELECT") == selects
+
+
+def test_get_top_groups_null(database: Database) -> None:
+    """
+    Test that a NULL group among the top groups fetched by a prequery is kept, since
+    NULL never matches an IN list.
+    """
+    import pandas as pd
+    from sqlalchemy import column
+
+    from superset.connectors.sqla.models import SqlaTable
+    from superset.models.helpers import ExploreMixin
+
+    table = SqlaTable(database=database, schema=None, table_name="t")
+    df = pd.DataFrame({"b": ["Alice", None, "Bob"]})
+
+    top_groups = ExploreMixin._get_top_groups(table, df, ["b"], {"b": column("b")}, {})
+    sql = str(top_groups.compile(compile_kwargs={"literal_binds": True}))
+    assert sql == "b IN ('Alice', 'Bob') OR b IS NULL"
+
+    df = pd.DataFrame({"b": ["Alice", "Bob"]})
+    top_groups = ExploreMixin._get_top_groups(table, df, ["b"], {"b": column("b")}, {})
+    sql = str(top_groups.compile(compile_kwargs={"literal_binds": True}))
+    assert sql == "b IN ('Alice', 'Bob')"
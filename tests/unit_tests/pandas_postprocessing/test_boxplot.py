@@ -15,6 +15,7 @@
 # specific language governing permissions and limitations
 # under the License.
 import pytest
+from pandas import DataFrame
 
 from superset.exceptions import InvalidPostProcessingError
 from superset.utils.core import PostProcessingBoxplotWhiskerType
@@ -149,3 +150,51 @@ def test_boxplot_type_coercion():
         "region",
     }
     assert len(df) == 4
+
+
+def test_boxplot_tukey_outliers():
+    df = boxplot(
+        df=DataFrame(
+            {
+                "region": ["a"] * 6 + ["b"] * 4 + [None],
+                "cars": [-20, 1, 2, 3, 4, 30, 5, 6, 7, 8, 100],
+            }
+        ),
+        groupby=["region"],
+        whisker_type=PostProcessingBoxplotWhiskerType.TUKEY,
+        metrics=["cars"],
+    )
+    assert df.to_dict("records") == [
+        {
+            "region": "a",
+            "cars__mean": 10 / 3,
+            "cars__median": 2.5,
+            "cars__max": 4,
+            "cars__min": 1,
+            "cars__q1": 1.5,
+            "cars__q3": 3.5,
+            "cars__count": 6,
+            "cars__outliers": [30, -20],
+        },
+        {
+            "region": "b",
+            "cars__mean": 6.5,
+            "cars__median": 6.5,
+            "cars__max": 8,
+            "cars__min": 5,
+            "cars__q1": 5.5,
+            "cars__q3": 7.5,
+            "cars__count": 4,
+            "cars__outliers": [],
+        },
+    ]
+
+
+def test_boxplot_missing_columns():
+    with pytest.raises(InvalidPostProcessingError):
+        boxplot(
+            df=names_df,
+            groupby=["region"],
+            whisker_type=PostProcessingBoxplotWhiskerType.TUKEY,
+            metrics=["foo"],
+        )
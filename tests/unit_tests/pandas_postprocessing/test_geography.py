@@ -14,6 +14,12 @@
 # KIND, either express or implied.  See the License for the
 # specific language governing permissions and limitations
 # under the License.
+import geohash as geohash_lib
+import pandas as pd
+import pytest
+from geopy.point import Point
+
+from superset.exceptions import InvalidPostProcessingError
 from superset.utils.pandas_postprocessing import (
     geodetic_parse,
     geohash_decode,
@@ -88,3 +94,80 @@ def test_geodetic_parse():
         lonlat_df["longitude"]
     )
     assert series_to_list(post_df["latitude"]), series_to_list(lonlat_df["latitude"])
+
+
+def test_geohash_decode_lengths():
+    # geohashes of any length and case decode like the geohash library
+    geohashes = ["u", "U4", "u4pruydqqvj", "u4pruydqqvj8", "u4pruydqqvj8pr", "7zzzzz"]
+    post_df = geohash_decode(
+        df=pd.DataFrame({"geohash": geohashes}, index=[5, 4, 3, 2, 1, 0]),
+        geohash="geohash",
+        latitude="latitude",
+        longitude="longitude",
+    )
+    assert list(zip(post_df["latitude"], post_df["longitude"], strict=True)) == [
+        geohash_lib.decode(value) for value in geohashes
+    ]
+
+    with pytest.raises(InvalidPostProcessingError):
+        geohash_decode(
+            df=pd.DataFrame({"geohash": ["u4pa"]}),
+            geohash="geohash",
+            latitude="latitude",
+            longitude="longitude",
+        )
+
+
+def test_geohash_encode_invalid():
+    # longitudes wrap around, latitudes out of range are invalid
+    post_df = geohash_encode(
+        df=pd.DataFrame({"lat": [10.5, -90.0], "lon": [190.0, -180.0]}),
+        latitude="lat",
+        longitude="lon",
+        geohash="geohash",
+    )
+    assert series_to_list(post_df["geohash"]) == [
+        geohash_lib.encode(10.5, 190.0),
+        geohash_lib.encode(-90.0, -180.0),
+    ]
+
+    with pytest.raises(InvalidPostProcessingError):
+        geohash_encode(
+            df=pd.DataFrame({"lat": [91.0], "lon": [0.0]}),
+            latitude="lat",
+            longitude="lon",
+            geohash="geohash",
+        )
+
+
+def test_geodetic_parse_formats():
+    # points not in decimal degrees are parsed by geopy
+    geodetics = [
+        "41.5, -81.0",
+        "41 26m 46s N, 23 27m 30s E",
+        "41.5; 200.0; 1.5 km",
+        "-0.0, 10.0, 3 mi",
+    ]
+    post_df = geodetic_parse(
+        df=pd.DataFrame({"geodetic": geodetics}),
+        geodetic="geodetic",
+        latitude="latitude",
+        longitude="longitude",
+        altitude="altitude",
+    )
+    assert list(
+        zip(
+            post_df["latitude"],
+            post_df["longitude"],
+            post_df["altitude"],
+            strict=True,
+        )
+    ) == [tuple(Point(value)) for value in geodetics]
+
+    with pytest.raises(InvalidPostProcessingError):
+        geodetic_parse(
+            df=pd.DataFrame({"geodetic": ["foo"]}),
+            geodetic="geodetic",
+            latitude="latitude",
+            longitude="longitude",
+        )
@@ -59,6 +59,24 @@ def test_histogram_with_groupby():
     assert result.values.tolist() == [["A", 2, 0, 2, 0, 2], ["B", 0, 2, 0, 2, 0]]
 
 
+def test_histogram_with_multiple_groupby():
+    data_with_missing_groups = DataFrame(
+        {
+            "group": ["A", "B", None, "A", "B"],
+            "sub": [1, 1, 1, 2, 2],
+            "a": [1, 2, 3, 4, 5],
+        }
+    )
+    result = histogram(data_with_missing_groups, "a", ["group", "sub"], 2)
+    assert result.columns.tolist() == ["group", "sub", "1.0 - 3.0", "3.0 - 5.0"]
+    assert result.values.tolist() == [
+        ["A", 1, 1, 0],
+        ["A", 2, 0, 1],
+        ["B", 1, 1, 0],
+        ["B", 2, 0, 1],
+    ]
+
+
 def test_histogram_with_groupby_and_normalize():
     result = histogram(data, "a", ["group"], bins, normalize=True)
     assert result.shape == (2, bins + 1)
@@ -15,16 +15,24 @@
 # specific language governing permissions and limitations
 # under the License.
 from datetime import datetime
+from importlib import import_module
 from importlib.util import find_spec
 
 import pandas as pd
 import pytest
+from flask import current_app
+from flask_caching.backends import SimpleCache
+from pytest_mock import MockerFixture
 
 from superset.exceptions import InvalidPostProcessingError
+from superset.extensions import cache_manager
 from superset.utils.core import DTTM_ALIAS
 from superset.utils.pandas_postprocessing import prophet
 from tests.unit_tests.fixtures.dataframes import prophet_df
 
+# the module is shadowed by the function in `pandas_postprocessing`
+prophet_module = import_module("superset.utils.pandas_postprocessing.prophet")
+
 
 def test_prophet_valid():
     df = prophet(df=prophet_df, time_grain="P1M", periods=3, confidence_interval=0.9)
@@ -184,3 +192,54 @@ def test_prophet_incorrect_time_grain():
             periods=10,
             confidence_interval=0.8,
         )
+
+
+def test_prophet_parallel(app_context: None, mocker: MockerFixture) -> None:
+    """
+    Test that fitting the models in a process pool gives the same forecasts.
+    """
+    expected = prophet(
+        df=prophet_df, time_grain="P1M", periods=3, confidence_interval=0.9
+    )
+
+    mocker.patch.dict(current_app.config, {"PROPHET_MAX_WORKERS": 2})
+    fit_and_predict = mocker.spy(prophet_module, "_prophet_fit_and_predict")
+    df = prophet(df=prophet_df, time_grain="P1M", periods=3, confidence_interval=0.9)
+
+    # models were fitted in other processes
+    fit_and_predict.assert_not_called()
+    assert list(df.columns) == list(expected.columns)
+    # confidence intervals are sampled, unlike the forecasts
+    columns = [DTTM_ALIAS, "a__yhat", "a", "b__yhat", "b"]
+    pd.testing.assert_frame_equal(df[columns], expected[columns])
+
+
+def test_prophet_cache(app_context: None, mocker: MockerFixture) -> None:
+    """
+    Test that forecasts of unchanged series are read from the cache.
+    """
+    mocker.patch.dict(
+        current_app.config, {"PROPHET_MAX_WORKERS": 1, "PROPHET_CACHE_TIMEOUT": 60}
+    )
+    mocker.patch.object(cache_manager, "_data_cache", SimpleCache())
+    fit_and_predict = mocker.spy(prophet_module, "_prophet_fit_and_predict")
+
+    expected = prophet(
+        df=prophet_df, time_grain="P1M", periods=3, confidence_interval=0.9
+    )
+    assert fit_and_predict.call_count == 2
+
+    df = prophet(df=prophet_df, time_grain="P1M", periods=3, confidence_interval=0.9)
+    assert fit_and_predict.call_count == 2
+    pd.testing.assert_frame_equal(df, expected)
+
+    # only the changed series and parameters need a new model
+    prophet(
+        df=prophet_df.assign(b=[4, 3, 4.1, 4]),
+        time_grain="P1M",
+        periods=3,
+        confidence_interval=0.9,
+    )
+    assert fit_and_predict.call_count == 3
+    prophet(df=prophet_df, time_grain="P1M", periods=3, confidence_interval=0.8)
+    assert fit_and_predict.call_count == 5
@@ -14,12 +14,14 @@
 # KIND, either express or implied.  See the License for the
 # specific language governing permissions and limitations
 # under the License.
+from datetime import datetime
 from unittest import mock
 
 import pytest
 from flask_babel import lazy_gettext as _
 
 from superset.commands.chart.exceptions import ChartDataQueryFailedError
+from superset.common.chart_data import ChartDataResultFormat, ChartDataResultType
 
 
 @mock.patch("superset.tasks.async_queries.security_manager")
@@ -53,3 +55,98 @@ def test_load_chart_data_into_cache_with_error(
     mock_async_query_manager.update_job.assert_called_once_with(
         job_metadata, "error", errors=expected_errors
     )
+
+
+def _chart_data_result(rows: int) -> dict:
+    query_context = mock.MagicMock()
+    query_context.result_format = ChartDataResultFormat.JSON
+    query_context.result_type = ChartDataResultType.FULL
+    return {
+        "query_context": query_context,
+        "cache_key": "abc",
+        "queries": [
+            {
+                "colnames": ["ts", "value"],
+                "rowcount": rows,
+                "data": [
+                    {"ts": datetime(2020, 1, 1), "value": float("nan")}
+                    for _ in range(rows)
+                ],
+                "query": "SELECT ts, value FROM t",
+            }
+        ],
+    }
+
+
+@pytest.mark.parametrize(
+    "max_bytes,rows,expected",
+    [
+        (
+            1000,
+            1,
+            [
+                {
+                    "colnames": ["ts", "value"],
+                    "rowcount": 1,
+                    "data": [{"ts": 1577836800000, "value": None}],
+                    "query": "SELECT ts, value FROM t",
+                }
+            ],
+        ),
+        (1000, 100, None),
+        (0, 1, None),
+    ],
+)
+@mock.patch(
+    "superset.tasks.async_queries.security_manager", new_callable=mock.MagicMock
+)
+def test_get_inline_result(mock_security_manager, app, max_bytes, rows, expected):
+    from superset.tasks.async_queries import _get_inline_result
+
+    mock_security_manager.is_guest_user.return_value = False
+    app.config["GLOBAL_ASYNC_QUERIES_INLINE_RESULT_MAX_BYTES"] = max_bytes
+
+    assert _get_inline_result(_chart_data_result(rows)) == expected
+
+
+@mock.patch(
+    "superset.tasks.async_queries.security_manager", new_callable=mock.MagicMock
+)
+def test_get_inline_result_guest_user(mock_security_manager, app):
+    from superset.tasks.async_queries import _get_inline_result
+
+    mock_security_manager.is_guest_user.return_value = True
+    app.config["GLOBAL_ASYNC_QUERIES_INLINE_RESULT_MAX_BYTES"] = 1000
+
+    result = _get_inline_result(_chart_data_result(1))
+
+    assert result is not None
+    assert "query" not in result[0]
+
+
+@mock.patch("superset.tasks.async_queries._get_inline_result")
+@mock.patch("superset.tasks.async_queries.async_query_manager")
+@mock.patch("superset.tasks.async_queries.ChartDataQueryContextSchema")
+@mock.patch("superset.commands.chart.data.get_data_command.ChartDataCommand.run")
+def test_load_chart_data_into_cache_inline_result(
+    mock_run,
+    mock_query_context_schema_cls,
+    mock_async_query_manager,
+    mock_get_inline_result,
+):
+    from superset.tasks.async_queries import load_chart_data_into_cache
+
+    job_metadata = {"user_id": 1}
+    mock_async_query_manager.STATUS_DONE = "done"
+    mock_run.return_value = {"cache_key": "abc"}
+    mock_get_inline_result.return_value = [{"data": []}]
+
+    load_chart_data_into_cache(job_metadata, {})
+
+    mock_get_inline_result.assert_called_once_with(mock_run.return_value)
+    mock_async_query_manager.update_job.assert_called_once_with(
+        job_metadata,
+        "done",
+        result_url="/api/v1/chart/data/abc",
+        result=[{"data": []}],
+    )
@@ -17,7 +17,7 @@
 
 import pandas as pd
 import pyarrow as pa
-import pytest  # noqa: F401
+import pytest
 
 from superset.utils import csv
 
@@ -95,3 +95,139 @@ def test_df_to_escaped_csv():
 
     df = pa.array([1, None]).to_pandas(integer_object_nulls=True).to_frame()
     assert csv.df_to_escaped_csv(df, encoding="utf8", index=False) == '0\n1\n""\n'
+
+
+def test_arrow_table_to_escaped_csv():
+    table = pa.table(
+        {
+            "value": [
+                "a",
+                "=func()",
+                "-10",
+                "=cmd|' /C calc'!A0",
+                " =a",
+                None,
+            ],
+            "=count": [1, 2, 3, 4, 5, None],
+        }
+    )
+
+    chunks = list(
+        csv.arrow_table_to_escaped_csv(table, batch_size=4, encoding="utf-8-sig")
+    )
+
+    assert len(chunks) == 3
+    assert b"".join(chunks) == (
+        b"\xef\xbb\xbf"
+        b"value,'=count\n"
+        b"a,1\n"
+        b"'=func(),2\n"
+        b"-10,3\n"
+        b"'=cmd\\\\|' /C calc'!A0,4\n"
+        b"' =a,5\n"
+        b",\n"
+    )
+
+
+def test_arrow_table_to_escaped_csv_empty():
+    table = pa.table({"a": pa.array([], pa.string()), "b": pa.array([], pa.int64())})
+
+    assert b"".join(csv.arrow_table_to_escaped_csv(table, sep=";")) == b"a;b\n"
+
+
+def test_can_write_arrow_csv():
+    table = pa.table({"a": [1, 2]})
+
+    assert csv.can_write_arrow_csv(table, encoding="utf-8", sep=";")
+    assert not csv.can_write_arrow_csv(table, decimal=",")
+    assert not csv.can_write_arrow_csv(pa.table({"a": [[1], [2]]}))
+    assert not csv.can_write_arrow_csv(pa.table({"a": [1.0, 2.0]}))
+    assert not csv.can_write_arrow_csv(
+        pa.table({"a": pa.array([0], pa.timestamp("s"))})
+    )
+
+
+@pytest.mark.parametrize("sep", [",", ";"])
+def test_arrow_table_to_escaped_csv_matches_pandas(sep: str) -> None:
+    """
+    Test that tables are written like the pandas path writes the records of the
+    table, so that exports don't depend on how results are stored.
+    """
+    from superset.dataframe import df_to_records
+    from superset.result_set import SupersetResultSet
+
+    table = pa.table(
+        {
+            "int": pa.array([1, None, -3, 2**62], pa.int64()),
+            "uint": pa.array([1, 2, 3, 4], pa.uint8()),
+            "bool": [True, None, False, True],
+            "null": pa.array([None] * 4, pa.null()),
+            "str": ["a", "b,c;d", 'q"uote', "back\\slash"],
+            "formula": ["=1+1", "=cmd|' /C calc'!A0", "-10", None],
+            "lines": ["new\nline", "cr\rx", " lead", ""],
+            "dict": pa.array(["x", None, "y", "x"]).dictionary_encode(),
+            "a,b": [1, 2, 3, 4],
+            "=c": [1, 2, 3, 4],
+        }
+    )
+    assert csv.can_write_arrow_csv(table, sep=sep)
+
+    df = pd.DataFrame(
+        df_to_records(SupersetResultSet.convert_table_to_df(table)),
+        dtype=object,
+        columns=table.column_names,
+    )
+    expected = csv.df_to_escaped_csv(df, index=False, sep=sep, encoding="utf-8")
+
+    chunks = csv.arrow_table_to_escaped_csv(
+        table, batch_size=3, sep=sep, encoding="utf-8"
+    )
+    assert b"".join(chunks).decode("utf-8") == expected
+
+
+def test_get_chart_csv_data():
+    assert csv.get_chart_csv_data([]) is None
+    assert csv.get_chart_csv_data([{"data": ""}]) is None
+    assert (
+        csv.get_chart_csv_data([{"data": "a,b\n1,2\n"}], encoding="utf-8-sig")
+        == b"\xef\xbb\xbfa,b\n1,2\n"
+    )
+
+
+def test_get_chart_csv_data_multiple_queries():
+    from io import BytesIO
+    from zipfile import ZipFile
+
+    data = csv.get_chart_csv_data([{"data": "a\n1\n"}, {"data": "b\n2\n"}])
+
+    with ZipFile(BytesIO(data)) as bundle:
+        assert bundle.read("query_1.csv") == b"a\n1\n"
+        assert bundle.read("query_2.csv") == b"b\n2\n"
+
+
+def test_get_chart_dataframe():
+    assert csv.get_chart_dataframe([]) is None
+
+    df = csv.get_chart_dataframe(
+        [
+            {
+                "data": {
+                    "name": {"0": "a", "1": "b"},
+                    "ds": {
+                        "0": pd.Timestamp("2022-01-01"),
+                        "1": pd.Timestamp("2022-01-02"),
+                    },
+                },
+                "colnames": [("name",), ("ds",)],
+                "indexnames": [(0,), (1,)],
+                "coltypes": [1, 2],
+            }
+        ]
+    )
+
+    assert df.columns.tolist() == [("name",), ("ds",)]
+    assert df.index.tolist() == [(0,), (1,)]
+    assert df[("ds",)].tolist() == [
+        pd.Timestamp("2022-01-01"),
+        pd.Timestamp("2022-01-02"),
+    ]
@@ -0,0 +1,162 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+import threading
+from typing import Any
+
+import pytest
+from cachelib import SimpleCache
+from pytest_mock import MockerFixture
+
+from superset.sql.parse import Table
+from superset.utils import partition_cache
+
+
+@pytest.fixture
+def cache(mocker: MockerFixture, app_context: None) -> SimpleCache:
+    cache = SimpleCache()
+    mocker.patch.object(partition_cache.cache_manager, "_data_cache", cache)
+    return cache
+
+
+@pytest.fixture
+def stats_logger(mocker: MockerFixture) -> Any:
+    return mocker.patch.object(
+        partition_cache.stats_logger_manager, "_stats_logger", mocker.MagicMock()
+    )
+
+
+def test_get_or_fetch(
+    mocker: MockerFixture,
+    cache: SimpleCache,
+    stats_logger: Any,
+) -> None:
+    """
+    Test that lookups are cached per table and parameters, with the timeout of the
+    table.
+    """
+    database = mocker.MagicMock(id=1)
+    fetch = mocker.MagicMock(return_value=None)
+    mocker.patch.dict(
+        "flask.current_app.config",
+        {"LATEST_PARTITION_CACHE_TIMEOUT": lambda database, table: 10},
+    )
+    set_ = mocker.spy(cache, "set")
+
+    for _ in range(2):
+        assert (
+            partition_cache.get_or_fetch(database, Table("t"), "lookup", fetch) is None
+        )
+    fetch.assert_called_once()
+    assert set_.call_args.kwargs["timeout"] == 10
+
+    partition_cache.get_or_fetch(database, Table("t"), "lookup", fetch, ds="1")
+    partition_cache.get_or_fetch(database, Table("t", "s"), "lookup", fetch)
+    assert fetch.call_count == 3
+    assert [call.args[0] for call in stats_logger.incr.call_args_list] == [
+        "latest_partition.cache_miss",
+        "latest_partition.cache_hit",
+        "latest_partition.cache_miss",
+        "latest_partition.cache_miss",
+    ]
+
+
+def test_invalidate(mocker: MockerFixture, cache: SimpleCache) -> None:
+    """
+    Test that lookups can be invalidated per table and per database.
+    """
+    database = mocker.MagicMock(id=1)
+    fetch = mocker.MagicMock(return_value=["2024-01-01"])
+
+    def lookup(table: Table) -> None:
+        partition_cache.get_or_fetch(database, table, "lookup", fetch)
+
+    lookup(Table("t1"))
+    lookup(Table("t2"))
+    assert fetch.call_count == 2
+
+    partition_cache.invalidate(database, Table("t1"))
+    lookup(Table("t1"))
+    lookup(Table("t2"))
+    assert fetch.call_count == 3
+
+    partition_cache.invalidate(database)
+    lookup(Table("t1"))
+    lookup(Table("t2"))
+    assert fetch.call_count == 5
+
+
+def test_get_or_fetch_single_flight(mocker: MockerFixture, cache: SimpleCache) -> None:
+    """
+    Test that concurrent lookups of the same partitions only run once.
+    """
+    database = mocker.MagicMock(id=1)
+    started = threading.Event()
+    release = threading.Event()
+    calls: list[int] = []
+
+    def fetch() -> str:
+        calls.append(1)
+        started.set()
+        release.wait(timeout=5)
+        return "2024-01-01"
+
+    results: list[str] = []
+    flask_app = partition_cache.current_app._get_current_object()
+
+    def lookup() -> None:
+        with flask_app.app_context():
+            results.append(
+                partition_cache.get_or_fetch(database, Table("t"), "lookup", fetch)
+            )
+
+    threads = [threading.Thread(target=lookup) for _ in range(3)]
+    threads[0].start()
+    started.wait(timeout=5)
+    for thread in threads[1:]:
+        thread.start()
+    release.set()
+    for thread in threads:
+        thread.join(timeout=5)
+
+    assert calls == [1]
+    assert results == ["2024-01-01"] * 3
+
+
+def test_get_or_fetch_other_process(
+    mocker: MockerFixture,
+    cache: SimpleCache,
+    stats_logger: Any,
+) -> None:
+    """
+    Test that lookups wait for another process looking up the same partitions.
+    """
+    database = mocker.MagicMock(id=1)
+    mocker.patch.object(partition_cache, "POLL_INTERVAL", 0.01)
+    key = partition_cache.get_cache_key(database, Table("t"), "lookup")
+    cache.add(f"{key}:lock", True)
+    fetch = mocker.MagicMock()
+
+    timer = threading.Timer(0.05, lambda: cache.set(key, ("2024-01-01",)))
+    timer.start()
+    assert (
+        partition_cache.get_or_fetch(database, Table("t"), "lookup", fetch)
+        == "2024-01-01"
+    )
+    timer.join()
+
+    fetch.assert_not_called()
+    stats_logger.incr.assert_called_once_with("latest_partition.cache_wait")
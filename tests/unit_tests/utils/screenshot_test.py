@@ -36,15 +36,15 @@ class MockCache:
     """A class to manage screenshot cache."""
 
     def __init__(self):
-        self._cache = None  # Store the cached value
+        self._cache = {}  # Store the cached values
 
-    def set(self, _key, value):
+    def set(self, key, value):
         """Set the cache with a new value."""
-        self._cache = value
+        self._cache[key] = value
 
-    def get(self, _key):
+    def get(self, key):
         """Get the cached value."""
-        return self._cache
+        return self._cache.get(key)
 
 
 @pytest.fixture
@@ -121,7 +121,9 @@ class TestComputeAndCache:
     def test_happy_path(self, mocker: MockerFixture, screenshot_obj):
         self._setup_compute_and_cache(mocker, screenshot_obj)
         screenshot_obj.compute_and_cache(force=False)
-        cache_payload: ScreenshotCachePayloadType = screenshot_obj.cache.get("key")
+        cache_payload: ScreenshotCachePayloadType = screenshot_obj.cache.get(
+            screenshot_obj.get_cache_key()
+        )
         assert cache_payload["status"] == "Updated"
 
     def test_screenshot_error(self, mocker: MockerFixture, screenshot_obj):
@@ -129,7 +131,9 @@ class TestComputeAndCache:
         get_screenshot: MagicMock = mocks.get("get_screenshot")
         get_screenshot.side_effect = Exception
         screenshot_obj.compute_and_cache(force=False)
-        cache_payload: ScreenshotCachePayloadType = screenshot_obj.cache.get("key")
+        cache_payload: ScreenshotCachePayloadType = screenshot_obj.cache.get(
+            screenshot_obj.get_cache_key()
+        )
         assert cache_payload["status"] == "Error"
 
     def test_resize_error(self, mocker: MockerFixture, screenshot_obj):
@@ -137,7 +141,9 @@ class TestComputeAndCache:
         resize_image: MagicMock = mocks.get("resize_image")
         resize_image.side_effect = Exception
         screenshot_obj.compute_and_cache(force=False)
-        cache_payload: ScreenshotCachePayloadType = screenshot_obj.cache.get("key")
+        cache_payload: ScreenshotCachePayloadType = screenshot_obj.cache.get(
+            screenshot_obj.get_cache_key()
+        )
         assert cache_payload["status"] == "Error"
 
     def test_skips_if_computing(self, mocker: MockerFixture, screenshot_obj):
@@ -155,7 +161,9 @@ class TestComputeAndCache:
         # Ensure that it processes when force = True
         screenshot_obj.compute_and_cache(force=True)
         get_screenshot.assert_called_once()
-        cache_payload: ScreenshotCachePayloadType = screenshot_obj.cache.get("key")
+        cache_payload: ScreenshotCachePayloadType = screenshot_obj.cache.get(
+            screenshot_obj.get_cache_key()
+        )
         assert cache_payload["status"] == "Updated"
 
     def test_skips_if_updated(self, mocker: MockerFixture, screenshot_obj):
@@ -177,7 +185,9 @@ class TestComputeAndCache:
             force=True, window_size=window_size, thumb_size=thumb_size
         )
         get_screenshot.assert_called_once()
-        cache_payload: ScreenshotCachePayloadType = screenshot_obj.cache.get("key")
+        cache_payload: ScreenshotCachePayloadType = screenshot_obj.cache.get(
+            screenshot_obj.get_cache_key(window_size, thumb_size)
+        )
         assert cache_payload["image"] != b"initial_value"
 
     def test_resize(self, mocker: MockerFixture, screenshot_obj):
@@ -192,3 +202,79 @@ class TestComputeAndCache:
             force=False, window_size=(1, 1), thumb_size=thumb_size
         )
         resize_image.assert_called_once()
+
+    def test_render_once_for_all_sizes(self, mocker: MockerFixture, screenshot_obj):
+        mocks = self._setup_compute_and_cache(mocker, screenshot_obj)
+        mocker.stop(mocks["get_from_cache_key"])
+        window_size = (10, 10)
+
+        screenshot_obj.compute_and_cache(
+            force=False, window_size=window_size, thumb_size=(5, 5)
+        )
+        screenshot_obj.compute_and_cache(
+            force=False, window_size=window_size, thumb_size=(2, 2)
+        )
+
+        mocks["get_screenshot"].assert_called_once()
+        assert mocks["resize_image"].call_count == 2
+        for thumb_size in [(5, 5), (2, 2)]:
+            cache_payload = screenshot_obj.get_from_cache(window_size, thumb_size)
+            assert cache_payload.get_status() == "Updated"
+            assert cache_payload.get_image().read() == b"resized_image_data"
+
+    def test_renditions(self, mocker: MockerFixture, app, screenshot_obj):
+        mocks = self._setup_compute_and_cache(mocker, screenshot_obj)
+        mocker.stop(mocks["get_from_cache_key"])
+        mocker.patch.dict(
+            app.config,
+            {
+                "THUMBNAIL_RENDITIONS": {
+                    "": [{"thumb_size": (4, 3), "format": "webp"}],
+                }
+            },
+        )
+        window_size = (10, 10)
+
+        screenshot_obj.compute_and_cache(
+            force=False, window_size=window_size, thumb_size=(5, 5)
+        )
+        mocks["get_screenshot"].assert_called_once()
+        assert mocks["resize_image"].call_count == 2
+        mocks["resize_image"].assert_called_with(
+            b"new_image_data", output="webp", thumb_size=(4, 3)
+        )
+
+        # the configured rendition is served without rendering or resizing
+        screenshot_obj.compute_and_cache(
+            force=False,
+            window_size=window_size,
+            thumb_size=(4, 3),
+            image_format="webp",
+        )
+        mocks["get_screenshot"].assert_called_once()
+        assert mocks["resize_image"].call_count == 2
+        cache_payload = screenshot_obj.get_from_cache_key(
+            screenshot_obj.get_cache_key(window_size, (4, 3), image_format="webp")
+        )
+        assert cache_payload.get_status() == "Updated"
+        assert cache_payload.get_mimetype() == "image/webp"
+
+    def test_images_stored_by_content(self, mocker: MockerFixture, screenshot_obj):
+        mocks = self._setup_compute_and_cache(mocker, screenshot_obj)
+        mocker.stop(mocks["get_from_cache_key"])
+        other_screenshot_obj = BaseScreenshot("http://example.com", "other_digest")
+
+        screenshot_obj.compute_and_cache(force=False)
+        other_screenshot_obj.compute_and_cache(force=False)
+
+        assert mocks["get_screenshot"].call_count == 2
+        cache_payload = screenshot_obj.cache.get(screenshot_obj.get_cache_key())
+        other_cache_payload = screenshot_obj.cache.get(
+            other_screenshot_obj.get_cache_key()
+        )
+        assert cache_payload["image"] is None
+        assert cache_payload["image_key"] == other_cache_payload["image_key"]
+
+        # the payload expires with its image
+        del screenshot_obj.cache._cache[cache_payload["image_key"]]
+        assert screenshot_obj.get_from_cache_key(screenshot_obj.get_cache_key()) is None
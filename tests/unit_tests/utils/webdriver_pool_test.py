@@ -0,0 +1,153 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+import threading
+from unittest.mock import MagicMock
+
+import pytest
+from pytest_mock import MockerFixture
+
+from superset.utils.webdriver_pool import WebDriverPool, WebDriverPoolTimeoutError
+
+
+def make_pool(**kwargs) -> tuple[WebDriverPool, MagicMock, MagicMock]:
+    destroy = MagicMock()
+    is_healthy = MagicMock(return_value=True)
+    pool = WebDriverPool("test", destroy=destroy, is_healthy=is_healthy, **kwargs)
+    return pool, destroy, is_healthy
+
+
+def test_acquire_reuses_driver_per_key() -> None:
+    pool, destroy, _ = make_pool()
+    create = MagicMock(side_effect=["driver_1", "driver_2"])
+
+    with pool.acquire(1, create) as driver:
+        assert driver == "driver_1"
+    with pool.acquire(1, create) as driver:
+        assert driver == "driver_1"
+    with pool.acquire(2, create) as driver:
+        assert driver == "driver_2"
+
+    assert create.call_count == 2
+    assert pool.size == 2
+    assert pool.idle_count == 2
+    destroy.assert_not_called()
+
+
+def test_acquire_recycles_after_max_uses() -> None:
+    pool, destroy, _ = make_pool(max_uses=2)
+    create = MagicMock(side_effect=["driver_1", "driver_2"])
+
+    for _ in range(3):
+        with pool.acquire(1, create):
+            pass
+
+    destroy.assert_called_once_with("driver_1")
+    assert create.call_count == 2
+
+
+def test_acquire_discards_unhealthy_driver() -> None:
+    pool, destroy, is_healthy = make_pool()
+    create = MagicMock(side_effect=["driver_1", "driver_2"])
+
+    with pool.acquire(1, create):
+        pass
+    is_healthy.return_value = False
+    with pool.acquire(1, create) as driver:
+        assert driver == "driver_2"
+
+    destroy.assert_called_once_with("driver_1")
+    assert pool.size == 1
+
+
+def test_acquire_discards_driver_on_error() -> None:
+    pool, destroy, _ = make_pool()
+
+    with pytest.raises(ValueError, match="page crashed"):
+        with pool.acquire(1, lambda: "driver_1"):
+            raise ValueError("page crashed")
+
+    destroy.assert_called_once_with("driver_1")
+    assert pool.size == 0
+
+
+def test_acquire_evicts_idle_driver_when_full() -> None:
+    pool, destroy, _ = make_pool(max_size=1)
+
+    with pool.acquire(1, lambda: "driver_1"):
+        pass
+    with pool.acquire(2, lambda: "driver_2") as driver:
+        assert driver == "driver_2"
+
+    destroy.assert_called_once_with("driver_1")
+    assert pool.size == 1
+
+
+def test_acquire_timeout_when_exhausted() -> None:
+    pool, _, _ = make_pool(max_size=1, acquire_timeout=0.01)
+
+    with pool.acquire(1, lambda: "driver_1"):
+        with pytest.raises(WebDriverPoolTimeoutError):
+            with pool.acquire(1, lambda: "driver_2"):
+                pass
+
+
+def test_acquire_failed_create_releases_slot() -> None:
+    pool, _, _ = make_pool(max_size=1)
+
+    with pytest.raises(RuntimeError):
+        with pool.acquire(1, MagicMock(side_effect=RuntimeError("no browser"))):
+            pass
+
+    assert pool.size == 0
+
+
+def test_clear() -> None:
+    pool, destroy, _ = make_pool()
+
+    with pool.acquire(1, lambda: "driver_1"):
+        pass
+    pool.clear()
+
+    destroy.assert_called_once_with("driver_1")
+    assert pool.size == 0
+
+
+def test_playwright_runtime_main_thread_only(mocker: MockerFixture) -> None:
+    """
+    Test that the Playwright runtime is only kept on the main thread, since
+    browsers launched by short lived threads could never be closed.
+    """
+    from superset.utils.webdriver import _PlaywrightRuntime
+
+    mocker.patch(
+        "superset.utils.webdriver.get_pool_config", return_value={"max_size": 1}
+    )
+    mocker.patch.object(_PlaywrightRuntime, "_runtime", None)
+    init = mocker.patch.object(_PlaywrightRuntime, "__init__", return_value=None)
+
+    runtimes = []
+    thread = threading.Thread(target=lambda: runtimes.append(_PlaywrightRuntime.get()))
+    thread.start()
+    thread.join()
+    assert runtimes == [None]
+    init.assert_not_called()
+
+    mocker.patch("superset.utils.webdriver.os.getpid", return_value=1)
+    runtime = _PlaywrightRuntime.get()
+    runtime._pid = 1
+    assert _PlaywrightRuntime.get() is runtime
+    init.assert_called_once_with({"max_size": 1})